@@ -1,183 +1,612 @@
-'''
-Base class for ApiConnectors
-
-The base ApiConnector class contains common methods for managing the notification queue. 
-'''
-
-import logging
-from Queue import Empty  
-from Queue import Queue
-
-import ApiException
-DEFAULT_Q_SIZE = 1000
-
-# Log initialization 
-class NullHandler(logging.Handler):
-    def emit(self, record):
-        pass
-log = logging.getLogger('ApiConnector')
-log.setLevel(logging.INFO)
-log.addHandler(NullHandler())
-
-def logDump(buf, msg = None, level=logging.DEBUG):
-    '''
-    \brief Print dump for binary object to trace file.
-    '''
-    
-    if log.getEffectiveLevel() > level :
-        return
-    if msg :
-        log.log(level, msg)
-    addr = 0
-    step = 20
-    dump = " ".join(["{0:02x}".format(ord(c)) for c in buf])
-    for i in xrange(0, len(dump), 3 * step) :
-        log.log(level, "    {0:3} : {1}".format(addr, dump[i : i + 3 * step]))
-        addr += step
-        
-
-class ApiConnector(object):
-    '''
-    \ingroup ApiConnector
-    
-    \brief Base class for all connector objects.
-    '''
-    
-    def __init__(self, maxQSize = DEFAULT_Q_SIZE):
-        self.maxQSize = maxQSize
-        self.queue = NotifQueue(self.maxQSize)
-        self.isConnected = False
-        self.isExceptionRaise = False
-        self.pendingNotification = None
-        self.disconnectReason = ''
-        self.traceFile = None
-                
-    def connect(self) :
-        self.queue.clear()
-        self.isConnected = True
-        self.isExceptionRaise = False
-        self.pendingNotification = None
-        
-    def disconnect(self, reason):
-        if not self.isConnected :
-            return
-        self.disconnectReason = reason
-        self.isConnected = False
-        self.putDisconnectNotification(reason)
-        
-    def send(self, cmdName, params):
-        raise NotImplementedError("ApiConnector.send is not implemented")
-
-    def getNotificationInternal(self, timeoutSec=-1):
-        '''
-        \brief get notification from queue
-        
-        \param timeoutSec timeout for waiting if queue is empty.
-               <0 wait infinity (blocked), >=0 wait up to 'timeout' seconds
-         
-        \exception ConnectionError disconnected from device
-        \exception QueueError reading from empty 'offline' queue
-        \returns   Notification object or None if queue is empty.
-        '''
-        
-        if self.pendingNotification :
-            res, self.pendingNotification = self.pendingNotification, None
-            return res
-        
-        if not self.isConnected :
-            self.oneTimeRaiseDisconnectException(None)
-            timeoutSec = 0   # for 'offline' queue use get without timeout 
-            
-        res = self.queue.get(timeoutSec)
-        if not self.isConnected :
-            self.oneTimeRaiseDisconnectException(res)
-            
-        if not self.isConnected and not res :
-            raise ApiException.QueueError() # Send exception: Reading from empty queue
-        return res
-    
-    def oneTimeRaiseDisconnectException(self, notif):
-        '''
-        \brief raise exception only one time for one session and save current
-               notification.
-        '''
-        
-        if not self.isExceptionRaise :  # Send Disconnect Exception (only one time)
-            self.isExceptionRaise = True
-            self.pendingNotification = notif
-            raise ApiException.ConnectionError(self.disconnectReason)
-
-    def putNotification(self, item):
-        '''
-        \brief Put notification to queue
-         
-        Insert notification to queue. If queue is full raise ConnectionError exception
-       
-        \param item notification to insert
-       
-        \exception ConnectionError
-        '''
-        
-        if not self.isConnected :
-            raise ApiException.ConnectionError("Disconnected")
-        if self.queue.qsize() < self.maxQSize :
-            self.queue.put(item)
-        else :
-            raise ApiException.ConnectionError("Queue overflowed")
-
-    def putDisconnectNotification(self, reason):
-        '''
-        \brief Put Disconnect notification to queue
-       
-        \param reason reason for disconnection
-        '''
-        # used by HartMgr where notifications are separate from control messages
-        self.queue.putDisconnectNotification(reason)
-        
-     
-class NotifQueue(Queue):
-    class _DisconnectNotification:
-        '''
-        \brief Special internal notification - connection is broken
-        '''
-        def __init__(self, reason):
-            self.reason = reason
-        
-    def __init__(self, maxSize):
-        self.maxQSize = maxSize
-        Queue.__init__(self)
-    
-    def get(self, timeout = -1):
-        '''
-        \brief Get notification from queue
-        
-        \param timeout timeout for waiting if queue is empty.
-               <0 wait forever (blocked), >=0 wait up to 'timeout' seconds
-        
-        \returns   Notification object or None if queue is empty.
-        '''
-        
-        try :
-            if timeout < 0 :
-                notif = Queue.get(self, True)
-            elif timeout == 0 :
-                notif = Queue.get(self, False)
-            else:
-                notif = Queue.get(self, True, timeout)
-            if isinstance(notif, NotifQueue._DisconnectNotification) :  
-                notif = Queue.get(self, False)  # disconnect notification is used for kick 'get' method  
-            return notif
-        except Empty:
-            return None 
-               
-    def putDisconnectNotification(self, reason):
-        '''
-        \brief Put Disconnect notification to queue
-       
-        \param reason reason for disconnection
-        '''
-        self.put(NotifQueue._DisconnectNotification(reason))
-        
-    def clear(self) :
-        while self.get(0) : pass
-        
+'''
+Base class for ApiConnectors
+
+The base ApiConnector class contains common methods for managing the notification queue. 
+'''
+
+import logging
+import time
+import tempfile
+import cPickle as pickle
+from Queue import Empty  
+from Queue import Queue
+
+import ApiException
+DEFAULT_Q_SIZE = 1000
+
+# what to do with a notification when the queue is full (see NotifQueue)
+OVERFLOW_RAISE        = 'raise'         # raise ConnectionError, which disconnects
+OVERFLOW_BLOCK        = 'block'         # wait for room, then drop the notification
+OVERFLOW_DROP_OLDEST  = 'dropOldest'    # drop the oldest queued notification
+OVERFLOW_DROP_NEWEST  = 'dropNewest'    # drop the notification
+OVERFLOW_DROP_BY_TYPE = 'dropByType'    # drop a notification of a type to shed
+OVERFLOW_SPILL        = 'spill'         # queue the notification in a file
+OVERFLOW_POLICIES     = [
+    OVERFLOW_RAISE,
+    OVERFLOW_BLOCK,
+    OVERFLOW_DROP_OLDEST,
+    OVERFLOW_DROP_NEWEST,
+    OVERFLOW_DROP_BY_TYPE,
+    OVERFLOW_SPILL,
+]
+
+# Log initialization 
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('ApiConnector')
+log.setLevel(logging.INFO)
+log.addHandler(NullHandler())
+
+def logDump(buf, msg = None, level=logging.DEBUG):
+    '''
+    \brief Print dump for binary object to trace file.
+    '''
+    
+    if log.getEffectiveLevel() > level :
+        return
+    if msg :
+        log.log(level, msg)
+    addr = 0
+    step = 20
+    dump = " ".join(["{0:02x}".format(ord(c)) for c in buf])
+    for i in xrange(0, len(dump), 3 * step) :
+        log.log(level, "    {0:3} : {1}".format(addr, dump[i : i + 3 * step]))
+        addr += step
+        
+
+class ApiConnector(object):
+    '''
+    \ingroup ApiConnector
+    
+    \brief Base class for all connector objects.
+    '''
+    
+    def __init__(self, maxQSize = DEFAULT_Q_SIZE):
+        self.maxQSize = maxQSize
+        self.queue = NotifQueue(self.maxQSize)
+        self.isConnected = False
+        self.isExceptionRaise = False
+        self.pendingNotification = None
+        self.disconnectReason = ''
+        self.traceFile = None
+                
+    def connect(self) :
+        self.queue.clear()
+        self.isConnected = True
+        self.isExceptionRaise = False
+        self.pendingNotification = None
+        
+    def disconnect(self, reason):
+        if not self.isConnected :
+            return
+        self.disconnectReason = reason
+        self.isConnected = False
+        self.putDisconnectNotification(reason)
+        
+    def send(self, cmdName, params):
+        raise NotImplementedError("ApiConnector.send is not implemented")
+
+    def getNotificationInternal(self, timeoutSec=-1):
+        '''
+        \brief get notification from queue
+        
+        \param timeoutSec timeout for waiting if queue is empty.
+               <0 wait infinity (blocked), >=0 wait up to 'timeout' seconds
+         
+        \exception ConnectionError disconnected from device
+        \exception QueueError reading from empty 'offline' queue
+        \returns   Notification object or None if queue is empty.
+        '''
+        
+        if self.pendingNotification :
+            res, self.pendingNotification = self.pendingNotification, None
+            return res
+        
+        if not self.isConnected :
+            self.oneTimeRaiseDisconnectException(None)
+            timeoutSec = 0   # for 'offline' queue use get without timeout 
+            
+        res = self.queue.get(timeoutSec)
+        if not self.isConnected :
+            self.oneTimeRaiseDisconnectException(res)
+            
+        if not self.isConnected and not res :
+            raise ApiException.QueueError() # Send exception: Reading from empty queue
+        return res
+    
+    def getNotificationsInternal(self, maxCount, timeoutSec=-1):
+        '''
+        \brief get up to maxCount notifications from queue
+        
+        Waits for the first notification as getNotificationInternal() does,
+        then takes the notifications already queued, in a single acquisition
+        of the queue lock.
+        
+        \param maxCount   maximum number of notifications to return.
+        \param timeoutSec timeout for waiting if queue is empty.
+               <0 wait infinity (blocked), >=0 wait up to 'timeout' seconds
+         
+        \exception ConnectionError disconnected from device
+        \exception QueueError reading from empty 'offline' queue
+        \returns   List of notification objects, empty if queue is empty.
+        '''
+        
+        res = []
+        if self.pendingNotification :
+            res, self.pendingNotification = [self.pendingNotification], None
+            timeoutSec = 0   # return the pending notification without waiting
+        
+        if not self.isConnected :
+            if res :
+                return res
+            self.oneTimeRaiseDisconnectException(None)
+            timeoutSec = 0   # for 'offline' queue use get without timeout 
+        
+        res += self.queue.getMany(maxCount - len(res), timeoutSec)
+        if not self.isConnected and not self.isExceptionRaise and res :
+            return res       # disconnect exception is raised by the next call
+        if not self.isConnected :
+            self.oneTimeRaiseDisconnectException(None)
+        
+        if not self.isConnected and not res :
+            raise ApiException.QueueError() # Send exception: Reading from empty queue
+        return res
+    
+    def putBackNotificationsInternal(self, notifs):
+        '''
+        \brief put notifications taken by getNotificationsInternal() back at
+               the head of the queue, in order
+        
+        For the notifications a caller could not process, to be taken again
+        by the next calls.
+        
+        \param notifs List of notification objects.
+        '''
+        self.queue.putBack(notifs)
+    
+    def oneTimeRaiseDisconnectException(self, notif):
+        '''
+        \brief raise exception only one time for one session and save current
+               notification.
+        '''
+        
+        if not self.isExceptionRaise :  # Send Disconnect Exception (only one time)
+            self.isExceptionRaise = True
+            self.pendingNotification = notif
+            raise ApiException.ConnectionError(self.disconnectReason)
+
+    def putNotification(self, item):
+        '''
+        \brief Put notification to queue
+         
+        Insert notification to queue. If queue is full, what happens depends
+        on the overflow policy (see setOverflowPolicy()); by default, raise
+        ConnectionError exception
+       
+        \param item notification to insert
+       
+        \exception ConnectionError
+        '''
+        
+        if not self.isConnected :
+            raise ApiException.ConnectionError("Disconnected")
+        self.queue.putNotification(item)
+
+    def putDisconnectNotification(self, reason):
+        '''
+        \brief Put Disconnect notification to queue
+       
+        \param reason reason for disconnection
+        '''
+        # used by HartMgr where notifications are separate from control messages
+        self.queue.putDisconnectNotification(reason)
+    
+    def setOverflowPolicy(self, policy, **options):
+        '''
+        \brief Set what happens to a notification when the queue is full.
+        
+        See NotifQueue.setOverflowPolicy().
+        '''
+        self.queue.setOverflowPolicy(policy, **options)
+    
+    def getQueueStats(self):
+        '''
+        \brief Returns the counters of the notification queue.
+        
+        See NotifQueue.getStats().
+        '''
+        return self.queue.getStats()
+    
+    def resetQueueStats(self):
+        '''
+        \brief Reset the counters of the notification queue.
+        '''
+        self.queue.resetStats()
+        
+     
+class NotifQueue(Queue):
+    '''
+    \brief Queue of the notifications received by a connector.
+    
+    The queue holds up to maxQSize notifications. What happens to a
+    notification put while the queue is full depends on the overflow policy
+    (see setOverflowPolicy()). The default policy, OVERFLOW_RAISE, raises
+    ConnectionError, which disconnects the connector.
+    '''
+    
+    class _DisconnectNotification:
+        '''
+        \brief Special internal notification - connection is broken
+        '''
+        def __init__(self, reason):
+            self.reason = reason
+        
+    def __init__(self, maxSize):
+        self.maxQSize = maxSize
+        Queue.__init__(self)
+        
+        # overflow policy
+        self.policy          = OVERFLOW_RAISE
+        self.blockTimeout    = None     ##< max time to wait for room, OVERFLOW_BLOCK only
+        self.shedTypes       = set()    ##< names of the notifications to shed, OVERFLOW_DROP_BY_TYPE only
+        self.spillDir        = None     ##< directory of the spill file, OVERFLOW_SPILL only
+        self.maxSpilled      = None     ##< max number of notifications in the spill file, OVERFLOW_SPILL only
+        self.isDisconnected  = False    ##< True once a disconnect notification is put, until clear()
+        
+        # spill file, holding the notifications newer than the ones in memory
+        self.spillFile       = None
+        self.spillReadPos    = 0
+        self.spillCount      = 0        ##< number of notifications in the spill file
+        
+        self.resetStats()
+    
+    #======================== public ==========================================
+    
+    def setOverflowPolicy(self, policy, blockTimeout=None, shedTypes=None, spillDir=None, maxSpilled=None):
+        '''
+        \brief Set what happens to a notification put while the queue is full.
+        
+        \param policy       One of:
+            - OVERFLOW_RAISE: raise ConnectionError, which disconnects the
+              connector (default).
+            - OVERFLOW_BLOCK: block the thread receiving the notifications
+              until there is room in the queue, for up to blockTimeout
+              seconds (None to wait forever), then drop the notification.
+              While blocked, a serial connector does not receive the
+              responses to its requests either.
+            - OVERFLOW_DROP_OLDEST: drop the oldest notification of the queue.
+            - OVERFLOW_DROP_NEWEST: drop the notification.
+            - OVERFLOW_DROP_BY_TYPE: drop the notification if its type is in
+              shedTypes, else the oldest queued notification of such a type.
+              If there is none, the notification is queued anyway, above
+              maxQSize.
+            - OVERFLOW_SPILL: write the notification, and the ones after it,
+              to a temporary file in spillDir (None for the default temporary
+              directory), read back in order as the queue empties. When the
+              file already holds maxSpilled notifications (None for no limit),
+              drop the notification.
+        \param blockTimeout See OVERFLOW_BLOCK.
+        \param shedTypes    See OVERFLOW_DROP_BY_TYPE. A list of notification
+                            names, e.g. ['notifData','notifHealthReport'];
+                            a notification is of a type if one of the names
+                            of the notification is.
+        \param spillDir     See OVERFLOW_SPILL.
+        \param maxSpilled   See OVERFLOW_SPILL.
+        '''
+        if policy not in OVERFLOW_POLICIES :
+            raise ValueError("unknown overflow policy {0}".format(policy))
+        with self.mutex :
+            self.policy       = policy
+            self.blockTimeout = blockTimeout
+            self.shedTypes    = set(shedTypes or [])
+            self.spillDir     = spillDir
+            self.maxSpilled   = maxSpilled
+            self.not_full.notify_all()
+    
+    def putNotification(self, item):
+        '''
+        \brief Put a notification in the queue, applying the overflow policy
+               if the queue is full.
+        
+        \exception ConnectionError The queue is full and the policy is
+                   OVERFLOW_RAISE, or the queue was disconnected while
+                   waiting for room.
+        '''
+        with self.mutex :
+            if self._putNotification(item) :
+                self.not_empty.notify()
+    
+    def putNotifications(self, items):
+        '''
+        \brief Put notifications in the queue, in a single acquisition of its
+               lock, applying the overflow policy if the queue is full.
+        
+        \exception ConnectionError See putNotification().
+        '''
+        with self.mutex :
+            numPut = 0
+            try :
+                for item in items :
+                    if self._putNotification(item) :
+                        numPut += 1
+            finally :
+                if numPut :
+                    self.not_empty.notify(numPut)
+    
+    def get(self, timeout = -1):
+        '''
+        \brief Get notification from queue
+        
+        \param timeout timeout for waiting if queue is empty.
+               <0 wait forever (blocked), >=0 wait up to 'timeout' seconds
+        
+        \returns   Notification object or None if queue is empty.
+        '''
+        
+        try :
+            if timeout < 0 :
+                notif = Queue.get(self, True)
+            elif timeout == 0 :
+                notif = Queue.get(self, False)
+            else:
+                notif = Queue.get(self, True, timeout)
+            if isinstance(notif, NotifQueue._DisconnectNotification) :  
+                notif = Queue.get(self, False)  # disconnect notification is used for kick 'get' method  
+            return notif
+        except Empty:
+            return None 
+               
+    def getMany(self, maxCount, timeout = -1):
+        '''
+        \brief Get up to maxCount notifications from queue, in a single
+               acquisition of its lock.
+        
+        \param timeout timeout for waiting if queue is empty.
+               <0 wait forever (blocked), >=0 wait up to 'timeout' seconds
+        
+        \returns   List of notification objects, empty if queue is empty.
+        '''
+        
+        notifs = []
+        with self.not_empty :
+            if timeout < 0 :
+                while not self._qsize() :
+                    self.not_empty.wait()
+            elif timeout > 0 :
+                endTime = time.time() + timeout
+                while not self._qsize() :
+                    remaining = endTime - time.time()
+                    if remaining <= 0 :
+                        break
+                    self.not_empty.wait(remaining)
+            while self._qsize() and len(notifs) < maxCount :
+                if not self.queue :
+                    self._unspill()
+                popleft = self.queue.popleft
+                notifs += [popleft() for _ in xrange(min(maxCount - len(notifs), len(self.queue)))]
+            self.not_full.notify_all()
+        # disconnect notification is used for kick 'getMany' method
+        return [notif for notif in notifs if not isinstance(notif, NotifQueue._DisconnectNotification)]
+    
+    def putBack(self, items):
+        '''
+        \brief Put notifications taken from the queue back at its head, in
+               order, whatever the overflow policy.
+        '''
+        if not items :
+            return
+        with self.mutex :
+            self.queue.extendleft(reversed(items))
+            self.not_empty.notify(len(items))
+    
+    def putDisconnectNotification(self, reason):
+        '''
+        \brief Put Disconnect notification to queue
+       
+        \param reason reason for disconnection
+        '''
+        with self.mutex :
+            # wake up a thread blocked by OVERFLOW_BLOCK
+            self.isDisconnected = True
+            self.not_full.notify_all()
+        self.put(NotifQueue._DisconnectNotification(reason))
+        
+    def clear(self) :
+        while self.get(0) : pass
+        with self.mutex :
+            self.isDisconnected = False
+    
+    def getStats(self):
+        '''
+        \brief Returns a snapshot of the counters of the queue, as a dictionary.
+        
+        - 'numPut': notifications queued, in memory or in the spill file.
+        - 'numOverflows': notifications put while the queue was full.
+        - 'numDropped': notifications dropped.
+        - 'numDroppedByType': notifications dropped, per notification name
+          (the last of its names).
+        - 'numBlocked', 'blockedTime': times the receiving thread waited for
+          room, and the total time it waited, in seconds.
+        - 'numSpilled': notifications written to the spill file.
+        - 'size': notifications currently queued, 'spilled' of which in the
+          spill file.
+        - 'highWaterMark': largest number of notifications queued.
+        '''
+        with self.mutex :
+            return {
+                'numPut':            self.numPut,
+                'numOverflows':      self.numOverflows,
+                'numDropped':        self.numDropped,
+                'numDroppedByType':  dict(self.numDroppedByType),
+                'numBlocked':        self.numBlocked,
+                'blockedTime':       self.blockedTime,
+                'numSpilled':        self.numSpilled,
+                'size':              self._qsize(),
+                'spilled':           self.spillCount,
+                'highWaterMark':     self.highWaterMark,
+            }
+    
+    def resetStats(self):
+        '''
+        \brief Reset the counters of the queue.
+        '''
+        self.numPut            = 0
+        self.numOverflows      = 0
+        self.numDropped        = 0
+        self.numDroppedByType  = {}
+        self.numBlocked        = 0
+        self.blockedTime       = 0.0
+        self.numSpilled        = 0
+        self.highWaterMark     = 0
+    
+    #======================== private =========================================
+    
+    # all called with self.mutex held
+    
+    def _qsize(self, len=len):
+        return len(self.queue) + self.spillCount
+    
+    def _get(self):
+        if not self.queue :
+            self._unspill()
+        return self.queue.popleft()
+    
+    def _putNotification(self, item):
+        '''
+        \returns True if the notification was queued.
+        '''
+        if self.spillCount or len(self.queue) >= self.maxQSize :
+            self.numOverflows += 1
+            if not self._overflow(item) :
+                return False
+        else :
+            self._put(item)
+        self.numPut += 1
+        self.highWaterMark = max(self.highWaterMark, self._qsize())
+        self.unfinished_tasks += 1
+        return True
+    
+    def _overflow(self, item):
+        '''
+        \brief Apply the overflow policy to a notification put while the
+               queue is full.
+        
+        \returns True if the notification was queued.
+        '''
+        if   self.policy == OVERFLOW_BLOCK :
+            if self._waitForRoom() and self._enqueue(item) :
+                return True
+        elif self.policy == OVERFLOW_DROP_OLDEST :
+            self._drop(self._get())
+            if self._enqueue(item) :
+                return True
+        elif self.policy == OVERFLOW_DROP_BY_TYPE :
+            if not self._isShed(item) :
+                for (i, queued) in enumerate(self.queue) :
+                    if self._isShed(queued) :
+                        del self.queue[i]
+                        self._drop(queued)
+                        break
+                if self._enqueue(item) :
+                    return True
+        elif self.policy == OVERFLOW_SPILL :
+            if self.maxSpilled is None or self.spillCount < self.maxSpilled :
+                if self._spill(item) :
+                    return True
+        elif self.policy == OVERFLOW_DROP_NEWEST :
+            pass
+        else :
+            raise ApiException.ConnectionError("Queue overflowed")
+        self._drop(item)
+        return False
+    
+    def _enqueue(self, item):
+        '''
+        \brief Queue a notification in memory or, if notifications are
+               already spilled (the policy was changed since), in the spill
+               file, to keep them in order.
+        
+        \returns True if it was queued.
+        '''
+        if self.spillCount :
+            return self._spill(item)
+        self._put(item)
+        return True
+    
+    def _waitForRoom(self):
+        '''
+        \brief Wait until there is room in the queue, for up to blockTimeout.
+        
+        \exception ConnectionError The queue was disconnected while waiting.
+        \returns True if there is room.
+        '''
+        startTime = time.time()
+        endTime   = None
+        if self.blockTimeout is not None :
+            endTime = startTime + self.blockTimeout
+        self.numBlocked += 1
+        try :
+            while len(self.queue) >= self.maxQSize and self.policy == OVERFLOW_BLOCK :
+                if self.isDisconnected :
+                    raise ApiException.ConnectionError("Disconnected")
+                if endTime is None :
+                    self.not_full.wait()
+                else :
+                    remaining = endTime - time.time()
+                    if remaining <= 0 :
+                        return False
+                    self.not_full.wait(remaining)
+            return True
+        finally :
+            self.blockedTime += time.time() - startTime
+    
+    def _isShed(self, item):
+        try :
+            return bool(self.shedTypes.intersection(item[0]))
+        except TypeError :
+            return False
+    
+    def _drop(self, item):
+        self.numDropped += 1
+        try :
+            notifType = item[0][-1]
+            self.numDroppedByType[notifType] = self.numDroppedByType.get(notifType, 0) + 1
+        except (TypeError, IndexError, KeyError) :
+            pass
+    
+    def _spill(self, item):
+        '''
+        \brief Append a notification to the spill file.
+        
+        \returns True if it was written.
+        '''
+        try :
+            if not self.spillFile :
+                self.spillFile    = tempfile.TemporaryFile(prefix='notifs', dir=self.spillDir)
+                self.spillReadPos = 0
+            self.spillFile.seek(0, 2)
+            pickle.dump(item, self.spillFile, pickle.HIGHEST_PROTOCOL)
+        except Exception as err :
+            log.error("could not spill notification: {0}".format(err))
+            return False
+        self.spillCount += 1
+        self.numSpilled += 1
+        return True
+    
+    def _unspill(self):
+        '''
+        \brief Move notifications from the spill file back to memory.
+        '''
+        if not self.spillCount :
+            return
+        self.spillFile.seek(self.spillReadPos)
+        while self.spillCount and len(self.queue) < self.maxQSize :
+            self.queue.append(pickle.load(self.spillFile))
+            self.spillCount -= 1
+        self.spillReadPos = self.spillFile.tell()
+        if not self.spillCount :
+            # empty the file, rather than have it grow forever
+            self.spillFile.seek(0)
+            self.spillFile.truncate()
+            self.spillReadPos = 0
@@ -1,271 +1,922 @@
-#!/usr/bin/python
-
-import struct
-import operator
-import types
-
-import ApiDefinition
-from   SmartMeshSDK.ApiException import CommandError
-from   SmartMeshSDK import FormatUtils
-
-import logging
-class NullHandler(logging.Handler):
-    def emit(self, record):
-        pass
-log = logging.getLogger('ByteArraySerializer')
-log.setLevel(logging.ERROR)
-log.addHandler(NullHandler())
-
-class ByteArraySerializer(object):
-    '''
-    \ingroup ApiDefinition
-    
-    \brief Serializer/deserializer for byte arrays.
-    '''
-
-    def __init__(self,ApiDef):
-        self.ApiDef = ApiDef
-    
-    def serialize(self,commandArray,fieldsToFill):
-        
-        # log
-        if log.isEnabledFor(logging.DEBUG):
-            output  = []
-            output += ["serialize ..."]
-            output += ["- commandArray:     {0}".format(commandArray)]
-            output += ["- fieldsToFill:     {0}".format(fieldsToFill)]
-            output  = '\n'.join(output)
-            log.debug(output)
-        
-        # validate input
-        if type(commandArray)!=types.ListType and type(commandArray)!=types.TupleType:
-            raise TypeError("First parameter should be a list or tuple, not "+str(type(commandArray)))
-        
-        # initialize the output
-        byteArray  = []
-        
-        for cmdCounter in range(len(commandArray)):
-        
-            # packet payload
-            definition = self.ApiDef.getDefinition(
-                ApiDefinition.ApiDefinition.COMMAND,
-                commandArray[:cmdCounter+1]
-            )
-            
-            fields = [ApiDefinition.Field(fieldRaw,self.ApiDef.fieldOptions)
-                         for fieldRaw in definition['request']]
-            
-            for field in fields:
-                thisFieldByteArray = []
-                if field.name in ApiDefinition.ApiDefinition.RESERVED:
-                    thisFieldByteArray.append(
-                        self.ApiDef.subcommandNameToId(
-                            ApiDefinition.ApiDefinition.COMMAND,
-                            commandArray[:cmdCounter+1],
-                            commandArray[cmdCounter+1]
-                        )
-                    )
-                else:
-                    val                          = fieldsToFill[field.name]
-                    
-                    if   field.format==ApiDefinition.FieldFormats.STRING:
-                        thisFieldByteArray      += [ord(car) for car in val]
-                    
-                    elif field.format==ApiDefinition.FieldFormats.BOOL:
-                        thisFieldByteArray.append(val)
-                    
-                    elif field.format==ApiDefinition.FieldFormats.INT:
-                        thisFieldByteArray      += [operator.mod(int(val>>(8*i)), 0x100) for i in xrange(field.length-1, -1, -1)]
-                    
-                    elif field.format==ApiDefinition.FieldFormats.INTS:
-                        if   field.length==1:
-                            temp = struct.pack('>b',int(val))
-                        elif field.length==2:
-                            temp = struct.pack('>h',int(val))
-                        elif field.length==4:
-                            temp = struct.pack('>i',int(val))
-                        else:
-                            raise SystemError('field with format='+field.format+' and length='+str(field.length)+' unsupported.')
-                        for i in range(len(temp)):
-                            thisFieldByteArray.append(ord(temp[i]))
-                    
-                    elif field.format==ApiDefinition.FieldFormats.HEXDATA:
-                        thisFieldByteArray    += val
-                    
-                    else:
-                        raise SystemError('unknown field format='+field.format)
-                    
-                    # padding
-                    while len(thisFieldByteArray)<field.length:
-                        thisFieldByteArray  = [0x00]+thisFieldByteArray
-                
-                byteArray = byteArray+thisFieldByteArray
-        
-        cmdId = self.ApiDef.nameToId(ApiDefinition.ApiDefinition.COMMAND,commandArray)
-        
-        if log.isEnabledFor(logging.DEBUG):
-            output  = []
-            output += ["... serialize into"]
-            output += ["- cmdId:            {0}".format(cmdId)]
-            output += ["- byteArray:        {0}".format(FormatUtils.formatBuffer(byteArray))]
-            output  = '\n'.join(output)
-            log.debug(output)
-        
-        return cmdId,byteArray
-
-    def deserialize(self,type,id,byteArray):
-        notRcOk         = False
-        returnFields    = {}
-        nameArray       = [self.ApiDef.idToName(type,id)]
-        index           = 0
-        
-        # log
-        if log.isEnabledFor(logging.DEBUG):
-            output  = []
-            output += ["deserialize ..."]
-            output += ["- type:             {0}".format(type)]
-            output += ["- id:               {0}".format(id)]
-            output += ["- byteArray:        {0}".format(FormatUtils.formatBuffer(byteArray))]
-            output  = '\n'.join(output)
-            log.debug(output)
-        
-        continueParsing  = True
-        while continueParsing:
-            
-            fieldDefs   = self.ApiDef.getResponseFields(type,nameArray)
-            
-            for fieldDef in fieldDefs:
-                
-                fieldMissing = False
-                
-                # isolate the piece of the byteArray corresponding to this field
-                if fieldDef.length:
-                    # this field has an expected length
-                    
-                    thisFieldArray = byteArray[index:index+fieldDef.length]
-                    index         += fieldDef.length
-                    
-                    if   len(thisFieldArray)==0:
-                        # field missing: allowed
-                        fieldMissing   = True
-                    elif len(thisFieldArray)<fieldDef.length:
-                        # incomplete field: not allowed
-                        raise CommandError(
-                            CommandError.TOO_FEW_BYTES,
-                            "incomplete field {0}".format(fieldDef.name),
-                        )
-                    
-                else:
-                    thisFieldArray = byteArray[index:]
-                    index          = len(byteArray)
-                    
-                    if len(thisFieldArray)<1:
-                        # too few bytes
-                        fieldMissing    = True
-                
-                # find thisFieldValue
-                if fieldMissing:
-                    thisFieldValue = None
-                else:
-                    if   fieldDef.format==ApiDefinition.FieldFormats.STRING:
-                        thisFieldValue = ''
-                        for byte in thisFieldArray:
-                            thisFieldValue += chr(byte)
-                    
-                    elif fieldDef.format==ApiDefinition.FieldFormats.BOOL:
-                        if    len(thisFieldArray)==1 and thisFieldArray[0]==0x00:
-                            thisFieldValue = False
-                        elif  len(thisFieldArray)==1 and thisFieldArray[0]==0x01:
-                            thisFieldValue = True
-                        else:
-                            raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
-                                               "field="+fieldDef.name+" value="+str(thisFieldValue))
-                    
-                    elif fieldDef.format==ApiDefinition.FieldFormats.INT:
-                        thisFieldValue = 0
-                        for i in range(len(thisFieldArray)):
-                            thisFieldValue += thisFieldArray[i]*pow(2,8*(len(thisFieldArray)-i-1))
-                    
-                    elif fieldDef.format==ApiDefinition.FieldFormats.INTS:
-                        tempList = [chr(i) for i in thisFieldArray]
-                        tempString = ''.join(tempList)
-                        if   len(thisFieldArray)==1:
-                            (thisFieldValue,) = struct.unpack_from('>b',tempString)
-                        elif len(thisFieldArray)==2:
-                            (thisFieldValue,) = struct.unpack_from('>h',tempString)
-                        elif len(thisFieldArray)==4:
-                            (thisFieldValue,) = struct.unpack_from('>i',tempString)
-                        else:
-                            raise SystemError('field with format='+fieldDef.format+' and length='+str(fieldDef.length)+' unsupported.')
-                    
-                    elif fieldDef.format==ApiDefinition.FieldFormats.HEXDATA:
-                        thisFieldValue = thisFieldArray
-                    
-                    else:
-                        raise SystemError('unknown field format='+fieldDef.format)
-                    
-                    # make sure thisFieldValue in fieldDef.options
-                    if fieldDef.options.validOptions:
-                        if thisFieldValue not in fieldDef.options.validOptions:
-                            raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
-                                               "field="+fieldDef.name+" value="+str(thisFieldValue))
-                
-                if fieldDef.name in ApiDefinition.ApiDefinition.RESERVED:
-                    # the subcommand specifier cannot be missing
-                    if thisFieldValue==None:
-                        raise CommandError(
-                            CommandError.TOO_FEW_BYTES,
-                            "reserved field missing {0}".format(fieldDef.name),
-                        )
-                    idNextCommand = thisFieldValue
-                else:
-                    returnFields[fieldDef.name] = thisFieldValue
-                    
-                # stop if not RC_OK
-                if  (
-                        (ApiDefinition.ApiDefinition.RC in returnFields) and
-                        (
-                            returnFields[ApiDefinition.ApiDefinition.RC]!= \
-                                ApiDefinition.ApiDefinition.RC_OK
-                        )
-                   ):
-                   notRcOk = True
-                   break
-            
-            # continue if subCommand
-            if  (
-                    (not notRcOk)           and
-                    continueParsing         and
-                    self.ApiDef.hasSubcommands(type,nameArray)
-                ):
-                # find name of subCommand
-                nameArray.append(self.ApiDef.subcommandIdToName(type,
-                                                                nameArray,
-                                                                idNextCommand))
-                continueParsing = True
-            else:
-                continueParsing = False
-            
-            # stop if not RC_OK
-            if  (
-                    continueParsing         and
-                    notRcOk
-                ):
-                continueParsing = False
-            
-            # stop if end of packet reached
-            if  (
-                    continueParsing         and
-                    index>=len(byteArray)
-                ):
-                continueParsing = False
-        
-        if log.isEnabledFor(logging.DEBUG):
-            output  = []
-            output += ["... deserialized into"]
-            output += ["- nameArray:        {0}".format(nameArray)]
-            output += ["- returnFields:     {0}".format(returnFields)]
-            output  = '\n'.join(output)
-            log.debug(output)
-        
-        return nameArray,returnFields
+#!/usr/bin/python
+
+import struct
+import operator
+import types
+import binascii
+import threading
+
+import ApiDefinition
+from   SmartMeshSDK.ApiException import CommandError
+from   SmartMeshSDK import FormatUtils
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('ByteArraySerializer')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+# struct formats to (un)pack INT and INTS fields, indexed by field length
+_INT_FORMATS  = {
+    1: struct.Struct('>B'),
+    2: struct.Struct('>H'),
+    4: struct.Struct('>I'),
+    8: struct.Struct('>Q'),
+}
+_INTS_FORMATS = {
+    1: struct.Struct('>b'),
+    2: struct.Struct('>h'),
+    4: struct.Struct('>i'),
+}
+
+# struct codes of the INT and INTS fields, indexed by field length
+_INT_CODES    = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+_INTS_CODES   = {1: 'b', 2: 'h', 4: 'i'}
+
+# fixups applied to the values unpacked by a ResponseCodec
+_FIXUP_BOOL   = 'bool'      # 0/1 into False/True
+_FIXUP_HEX    = 'hex'       # string into list (or tuple) of ints
+_FIXUP_INT    = 'int'       # string into int, for lengths without a struct code
+
+class RequestCodec(object):
+    '''
+    \brief Precompiled serializer of the request of a (sub)command.
+    
+    The fields of all the levels of the command are packed by a single
+    struct.Struct, the subcommand IDs being constants of the plan. Only the
+    last field can be of variable length; it is appended after packing.
+    '''
+    
+    def __init__(self,cmdId,fieldDefs,subIds):
+        '''
+        \param cmdId     The ID of the command.
+        \param fieldDefs The Field objects of the request, all levels
+                         concatenated.
+        \param subIds    The subcommand IDs, indexed by the position of
+                         their reserved field in fieldDefs.
+        '''
+        
+        # store params
+        self.cmdId           = cmdId
+        
+        # local variables
+        self.struct          = None     ##< None if the request can not be precompiled
+        self.constants       = []       ##< the struct arguments, subcommand IDs filled in
+        self.fields          = []       ##< (argument index, field name, conversion)
+        self.tail            = None     ##< (field name, conversion) of the variable-length field
+        
+        structFormat         = ['>']
+        for (i,fieldDef) in enumerate(fieldDefs):
+            if i in subIds:
+                structFormat.append('B')
+                self.constants.append(subIds[i])
+                continue
+            if not fieldDef.length:
+                if i!=len(fieldDefs)-1:
+                    return
+                if   fieldDef.format==ApiDefinition.FieldFormats.HEXDATA:
+                    self.tail = (fieldDef.name,list)
+                elif fieldDef.format==ApiDefinition.FieldFormats.STRING:
+                    self.tail = (fieldDef.name,lambda val: [ord(car) for car in val])
+                else:
+                    return
+                continue
+            (code,convert) = self._compileField(fieldDef)
+            if not code:
+                return
+            structFormat.append(code)
+            self.fields.append((len(self.constants),fieldDef.name,convert))
+            self.constants.append(None)
+        self.struct          = struct.Struct(''.join(structFormat))
+    
+    #======================== public ==========================================
+    
+    def encode(self,fieldsToFill):
+        '''
+        \brief Serialize the request.
+        
+        \returns The serialized fields, a list of ints, or None if the
+                 request can not be precompiled.
+        '''
+        if not self.struct:
+            return None
+        args = self.constants[:]
+        for (i,name,convert) in self.fields:
+            args[i] = convert(fieldsToFill[name])
+        byteArray = list(bytearray(self.struct.pack(*args)))
+        if self.tail:
+            byteArray += self.tail[1](fieldsToFill[self.tail[0]])
+        return byteArray
+    
+    #======================== private =========================================
+    
+    def _compileField(self,fieldDef):
+        length = fieldDef.length
+        if   fieldDef.format==ApiDefinition.FieldFormats.INT:
+            if length not in _INT_CODES:
+                return (None,None)
+            mask = (1<<(8*length))-1
+            return (_INT_CODES[length],lambda val: int(val)&mask)
+        elif fieldDef.format==ApiDefinition.FieldFormats.INTS:
+            if length not in _INTS_CODES:
+                return (None,None)
+            return (_INTS_CODES[length],int)
+        elif fieldDef.format==ApiDefinition.FieldFormats.BOOL and length==1:
+            return ('B',int)
+        elif fieldDef.format==ApiDefinition.FieldFormats.HEXDATA:
+            # short values are padded in front, as by the generic serializer
+            return ('{0}s'.format(length),lambda val: str(bytearray(val)).rjust(length,'\x00'))
+        elif fieldDef.format==ApiDefinition.FieldFormats.STRING:
+            return ('{0}s'.format(length),lambda val: str(val).rjust(length,'\x00'))
+        return (None,None)
+
+class ResponseCodec(object):
+    '''
+    \brief Precompiled deserializer of one level of a (sub)command response
+           or notification.
+    
+    The fixed-length fields are unpacked by a single struct.Struct, followed
+    by a small number of fixups (booleans, HEXDATA fields). The last field can
+    be of variable length.
+    
+    decode() only handles well-formed payloads: all the fields present, RC
+    equal to RC_OK, and all values valid. Otherwise, it lets the generic
+    deserializer parse the payload (and raise the appropriate error).
+    '''
+    
+    def __init__(self,fieldDefs):
+        '''
+        \param fieldDefs The Field objects of this level of the response.
+        '''
+        
+        # store params
+        self.fieldDefs       = fieldDefs
+        
+        # local variables
+        self.struct          = None     ##< None if the response can not be precompiled
+        self.names           = []       ##< the field names, in struct order
+        self.fixups          = []       ##< (index, fixup) of the values needing one
+        self.checks          = []       ##< (index, valid options) of the fields with options
+        self.rcIndex         = None     ##< index of the RC field, if any
+        self.reservedIndex   = None     ##< index of the subcommand ID field, if any
+        self.tail            = None     ##< the variable-length Field
+        
+        structFormat         = ['>']
+        for (i,fieldDef) in enumerate(fieldDefs):
+            if not fieldDef.length:
+                if (
+                        i!=len(fieldDefs)-1                                            or
+                        fieldDef.name in ApiDefinition.ApiDefinition.RESERVED          or
+                        fieldDef.options.validOptions                                  or
+                        fieldDef.format not in [ApiDefinition.FieldFormats.HEXDATA,
+                                                ApiDefinition.FieldFormats.STRING]
+                    ):
+                    return
+                self.tail = fieldDef
+                continue
+            (code,fixup) = self._compileField(fieldDef)
+            if not code:
+                return
+            structFormat.append(code)
+            if fixup:
+                self.fixups.append((len(self.names),fixup))
+            if fieldDef.options.validOptions:
+                self.checks.append((len(self.names),self._toLookup(fieldDef.options.validOptions)))
+            if fieldDef.name==ApiDefinition.ApiDefinition.RC:
+                self.rcIndex = len(self.names)
+            if fieldDef.name in ApiDefinition.ApiDefinition.RESERVED:
+                self.reservedIndex = len(self.names)
+            self.names.append(fieldDef.name)
+        self.struct          = struct.Struct(''.join(structFormat))
+    
+    #======================== public ==========================================
+    
+    def decode(self,byteArray,index,returnFields,hexAsTuple):
+        '''
+        \brief Deserialize this level of the response.
+        
+        \param byteArray    The payload, a memoryview.
+        \param index        Where this level starts in the payload.
+        \param returnFields The dictionary to add the fields to.
+        \param hexAsTuple   Whether to return HEXDATA fields as tuples.
+        
+        \returns A tuple (index,idNextCommand), index being where this
+                 level ends, or None if the generic deserializer needs
+                 to parse this level.
+        '''
+        hexType  = tuple if hexAsTuple else list
+        unpacked = self.unpack(byteArray,index,hexType)
+        if not unpacked:
+            return None
+        (values,index) = unpacked
+        
+        fields = dict(zip(self.names,values))
+        
+        if self.tail:
+            tailArray = byteArray[index:]
+            index     = len(byteArray)
+            if len(tailArray)<1:
+                fields[self.tail.name] = None
+            elif self.tail.format==ApiDefinition.FieldFormats.STRING:
+                fields[self.tail.name] = tailArray.tobytes()
+            else:
+                fields[self.tail.name] = hexType(tailArray.tolist())
+        
+        idNextCommand = None
+        if self.reservedIndex is not None:
+            idNextCommand = fields.pop(self.names[self.reservedIndex])
+        returnFields.update(fields)
+        
+        return (index,idNextCommand)
+    
+    def unpack(self,byteArray,index,hexType):
+        '''
+        \brief Unpack the fixed-length fields of this level of the response.
+        
+        \param byteArray    The payload, a memoryview.
+        \param index        Where this level starts in the payload.
+        \param hexType      list or tuple to return HEXDATA fields as lists
+                            or tuples of ints, str to leave them as strings.
+        
+        \returns A tuple (values,index), values being in the order of
+                 'names' and index where the fixed-length fields end, or None
+                 if the generic deserializer needs to parse this level.
+        '''
+        if (not self.struct) or len(byteArray)-index<self.struct.size:
+            return None
+        values = self.struct.unpack_from(byteArray,index)
+        if self.rcIndex is not None and values[self.rcIndex]!=ApiDefinition.ApiDefinition.RC_OK:
+            return None
+        index += self.struct.size
+        
+        if self.fixups:
+            values = list(values)
+            for (i,fixup) in self.fixups:
+                value = values[i]
+                if   fixup==_FIXUP_HEX:
+                    if hexType is not str:
+                        value = hexType(bytearray(value))
+                elif fixup==_FIXUP_BOOL:
+                    if value>1:
+                        return None
+                    value = (value==1)
+                elif fixup==_FIXUP_INT:
+                    value = int(binascii.hexlify(value),16)
+                values[i] = value
+        for (i,validOptions) in self.checks:
+            if values[i] not in validOptions:
+                return None
+        
+        return (values,index)
+    
+    #======================== private =========================================
+    
+    def _compileField(self,fieldDef):
+        length = fieldDef.length
+        if   fieldDef.format==ApiDefinition.FieldFormats.INT:
+            if length in _INT_CODES:
+                return (_INT_CODES[length],None)
+            return ('{0}s'.format(length),_FIXUP_INT)
+        elif fieldDef.format==ApiDefinition.FieldFormats.INTS:
+            return (_INTS_CODES.get(length),None)
+        elif fieldDef.format==ApiDefinition.FieldFormats.BOOL and length==1:
+            return ('B',_FIXUP_BOOL)
+        elif fieldDef.format==ApiDefinition.FieldFormats.HEXDATA:
+            return ('{0}s'.format(length),_FIXUP_HEX)
+        elif fieldDef.format==ApiDefinition.FieldFormats.STRING:
+            return ('{0}s'.format(length),None)
+        return (None,None)
+    
+    def _toLookup(self,validOptions):
+        try:
+            return frozenset(validOptions)
+        except TypeError:
+            return validOptions
+
+class DecodePlan(object):
+    '''
+    \brief The ResponseCodec of one level of a (sub)command response or
+           notification, with the plans of its subcommands, indexed by
+           subcommand ID.
+    '''
+    
+    def __init__(self,serializer,type,nameArray,parentCodecs=()):
+        '''
+        \param serializer   The ByteArraySerializer.
+        \param type         COMMAND or NOTIFICATION.
+        \param nameArray    The name of this level, a tuple.
+        \param parentCodecs The ResponseCodecs of the levels above, a tuple.
+        '''
+        
+        # store params
+        self.serializer      = serializer
+        self.type            = type
+        self.nameArray       = nameArray
+        
+        # local variables
+        self.codec           = serializer.getResponseCodec(type,nameArray)
+        self.codecs          = parentCodecs+(self.codec,)    ##< the codecs of all levels, down to this one
+        self.hasSubcommands  = serializer.ApiDef.hasSubcommands(type,nameArray)
+        self.subPlans        = {}
+    
+    #======================== public ==========================================
+    
+    def getSubPlan(self,id):
+        '''
+        \brief Get the plan of a subcommand of this level.
+        
+        \exception CommandError(UNKNOWN_SUBCOMMAND) No such subcommand.
+        '''
+        try:
+            return self.subPlans[id]
+        except (KeyError,TypeError):
+            pass
+        name = self.serializer.ApiDef.subcommandIdToName(self.type,list(self.nameArray),id)
+        plan = DecodePlan(self.serializer,self.type,self.nameArray+(name,),self.codecs)
+        self.subPlans[id] = plan
+        return plan
+
+class ColumnBatch(object):
+    '''
+    \brief The fields of the packets of a batch which have the same
+           (sub)command or notification name, column by column.
+    
+    Fixed-length HEXDATA fields (e.g. 'macAddress') are strings. The
+    variable-length last field (e.g. 'data' in notifData), if any, is not
+    copied: for packet i, it is tailLengths[i] bytes at offset
+    tailOffsets[i] of tailBuffers[i], the packet's payload; its length is 0
+    if the field is absent.
+    '''
+    
+    def __init__(self,nameArray,codecs):
+        '''
+        \param nameArray The (sub)command or notification name, a tuple.
+        \param codecs    The ResponseCodec of each level of the name.
+        '''
+        
+        # store params
+        self.nameArray       = list(nameArray)
+        
+        # local variables
+        self.positions       = []       ##< the position of each packet in the batch
+        self.fieldNames      = []       ##< the names of the columns, in packet order
+        self.columns         = {}       ##< {field name: list of values}
+        self.tailName        = None     ##< the name of the variable-length field, if any
+        self.tailBuffers     = []
+        self.tailOffsets     = []
+        self.tailLengths     = []
+        self.slots           = []       ##< (level, index in the level's values, column)
+        self.hexNames        = set()    ##< the fixed-length HEXDATA columns
+        
+        for (level,codec) in enumerate(codecs):
+            index = 0
+            for fieldDef in codec.fieldDefs:
+                if not fieldDef.length:
+                    self.tailName = fieldDef.name
+                    continue
+                if fieldDef.name not in ApiDefinition.ApiDefinition.RESERVED:
+                    column = []
+                    self.fieldNames.append(fieldDef.name)
+                    self.columns[fieldDef.name] = column
+                    self.slots.append((level,index,column))
+                    if fieldDef.format==ApiDefinition.FieldFormats.HEXDATA:
+                        self.hexNames.add(fieldDef.name)
+                index += 1
+    
+    def __len__(self):
+        return len(self.positions)
+    
+    #======================== public ==========================================
+    
+    def getTail(self,i):
+        '''
+        \brief Get the variable-length field of the i-th packet of this batch,
+               a memoryview of its payload.
+        '''
+        offset = self.tailOffsets[i]
+        return self.tailBuffers[i][offset:offset+self.tailLengths[i]]
+    
+    def appendValues(self,position,levels,byteArray,tailOffset):
+        '''
+        \brief Add a packet, from the values unpacked by the codec of each
+               level.
+        '''
+        self.positions.append(position)
+        for (level,index,column) in self.slots:
+            column.append(levels[level][index])
+        if self.tailName:
+            self.tailBuffers.append(byteArray)
+            self.tailOffsets.append(tailOffset)
+            self.tailLengths.append(len(byteArray)-tailOffset)
+    
+    def appendFields(self,position,fields,byteArray):
+        '''
+        \brief Add a packet, from the fields returned by deserialize().
+        '''
+        self.positions.append(position)
+        for name in self.fieldNames:
+            value = fields.get(name)
+            if value is not None and name in self.hexNames:
+                value = str(bytearray(value))
+            self.columns[name].append(value)
+        if self.tailName:
+            tail = fields.get(self.tailName) or []
+            self.tailBuffers.append(byteArray)
+            self.tailOffsets.append(len(byteArray)-len(tail))
+            self.tailLengths.append(len(tail))
+
+class ByteArraySerializer(object):
+    '''
+    \ingroup ApiDefinition
+    
+    \brief Serializer/deserializer for byte arrays.
+    
+    Each (sub)command and notification is compiled, on first use, into a
+    RequestCodec and ResponseCodec which are then cached.
+    '''
+    
+    def __init__(self,ApiDef):
+        self.ApiDef          = ApiDef
+        self.codecLock       = threading.Lock()
+        self.requestCodecs   = {}
+        self.responseCodecs  = {}
+        self.decodePlans     = {}
+    
+    #======================== public ==========================================
+    
+    def getRequestCodec(self,commandArray):
+        '''
+        \brief Get the (cached) RequestCodec of a (sub)command.
+        
+        \param commandArray An array of the form [commandName, subCommandname].
+        '''
+        key = tuple(commandArray)
+        try:
+            return self.requestCodecs[key]
+        except KeyError:
+            pass
+        
+        fieldDefs  = []
+        subIds     = {}
+        for cmdCounter in range(len(commandArray)):
+            definition = self.ApiDef.getDefinition(
+                ApiDefinition.ApiDefinition.COMMAND,
+                commandArray[:cmdCounter+1]
+            )
+            for fieldRaw in definition['request']:
+                field = ApiDefinition.Field(fieldRaw,self.ApiDef.fieldOptions)
+                if field.name in ApiDefinition.ApiDefinition.RESERVED:
+                    subIds[len(fieldDefs)] = self.ApiDef.subcommandNameToId(
+                        ApiDefinition.ApiDefinition.COMMAND,
+                        commandArray[:cmdCounter+1],
+                        commandArray[cmdCounter+1]
+                    )
+                fieldDefs.append(field)
+        cmdId = self.ApiDef.nameToId(ApiDefinition.ApiDefinition.COMMAND,commandArray)
+        
+        codec = RequestCodec(cmdId,fieldDefs,subIds)
+        with self.codecLock:
+            self.requestCodecs[key] = codec
+        return codec
+    
+    def getResponseCodec(self,type,nameArray):
+        '''
+        \brief Get the (cached) ResponseCodec of one level of a (sub)command
+               response or notification.
+        
+        \param type      COMMAND or NOTIFICATION.
+        \param nameArray An array of the form [commandName, subCommandname].
+        '''
+        key = (type,tuple(nameArray))
+        try:
+            return self.responseCodecs[key]
+        except KeyError:
+            pass
+        
+        codec = ResponseCodec(self.ApiDef.getResponseFields(type,nameArray))
+        with self.codecLock:
+            self.responseCodecs[key] = codec
+        return codec
+    
+    def getDecodePlan(self,type,id):
+        '''
+        \brief Get the (cached) DecodePlan of a command response or
+               notification.
+        
+        \param type      COMMAND or NOTIFICATION.
+        \param id        The command or notification ID.
+        '''
+        key = (type,id)
+        try:
+            return self.decodePlans[key]
+        except (KeyError,TypeError):
+            pass
+        
+        plan = DecodePlan(self,type,(self.ApiDef.idToName(type,id),))
+        with self.codecLock:
+            self.decodePlans[key] = plan
+        return plan
+    
+    def serialize(self,commandArray,fieldsToFill):
+        
+        # log
+        if log.isEnabledFor(logging.DEBUG):
+            output  = []
+            output += ["serialize ..."]
+            output += ["- commandArray:     {0}".format(commandArray)]
+            output += ["- fieldsToFill:     {0}".format(fieldsToFill)]
+            output  = '\n'.join(output)
+            log.debug(output)
+        
+        # validate input
+        if type(commandArray)!=types.ListType and type(commandArray)!=types.TupleType:
+            raise TypeError("First parameter should be a list or tuple, not "+str(type(commandArray)))
+        
+        codec     = self.getRequestCodec(commandArray)
+        cmdId     = codec.cmdId
+        byteArray = codec.encode(fieldsToFill)
+        if byteArray is None:
+            byteArray = self._serializeFields(commandArray,fieldsToFill)
+        
+        if log.isEnabledFor(logging.DEBUG):
+            output  = []
+            output += ["... serialize into"]
+            output += ["- cmdId:            {0}".format(cmdId)]
+            output += ["- byteArray:        {0}".format(FormatUtils.formatBuffer(byteArray))]
+            output  = '\n'.join(output)
+            log.debug(output)
+        
+        return cmdId,byteArray
+    
+    def deserialize(self,type,id,byteArray):
+        '''
+        \brief Deserialize a received (sub)command or notification.
+        
+        \param type      COMMAND or NOTIFICATION.
+        \param id        The command or notification ID.
+        \param byteArray The payload, a bytearray, memoryview, string, list
+                         or tuple of ints. The fields are read in place,
+                         without copying the payload.
+        
+        \returns A tuple (nameArray,fields). HEXDATA fields are returned as
+                 lists of ints (tuples if byteArray is a tuple).
+        '''
+        returnFields    = {}
+        nameArray       = [self.ApiDef.idToName(type,id)]
+        index           = 0
+        hexAsTuple      = isinstance(byteArray,tuple)
+        
+        # access the payload through a memoryview, so slicing does not copy
+        if isinstance(byteArray,(list,tuple)):
+            byteArray   = bytearray(byteArray)
+        if not isinstance(byteArray,memoryview):
+            byteArray   = memoryview(byteArray)
+        
+        # log
+        if log.isEnabledFor(logging.DEBUG):
+            output  = []
+            output += ["deserialize ..."]
+            output += ["- type:             {0}".format(type)]
+            output += ["- id:               {0}".format(id)]
+            output += ["- byteArray:        {0}".format(FormatUtils.formatBuffer(byteArray.tolist()))]
+            output  = '\n'.join(output)
+            log.debug(output)
+        
+        continueParsing  = True
+        while continueParsing:
+            
+            codec       = self.getResponseCodec(type,nameArray)
+            
+            decoded     = codec.decode(byteArray,index,returnFields,hexAsTuple)
+            if decoded:
+                (index,idNextCommand) = decoded
+                notRcOk = False
+            else:
+                (index,notRcOk,idNextCommand) = self._deserializeFields(
+                    codec.fieldDefs,
+                    byteArray,
+                    index,
+                    returnFields,
+                    hexAsTuple,
+                )
+            
+            # continue if subCommand
+            if  (
+                    (not notRcOk)           and
+                    continueParsing         and
+                    self.ApiDef.hasSubcommands(type,nameArray)
+                ):
+                # find name of subCommand
+                nameArray.append(self.ApiDef.subcommandIdToName(type,
+                                                                nameArray,
+                                                                idNextCommand))
+                continueParsing = True
+            else:
+                continueParsing = False
+            
+            # stop if not RC_OK
+            if  (
+                    continueParsing         and
+                    notRcOk
+                ):
+                continueParsing = False
+            
+            # stop if end of packet reached
+            if  (
+                    continueParsing         and
+                    index>=len(byteArray)
+                ):
+                continueParsing = False
+        
+        if log.isEnabledFor(logging.DEBUG):
+            output  = []
+            output += ["... deserialized into"]
+            output += ["- nameArray:        {0}".format(nameArray)]
+            output += ["- returnFields:     {0}".format(returnFields)]
+            output  = '\n'.join(output)
+            log.debug(output)
+        
+        return nameArray,returnFields
+    
+    def deserializeBatch(self,packets,columnar=False,errors=None):
+        '''
+        \brief Deserialize a batch of received (sub)commands or notifications.
+        
+        The lookups are done once per (sub)command or notification in the
+        batch, rather than once per packet.
+        
+        \param packets  A list of (type,id,payload) tuples, type, id and
+                        payload as passed to deserialize().
+        \param columnar If True, return the fields column by column,
+                        without building a dictionary per packet.
+        \param errors   If a list, the packets which can not be
+                        deserialized are skipped, and (position,exception)
+                        appended to it. If None, the first such error is
+                        raised.
+        
+        \returns If columnar is False, a list with, for each packet, the
+                 (nameArray,fields) tuple returned by deserialize(), or None
+                 if the packet was skipped. If columnar is True, a
+                 dictionary {(type,tuple(nameArray)): ColumnBatch}.
+        '''
+        if columnar:
+            returnVal = {}
+        else:
+            returnVal = []
+        
+        for (position,(type,id,byteArray)) in enumerate(packets):
+            try:
+                if columnar:
+                    self._deserializeColumns(position,type,id,byteArray,returnVal)
+                else:
+                    returnVal.append(self._deserializePlanned(type,id,byteArray))
+            except CommandError as err:
+                if errors is None:
+                    raise
+                errors.append((position,err))
+                if not columnar:
+                    returnVal.append(None)
+        
+        return returnVal
+    
+    #======================== private =========================================
+    
+    def _serializeFields(self,commandArray,fieldsToFill):
+        '''
+        \brief Generic serializer, for the requests a RequestCodec can not
+               handle.
+        '''
+        
+        # initialize the output
+        byteArray  = []
+        
+        for cmdCounter in range(len(commandArray)):
+            
+            # packet payload
+            definition = self.ApiDef.getDefinition(
+                ApiDefinition.ApiDefinition.COMMAND,
+                commandArray[:cmdCounter+1]
+            )
+            
+            fields = [ApiDefinition.Field(fieldRaw,self.ApiDef.fieldOptions)
+                         for fieldRaw in definition['request']]
+            
+            for field in fields:
+                thisFieldByteArray = []
+                if field.name in ApiDefinition.ApiDefinition.RESERVED:
+                    thisFieldByteArray.append(
+                        self.ApiDef.subcommandNameToId(
+                            ApiDefinition.ApiDefinition.COMMAND,
+                            commandArray[:cmdCounter+1],
+                            commandArray[cmdCounter+1]
+                        )
+                    )
+                else:
+                    val                          = fieldsToFill[field.name]
+                    
+                    if   field.format==ApiDefinition.FieldFormats.STRING:
+                        thisFieldByteArray      += [ord(car) for car in val]
+                    
+                    elif field.format==ApiDefinition.FieldFormats.BOOL:
+                        thisFieldByteArray.append(val)
+                    
+                    elif field.format==ApiDefinition.FieldFormats.INT:
+                        thisFieldByteArray      += [operator.mod(int(val>>(8*i)), 0x100) for i in xrange(field.length-1, -1, -1)]
+                    
+                    elif field.format==ApiDefinition.FieldFormats.INTS:
+                        if field.length not in _INTS_FORMATS:
+                            raise SystemError('field with format='+field.format+' and length='+str(field.length)+' unsupported.')
+                        thisFieldByteArray      += bytearray(_INTS_FORMATS[field.length].pack(int(val)))
+                    
+                    elif field.format==ApiDefinition.FieldFormats.HEXDATA:
+                        thisFieldByteArray    += val
+                    
+                    else:
+                        raise SystemError('unknown field format='+field.format)
+                    
+                    # padding
+                    if field.length and len(thisFieldByteArray)<field.length:
+                        byteArray += [0x00]*(field.length-len(thisFieldByteArray))
+                
+                byteArray += thisFieldByteArray
+        
+        return byteArray
+    
+    def _deserializePlanned(self,type,id,byteArray):
+        '''
+        \brief Deserialize a packet following its DecodePlan; same result as
+               deserialize().
+        '''
+        payload         = byteArray
+        hexAsTuple      = isinstance(byteArray,tuple)
+        if isinstance(byteArray,(list,tuple)):
+            byteArray   = bytearray(byteArray)
+        if not isinstance(byteArray,memoryview):
+            byteArray   = memoryview(byteArray)
+        
+        plan            = self.getDecodePlan(type,id)
+        returnFields    = {}
+        index           = 0
+        while True:
+            decoded     = plan.codec.decode(byteArray,index,returnFields,hexAsTuple)
+            if not decoded:
+                return self.deserialize(type,id,payload)
+            (index,idNextCommand) = decoded
+            if not plan.hasSubcommands:
+                break
+            plan        = plan.getSubPlan(idNextCommand)
+            if index>=len(byteArray):
+                break
+        
+        return (list(plan.nameArray),returnFields)
+    
+    def _deserializeColumns(self,position,type,id,byteArray,batches):
+        '''
+        \brief Deserialize a packet into the ColumnBatch of its name.
+        '''
+        payload         = byteArray
+        if isinstance(byteArray,(list,tuple)):
+            byteArray   = bytearray(byteArray)
+        if not isinstance(byteArray,memoryview):
+            byteArray   = memoryview(byteArray)
+        
+        plan            = self.getDecodePlan(type,id)
+        levels          = []
+        index           = 0
+        while True:
+            unpacked    = plan.codec.unpack(byteArray,index,str)
+            if not unpacked:
+                break
+            (values,index) = unpacked
+            levels.append(values)
+            if not plan.hasSubcommands:
+                break
+            if plan.codec.tail or plan.codec.reservedIndex is None or index>=len(byteArray):
+                unpacked = None
+                break
+            plan        = plan.getSubPlan(values[plan.codec.reservedIndex])
+        
+        if unpacked:
+            batch       = self._getColumnBatch(batches,type,plan.nameArray)
+            batch.appendValues(position,levels,byteArray,index)
+        else:
+            (nameArray,fields) = self.deserialize(type,id,payload)
+            batch       = self._getColumnBatch(batches,type,tuple(nameArray))
+            batch.appendFields(position,fields,byteArray)
+    
+    def _getColumnBatch(self,batches,type,nameArray):
+        key = (type,nameArray)
+        if key not in batches:
+            codecs = [self.getResponseCodec(type,nameArray[:i+1]) for i in range(len(nameArray))]
+            batches[key] = ColumnBatch(nameArray,codecs)
+        return batches[key]
+    
+    def _deserializeFields(self,fieldDefs,byteArray,index,returnFields,hexAsTuple):
+        '''
+        \brief Generic deserializer of one level of a response, for the
+               payloads a ResponseCodec can not handle.
+        
+        \returns A tuple (index,notRcOk,idNextCommand).
+        '''
+        notRcOk         = False
+        idNextCommand   = None
+        
+        for fieldDef in fieldDefs:
+            
+            fieldMissing = False
+            
+            # isolate the piece of the byteArray corresponding to this field
+            if fieldDef.length:
+                # this field has an expected length
+                
+                thisFieldArray = byteArray[index:index+fieldDef.length]
+                index         += fieldDef.length
+                
+                if   len(thisFieldArray)==0:
+                    # field missing: allowed
+                    fieldMissing   = True
+                elif len(thisFieldArray)<fieldDef.length:
+                    # incomplete field: not allowed
+                    raise CommandError(
+                        CommandError.TOO_FEW_BYTES,
+                        "incomplete field {0}".format(fieldDef.name),
+                    )
+            
+            else:
+                thisFieldArray = byteArray[index:]
+                index          = len(byteArray)
+                
+                if len(thisFieldArray)<1:
+                    # too few bytes
+                    fieldMissing    = True
+            
+            # find thisFieldValue
+            if fieldMissing:
+                thisFieldValue = None
+            else:
+                if   fieldDef.format==ApiDefinition.FieldFormats.STRING:
+                    thisFieldValue = thisFieldArray.tobytes()
+                
+                elif fieldDef.format==ApiDefinition.FieldFormats.BOOL:
+                    thisFieldRaw   = thisFieldArray.tolist()
+                    if    thisFieldRaw==[0x00]:
+                        thisFieldValue = False
+                    elif  thisFieldRaw==[0x01]:
+                        thisFieldValue = True
+                    else:
+                        raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
+                                           "field="+fieldDef.name+" value="+str(thisFieldRaw))
+                
+                elif fieldDef.format==ApiDefinition.FieldFormats.INT:
+                    if len(thisFieldArray) in _INT_FORMATS:
+                        (thisFieldValue,) = _INT_FORMATS[len(thisFieldArray)].unpack_from(thisFieldArray)
+                    else:
+                        thisFieldValue = 0
+                        for byte in thisFieldArray.tolist():
+                            thisFieldValue = (thisFieldValue<<8) | byte
+                
+                elif fieldDef.format==ApiDefinition.FieldFormats.INTS:
+                    if len(thisFieldArray) in _INTS_FORMATS:
+                        (thisFieldValue,) = _INTS_FORMATS[len(thisFieldArray)].unpack_from(thisFieldArray)
+                    else:
+                        raise SystemError('field with format='+fieldDef.format+' and length='+str(fieldDef.length)+' unsupported.')
+                
+                elif fieldDef.format==ApiDefinition.FieldFormats.HEXDATA:
+                    thisFieldValue = thisFieldArray.tolist()
+                    if hexAsTuple:
+                        thisFieldValue = tuple(thisFieldValue)
+                
+                else:
+                    raise SystemError('unknown field format='+fieldDef.format)
+                
+                # make sure thisFieldValue in fieldDef.options
+                if fieldDef.options.validOptions:
+                    if thisFieldValue not in fieldDef.options.validOptions:
+                        raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
+                                           "field="+fieldDef.name+" value="+str(thisFieldValue))
+            
+            if fieldDef.name in ApiDefinition.ApiDefinition.RESERVED:
+                # the subcommand specifier cannot be missing
+                if thisFieldValue==None:
+                    raise CommandError(
+                        CommandError.TOO_FEW_BYTES,
+                        "reserved field missing {0}".format(fieldDef.name),
+                    )
+                idNextCommand = thisFieldValue
+            else:
+                returnFields[fieldDef.name] = thisFieldValue
+            
+            # stop if not RC_OK
+            if  (
+                    (ApiDefinition.ApiDefinition.RC in returnFields) and
+                    (
+                        returnFields[ApiDefinition.ApiDefinition.RC]!= \
+                            ApiDefinition.ApiDefinition.RC_OK
+                    )
+               ):
+               notRcOk = True
+               break
+        
+        return (index,notRcOk,idNextCommand)
@@ -0,0 +1,190 @@
+#!/usr/bin/python
+
+'''
+Process-wide instances of the API definitions, built on first use.
+
+The API definition modules hold thousands of lines of tables. The connectors
+get their definition through getDefinition(), so a module is only imported
+when a connector which needs it is first created, and all the connectors of
+a process share a single instance, and so its lookup tables and compiled
+codecs.
+
+When the directory of the modules cannot be written to (read-only install),
+Python cannot keep their .pyc files, and compiles them on every import.
+setCacheDir() (or the SMARTMESHSDK_CACHE_DIR environment variable) points to
+a directory where the compiled modules are then kept, marshalled. A cached
+module is recompiled when its source file or the Python version changes.
+'''
+
+import imp
+import marshal
+import os
+import sys
+import threading
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('DefinitionLoader')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+#============================ defines =========================================
+
+DEFINITIONS      = [
+    'IpMgrDefinition',
+    'IpMoteDefinition',
+    'HartMgrDefinition',
+    'HartMoteDefinition',
+]
+
+CACHE_DIR_ENV    = 'SMARTMESHSDK_CACHE_DIR'
+CACHE_EXTENSION  = '.defcache'
+
+_PACKAGE         = __name__.rpartition('.')[0]
+_SOURCE_DIR      = os.path.dirname(os.path.abspath(__file__))
+
+#============================ variables =======================================
+
+_lock            = threading.RLock()
+_instances       = {}   # {name: instance}
+_cacheDir        = os.environ.get(CACHE_DIR_ENV) or None
+
+#============================ public ==========================================
+
+def setCacheDir(cacheDir):
+    '''
+    \brief Set the directory where the compiled definition modules are kept.
+
+    \param cacheDir The directory, created if needed, or None to not use a
+                    cache.
+    '''
+    global _cacheDir
+    with _lock:
+        _cacheDir = cacheDir
+
+def getCacheDir():
+    '''
+    \brief Get the directory where the compiled definition modules are kept,
+           None if there is none.
+    '''
+    return _cacheDir
+
+def getDefinition(name):
+    '''
+    \brief Get the process-wide instance of an API definition.
+
+    The instance is created, and its module loaded, on first use.
+
+    \param name The name of the API definition, one of DEFINITIONS.
+
+    \returns The instance of the API definition class.
+    '''
+    try:
+        return _instances[name]
+    except KeyError:
+        pass
+    with _lock:
+        if name not in _instances:
+            module = loadModule(name)
+            _instances[name] = getattr(module,name)()
+        return _instances[name]
+
+def loadModule(name):
+    '''
+    \brief Load the module of an API definition, from the cache if there is
+           one.
+
+    \param name The name of the API definition, one of DEFINITIONS.
+
+    \returns The module.
+    '''
+    if name not in DEFINITIONS:
+        raise ValueError('unknown API definition {0}'.format(name))
+
+    fullName = _getFullName(name)
+    with _lock:
+        if fullName in sys.modules:
+            return sys.modules[fullName]
+
+        sourcePath = os.path.join(_SOURCE_DIR,name+'.py')
+        if not (_cacheDir and os.path.isfile(sourcePath)):
+            # regular import, using the .pyc files if any
+            __import__(fullName)
+            return sys.modules[fullName]
+
+        code = _readCache(name,sourcePath)
+        if code is None:
+            with open(sourcePath,'rU') as f:
+                code = compile(f.read(),sourcePath,'exec')
+            _writeCache(name,sourcePath,code)
+
+        module              = imp.new_module(fullName)
+        module.__file__     = sourcePath
+        module.__package__  = _PACKAGE or None
+        sys.modules[fullName] = module
+        try:
+            exec code in module.__dict__
+        except:
+            del sys.modules[fullName]
+            raise
+        if _PACKAGE:
+            setattr(sys.modules[_PACKAGE],name,module)
+        return module
+
+#============================ private =========================================
+
+def _getFullName(name):
+    if _PACKAGE:
+        return _PACKAGE+'.'+name
+    return name
+
+def _getCachePath(name):
+    return os.path.join(_cacheDir,name+CACHE_EXTENSION)
+
+def _getSourceStamp(sourcePath):
+    stat = os.stat(sourcePath)
+    return (imp.get_magic(),int(stat.st_mtime),stat.st_size)
+
+def _readCache(name,sourcePath):
+    '''
+    \brief Read the compiled module from the cache.
+
+    \returns The code object, None if it is not cached or out of date.
+    '''
+    try:
+        with open(_getCachePath(name),'rb') as f:
+            (stamp,code) = marshal.load(f)
+    except (IOError,EOFError,ValueError,TypeError) as err:
+        log.debug('no cached {0}: {1}'.format(name,err))
+        return None
+    if tuple(stamp)!=_getSourceStamp(sourcePath):
+        log.debug('cached {0} is out of date'.format(name))
+        return None
+    return code
+
+def _writeCache(name,sourcePath,code):
+    '''
+    \brief Write the compiled module to the cache.
+
+    Failing to do so is logged and otherwise ignored: the module is then
+    compiled again next time.
+    '''
+    cachePath = _getCachePath(name)
+    tempPath  = '{0}.{1}.tmp'.format(cachePath,os.getpid())
+    try:
+        if not os.path.isdir(_cacheDir):
+            os.makedirs(_cacheDir)
+        with open(tempPath,'wb') as f:
+            marshal.dump((_getSourceStamp(sourcePath),code),f)
+        # write then rename, so other processes never read a partial file
+        if os.name=='nt' and os.path.exists(cachePath):
+            os.remove(cachePath)
+        os.rename(tempPath,cachePath)
+    except (IOError,OSError) as err:
+        log.warning('could not cache {0}: {1}'.format(name,err))
+        try:
+            os.remove(tempPath)
+        except OSError:
+            pass
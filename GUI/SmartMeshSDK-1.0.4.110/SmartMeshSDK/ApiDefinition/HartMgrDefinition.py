@@ -4,6 +4,7 @@ import ApiDefinition
 
 import xmlutils
 import re
+import binascii
 
 # Add a log handler for the HART Manager
 
@@ -16,6 +17,21 @@ log = logging.getLogger('HartManager')
 log.setLevel(logging.INFO)
 log.addHandler(NullHandler())
 
+# converters from the text of an XML element to the value of a field
+
+def _parse_bool(str_value):
+    return str_value.lower() == 'true'
+
+def _parse_hexdata(str_value):
+    try:
+        return list(bytearray(binascii.unhexlify(str_value)))
+    except TypeError:
+        # odd number of digits, or whitespace
+        return [int(str_value[i:i+2], 16) for i in range(0, len(str_value), 2)]
+
+def _parse_string(str_value):
+    return str_value
+
 ##
 # \ingroup ApiDefinition
 #
@@ -29,6 +45,8 @@ class HartMgrDefinition(ApiDefinition.ApiDefinition):
     '''
 
     FIELDS = 'unnamed'
+
+    _fieldParsers = None    # {Field tuple: {name: (Field, converter)}}, see _getFieldParsers()
     
     STRING    = ApiDefinition.FieldFormats.STRING
     BOOL      = ApiDefinition.FieldFormats.BOOL
@@ -639,9 +657,9 @@ class HartMgrDefinition(ApiDefinition.ApiDefinition):
 
     # Notification parsing
 
-    def parse_dataNotif(self, notif_str, notif_fields):
-        data_dict = self._parse_xmlobj(notif_str, 'data', notif_fields)
-        log.debug('DATA: %s' % str(data_dict))
+    def parse_dataNotif(self, notif_obj, notif_fields):
+        data_dict = self._xml_parse_fieldset(notif_obj, notif_fields)
+        log.debug('DATA: %s', data_dict)
         # reconvert payload type as a hex value
         data_dict['payloadType'] = int(str(data_dict['payloadType']), 16)
         # set default values for any fields that aren't present
@@ -654,9 +672,8 @@ class HartMgrDefinition(ApiDefinition.ApiDefinition):
                 data_dict[f] = v
         return (['data'], data_dict)
 
-    def parse_eventNotif(self, notif_str, notif_fields):
-        obj_dict = self._parse_xmlobj(notif_str, 'event', None)
-        log.debug('EVENT: %s' % str(obj_dict))
+    def parse_eventNotif(self, obj_dict, notif_fields):
+        log.debug('EVENT: %s', obj_dict)
         
         event_name = ['event']
         event_dict = {}
@@ -667,18 +684,30 @@ class HartMgrDefinition(ApiDefinition.ApiDefinition):
                 event_dict.update(self._xml_parse_fieldset(val, subevent_fields))
             else:
                 # we assume that all event fields are defined
-                field = [f for f in notif_fields if f.name == event_attr][0]
-                event_dict[event_attr] = self._xml_parse_field(val, field)
+                (field, convert) = self._getFieldParsers(notif_fields)[event_attr]
+                event_dict[event_attr] = convert(val)
         return (event_name, event_dict)
 
     def parse_notif(self, notif_name, notif_str):
+        notif_obj = self._parse_xmlobj(notif_str, notif_name[0], None)
+        return self.parse_notif_obj(notif_name, notif_obj)
+
+    def parse_notif_obj(self, notif_name, notif_obj):
+        '''\brief Parse a notification already read into a dict of strings
+
+        \param notif_name The notification name, e.g. ['data'].
+        \param notif_obj  The dict of its child elements, as built by
+                          xmlutils.element_to_dict (or NotifReader.NotifParser).
+
+        \returns A tuple of the notification name and its parsed fields.
+        '''
         notif_metadata = self.getDefinition(self.NOTIFICATION, notif_name)
         notif_fields = self.getResponseFields(self.NOTIFICATION, notif_name)
         if notif_metadata.has_key('deserializer'):
             deserialize_func = getattr(self, notif_metadata['deserializer'])
-            notif_name, notif_dict = deserialize_func(notif_str, notif_fields)
+            notif_name, notif_dict = deserialize_func(notif_obj, notif_fields)
         else:
-            notif_dict = self._parse_xmlobj(notif_str, notif_name[0], notif_fields)
+            notif_dict = self._xml_parse_fieldset(notif_obj, notif_fields)
         return (notif_name, notif_dict)
     
     # XML-RPC Serializer
@@ -703,44 +732,79 @@ class HartMgrDefinition(ApiDefinition.ApiDefinition):
 
     # XML-RPC Deserializer
 
-    def _xml_parse_field(self, str_value, field_metadata):
+    def _field_converter(self, field_metadata):
         if field_metadata.format in [self.INT, self.INTS]:
-            return int(str_value)
+            return int
         elif field_metadata.format == self.FLOAT:
-            return float(str_value)
+            return float
         elif field_metadata.format == self.BOOL:
-            if str_value.lower() == 'true':
-                return True
-            else:
-                return False
+            return _parse_bool
         elif field_metadata.format == self.HEXDATA:
-            returnVal = [int(str_value[i:i+2], 16) for i in range(0, len(str_value), 2)]
-            return returnVal
+            return _parse_hexdata
         else: 
-            return str_value
+            return _parse_string
+
+    def _getFieldParsers(self, fields_metadata):
+        '''\brief Returns the fields of a response by name, with the converter
+               of each, built on first use.
+        '''
+        if self._fieldParsers is None:
+            self._fieldParsers = {}
+        fields_metadata = tuple(fields_metadata)
+        try:
+            return self._fieldParsers[fields_metadata]
+        except KeyError:
+            pass
+        parsers = {}
+        for field in fields_metadata:
+            parsers.setdefault(field.name, (field, self._field_converter(field)))
+        self._fieldParsers[fields_metadata] = parsers
+        return parsers
+
+    def _xml_parse_field(self, str_value, field_metadata):
+        return self._field_converter(field_metadata)(str_value)
 
     def _xml_parse_fieldset(self, obj_dict, fields_metadata):
         'Filter and parse fields in obj_dict'
         filtered_dict = {}
-        for field in fields_metadata:
+        for name, (field, convert) in self._getFieldParsers(fields_metadata).iteritems():
             try:
-                field_str = obj_dict[field.name]
-                filtered_dict[field.name] = self._xml_parse_field(field_str, field)
+                field_str = obj_dict[name]
             except KeyError:
                 # some fields are not always present (especially in Statistics)
-                filtered_dict[field.name] = ''
+                filtered_dict[name] = ''
+            else:
+                filtered_dict[name] = convert(field_str)
+        return filtered_dict
+
+    def _xml_parse_element(self, element, fields_metadata):
+        'Parse the fields of an ElementTree element, in a single pass'
+        parsers = self._getFieldParsers(fields_metadata)
+        filtered_dict = {}
+        for ch_node in element:
+            name = ch_node.tag
+            if name in parsers and not (ch_node.attrib or name in filtered_dict or len(ch_node)):
+                filtered_dict[name] = parsers[name][1](ch_node.text or '')
+            elif name in parsers or ch_node.attrib:
+                # attributes, repeated fields or fields with child elements,
+                # parsed as xmlutils.element_to_dict does
+                return self._xml_parse_fieldset(xmlutils.element_to_dict(element), fields_metadata)
+        if len(filtered_dict) != len(parsers):
+            # some fields are not always present (especially in Statistics)
+            for name in parsers:
+                filtered_dict.setdefault(name, '')
         return filtered_dict
 
     def _parse_xmlobj(self, xml_doc, base_element, fields_metadata, isArray = False):
         log.debug('Parsing XML: %s %s', base_element, xml_doc)
-        aFull_resp = xmlutils.parse_xml_obj(xml_doc, base_element, fields_metadata)
+        xml_root = xmlutils.parse_xml(xml_doc)
         aRes = []
-        for full_resp in aFull_resp : 
+        for element in xml_root.iter(base_element):
             if fields_metadata:
                 # parse each field listed in the fields_metadata
-                res = self._xml_parse_fieldset(full_resp, fields_metadata)
+                res = self._xml_parse_element(element, fields_metadata)
             else:
-                res = full_resp
+                res = xmlutils.element_to_dict(element)
             if not isArray :
                 return res
             aRes.append(res)
@@ -753,11 +817,12 @@ class HartMgrDefinition(ApiDefinition.ApiDefinition):
         if cmd_metadata['response'].has_key(self.FIELDS):
             # unnamed fields are processed in order
             # note: special case the single return value
+            parsers = self._getFieldParsers(resp_fields)
             if len(resp_fields) is 1:
-                resp[resp_fields[0].name] = self._xml_parse_field(xmlrpc_resp, resp_fields[0])
+                resp[resp_fields[0].name] = parsers[resp_fields[0].name][1](xmlrpc_resp)
             else:
                 for i, field in enumerate(resp_fields):
-                    resp[field.name] = self._xml_parse_field(xmlrpc_resp[i], field)
+                    resp[field.name] = parsers[field.name][1](xmlrpc_resp[i])
 
         elif cmd_metadata['id'] in ['getConfig', 'setConfig'] :
             # default getConfig parser
@@ -865,7 +930,6 @@ class HartMgrDefinition(ApiDefinition.ApiDefinition):
     # (must be defined ahead of commands)
 
     def deserialize_getStats(self, cmd_metadata, xmlrpc_resp):
-        net_stats = {}
         fields = self.getResponseFields(self.COMMAND, [cmd_metadata['name']])
         # parse the Statistics element
         resp_dict = self._parse_xmlobj(xmlrpc_resp, 'Statistics', None)
@@ -883,13 +947,8 @@ class HartMgrDefinition(ApiDefinition.ApiDefinition):
         if type(stat_dict) != dict:
             stat_dict = {}
         # fill in the statistics fields
-        for field in fields:
-            try:
-                field_str = stat_dict[field.name]
-                net_stats[field.name] = self._xml_parse_field(field_str, field)
-            except KeyError:
-                # some fields are not always present (especially in Statistics)
-                net_stats[field.name] = ''  # default value
+        # (some fields are not always present, they default to '')
+        net_stats = self._xml_parse_fieldset(stat_dict, fields)
         return net_stats
 
     def deserialize_getSourceRoute(self, cmd_metadata, xmlrpc_resp):
@@ -1,6 +1,9 @@
 """XML utility functions"""
 
-from xml.dom.minidom import parseString
+try:
+    import xml.etree.cElementTree as ElementTree
+except ImportError:
+    import xml.etree.ElementTree as ElementTree
 
 
 def xml_obj_to_dict(xml_obj):
@@ -45,17 +48,39 @@ def xml_obj_to_dict(xml_obj):
     return attrs
 
 
+def element_to_dict(element):
+    """Same as xml_obj_to_dict, for an ElementTree element"""
+    attrs = {}
+    for ch_node in element:
+        n = ch_node.tag
+        # the value is a dict of the child elements, if any, or the text
+        if len(ch_node):
+            v = element_to_dict(ch_node)
+        else:
+            v = ch_node.text or ''
+        # create a list of values if the child name already exists
+        if n in attrs:
+            if not type(attrs[n]) is list:
+                attrs[n] = [attrs[n]]
+            attrs[n].append(v)
+        else:
+            attrs[n] = v
+        for name, val in ch_node.attrib.items():
+            attrs[n + name.capitalize()] = val
+    return attrs
+
+
+def parse_xml(xml_str):
+    """Parse an XML document into an ElementTree element"""
+    if isinstance(xml_str, unicode):
+        xml_str = xml_str.encode('utf-8')
+    return ElementTree.fromstring(xml_str)
+
+
 def parse_xml_obj(xml_str, base_element, fields = None):
-    xml_doc = parseString(xml_str)
-    obj_docs = xml_doc.getElementsByTagName(base_element)
+    xml_doc = parse_xml(xml_str)
     # parse each found object into a dict of fields
-    obj_dicts = []
-    for obj_doc in obj_docs:
-        obj_dicts.append(xml_obj_to_dict(obj_doc))
-        if fields:
-            # TODO: filter dict for requested fields
-            pass
-    return obj_dicts
+    return [element_to_dict(obj_doc) for obj_doc in xml_doc.iter(base_element)]
 
 def _dict_to_xml(inpDict, outList) :
     for k in inpDict :
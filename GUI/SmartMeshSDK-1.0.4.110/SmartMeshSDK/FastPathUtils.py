@@ -0,0 +1,45 @@
+'''
+Helpers of the fast paths GenApiConnectors generates for each dn_*() method.
+
+A fast path serializes the request and parses the response of a command with
+a precompiled struct format. It only handles the values it can convert
+exactly as the generic ApiDefinition serializer/deserializer would; for
+anything else, it returns None and the generic path is used.
+'''
+
+import binascii
+
+_SEQUENCE_TYPES = (list,tuple)
+
+def toBytes(val,length):
+    '''
+    \brief Convert the value of a HEXDATA request field into a string.
+
+    \param val    The value passed to the dn_*() method, a list or tuple of
+                  ints.
+    \param length The length of the field, None if it is of variable length.
+
+    \returns The string, padded in front to length bytes, or None if val is
+             not a valid value for the field.
+    '''
+    if type(val) not in _SEQUENCE_TYPES:
+        return None
+    if length and len(val)>length:
+        return None
+    for i in val:
+        if type(i) is not int:
+            return None
+    try:
+        returnVal = str(bytearray(val))
+    except ValueError:
+        return None
+    if length:
+        returnVal = returnVal.rjust(length,'\x00')
+    return returnVal
+
+def toInt(val):
+    '''
+    \brief Convert the big-endian string unpacked for an INT response field
+           into an int, for the lengths struct has no format for.
+    '''
+    return int(binascii.hexlify(val),16)
@@ -1,507 +1,1027 @@
-#============================ adjust path =====================================
-
-import sys
-import os
-if __name__ == "__main__":
-    here = sys.path[0]
-    sys.path.insert(0, os.path.join(here, '..'))
-
-#============================ imports =========================================
-
-from   SmartMeshSDK import ApiException
-from   SmartMeshSDK.ApiDefinition.IpMgrDefinition    import IpMgrDefinition
-from   SmartMeshSDK.ApiDefinition.IpMoteDefinition   import IpMoteDefinition
-from   SmartMeshSDK.ApiDefinition.HartMgrDefinition  import HartMgrDefinition
-from   SmartMeshSDK.ApiDefinition.HartMoteDefinition import HartMoteDefinition
-
-#============================ templates =======================================
-
-TMPL_CLASSDEF = '''\'\'\'
-This module was generated automatically. Do not edit directly.
-\'\'\'
-
-import collections
-from   SmartMeshSDK import ApiException
-from   {MODULE_NAME} import {BASE_CLASS_NAME}
-
-##
-# \\addtogroup {GEN_CLASS_NAME}
-# \\{{
-# 
-
-class {GEN_CLASS_NAME}({BASE_CLASS_NAME}):
-    \'\'\'
-    \\brief {BRIEF_DESCRIPTION}
-    \'\'\'
-'''
-
-TMPL_DEF = '''
-    ##
-    # The named tuple returned by the {CMD_NAME}() function.
-    # 
-{TUPLE_COMMENT}
-    # 
-    Tuple_{CMD_NAME} = collections.namedtuple("Tuple_{CMD_NAME}", {TUPLE_PARAMS})
-
-    ##
-    # {DESCR}
-    # 
-{CMD_COMMENT}
-    # 
-    # \\returns The response to the command, formatted as a #Tuple_{CMD_NAME} named tuple.
-    # 
-    def {CMD_NAME}(self, {CMD_PARMS}) :
-        res = {BASE_CLASS_NAME}.send(self, {NAMES}, {{{PARAMS_DICT}}})
-        return {CLASS_NAME}.Tuple_{CMD_NAME}(**res)
-''' 
-
-TMPL_DEF_LIST = '''
-    ##
-    # The named tuple returned by the {CMD_NAME}() function.
-    # 
-{TUPLE_COMMENT}
-    # 
-    Tuple_{CMD_NAME} = collections.namedtuple("Tuple_{CMD_NAME}", {TUPLE_PARAMS})
-
-    ##
-    # {DESCR}
-    # 
-{CMD_COMMENT}
-    # 
-    # \\returns The response to the command, formatted as a list of #Tuple_{CMD_NAME} named tuple.
-    # 
-    def {CMD_NAME}(self, {CMD_PARMS}) :
-        res = {BASE_CLASS_NAME}.send(self, {NAMES}, {{{PARAMS_DICT}}})
-        tupleList = []
-        for r in res :
-            tupleList.append({CLASS_NAME}.Tuple_{CMD_NAME}(**r))
-        return tupleList
-'''
- 
-TMPL_DEF_NOTUPLE = '''
-    ##
-    # {DESCR}
-    # 
-{CMD_COMMENT}
-    # 
-    # \\returns The response to the command.
-    # 
-    def {CMD_NAME}(self, {CMD_PARMS}) :
-        res = {BASE_CLASS_NAME}.send(self, {NAMES}, {{{PARAMS_DICT}}})
-        return res
-''' 
-
-TMPL_NOTIF = '''
-    ##
-    # \\brief {NOTIF_NAME_UP} notification.
-    # 
-    # {DESCR}
-    #
-{NOTIF_COMMENT}    
-    # 
-    {NOTIF_NAME_UP} = "{NOTIF_NAME}"
-    notifTupleTable[{NOTIF_NAME_UP}] = Tuple_{NOTIF_NAME} = collections.namedtuple("Tuple_{NOTIF_NAME}", {NOTIF_PARAMS})
-'''
-
-TMPL_NOTIF_NOTUPLE = '''
-    ##
-    # \\brief Notification {NOTIF_NAME_UP} 
-    # 
-    # {DESCR}
-    #        
-    {NOTIF_NAME_UP} = "{NOTIF_NAME}"
-    notifTupleTable[{NOTIF_NAME_UP}] = None
-'''
-
-TMPL_GETNOTIFICATION = '''
-    ##
-    # \\brief Get a notification from the notification queue, and returns
-    #        it properly formatted.
-    #
-    # \\exception NotificationError if unknown notification.
-    # 
-    def getNotification(self, timeoutSec=-1) :
-        temp = self.getNotificationInternal(timeoutSec)
-        if not temp:
-            return temp
-        (ids, param) = temp
-        try :
-            if  {CLASS_NAME}.notifTupleTable[ids[-1]] :
-                return (ids[-1], {CLASS_NAME}.notifTupleTable[ids[-1]](**param))
-            else :
-                return (ids[-1], None)
-        except KeyError :
-            raise ApiException.NotificationError(ids, param)
-'''
-
-START_LOCATION_COMMENT = '''
-    # \param numFrames 1-byte field formatted as an integer.<br/>
-    #     There is no restriction on the value of this field.
-    # \param mobileMote 8-byte field formatted as hex.<br/>
-    #     There is no restriction on the value of this field.
-    # \param fixedMotes list of 8-byte fields formatted as hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-'''
-
-START_LOCATION_PAYLOAD = '''
-        payload = []
-        for fm in fixedMotes :
-            payload += fm
-        res = {BASE_CLASS_NAME}.send(self, ['startLocation'], {{"numFrames" : numFrames, "mobileMote" : mobileMote, "fixedMotes" : payload}})
-'''
-
-TMPL_ENDCLASSDEF = '''
-##
-# end of {GEN_CLASS_NAME}
-# \\}}
-# 
-'''
-
-def printStartLocation(names, respFieldsName, reqFieldsName, 
-                       CMD_NAME, CMD_PARMS, DESCR, 
-                       TUPLE_PARAMS, NAMES, PARAMS_DICT, 
-                       BASE_CLASS_NAME, CLASS_NAME,
-                       TUPLE_COMMENT, CMD_COMMENT) :
-    s = TMPL_DEF.format(CMD_NAME = CMD_NAME, CMD_PARMS = CMD_PARMS, DESCR = DESCR, 
-                       TUPLE_PARAMS = TUPLE_PARAMS, NAMES = NAMES, PARAMS_DICT = PARAMS_DICT, 
-                       BASE_CLASS_NAME = BASE_CLASS_NAME, CLASS_NAME = CLASS_NAME,
-                       TUPLE_COMMENT = TUPLE_COMMENT, CMD_COMMENT = '***')
-    lines = s.split('\n')
-    res = []
-    for l in lines :
-        if l == '***' :
-            res += [START_LOCATION_COMMENT[1:]]
-        elif l.find('send(self') >= 0:
-            res += [START_LOCATION_PAYLOAD[1:].format(BASE_CLASS_NAME=BASE_CLASS_NAME)]
-        else :
-            res += [l + '\n']
-    return ''.join(res)
-
-RADIOTEST_TX_COMMENT = '''
-    # \param type 1-byte field formatted as an integer.<br/>
-    #     Type of transmission test: 0=packet, 1=continuous modulation (CM), 2=continuous wave (CW)
-    # \param mask 2-bytes field formatted as an integer.<br/>
-    #     Mask of channels(0-15) enabled for test.
-    # \param txPower 1-byte field formatted as an sign integer.<br/>
-    #     Transmit power, in dB. Valid values are 0 (power amplifier off) and 8 (power amplifier on).
-    # \param numRepeats 2-byte field formatted as an integer.<br/>
-    #     Number of times to repeat the packet sequence (0=do not stop). Applies only to packet transmission tests.
-    # \param tests list of pair of integer.<br/>
-    #     Sequence definitions (up to 10) specifies the length (bytes) and after-packet delay (usec) for each packets
-'''
-
-RADIOTEST_TX_PAYLOAD = '''
-        d = {{"type" : type, "mask" : mask, "numRepeats" : numRepeats, "txPower" : txPower, "numPackets" : len(tests)}}
-        for i in xrange(10) :
-            if i < len(tests) :
-                l, g = tests[i]
-            else :
-                l, g = (0, 0)
-            d["pkSize" + str(i+1)] = l
-            d["gap" + str(i+1)]    = g
-        res = {BASE_CLASS_NAME}.send(self, ['radiotestTx'], d)
-'''
-    
-def printRsadioTestTx(names, respFieldsName, reqFieldsName, 
-                       CMD_NAME, CMD_PARMS, DESCR, 
-                       TUPLE_PARAMS, NAMES, PARAMS_DICT, 
-                       BASE_CLASS_NAME, CLASS_NAME,
-                       TUPLE_COMMENT, CMD_COMMENT) :
-    s = TMPL_DEF.format(CMD_NAME = CMD_NAME, CMD_PARMS = CMD_PARMS, DESCR = DESCR, 
-                       TUPLE_PARAMS = TUPLE_PARAMS, NAMES = NAMES, PARAMS_DICT = PARAMS_DICT, 
-                       BASE_CLASS_NAME = BASE_CLASS_NAME, CLASS_NAME = CLASS_NAME,
-                       TUPLE_COMMENT = TUPLE_COMMENT, CMD_COMMENT = '***')
-    lines = s.split('\n')
-    res = []
-    for l in lines :
-        if l == '***' :
-            res += [RADIOTEST_TX_COMMENT[1:]]
-        elif l.find('def dn_radioTestTx') >= 0 :
-            res += '    def dn_radioTestTx(self, type, mask, txPower, numRepeats, tests) :\n'
-        elif l.find('send(self') >= 0:
-            res += [RADIOTEST_TX_PAYLOAD[1:].format(BASE_CLASS_NAME=BASE_CLASS_NAME)]
-        else :
-            res += [l + '\n']
-    return ''.join(res)
-    
-'''
-Dictionary of commands with special processing:
-    {'cmdName' : [requestFields, responseFields, generator]}
-    
-    def generator(names, respFieldsName, reqFieldsName, 
-                  CMD_NAME, CMD_PARMS, DESCR, TUPLE_PARAMS, NAMES, PARAMS_DICT, 
-                  BASE_CLASS_NAME, CLASS_NAME, TUPLE_COMMENT, CMD_COMMENT) :
-        return strings
-'''
-
-specialCmd = {
-    'dn_startLocation' : [
-        ['numFrames', 'mobileMote', 'fixedMotes'],
-        ['RC', 'callbackId'],
-        printStartLocation
-    ],
-
-    'dn_radioTestTx' : [
-        ['type', 'mask', 'numRepeats', 'txPower', 'numPackets',
-         'pkSize1', 'gap1', 'pkSize2', 'gap2', 'pkSize3', 'gap3', 'pkSize4', 'gap4', 'pkSize5', 'gap5', 
-         'pkSize6', 'gap6', 'pkSize7', 'gap7', 'pkSize8', 'gap8', 'pkSize9', 'gap9', 'pkSize10', 'gap10'],
-        ['RC'],
-        printRsadioTestTx
-    ]   
-}       
-        
-class GenApiConnectors(object):
-        
-    #======================== public ==========================================
-    
-    def __init__(self, apiDefName, myClassName, baseClassName, baseModuleName, outputFileName = None, briefDescription = '', apiDefClass=None):
-        if apiDefName:
-            apiDefClass = globals()[apiDefName]
-        self.apiDef           = apiDefClass() 
-        self.myClassName      = myClassName
-        self.baseClassName    = baseClassName 
-        self.baseModuleName   = baseModuleName
-        self.briefDescription = briefDescription
-        if outputFileName:
-            self.outFile = open(outputFileName, "wt")
-        else:
-            self.outFile = sys.stdout
-            
-    def gen(self):
-        s = TMPL_CLASSDEF.format(MODULE_NAME       = self.baseModuleName,
-                                 BASE_CLASS_NAME   = self.baseClassName, 
-                                 GEN_CLASS_NAME    = self.myClassName,
-                                 BRIEF_DESCRIPTION = self.briefDescription)
-        self.outFile.write(s)
-        self.outFile.write('\n    #======================== commands ========================================\n')
-        self.genCmd()
-        self.outFile.write('\n    #======================== notifications ===================================\n')
-        self.genNotif()
-        s = TMPL_ENDCLASSDEF.format(GEN_CLASS_NAME    = self.myClassName)
-        self.outFile.write(s)
-        self.genFinish()
-        
-    #======================== private =========================================
-    
-    #===== commands
-    
-    def genCmd(self):
-        cmdNames = self.apiDef.getNames(self.apiDef.COMMAND)
-        for name in cmdNames :
-            self.genOneCmd([name], [], [])
-    
-    def genOneCmd(self, names, respFieldsName, reqFieldsName):
-        
-        # get request fields
-        r = self.apiDef.getRequestFieldNames(names)
-        reqFieldsName += [n for n in r if n not in self.apiDef.RESERVED]
-        
-        # get response fields
-        try:
-            r = self.apiDef.getResponseFieldNames(self.apiDef.COMMAND, names) 
-            respFieldsName += [n for n in r if n not in self.apiDef.RESERVED]
-        except ApiException.CommandError :
-            # means that this function has no response fields, which is OK
-            pass
-        
-        if self.apiDef.hasSubcommands(self.apiDef.COMMAND, names):
-            subcmdsName = self.apiDef.getNames(self.apiDef.COMMAND, names)
-            for sn in subcmdsName :
-                self.genOneCmd(names+[sn], respFieldsName[:], reqFieldsName[:])
-        else:
-            cmdName     = 'dn_'
-            cmdName    += '_'.join([n for n in names])
-            cmdParams   = ', '.join([p for p in reqFieldsName])
-            paramsDict  = ', '.join(['"{0}" : {1}'.format(p, p) for p in reqFieldsName])
-            descr       = self.apiDef.getDescription(self.apiDef.COMMAND, names).replace('\n', '\n    # ')
-            cmdComment  = ''.join([self.getCmdComments(names, p) for p in reqFieldsName])[:-1]
-            if not cmdComment:
-                cmdComment = '    # '
-            tupleComment = ''.join([self.getCmdTupleComments(names, p) for p in respFieldsName])[:-1]
-            
-            if cmdName in specialCmd and specialCmd[cmdName][0] == reqFieldsName and specialCmd[cmdName][1] == respFieldsName :
-                s = specialCmd[cmdName][2](names, respFieldsName, reqFieldsName, 
-                                           CMD_NAME             = cmdName,
-                                           CMD_PARMS            = cmdParams,
-                                           DESCR                = descr, 
-                                           TUPLE_PARAMS         = respFieldsName,
-                                           NAMES                = names,
-                                           PARAMS_DICT          = paramsDict, 
-                                           BASE_CLASS_NAME      = self.baseClassName,
-                                           CLASS_NAME           = self.myClassName,
-                                           TUPLE_COMMENT        = tupleComment,
-                                           CMD_COMMENT          = cmdComment)
-            else :
-                if respFieldsName :
-                    cmd_metadata = self.apiDef.getDefinition(self.apiDef.COMMAND, names)
-                    if ('isResponseArray' in cmd_metadata) :
-                        s = TMPL_DEF_LIST.format(CMD_NAME                = cmdName,
-                                            CMD_PARMS               = cmdParams,
-                                            DESCR                   = descr, 
-                                            TUPLE_PARAMS            = respFieldsName,
-                                            NAMES                   = names,
-                                            PARAMS_DICT             = paramsDict, 
-                                            BASE_CLASS_NAME         = self.baseClassName,
-                                            CLASS_NAME              = self.myClassName,
-                                            TUPLE_COMMENT           = tupleComment,
-                                            CMD_COMMENT             = cmdComment)
-                    else :
-                        s = TMPL_DEF.format(CMD_NAME                = cmdName,
-                                            CMD_PARMS               = cmdParams,
-                                            DESCR                   = descr, 
-                                            TUPLE_PARAMS            = respFieldsName,
-                                            NAMES                   = names,
-                                            PARAMS_DICT             = paramsDict, 
-                                            BASE_CLASS_NAME         = self.baseClassName,
-                                            CLASS_NAME              = self.myClassName,
-                                            TUPLE_COMMENT           = tupleComment,
-                                            CMD_COMMENT             = cmdComment)
-                else :
-                    s = TMPL_DEF_NOTUPLE.format(CMD_NAME        = cmdName,
-                                                CMD_PARMS       = cmdParams,
-                                                DESCR           = descr, 
-                                                NAMES           = names,
-                                                PARAMS_DICT     = paramsDict, 
-                                                BASE_CLASS_NAME = self.baseClassName,
-                                                CMD_COMMENT     = cmdComment)
-            self.outFile.write(s)
-    
-    #===== notifications
-    
-    def genNotif(self):
-        # write header
-        output  = []
-        output += ['    \n']
-        output += ['    ##\n']
-        output += ['    # Dictionary of all notification tuples.\n']
-        output += ['    #\n']
-        output += ['    notifTupleTable = {}\n']
-        output += ['    ']
-        self.outFile.write(''.join(output))
-        
-        # generate all notifications
-        notifIds = self.apiDef.getIds(self.apiDef.NOTIFICATION)
-        for notifId in notifIds :
-            notifName = self.apiDef.idToName(self.apiDef.NOTIFICATION, notifId)
-            self.genOneNotif([notifName], [])
-        s = TMPL_GETNOTIFICATION.format(BASE_CLASS_NAME=self.baseClassName,
-                                        CLASS_NAME=self.myClassName)
-        self.outFile.write(s)
-        
-    def genOneNotif(self, names, fieldNames) :
-        try :
-            f = self.apiDef.getResponseFieldNames(self.apiDef.NOTIFICATION, names)
-            if not f :
-                raise KeyError
-            fieldNames += [n for n in f if n not in self.apiDef.RESERVED]
-        except (NameError, KeyError, ApiException.CommandError) :
-            pass
-        
-        try :
-            subcmdsName = self.apiDef.getNames(self.apiDef.NOTIFICATION, names)
-            for sn in subcmdsName :
-                self.genOneNotif(names + [sn], fieldNames[:])
-        except ApiException.CommandError :
-            notifName = names[-1]
-            descr = self.apiDef.getDescription(self.apiDef.NOTIFICATION, names).replace('\n', '\n    # ')
-            if fieldNames:
-                tupleName = "Tuple_"+notifName
-                notifComment  = '    # Formatted as a {0} named tuple.'.format(tupleName)
-                notifComment += ' It contains the following fields:\n'
-                notifComment += ''.join([self.getNotifComments(names,tupleName,fieldName) for fieldName in fieldNames])[:-1]
-                if not notifComment:
-                    notifComment = '    # '
-                s = TMPL_NOTIF.format(NOTIF_NAME                = notifName,
-                                      NOTIF_NAME_UP             = notifName.upper(),
-                                      NOTIF_PARAMS              = fieldNames,
-                                      DESCR                     = descr,
-                                      NOTIF_COMMENT             = notifComment)
-            else :
-                s = TMPL_NOTIF_NOTUPLE.format(NOTIF_NAME        = notifName,
-                                              NOTIF_NAME_UP     = notifName.upper(),
-                                              DESCR             = descr)
-            self.outFile.write(s)
-    
-    #===== end
-    
-    def genFinish(self):
-        if self.outFile != sys.stdout :
-            self.outFile.close()
-    
-    #======================== helpers =========================================
-    
-    def getCmdTupleComments(self, names, param):
-        format  = self.apiDef.getResponseFieldFormat(self.apiDef.COMMAND, names, param)
-        length  = self.apiDef.getResponseFieldLength(self.apiDef.COMMAND, names, param)
-        options = self.apiDef.getResponseFieldOptions(self.apiDef.COMMAND, names, param)
-        s = '    # - <tt>{NAME}</tt>: {LEN}-byte field formatted as a {FMT}.<br/>\n'.format(NAME=param, 
-                                                                                            LEN=length,
-                                                                                            FMT=format)
-        s +=  self.getValidationComment(options)
-        return s
-    
-    def getCmdComments(self, names, param):
-        format  = self.apiDef.getRequestFieldFormat(names, param)
-        length  = self.apiDef.getRequestFieldLength(names, param)
-        options = self.apiDef.getRequestFieldOptions(names, param)
-        s = '    # \param {NAME} {LEN}-byte field formatted as a {FMT}.<br/>\n'.format(NAME=param, 
-                                                                                       LEN=length,
-                                                                                       FMT=format)
-        s +=  self.getValidationComment(options)
-        return s
-    
-    def getNotifComments(self, names, tupleName, fieldName):
-        format  = self.apiDef.getResponseFieldFormat(self.apiDef.NOTIFICATION,
-                                                     names,
-                                                     fieldName)
-        length  = self.apiDef.getResponseFieldLength(self.apiDef.NOTIFICATION,
-                                                     names,
-                                                     fieldName)
-        options = self.apiDef.getResponseFieldOptions(self.apiDef.NOTIFICATION,
-                                                      names,
-                                                      fieldName)
-        s = '    #   - <tt>{NAME}</tt> {LEN}-byte field formatted as a {FMT}.<br/>\n'.format(NAME=fieldName, 
-                                                                                           LEN=length,
-                                                                                           FMT=format)
-        s +=  self.getValidationComment(options)
-        return s
-        
-    def getValidationComment(self, options):
-        if not options.validOptions:
-            return '    #     There is no restriction on the value of this field.\n' 
-        s = '    #     This field can only take one of the following values:\n'
-        for i in range(len(options.validOptions)):
-            s += '    #      - {0}: {1}\n'.format(options.validOptions[i], options.optionDescs[i])
-        return s
-
-def genFile(srcFileName, dstFileName, comment):
-    if isinstance(srcFileName, str):
-        apiDefClass = None
-        apiDefName = os.path.splitext(os.path.basename(srcFileName))[0]
-    else:
-        apiDefClass = srcFileName
-        apiDefName = None
-    baseName   = os.path.splitext(os.path.basename(dstFileName))[0]
-    gen = GenApiConnectors(apiDefName=apiDefName,
-                           apiDefClass=apiDefClass,
-                           myClassName=baseName,
-                           baseClassName=baseName + "Internal",
-                           baseModuleName=baseName + "Internal",
-                           outputFileName=dstFileName,
-                           briefDescription=comment)
-    gen.gen()
-        
-def main() :
-    if len(sys.argv) < 3:
-        print "Usage: GenApiConnectors <apiDefinitionFile> <resultFile> [<comment>]"
-        return 1
-    
-    comment = ''
-    if len(sys.argv) > 3:
-        comment = sys.argv[3]
-    genFile(sys.argv[1], sys.argv[2], comment)
-    
-if __name__ == '__main__':
-    main()
-
+#============================ adjust path =====================================
+
+import sys
+import os
+import struct
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..'))
+
+#============================ imports =========================================
+
+from   SmartMeshSDK import ApiException
+from   SmartMeshSDK.ApiDefinition                    import ApiDefinition
+from   SmartMeshSDK.ApiDefinition                    import ByteArraySerializer
+from   SmartMeshSDK.ApiDefinition.IpMgrDefinition    import IpMgrDefinition
+from   SmartMeshSDK.ApiDefinition.IpMoteDefinition   import IpMoteDefinition
+from   SmartMeshSDK.ApiDefinition.HartMgrDefinition  import HartMgrDefinition
+from   SmartMeshSDK.ApiDefinition.HartMoteDefinition import HartMoteDefinition
+
+#============================ templates =======================================
+
+TMPL_CLASSDEF = '''\'\'\'
+This module was generated automatically. Do not edit directly.
+\'\'\'
+
+import collections
+{FAST_PATH_IMPORTS}from   SmartMeshSDK import ApiException
+from   {MODULE_NAME} import {BASE_CLASS_NAME}
+
+##
+# \\addtogroup {GEN_CLASS_NAME}
+# \\{{
+# 
+
+class {GEN_CLASS_NAME}({BASE_CLASS_NAME}):
+    \'\'\'
+    \\brief {BRIEF_DESCRIPTION}
+    \'\'\'
+'''
+
+TMPL_DEF = '''
+    ##
+    # The named tuple returned by the {CMD_NAME}() function.
+    # 
+{TUPLE_COMMENT}
+    # 
+    Tuple_{CMD_NAME} = collections.namedtuple("Tuple_{CMD_NAME}", {TUPLE_PARAMS})
+
+    ##
+    # {DESCR}
+    # 
+{CMD_COMMENT}
+    # 
+    # \\returns The response to the command, formatted as a #Tuple_{CMD_NAME} named tuple.
+    # 
+    def {CMD_NAME}(self, {CMD_PARMS}) :
+        res = {BASE_CLASS_NAME}.send(self, {NAMES}, {{{PARAMS_DICT}}})
+        return {CLASS_NAME}.Tuple_{CMD_NAME}(**res)
+''' 
+
+TMPL_DEF_LIST = '''
+    ##
+    # The named tuple returned by the {CMD_NAME}() function.
+    # 
+{TUPLE_COMMENT}
+    # 
+    Tuple_{CMD_NAME} = collections.namedtuple("Tuple_{CMD_NAME}", {TUPLE_PARAMS})
+
+    ##
+    # {DESCR}
+    # 
+{CMD_COMMENT}
+    # 
+    # \\returns The response to the command, formatted as a list of #Tuple_{CMD_NAME} named tuple.
+    # 
+    def {CMD_NAME}(self, {CMD_PARMS}) :
+        res = {BASE_CLASS_NAME}.send(self, {NAMES}, {{{PARAMS_DICT}}})
+        tupleList = []
+        for r in res :
+            tupleList.append({CLASS_NAME}.Tuple_{CMD_NAME}(**r))
+        return tupleList
+'''
+ 
+TMPL_DEF_NOTUPLE = '''
+    ##
+    # {DESCR}
+    # 
+{CMD_COMMENT}
+    # 
+    # \\returns The response to the command.
+    # 
+    def {CMD_NAME}(self, {CMD_PARMS}) :
+        res = {BASE_CLASS_NAME}.send(self, {NAMES}, {{{PARAMS_DICT}}})
+        return res
+''' 
+
+# names the code of the fast paths uses, which the fields must not shadow
+FAST_PATH_NAMES = set(['type', 'len', 'int', 'str', 'bytearray', 'FastPathUtils', 'payload', 'hexType'])
+
+TMPL_FAST_PATH_IMPORTS = '''import struct
+from   SmartMeshSDK import FastPathUtils
+'''
+
+TMPL_DEF_FAST = '''
+    ##
+    # The named tuple returned by the {CMD_NAME}() function.
+    # 
+{TUPLE_COMMENT}
+    # 
+    Tuple_{CMD_NAME} = collections.namedtuple("Tuple_{CMD_NAME}", {TUPLE_PARAMS})
+
+    ##
+    # {DESCR}
+    # 
+{CMD_COMMENT}
+    # 
+    # \\returns The response to the command, formatted as a #Tuple_{CMD_NAME} named tuple.
+    # 
+    def {CMD_NAME}(self, {CMD_PARMS}) :
+        serializedFields = {CLASS_NAME}._serialize_{CMD_NAME}({CMD_ARGS})
+        if serializedFields is None :
+            res = {BASE_CLASS_NAME}.send(self, {NAMES}, {{{PARAMS_DICT}}})
+        else :
+            res = {BASE_CLASS_NAME}.sendSerialized(self, {NAMES}, {CMD_ID}, serializedFields, {CLASS_NAME}._parse_{CMD_NAME})
+        if type(res) is dict :
+            res = {CLASS_NAME}.Tuple_{CMD_NAME}(**res)
+        return res
+
+    _Request_{CMD_NAME}  = struct.Struct('{REQUEST_FORMAT}')
+    _Response_{CMD_NAME} = struct.Struct('{RESPONSE_FORMAT}')
+
+    ##
+    # Serializes the request of {CMD_NAME}() with a precompiled struct format.
+    # 
+    # \\returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_{CMD_NAME}({CMD_ARGS}) :
+{SERIALIZE_BODY}
+
+    ##
+    # Parses the response of {CMD_NAME}() with a precompiled struct format.
+    # 
+    # \\returns The response as a #Tuple_{CMD_NAME} named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_{CMD_NAME}(payload, hexType) :
+{PARSE_BODY}
+'''
+
+TMPL_DEF_ASYNC = '''
+    ##
+    # Sends the command of {CMD_NAME}(), without waiting for its response.
+    # 
+    # \\param timeoutSec Seconds to wait for the response, None for the timeout of the connection.
+    # 
+    # \\returns A CommandFuture, whose result() is what {CMD_NAME}() returns.
+    # 
+    def {CMD_NAME}_async(self, {CMD_PARMS_ASYNC}timeoutSec=None) :
+        return {BASE_CLASS_NAME}.sendAsync(self, {NAMES}, {{{PARAMS_DICT}}}, timeoutSec, {FORMATTER})
+'''
+
+TMPL_DEF_ASYNC_FAST = '''
+    ##
+    # Sends the command of {CMD_NAME}(), without waiting for its response.
+    # 
+    # \\param timeoutSec Seconds to wait for the response, None for the timeout of the connection.
+    # 
+    # \\returns A CommandFuture, whose result() is what {CMD_NAME}() returns.
+    # 
+    def {CMD_NAME}_async(self, {CMD_PARMS_ASYNC}timeoutSec=None) :
+        serializedFields = {CLASS_NAME}._serialize_{CMD_NAME}({CMD_ARGS})
+        if serializedFields is None :
+            return {BASE_CLASS_NAME}.sendAsync(self, {NAMES}, {{{PARAMS_DICT}}}, timeoutSec, {FORMATTER})
+        return {BASE_CLASS_NAME}.sendSerializedAsync(self, {NAMES}, {CMD_ID}, serializedFields, {CLASS_NAME}._parse_{CMD_NAME}, timeoutSec, {FORMATTER})
+'''
+
+# formatters of the responses of the asynchronous commands, by template of the synchronous ones
+TMPL_FORMATTER       = 'lambda res : {CLASS_NAME}.Tuple_{CMD_NAME}(**res)'
+TMPL_FORMATTER_LIST  = 'lambda res : [{CLASS_NAME}.Tuple_{CMD_NAME}(**r) for r in res]'
+
+TMPL_BENCHMARK = '''#!/usr/bin/python
+
+\'\'\'
+This module was generated automatically by GenApiConnectors. Do not edit directly.
+
+Compares, for each command with a fast path, the cost of serializing a sample
+request and parsing a sample response with the code generated in the
+connector (fast path) and with the API definition (generic path, as send()
+does). Also verifies that both paths give the same results.
+
+Usage: {BENCHMARK_NAME}.py [<numRuns>]
+\'\'\'
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import struct
+import time
+
+{IMPORTS}
+
+#============================ defines =========================================
+
+NUM_RUNS           = 1000
+
+# (connector, API definition, [(command, names, sample request fields, sample response)])
+CONNECTORS         = [
+{CONNECTORS}
+]
+
+#============================ helpers =========================================
+
+def runGeneric(connector, apiDef, cmdName, names, request, response):
+    (cmdId, serializedFields) = apiDef.serialize(names, dict(request))
+    serializedFields = str(bytearray(serializedFields))
+    if connector.RESPONSE_HEX_TYPE is tuple:
+        payload = struct.unpack('!'+str(len(response))+'B', response)
+    else:
+        payload = memoryview(bytearray(response))
+    (nameArray, res) = apiDef.deserialize(apiDef.COMMAND, cmdId, payload)
+    return (serializedFields, getattr(connector, 'Tuple_'+cmdName)(**res))
+
+def runFastPath(connector, apiDef, cmdName, names, request, response):
+    serializedFields = getattr(connector, '_serialize_'+cmdName)(*[v for (n, v) in request])
+    res = getattr(connector, '_parse_'+cmdName)(memoryview(response), connector.RESPONSE_HEX_TYPE)
+    return (serializedFields, res)
+
+def measure(func, connector, apiDef, commands, numRuns):
+    startTime = time.time()
+    for _ in xrange(numRuns):
+        for (cmdName, names, request, response) in commands:
+            func(connector, apiDef, cmdName, names, request, response)
+    return time.time()-startTime
+
+#============================ main ============================================
+
+def main():
+    
+    numRuns = NUM_RUNS
+    if len(sys.argv)>1:
+        numRuns = int(sys.argv[1])
+    
+    for (connector, apiDefClass, commands) in CONNECTORS:
+        apiDef = apiDefClass()
+        
+        # both paths give the same results
+        for (cmdName, names, request, response) in commands:
+            generic  = runGeneric(connector, apiDef, cmdName, names, request, response)
+            fastPath = runFastPath(connector, apiDef, cmdName, names, request, response)
+            assert generic==fastPath, (cmdName, generic, fastPath)
+        
+        numCalls = numRuns*len(commands)
+        generic  = measure(runGeneric,  connector, apiDef, commands, numRuns)
+        fastPath = measure(runFastPath, connector, apiDef, commands, numRuns)
+        print '{{0:<22}} {{1:>3}} commands, generic {{2:5.1f}} us/call, fast path {{3:5.1f}} us/call ({{4:.1f}}x)'.format(
+            connector.__name__,
+            len(commands),
+            1000000*generic/numCalls,
+            1000000*fastPath/numCalls,
+            generic/fastPath,
+        )
+
+if __name__=="__main__":
+    main()
+'''
+
+TMPL_NOTIF = '''
+    ##
+    # \\brief {NOTIF_NAME_UP} notification.
+    # 
+    # {DESCR}
+    #
+{NOTIF_COMMENT}    
+    # 
+    {NOTIF_NAME_UP} = "{NOTIF_NAME}"
+    notifTupleTable[{NOTIF_NAME_UP}] = Tuple_{NOTIF_NAME} = collections.namedtuple("Tuple_{NOTIF_NAME}", {NOTIF_PARAMS})
+'''
+
+TMPL_NOTIF_NOTUPLE = '''
+    ##
+    # \\brief Notification {NOTIF_NAME_UP} 
+    # 
+    # {DESCR}
+    #        
+    {NOTIF_NAME_UP} = "{NOTIF_NAME}"
+    notifTupleTable[{NOTIF_NAME_UP}] = None
+'''
+
+TMPL_GETNOTIFICATION = '''
+    ##
+    # \\brief Get a notification from the notification queue, and returns
+    #        it properly formatted.
+    #
+    # \\exception NotificationError if unknown notification.
+    # 
+    def getNotification(self, timeoutSec=-1) :
+        temp = self.getNotificationInternal(timeoutSec)
+        if not temp:
+            return temp
+        (ids, param) = temp
+        try :
+            if  {CLASS_NAME}.notifTupleTable[ids[-1]] :
+                return (ids[-1], {CLASS_NAME}.notifTupleTable[ids[-1]](**param))
+            else :
+                return (ids[-1], None)
+        except KeyError :
+            raise ApiException.NotificationError(ids, param)
+
+    ##
+    # \\brief Get up to maxCount notifications from the notification queue,
+    #        and returns them properly formatted.
+    #
+    # Waits for the first notification as getNotification() does, then takes
+    # the notifications already queued, in a single acquisition of the queue
+    # lock.
+    #
+    # \\exception NotificationError if unknown notification. The notifications
+    #            taken before it are returned first, and the ones after it
+    #            put back in the queue, for the next calls.
+    # \\returns A list of (name, tuple) tuples, empty if the queue is empty.
+    # 
+    def getNotifications(self, maxCount, timeoutSec=-1) :
+        returnVal = []
+        notifs = self.getNotificationsInternal(maxCount, timeoutSec)
+        for (i, (ids, param)) in enumerate(notifs) :
+            try :
+                tupleClass = {CLASS_NAME}.notifTupleTable[ids[-1]]
+            except KeyError :
+                if returnVal :
+                    self.putBackNotificationsInternal(notifs[i:])
+                    return returnVal
+                self.putBackNotificationsInternal(notifs[i+1:])
+                raise ApiException.NotificationError(ids, param)
+            if tupleClass :
+                returnVal.append((ids[-1], tupleClass(**param)))
+            else :
+                returnVal.append((ids[-1], None))
+        return returnVal
+'''
+
+START_LOCATION_COMMENT = '''
+    # \param numFrames 1-byte field formatted as an integer.<br/>
+    #     There is no restriction on the value of this field.
+    # \param mobileMote 8-byte field formatted as hex.<br/>
+    #     There is no restriction on the value of this field.
+    # \param fixedMotes list of 8-byte fields formatted as hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+'''
+
+START_LOCATION_PAYLOAD = '''
+        payload = []
+        for fm in fixedMotes :
+            payload += fm
+        res = {BASE_CLASS_NAME}.send(self, ['startLocation'], {{"numFrames" : numFrames, "mobileMote" : mobileMote, "fixedMotes" : payload}})
+'''
+
+TMPL_ENDCLASSDEF = '''
+##
+# end of {GEN_CLASS_NAME}
+# \\}}
+# 
+'''
+
+def printStartLocation(names, respFieldsName, reqFieldsName, 
+                       CMD_NAME, CMD_PARMS, DESCR, 
+                       TUPLE_PARAMS, NAMES, PARAMS_DICT, 
+                       BASE_CLASS_NAME, CLASS_NAME,
+                       TUPLE_COMMENT, CMD_COMMENT) :
+    s = TMPL_DEF.format(CMD_NAME = CMD_NAME, CMD_PARMS = CMD_PARMS, DESCR = DESCR, 
+                       TUPLE_PARAMS = TUPLE_PARAMS, NAMES = NAMES, PARAMS_DICT = PARAMS_DICT, 
+                       BASE_CLASS_NAME = BASE_CLASS_NAME, CLASS_NAME = CLASS_NAME,
+                       TUPLE_COMMENT = TUPLE_COMMENT, CMD_COMMENT = '***')
+    lines = s.split('\n')
+    res = []
+    for l in lines :
+        if l == '***' :
+            res += [START_LOCATION_COMMENT[1:]]
+        elif l.find('send(self') >= 0:
+            res += [START_LOCATION_PAYLOAD[1:].format(BASE_CLASS_NAME=BASE_CLASS_NAME)]
+        else :
+            res += [l + '\n']
+    return ''.join(res)
+
+RADIOTEST_TX_COMMENT = '''
+    # \param type 1-byte field formatted as an integer.<br/>
+    #     Type of transmission test: 0=packet, 1=continuous modulation (CM), 2=continuous wave (CW)
+    # \param mask 2-bytes field formatted as an integer.<br/>
+    #     Mask of channels(0-15) enabled for test.
+    # \param txPower 1-byte field formatted as an sign integer.<br/>
+    #     Transmit power, in dB. Valid values are 0 (power amplifier off) and 8 (power amplifier on).
+    # \param numRepeats 2-byte field formatted as an integer.<br/>
+    #     Number of times to repeat the packet sequence (0=do not stop). Applies only to packet transmission tests.
+    # \param tests list of pair of integer.<br/>
+    #     Sequence definitions (up to 10) specifies the length (bytes) and after-packet delay (usec) for each packets
+'''
+
+RADIOTEST_TX_PAYLOAD = '''
+        d = {{"type" : type, "mask" : mask, "numRepeats" : numRepeats, "txPower" : txPower, "numPackets" : len(tests)}}
+        for i in xrange(10) :
+            if i < len(tests) :
+                l, g = tests[i]
+            else :
+                l, g = (0, 0)
+            d["pkSize" + str(i+1)] = l
+            d["gap" + str(i+1)]    = g
+        res = {BASE_CLASS_NAME}.send(self, ['radiotestTx'], d)
+'''
+    
+def printRsadioTestTx(names, respFieldsName, reqFieldsName, 
+                       CMD_NAME, CMD_PARMS, DESCR, 
+                       TUPLE_PARAMS, NAMES, PARAMS_DICT, 
+                       BASE_CLASS_NAME, CLASS_NAME,
+                       TUPLE_COMMENT, CMD_COMMENT) :
+    s = TMPL_DEF.format(CMD_NAME = CMD_NAME, CMD_PARMS = CMD_PARMS, DESCR = DESCR, 
+                       TUPLE_PARAMS = TUPLE_PARAMS, NAMES = NAMES, PARAMS_DICT = PARAMS_DICT, 
+                       BASE_CLASS_NAME = BASE_CLASS_NAME, CLASS_NAME = CLASS_NAME,
+                       TUPLE_COMMENT = TUPLE_COMMENT, CMD_COMMENT = '***')
+    lines = s.split('\n')
+    res = []
+    for l in lines :
+        if l == '***' :
+            res += [RADIOTEST_TX_COMMENT[1:]]
+        elif l.find('def dn_radioTestTx') >= 0 :
+            res += '    def dn_radioTestTx(self, type, mask, txPower, numRepeats, tests) :\n'
+        elif l.find('send(self') >= 0:
+            res += [RADIOTEST_TX_PAYLOAD[1:].format(BASE_CLASS_NAME=BASE_CLASS_NAME)]
+        else :
+            res += [l + '\n']
+    return ''.join(res)
+    
+'''
+Dictionary of commands with special processing:
+    {'cmdName' : [requestFields, responseFields, generator]}
+    
+    def generator(names, respFieldsName, reqFieldsName, 
+                  CMD_NAME, CMD_PARMS, DESCR, TUPLE_PARAMS, NAMES, PARAMS_DICT, 
+                  BASE_CLASS_NAME, CLASS_NAME, TUPLE_COMMENT, CMD_COMMENT) :
+        return strings
+'''
+
+specialCmd = {
+    'dn_startLocation' : [
+        ['numFrames', 'mobileMote', 'fixedMotes'],
+        ['RC', 'callbackId'],
+        printStartLocation
+    ],
+
+    'dn_radioTestTx' : [
+        ['type', 'mask', 'numRepeats', 'txPower', 'numPackets',
+         'pkSize1', 'gap1', 'pkSize2', 'gap2', 'pkSize3', 'gap3', 'pkSize4', 'gap4', 'pkSize5', 'gap5', 
+         'pkSize6', 'gap6', 'pkSize7', 'gap7', 'pkSize8', 'gap8', 'pkSize9', 'gap9', 'pkSize10', 'gap10'],
+        ['RC'],
+        printRsadioTestTx
+    ]   
+}       
+        
+class GenApiConnectors(object):
+        
+    #======================== public ==========================================
+    
+    def __init__(self, apiDefName, myClassName, baseClassName, baseModuleName, outputFileName = None, briefDescription = '', apiDefClass=None, hasAsync=False):
+        if apiDefName:
+            apiDefClass = globals()[apiDefName]
+        self.apiDef           = apiDefClass() 
+        self.myClassName      = myClassName
+        self.baseClassName    = baseClassName 
+        self.baseModuleName   = baseModuleName
+        self.briefDescription = briefDescription
+        self.outputFileName   = outputFileName
+        # fast paths are only generated for the APIs serialized into bytes
+        self.hasFastPath      = isinstance(getattr(self.apiDef, 'serializer', None),
+                                           ByteArraySerializer.ByteArraySerializer)
+        self.fastPathCmds     = []    # (cmdName, names, sample request fields, sample response)
+        # the base class has sendAsync() and sendSerializedAsync()
+        self.hasAsync         = hasAsync
+        if outputFileName:
+            self.outFile = open(outputFileName, "wt")
+        else:
+            self.outFile = sys.stdout
+            
+    def gen(self):
+        fastPathImports = ''
+        if self.hasFastPath :
+            fastPathImports = TMPL_FAST_PATH_IMPORTS
+        s = TMPL_CLASSDEF.format(MODULE_NAME       = self.baseModuleName,
+                                 BASE_CLASS_NAME   = self.baseClassName, 
+                                 GEN_CLASS_NAME    = self.myClassName,
+                                 BRIEF_DESCRIPTION = self.briefDescription,
+                                 FAST_PATH_IMPORTS = fastPathImports)
+        self.outFile.write(s)
+        self.outFile.write('\n    #======================== commands ========================================\n')
+        self.genCmd()
+        self.outFile.write('\n    #======================== notifications ===================================\n')
+        self.genNotif()
+        s = TMPL_ENDCLASSDEF.format(GEN_CLASS_NAME    = self.myClassName)
+        self.outFile.write(s)
+        self.genFinish()
+        
+    #======================== private =========================================
+    
+    #===== commands
+    
+    def genCmd(self):
+        cmdNames = self.apiDef.getNames(self.apiDef.COMMAND)
+        for name in cmdNames :
+            self.genOneCmd([name], [], [])
+    
+    def genOneCmd(self, names, respFieldsName, reqFieldsName):
+        
+        # get request fields
+        r = self.apiDef.getRequestFieldNames(names)
+        reqFieldsName += [n for n in r if n not in self.apiDef.RESERVED]
+        
+        # get response fields
+        try:
+            r = self.apiDef.getResponseFieldNames(self.apiDef.COMMAND, names) 
+            respFieldsName += [n for n in r if n not in self.apiDef.RESERVED]
+        except ApiException.CommandError :
+            # means that this function has no response fields, which is OK
+            pass
+        
+        if self.apiDef.hasSubcommands(self.apiDef.COMMAND, names):
+            subcmdsName = self.apiDef.getNames(self.apiDef.COMMAND, names)
+            for sn in subcmdsName :
+                self.genOneCmd(names+[sn], respFieldsName[:], reqFieldsName[:])
+        else:
+            cmdName     = 'dn_'
+            cmdName    += '_'.join([n for n in names])
+            cmdParams   = ', '.join([p for p in reqFieldsName])
+            paramsDict  = ', '.join(['"{0}" : {1}'.format(p, p) for p in reqFieldsName])
+            descr       = self.apiDef.getDescription(self.apiDef.COMMAND, names).replace('\n', '\n    # ')
+            cmdComment  = ''.join([self.getCmdComments(names, p) for p in reqFieldsName])[:-1]
+            if not cmdComment:
+                cmdComment = '    # '
+            tupleComment = ''.join([self.getCmdTupleComments(names, p) for p in respFieldsName])[:-1]
+            asyncTmpl   = None
+            asyncFields = {}
+            
+            if cmdName in specialCmd and specialCmd[cmdName][0] == reqFieldsName and specialCmd[cmdName][1] == respFieldsName :
+                s = specialCmd[cmdName][2](names, respFieldsName, reqFieldsName, 
+                                           CMD_NAME             = cmdName,
+                                           CMD_PARMS            = cmdParams,
+                                           DESCR                = descr, 
+                                           TUPLE_PARAMS         = respFieldsName,
+                                           NAMES                = names,
+                                           PARAMS_DICT          = paramsDict, 
+                                           BASE_CLASS_NAME      = self.baseClassName,
+                                           CLASS_NAME           = self.myClassName,
+                                           TUPLE_COMMENT        = tupleComment,
+                                           CMD_COMMENT          = cmdComment)
+            else :
+                if respFieldsName :
+                    cmd_metadata = self.apiDef.getDefinition(self.apiDef.COMMAND, names)
+                    if ('isResponseArray' in cmd_metadata) :
+                        s = TMPL_DEF_LIST.format(CMD_NAME                = cmdName,
+                                            CMD_PARMS               = cmdParams,
+                                            DESCR                   = descr, 
+                                            TUPLE_PARAMS            = respFieldsName,
+                                            NAMES                   = names,
+                                            PARAMS_DICT             = paramsDict, 
+                                            BASE_CLASS_NAME         = self.baseClassName,
+                                            CLASS_NAME              = self.myClassName,
+                                            TUPLE_COMMENT           = tupleComment,
+                                            CMD_COMMENT             = cmdComment)
+                        asyncTmpl = TMPL_DEF_ASYNC
+                        formatter = TMPL_FORMATTER_LIST
+                    else :
+                        fastPath = self.genFastPath(cmdName, names, respFieldsName, reqFieldsName)
+                        if fastPath :
+                            s = TMPL_DEF_FAST.format(CMD_NAME           = cmdName,
+                                                     CMD_PARMS          = cmdParams,
+                                                     DESCR              = descr, 
+                                                     TUPLE_PARAMS       = respFieldsName,
+                                                     NAMES              = names,
+                                                     PARAMS_DICT        = paramsDict, 
+                                                     BASE_CLASS_NAME    = self.baseClassName,
+                                                     CLASS_NAME         = self.myClassName,
+                                                     TUPLE_COMMENT      = tupleComment,
+                                                     CMD_COMMENT        = cmdComment,
+                                                     **fastPath)
+                            asyncTmpl   = TMPL_DEF_ASYNC_FAST
+                            formatter   = TMPL_FORMATTER
+                            asyncFields = fastPath
+                        else :
+                            s = TMPL_DEF.format(CMD_NAME                = cmdName,
+                                                CMD_PARMS               = cmdParams,
+                                                DESCR                   = descr, 
+                                                TUPLE_PARAMS            = respFieldsName,
+                                                NAMES                   = names,
+                                                PARAMS_DICT             = paramsDict, 
+                                                BASE_CLASS_NAME         = self.baseClassName,
+                                                CLASS_NAME              = self.myClassName,
+                                                TUPLE_COMMENT           = tupleComment,
+                                                CMD_COMMENT             = cmdComment)
+                            asyncTmpl = TMPL_DEF_ASYNC
+                            formatter = TMPL_FORMATTER
+                else :
+                    s = TMPL_DEF_NOTUPLE.format(CMD_NAME        = cmdName,
+                                                CMD_PARMS       = cmdParams,
+                                                DESCR           = descr, 
+                                                NAMES           = names,
+                                                PARAMS_DICT     = paramsDict, 
+                                                BASE_CLASS_NAME = self.baseClassName,
+                                                CMD_COMMENT     = cmdComment)
+                    asyncTmpl = TMPL_DEF_ASYNC
+                    formatter = 'None'
+                if self.hasAsync and asyncTmpl :
+                    cmdParamsAsync = ''
+                    if cmdParams :
+                        cmdParamsAsync = cmdParams + ', '
+                    asyncFields = dict(asyncFields)
+                    asyncFields.update(CMD_NAME         = cmdName,
+                                       CMD_PARMS_ASYNC  = cmdParamsAsync,
+                                       NAMES            = names,
+                                       PARAMS_DICT      = paramsDict, 
+                                       BASE_CLASS_NAME  = self.baseClassName,
+                                       CLASS_NAME       = self.myClassName,
+                                       FORMATTER        = formatter.format(CLASS_NAME = self.myClassName,
+                                                                           CMD_NAME   = cmdName))
+                    s += asyncTmpl.format(**asyncFields)
+            self.outFile.write(s)
+    
+    #===== fast paths
+    
+    def genFastPath(self, cmdName, names, respFieldsName, reqFieldsName):
+        '''
+        \brief Generate the fast path of a command: a serializer of its request
+               and a parser of its response, based on precompiled struct formats.
+        
+        \returns The values to fill TMPL_DEF_FAST with, or None if this command
+                 can only use the generic path.
+        '''
+        if not self.hasFastPath :
+            return None
+        
+        request  = self.genFastPathRequest(cmdName, names, reqFieldsName)
+        response = self.genFastPathResponse(cmdName, names, respFieldsName)
+        if not (request and response) :
+            return None
+        
+        (cmdId, requestFormat, serializeBody, sampleRequest)   = request
+        (responseFormat, parseBody, sampleResponse)            = response
+        
+        self.fastPathCmds.append((cmdName, names, sampleRequest, sampleResponse))
+        
+        return {
+            'CMD_ARGS':        ', '.join(reqFieldsName),
+            'CMD_ID':          cmdId,
+            'REQUEST_FORMAT':  requestFormat,
+            'RESPONSE_FORMAT': responseFormat,
+            'SERIALIZE_BODY':  serializeBody,
+            'PARSE_BODY':      parseBody,
+        }
+    
+    def genFastPathRequest(self, cmdName, names, reqFieldsName):
+        '''
+        \brief Generate the serializer of the request of a command.
+        
+        The serializer only accepts the values the generic serializer would
+        accept and serialize to the same bytes (see Field.isValidValue).
+        
+        \returns A tuple (cmdId, struct format, code, sample request
+                 fields), or None.
+        '''
+        
+        # the generic path validates the fields of the last level only
+        if 'serializer' in self.apiDef.getDefinition(self.apiDef.COMMAND, names) :
+            return None
+        leafFields = [f for f in self.apiDef.getRequestFields(names)
+                      if f.name not in self.apiDef.RESERVED]
+        if sorted([f.name for f in leafFields]) != sorted(reqFieldsName) :
+            return None
+        if set(reqFieldsName) & FAST_PATH_NAMES :
+            return None
+        
+        codec = self.apiDef.serializer.getRequestCodec(names)
+        if not codec.struct :
+            return None
+        if codec.cmdId != self.apiDef.nameToId(self.apiDef.COMMAND, names[:1]) :
+            return None
+        
+        args     = [repr(c) for c in codec.constants]
+        convs    = []
+        checks   = []
+        sample   = {}
+        fields   = [(i, name) for (i, name, convert) in codec.fields]
+        if codec.tail :
+            fields += [(None, codec.tail[0])]
+        for (i, name) in fields :
+            field = self.apiDef.getRequestField(names, name)
+            options = field.options.validOptions
+            if   field.format == ApiDefinition.FieldFormats.INT :
+                maxVal  = (1 << (8 * field.length)) - 1
+                check   = 'type({0}) is not int or not 0 <= {0} <= {1:#x}'.format(name, maxVal)
+                arg     = name
+                sample[name] = min(maxVal, 0x5a)
+            elif field.format == ApiDefinition.FieldFormats.INTS :
+                maxVal  = (1 << (8 * field.length - 1)) - 1
+                check   = 'type({0}) is not int or not {1} <= {0} <= {2}'.format(name, -maxVal - 1, maxVal)
+                arg     = name
+                sample[name] = -5
+            elif field.format == ApiDefinition.FieldFormats.BOOL :
+                check   = 'type({0}) is not bool'.format(name)
+                arg     = name
+                sample[name] = True
+            elif field.format == ApiDefinition.FieldFormats.HEXDATA and not options :
+                convs  += ['        {0} = FastPathUtils.toBytes({0}, {1})\n'.format(name, field.length)]
+                check   = '{0} is None'.format(name)
+                arg     = name
+                sample[name] = range(field.length or 10)
+            elif field.format == ApiDefinition.FieldFormats.STRING and field.length and not options :
+                check   = 'type({0}) is not str or len({0}) > {1}'.format(name, field.length)
+                arg     = "{0}.rjust({1}, '\\x00')".format(name, field.length)
+                sample[name] = 'a' * field.length
+            else :
+                return None
+            if options :
+                check  += ' or {0} not in {1}'.format(name, tuple(options))
+                sample[name] = options[0]
+            checks += [check]
+            if i is not None :
+                args[i] = arg
+        
+        requestName = '{0}._Request_{1}'.format(self.myClassName, cmdName)
+        code  = ''.join(convs)
+        if checks :
+            code += '        if ({0}) :\n'.format(' or\n            '.join(checks))
+            code += '            return None\n'
+        if codec.tail :
+            code += '        return {0}.pack({1}) + {2}'.format(requestName, ', '.join(args), codec.tail[0])
+        else :
+            code += '        return {0}.pack({1})'.format(requestName, ', '.join(args))
+        
+        return (codec.cmdId, codec.struct.format, code, [(n, sample[n]) for n in reqFieldsName])
+    
+    def genFastPathResponse(self, cmdName, names, respFieldsName):
+        '''
+        \brief Generate the parser of the response of a command.
+        
+        The parser only accepts the complete responses with an RC of RC_OK and
+        valid values, and returns the same values as the generic deserializer.
+        
+        \returns A tuple (struct format, code, sample response bytes), or None.
+        '''
+        codecs = []
+        for i in range(len(names)) :
+            try :
+                codec = self.apiDef.serializer.getResponseCodec(self.apiDef.COMMAND, names[:i+1])
+            except ApiException.CommandError :
+                return None
+            if not codec.struct :
+                return None
+            if i < len(names) - 1 and (codec.tail or codec.reservedIndex is None) :
+                return None
+            codecs += [codec]
+        
+        valueNames = []
+        tupleArgs  = []
+        checks     = []
+        sample     = []
+        structFormat = '>'
+        for (level, codec) in enumerate(codecs) :
+            structFormat += codec.struct.format[1:]
+            for field in codec.fieldDefs :
+                if not field.length :
+                    continue
+                name    = field.name
+                options = field.options.validOptions
+                value   = 0x5a
+                if options :
+                    value = options[0]
+                arg     = name
+                if name == self.apiDef.RC :
+                    checks += ['{0} != {1}'.format(name, self.apiDef.RC_OK)]
+                    value   = self.apiDef.RC_OK
+                    if options and self.apiDef.RC_OK not in options :
+                        return None
+                    options = None
+                elif name in self.apiDef.RESERVED :
+                    value   = self.apiDef.subcommandNameToId(self.apiDef.COMMAND,
+                                                             names[:level+1],
+                                                             names[level+1])
+                    checks += ['{0} != {1}'.format(name, value)]
+                elif field.format == ApiDefinition.FieldFormats.BOOL :
+                    if options :
+                        return None
+                    checks += ['{0} > 1'.format(name)]
+                    arg     = '{0} == 1'.format(name)
+                    value   = 1
+                elif field.format == ApiDefinition.FieldFormats.HEXDATA :
+                    if options :
+                        return None
+                    arg     = 'hexType(bytearray({0}))'.format(name)
+                elif field.format == ApiDefinition.FieldFormats.INT and field.length not in (1, 2, 4, 8) :
+                    if options :
+                        return None
+                    arg     = 'FastPathUtils.toInt({0})'.format(name)
+                if options :
+                    checks += ['{0} not in {1}'.format(name, tuple(options))]
+                valueNames += [name]
+                if name not in self.apiDef.RESERVED :
+                    tupleArgs += [arg]
+                sample     += self.sampleBytes(field, value)
+        
+        size = struct.calcsize(structFormat)
+        tail = codecs[-1].tail
+        if tail :
+            valueNames += [tail.name]
+            if tail.format == ApiDefinition.FieldFormats.STRING :
+                tupleArgs += ['payload[{0}:].tobytes() or None'.format(size)]
+            else :
+                tupleArgs += ['hexType(payload[{0}:].tolist()) or None'.format(size)]
+            sample += range(10)
+        
+        # the values are passed to the named tuple by position
+        if [n for n in valueNames if n not in self.apiDef.RESERVED] != respFieldsName :
+            return None
+        if len(set(valueNames)) != len(valueNames) or set(valueNames) & FAST_PATH_NAMES :
+            return None
+        
+        if tail :
+            valueNames = valueNames[:-1]
+        if not valueNames :
+            return None
+        
+        code  = '        if len(payload) < {0} :\n'.format(size)
+        code += '            return None\n'
+        if len(valueNames) == 1 :
+            valueNames += ['']
+        code += '        ({0}) = {1}._Response_{2}.unpack_from(payload)\n'.format(', '.join(valueNames), self.myClassName, cmdName)
+        if checks :
+            code += '        if ({0}) :\n'.format(' or\n            '.join(checks))
+            code += '            return None\n'
+        code += '        return {0}.Tuple_{1}({2})'.format(self.myClassName, cmdName, ', '.join(tupleArgs))
+        
+        return (structFormat, code, sample)
+    
+    #===== notifications
+    
+    def genNotif(self):
+        # write header
+        output  = []
+        output += ['    \n']
+        output += ['    ##\n']
+        output += ['    # Dictionary of all notification tuples.\n']
+        output += ['    #\n']
+        output += ['    notifTupleTable = {}\n']
+        output += ['    ']
+        self.outFile.write(''.join(output))
+        
+        # generate all notifications
+        notifIds = self.apiDef.getIds(self.apiDef.NOTIFICATION)
+        for notifId in notifIds :
+            notifName = self.apiDef.idToName(self.apiDef.NOTIFICATION, notifId)
+            self.genOneNotif([notifName], [])
+        s = TMPL_GETNOTIFICATION.format(BASE_CLASS_NAME=self.baseClassName,
+                                        CLASS_NAME=self.myClassName)
+        self.outFile.write(s)
+        
+    def genOneNotif(self, names, fieldNames) :
+        try :
+            f = self.apiDef.getResponseFieldNames(self.apiDef.NOTIFICATION, names)
+            if not f :
+                raise KeyError
+            fieldNames += [n for n in f if n not in self.apiDef.RESERVED]
+        except (NameError, KeyError, ApiException.CommandError) :
+            pass
+        
+        try :
+            subcmdsName = self.apiDef.getNames(self.apiDef.NOTIFICATION, names)
+            for sn in subcmdsName :
+                self.genOneNotif(names + [sn], fieldNames[:])
+        except ApiException.CommandError :
+            notifName = names[-1]
+            descr = self.apiDef.getDescription(self.apiDef.NOTIFICATION, names).replace('\n', '\n    # ')
+            if fieldNames:
+                tupleName = "Tuple_"+notifName
+                notifComment  = '    # Formatted as a {0} named tuple.'.format(tupleName)
+                notifComment += ' It contains the following fields:\n'
+                notifComment += ''.join([self.getNotifComments(names,tupleName,fieldName) for fieldName in fieldNames])[:-1]
+                if not notifComment:
+                    notifComment = '    # '
+                s = TMPL_NOTIF.format(NOTIF_NAME                = notifName,
+                                      NOTIF_NAME_UP             = notifName.upper(),
+                                      NOTIF_PARAMS              = fieldNames,
+                                      DESCR                     = descr,
+                                      NOTIF_COMMENT             = notifComment)
+            else :
+                s = TMPL_NOTIF_NOTUPLE.format(NOTIF_NAME        = notifName,
+                                              NOTIF_NAME_UP     = notifName.upper(),
+                                              DESCR             = descr)
+            self.outFile.write(s)
+    
+    #===== end
+    
+    def genFinish(self):
+        if self.outFile != sys.stdout :
+            self.outFile.close()
+    
+    #======================== helpers =========================================
+    
+    def sampleBytes(self, field, value):
+        '''
+        \brief The bytes of a response field, for the sample responses of the
+               benchmark.
+        '''
+        if field.format == ApiDefinition.FieldFormats.HEXDATA :
+            return range(field.length)
+        if field.format == ApiDefinition.FieldFormats.STRING :
+            return [ord('a')] * field.length
+        return [(value >> (8 * i)) & 0xff for i in range(field.length - 1, -1, -1)]
+    
+    
+    def getCmdTupleComments(self, names, param):
+        format  = self.apiDef.getResponseFieldFormat(self.apiDef.COMMAND, names, param)
+        length  = self.apiDef.getResponseFieldLength(self.apiDef.COMMAND, names, param)
+        options = self.apiDef.getResponseFieldOptions(self.apiDef.COMMAND, names, param)
+        s = '    # - <tt>{NAME}</tt>: {LEN}-byte field formatted as a {FMT}.<br/>\n'.format(NAME=param, 
+                                                                                            LEN=length,
+                                                                                            FMT=format)
+        s +=  self.getValidationComment(options)
+        return s
+    
+    def getCmdComments(self, names, param):
+        format  = self.apiDef.getRequestFieldFormat(names, param)
+        length  = self.apiDef.getRequestFieldLength(names, param)
+        options = self.apiDef.getRequestFieldOptions(names, param)
+        s = '    # \param {NAME} {LEN}-byte field formatted as a {FMT}.<br/>\n'.format(NAME=param, 
+                                                                                       LEN=length,
+                                                                                       FMT=format)
+        s +=  self.getValidationComment(options)
+        return s
+    
+    def getNotifComments(self, names, tupleName, fieldName):
+        format  = self.apiDef.getResponseFieldFormat(self.apiDef.NOTIFICATION,
+                                                     names,
+                                                     fieldName)
+        length  = self.apiDef.getResponseFieldLength(self.apiDef.NOTIFICATION,
+                                                     names,
+                                                     fieldName)
+        options = self.apiDef.getResponseFieldOptions(self.apiDef.NOTIFICATION,
+                                                      names,
+                                                      fieldName)
+        s = '    #   - <tt>{NAME}</tt> {LEN}-byte field formatted as a {FMT}.<br/>\n'.format(NAME=fieldName, 
+                                                                                           LEN=length,
+                                                                                           FMT=format)
+        s +=  self.getValidationComment(options)
+        return s
+        
+    def getValidationComment(self, options):
+        if not options.validOptions:
+            return '    #     There is no restriction on the value of this field.\n' 
+        s = '    #     This field can only take one of the following values:\n'
+        for i in range(len(options.validOptions)):
+            s += '    #      - {0}: {1}\n'.format(options.validOptions[i], options.optionDescs[i])
+        return s
+
+def genFile(srcFileName, dstFileName, comment, hasAsync=False):
+    if isinstance(srcFileName, str):
+        apiDefClass = None
+        apiDefName = os.path.splitext(os.path.basename(srcFileName))[0]
+    else:
+        apiDefClass = srcFileName
+        apiDefName = None
+    baseName   = os.path.splitext(os.path.basename(dstFileName))[0]
+    gen = GenApiConnectors(apiDefName=apiDefName,
+                           apiDefClass=apiDefClass,
+                           myClassName=baseName,
+                           baseClassName=baseName + "Internal",
+                           baseModuleName=baseName + "Internal",
+                           outputFileName=dstFileName,
+                           briefDescription=comment,
+                           hasAsync=hasAsync)
+    gen.gen()
+    return gen
+        
+def genBenchmark(dstFileName, gens):
+    '''
+    \brief Generate the benchmark of the fast paths of the connectors generated
+           by gens, GenApiConnectors objects.
+    '''
+    imports    = []
+    connectors = []
+    for gen in gens:
+        if not gen.fastPathCmds:
+            continue
+        packageName = os.path.basename(os.path.dirname(gen.outputFileName))
+        apiDefName  = gen.apiDef.__class__.__name__
+        imports    += ['from SmartMeshSDK.{0} import {1}'.format(packageName, gen.myClassName)]
+        imports    += ['from SmartMeshSDK.ApiDefinition import {0}'.format(apiDefName)]
+        commands    = ['        ({0!r}, {1!r}, {2!r}, {3!r}),'.format(cmdName, names, request, str(bytearray(response)))
+                       for (cmdName, names, request, response) in gen.fastPathCmds]
+        connectors += ['    (',
+                       '        {0}.{0},'.format(gen.myClassName),
+                       '        {0}.{0},'.format(apiDefName),
+                       '        [']
+        connectors += ['    ' + c for c in commands]
+        connectors += ['        ],',
+                       '    ),']
+    f = open(dstFileName, "wt")
+    f.write(TMPL_BENCHMARK.format(BENCHMARK_NAME = os.path.splitext(os.path.basename(dstFileName))[0],
+                                  IMPORTS        = '\n'.join(sorted(set(imports))),
+                                  CONNECTORS     = '\n'.join(connectors)))
+    f.close()
+
+def main() :
+    if len(sys.argv) < 3:
+        print "Usage: GenApiConnectors <apiDefinitionFile> <resultFile> [<comment>]"
+        return 1
+    
+    comment = ''
+    if len(sys.argv) > 3:
+        comment = sys.argv[3]
+    genFile(sys.argv[1], sys.argv[2], comment)
+    
+if __name__ == '__main__':
+    main()
+
@@ -1,271 +1,495 @@
-#============================ adjust path =====================================
-
-import sys
-import os
-if __name__ == "__main__":
-    here = sys.path[0]
-    sys.path.insert(0, os.path.join(here, '..'))
-
-#============================ imports =========================================
-
-from   SmartMeshSDK import ApiException
-from   SmartMeshSDK.ApiDefinition.IpMgrDefinition    import IpMgrDefinition
-
-#============================ templates =======================================
-
-TMPL = '''# Warning: Do NOT edit this file directly. Your changes may be overwritten. 
-# This file is automatically generated by GenIpMgrSubscribe.py
-
-import threading
-
-from   SmartMeshSDK import ApiException
-
-class IpMgrSubscribe(object):
-    \'\'\'
-    \\brief {BRIEF_DESCRIPTION}
-    \'\'\'
-    
-    class SubscribeError(Exception) :
-        def __init__(self, msg) :
-            self.msg = msg
-        def __str__(self):
-            return self.msg
-    
-{CONST_NAME}
-    _trNotifNameTable = {{
-{EVENT_DICT}
-    }}
-    
-    #======================== public ==========================================
-    
-    def __init__(self, ipMgrConnector) :
-        # Structure of self._callback :
-        #     Notification Name : 
-        #         [0] - subscription mask mask, 
-        #         [1] - cb-function. Notification is subscribed if [1]!=None, 
-        #         [2] - transport for notification: True - reliable, false - unreliable
-        self._callback = {{
-{SUBSCRIBE_DICT}        
-        }}
-        self._con    = ipMgrConnector
-        self._thread = None
-        self._mask = self._unrlblMask = 0
-        self._isStarted = False
-        self._lock = threading.Lock()
-        
-    def start(self):
-        \'\'\'
-        \\brief Start the subscriber _thread.
-        \'\'\'
-        
-        if self._thread :   # Wait finish disconnect process
-            try :
-                self._thread.join(1.0)
-                if  self._thread.isAlive() :
-                    raise ApiException.ConnectionError("Already connected")
-            except RuntimeError :
-                pass    # Ignore join error
-            self._thread = None 
-        
-        # Clear _callback table
-        for i in self._callback :
-            self._callback[i][1] = None
-            self._callback[i][2] = True
-        self._mask = self._unrlblMask = 0
-        self._thread = threading.Thread(target = self._process) 
-        self._thread.name = "IpMgrSubscribe"
-        self._thread.start()
-        self._isStarted = True
-        
-    def subscribe(self, notifTypes, fun, isRlbl):
-        \'\'\'
-        \\brief Subscribe to notification(s).
-        
-        Calling this function multiple times will not cancel the effects of
-        the previous calls.
-        
-        \pre Call start() before calling this function.
-        
-        \param notifTypes Type(s) of notification(s) to subscribe to. This can
-            be a single string (when subscribing to a single notification), or
-            a list of strings (when subscribing to multiple notifications).
-            The list of possible types is:
-{COMMENT_NOTIF_TYPE}
-        \param fun The function to call when any of the notification types
-            specified in the notifTypes parameter occurs. If you wish to assign
-            a different _callback function to different notification types,
-            call this function multiple times. The signature of the function
-            needs to be fun(<notification name>, <notification parameter>),
-            as described below.
-        \param isRlbl define type of transport using for delivery 
-             notification: reliable (True) or best effort (False)
-        The _callback function is called with a notification name and a
-        notification parameter. Depending on the type of notification, the
-        parameter will be of a different format, according to the table below.
-        
-{COMMENT_FUN}
-        
-        \exception IpMgrSubscribe.SubscribeError The subscriber hasn't been
-            started, or the notification type(s) specified is (are) not valid.
-        \'\'\'
-        
-        if not self._isStarted :
-            raise self.SubscribeError("Error: subscriber is not started")
-        if isinstance(notifTypes, str) :
-            notifTypes = [notifTypes]
-        for nType in notifTypes :  # subscribe type validation
-            if nType not in self._callback :
-                raise self.SubscribeError("Error subscribe type: {{0}}".format(nType))
-        
-        self._lock.acquire()
-        for nType in notifTypes :
-            self._callback[nType][1] = fun
-            self._callback[nType][2] = isRlbl
-        self._lock.release()
-        
-        mask = unrlblMask = 0
-        # Structure of self._callback.values() :
-        #     [0] - subscription mask mask, 
-        #     [1] - cb-function. Notification is subscribed if [1]!=None, 
-        #     [2] - transport for notification: True - reliable, false - unreliable
-        for cb in self._callback.values() :
-            if cb[1] :
-                mask = mask | cb[0]
-            if cb[2] == False :
-                unrlblMask = unrlblMask | cb[0] 
-        if mask != self._mask or unrlblMask != self._unrlblMask :
-            self._mask = mask
-            self._unrlblMask = unrlblMask
-            self._con.dn_subscribe([0,self._mask], [0,self._unrlblMask])
-
-    #======================== private =========================================
-    
-    def _process(self):
-        while True :
-            try :
-                notif = self._con.getNotification()
-                name = notif[0]
-                if name in self._trNotifNameTable :
-                    name = self._trNotifNameTable[name]
-                self._processOneNotif(name, notif[0], notif[1])
-            except ApiException.QueueError:
-                self._processOneNotif(self.FINISH, self.FINISH, '')
-                self._isStarted = False
-                break
-            except Exception as ex :
-                self._processOneNotif(self.ERROR, self.ERROR, ex)
-    
-    def _processOneNotif(self, notifType, notifName, payload):
-        cb = self._getCallback(notifType)
-        if cb : 
-            cb(notifName, payload)
-    
-    def _getCallback(self, name) :
-        res = None
-
-        self._lock.acquire()
-        if name in self._callback :
-            res = self._callback[name][1]
-        self._lock.release()
-        
-        return res
-'''
-
-#============================ main ============================================
-
-NOTIFICATION_ID = 20
-ERROR_NOTIF     = "error" 
-FINISH_NOTIF    = "finish"
-ALLNOTIF        = "ALLNOTIF"
-
-_SPACE = ' ' * 80
-def indent(pos, s):
-    return ''.join([_SPACE[:pos], s])
-
-def genFile(apiDefFileName, fileName, classComment):
-    
-    
-    nameConst = ''
-    eventDict = ''
-    subscribeDict = ''
-    commentNotifType = ''
-    commentFun = ''
-    notifList = []
-    
-    apiDefName  = os.path.splitext(os.path.basename(apiDefFileName))[0]
-    apiDefClass = globals()[apiDefName]
-    apiDef      = apiDefClass()
-    notifName   = apiDef.idToName(apiDef.NOTIFICATION, NOTIFICATION_ID)
-    notifSubNames = apiDef.getNames(apiDef.NOTIFICATION, [notifName])
-    exNotifList = [ERROR_NOTIF, FINISH_NOTIF]  + notifSubNames 
-    strListNameConst = []
-    for subName in exNotifList:
-        strListNameConst.append(indent(4, '{0:20s} = "{1}"\n'.format(subName.upper(), subName)))
-        notifList.append(subName)
-    strListNameConst.append(indent(4, '{0:20s} = [{1}]\n'.format(ALLNOTIF, ', '.join([n.upper() for n in notifSubNames])))) 
-        
-    # generate comments with list of notification types     
-    commentNotifType = indent(12, ', '.join([n.upper() for n in exNotifList+[ALLNOTIF]])) + '\n'
-    
-    #Generate subscribe masks
-    strList = []
-    for subName in exNotifList :
-        try :
-            val = 1 << apiDef.getDefinition(apiDef.NOTIFICATION, [notifName, subName])['id']
-        except ApiException.CommandError:
-            val = 0 # Ignore error for two reserved 
-        strList.append(indent(12, 'self.{0:17s} : [0x{1:02x}, None, True],\n'.format(subName.upper(), val)))
-    subscribeDict = ''.join(strList)
-    
-    # Generate dictionary for sub-sub notification (events)
-    strList = []
-    for subNotif in apiDef.getNames(apiDef.NOTIFICATION, [notifName]) :
-        try :
-            subSubNames = apiDef.getNames(apiDef.NOTIFICATION, [notifName, subNotif])
-            notifList.remove(subNotif)
-            for name in subSubNames :
-                notifList.append(name)
-                strListNameConst.append(indent(4, '{0:20s} = "{1}"\n'.format(name.upper(), name)))
-                strList.append(indent(4, '"{0}" : "{1}",\n'.format(name, subNotif))) 
-        except Exception :
-            pass
-    nameConst  = ''.join(strListNameConst)
-    eventDict  = ''.join(strList)
-    
-    strList = []
-    strList.append(indent(8, '<table>\n'))
-    strList.append(indent(12, '<tr><th>{0:20s}</th><th>{1}</th>\n'.format('Notification Name', 'Parameter')))
-    for n in notifList :
-        if n == ERROR_NOTIF :
-            res = 'Exception'
-        elif n == FINISH_NOTIF :
-            res = "''"
-        else :
-            res = 'Tuple_' + n
-        strList.append(indent(12, '<tr><td>{0:20s}</td><td>{1}</td>\n'.format(n.upper(), res)))
-    strList.append(indent(8, '</table>'))
-    commentFun  = ''.join(strList)
-    
-    s = TMPL.format(BRIEF_DESCRIPTION = classComment, 
-                    CONST_NAME = nameConst,
-                    EVENT_DICT = eventDict,
-                    SUBSCRIBE_DICT = subscribeDict,
-                    COMMENT_NOTIF_TYPE = commentNotifType,
-                    COMMENT_FUN = commentFun)
-    
-    with open(fileName, "wt") as f :
-        f.write(s)
-    
-def main():
-    if len(sys.argv) < 3:
-        print "Usage: GenIpMgrSubscribe <apiDefinitionFile> <resultFile> [<comment>]"
-        sys.exit(1)
-    
-    comment = ''
-    if len(sys.argv) > 3:
-        comment = sys.argv[3]
-    genFile(sys.argv[1], sys.argv[2], comment)
-    
-if __name__ == '__main__':
-    main()
-
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..'))
+
+#============================ imports =========================================
+
+from   SmartMeshSDK import ApiException
+from   SmartMeshSDK.ApiDefinition.IpMgrDefinition    import IpMgrDefinition
+
+#============================ templates =======================================
+
+TMPL = '''# Warning: Do NOT edit this file directly. Your changes may be overwritten. 
+# This file is automatically generated by GenIpMgrSubscribe.py
+
+import threading
+
+from   SmartMeshSDK import ApiException
+
+class IpMgrSubscribe(object):
+    \'\'\'
+    \\brief {BRIEF_DESCRIPTION}
+    \'\'\'
+    
+    class SubscribeError(Exception) :
+        def __init__(self, msg) :
+            self.msg = msg
+        def __str__(self):
+            return self.msg
+    
+{CONST_NAME}
+    _trNotifNameTable = {{
+{EVENT_DICT}
+    }}
+    
+    # Raw layout of the notifications, to filter them before they are
+    # deserialized (see subscribe()):
+    #     Notification Name :
+    #         Field Name : (offset in the payload, length or None if variable)
+    _NOTIF_ID = {NOTIF_ID}
+    _subIdToName = {{
+{SUBID_DICT}
+    }}
+    _rawFields = {{
+{RAW_FIELDS_DICT}
+    }}
+    
+    #======================== public ==========================================
+    
+    def __init__(self, ipMgrConnector) :
+        # Structure of self._callback :
+        #     Notification Name : 
+        #         [0] - subscription mask mask, 
+        #         [1] - cb-function. Notification is subscribed if [1]!=None, 
+        #         [2] - transport for notification: True - reliable, false - unreliable
+        #         [3] - cb-function is called with lists of notifications (see subscribe())
+        #         [4] - check of the raw notifications, None to take them all (see subscribe())
+        #         [5] - same check, of the deserialized notifications, when the
+        #               connector cannot filter the raw ones (see start())
+        self._callback = {{
+{SUBSCRIBE_DICT}        
+        }}
+        self._con    = ipMgrConnector
+        self._thread = None
+        self._mask = self._unrlblMask = 0
+        self._isStarted = False
+        self._lock = threading.Lock()
+        self._batchSize = 1
+        self._dispatcher = None
+        self._isRawFiltered = False
+        
+    def start(self, batchSize = 1, dispatcher = None):
+        \'\'\'
+        \\brief Start the subscriber _thread.
+        
+        \param batchSize Maximum number of notifications the _thread takes
+            from the connector at once. With more than 1, the notifications
+            are taken with getNotifications(), which costs less per
+            notification under bursts than taking them one at a time.
+        \param dispatcher A NotifDispatcher calling the callbacks of the
+            notifications on its lanes, so that a slow callback does not
+            delay the other notifications. The callbacks of the notifications
+            of a mote (by MAC address) are still called in order. The ERROR
+            and FINISH callbacks are called by the _thread, FINISH once the
+            callbacks dispatched have returned. None to call all the
+            callbacks from the _thread. The dispatcher must run its lanes in
+            threads: callbacks (often bound methods) cannot be sent to worker
+            processes, so a dispatcher created with useProcesses raises a
+            SubscribeError.
+        
+        The notifications are filtered (see subscribe()) before being
+        deserialized when the connector has a setNotifFilter() method, as
+        IpMgrConnectorMux and IpMgrConnectorSerial do; with other connectors,
+        they are filtered once deserialized.
+        \'\'\'
+        
+        if dispatcher and dispatcher.useProcesses :
+            raise self.SubscribeError("Error dispatcher: callbacks cannot run in worker processes")
+        
+        if self._thread :   # Wait finish disconnect process
+            try :
+                self._thread.join(1.0)
+                if  self._thread.isAlive() :
+                    raise ApiException.ConnectionError("Already connected")
+            except RuntimeError :
+                pass    # Ignore join error
+            self._thread = None 
+        
+        # Clear _callback table
+        for i in self._callback :
+            self._callback[i][1] = None
+            self._callback[i][2] = True
+            self._callback[i][3] = False
+            self._callback[i][4] = None
+            self._callback[i][5] = None
+        self._mask = self._unrlblMask = 0
+        self._batchSize = batchSize
+        self._dispatcher = dispatcher
+        self._isRawFiltered = hasattr(self._con, 'setNotifFilter')
+        if self._isRawFiltered :
+            self._con.setNotifFilter(self._isWanted)
+        self._thread = threading.Thread(target = self._process) 
+        self._thread.name = "IpMgrSubscribe"
+        self._thread.start()
+        self._isStarted = True
+        
+    def subscribe(self, notifTypes, fun, isRlbl, isBatch = False,
+                  macs = None, srcPorts = None, dstPorts = None, payloadPrefix = None):
+        \'\'\'
+        \\brief Subscribe to notification(s).
+        
+        Calling this function multiple times will not cancel the effects of
+        the previous calls.
+        
+        \pre Call start() before calling this function.
+        
+        \param notifTypes Type(s) of notification(s) to subscribe to. This can
+            be a single string (when subscribing to a single notification), or
+            a list of strings (when subscribing to multiple notifications).
+            The list of possible types is:
+{COMMENT_NOTIF_TYPE}
+        \param fun The function to call when any of the notification types
+            specified in the notifTypes parameter occurs. If you wish to assign
+            a different _callback function to different notification types,
+            call this function multiple times. The signature of the function
+            needs to be fun(<notification name>, <notification parameter>),
+            as described below.
+        \param isRlbl define type of transport using for delivery 
+             notification: reliable (True) or best effort (False)
+        \param isBatch call fun once per batch of notifications taken from
+            the connector (see start()), with the list of the (<notification
+            name>, <notification parameter>) tuples of the batch it
+            subscribed to, instead of once per notification.
+        \param macs only pass the notifications from one of these MAC
+            addresses (each a list of 8 bytes) to fun.
+        \param srcPorts only pass the notifications from one of these ports.
+        \param dstPorts only pass the notifications to one of these ports.
+        \param payloadPrefix only pass the notifications whose
+            variable-length field (e.g. the data of NOTIFDATA) starts with
+            these bytes (a list of bytes).
+        The filters are checked on the raw notifications, which are only
+        deserialized if they pass them (and if a function is subscribed to
+        their type at all), or on the deserialized notifications if the
+        connector cannot filter the raw ones (see start()). A filter on a
+        field which one of the notification types does not have raises
+        SubscribeError.
+        
+        The _callback function is called with a notification name and a
+        notification parameter. Depending on the type of notification, the
+        parameter will be of a different format, according to the table below.
+        
+{COMMENT_FUN}
+        
+        \exception IpMgrSubscribe.SubscribeError The subscriber hasn't been
+            started, or the notification type(s) specified is (are) not valid.
+        \'\'\'
+        
+        if not self._isStarted :
+            raise self.SubscribeError("Error: subscriber is not started")
+        if isinstance(notifTypes, str) :
+            notifTypes = [notifTypes]
+        for nType in notifTypes :  # subscribe type validation
+            if nType not in self._callback :
+                raise self.SubscribeError("Error subscribe type: {{0}}".format(nType))
+        checks = {{}}
+        for nType in notifTypes :
+            checks[nType] = self._compileFilter(nType, macs, srcPorts, dstPorts, payloadPrefix)
+        
+        self._lock.acquire()
+        for nType in notifTypes :
+            self._callback[nType][1] = fun
+            self._callback[nType][2] = isRlbl
+            self._callback[nType][3] = isBatch
+            (self._callback[nType][4], self._callback[nType][5]) = checks[nType]
+            if self._isRawFiltered :
+                self._callback[nType][5] = None
+        self._lock.release()
+        
+        mask = unrlblMask = 0
+        # Structure of self._callback.values() :
+        #     [0] - subscription mask mask, 
+        #     [1] - cb-function. Notification is subscribed if [1]!=None, 
+        #     [2] - transport for notification: True - reliable, false - unreliable
+        for cb in self._callback.values() :
+            if cb[1] :
+                mask = mask | cb[0]
+            if cb[2] == False :
+                unrlblMask = unrlblMask | cb[0] 
+        if mask != self._mask or unrlblMask != self._unrlblMask :
+            self._mask = mask
+            self._unrlblMask = unrlblMask
+            self._con.dn_subscribe([0,self._mask], [0,self._unrlblMask])
+
+    #======================== private =========================================
+    
+    def _process(self):
+        while True :
+            try :
+                if self._batchSize > 1 :
+                    self._processBatch(self._con.getNotifications(self._batchSize))
+                    continue
+                notif = self._con.getNotification()
+                name = notif[0]
+                if name in self._trNotifNameTable :
+                    name = self._trNotifNameTable[name]
+                self._processOneNotif(name, notif[0], notif[1])
+            except ApiException.QueueError:
+                if self._dispatcher :
+                    self._dispatcher.join()
+                self._processOneNotif(self.FINISH, self.FINISH, '')
+                self._isStarted = False
+                break
+            except Exception as ex :
+                self._processOneNotif(self.ERROR, self.ERROR, ex)
+    
+    def _processOneNotif(self, notifType, notifName, payload):
+        (cb, isBatch, check) = self._getCallback(notifType)
+        if not cb :
+            return
+        if check and not check(payload) :
+            return
+        if isBatch :
+            args = ([(notifName, payload)],)
+        else :
+            args = (notifName, payload)
+        if self._dispatcher and notifType not in [self.ERROR, self.FINISH] :
+            self._dispatcher.dispatch(self._keyOf(payload), cb, args, self._onDispatchError)
+        else :
+            cb(*args)
+    
+    def _processBatch(self, notifs):
+        # look the callbacks up once per batch
+        self._lock.acquire()
+        callbacks = dict([(name, (cb[1], cb[3], cb[5])) for (name, cb) in self._callback.items()])
+        self._lock.release()
+        
+        # with a dispatcher, a batch per cb-function and lane, to keep the
+        # notifications of a mote in order
+        dispatcher = self._dispatcher
+        batches = []    # [(cb-function, key, notifications)], in the order of their first notification
+        batchOf = {{}}    # {{(cb-function, lane): notifications}}
+        for (notifName, payload) in notifs :
+            (cb, isBatch, check) = callbacks.get(self._trNotifNameTable.get(notifName, notifName), (None, False, None))
+            if not cb :
+                continue
+            if check and not check(payload) :
+                continue
+            key = self._keyOf(payload) if dispatcher else None
+            if isBatch :
+                lane = dispatcher.laneOf(key) if dispatcher else None
+                if (cb, lane) not in batchOf :
+                    batchOf[(cb, lane)] = []
+                    batches.append((cb, key, batchOf[(cb, lane)]))
+                batchOf[(cb, lane)].append((notifName, payload))
+            else :
+                self._dispatchCallback(cb, key, notifName, payload)
+        for (cb, key, batch) in batches :
+            self._dispatchCallback(cb, key, batch)
+    
+    def _dispatchCallback(self, cb, key, *args):
+        if self._dispatcher :
+            self._dispatcher.dispatch(key, cb, args, self._onDispatchError)
+        else :
+            self._callOneCallback(cb, *args)
+    
+    def _callOneCallback(self, cb, *args):
+        try :
+            cb(*args)
+        except Exception as ex :
+            self._processOneNotif(self.ERROR, self.ERROR, ex)
+    
+    def _onDispatchError(self, ex) :
+        # called by a lane of the dispatcher
+        self._processOneNotif(self.ERROR, self.ERROR, ex)
+    
+    def _keyOf(self, payload) :
+        # the key of the lane of a notification, its MAC address if it has one
+        return getattr(payload, 'macAddress', None)
+    
+    def _isWanted(self, cmdId, payload) :
+        # called by the input thread of the connector, with the raw notification
+        if cmdId != self._NOTIF_ID or len(payload) < 1 :
+            return True
+        name = self._subIdToName.get(ord(payload[0]))
+        if name is None :
+            return True     # let the deserializer report it
+        cb = self._callback[name]
+        if not cb[1] :
+            return False
+        return cb[4] is None or cb[4](payload)
+    
+    def _compileFilter(self, nType, macs, srcPorts, dstPorts, payloadPrefix) :
+        \'\'\'
+        \\brief Build the checks of the notifications of type nType, for the
+               filters of subscribe(): that of the raw notifications, and
+               that of the deserialized ones. Returns (None, None) if there
+               is no filter.
+        \'\'\'
+        fields = self._rawFields.get(nType, {{}})
+        def getField(name, isVariable = False) :
+            for (fieldName, (offset, length)) in fields.items() :
+                if fieldName == name or (isVariable and length is None) :
+                    return (fieldName, offset, length)
+            raise self.SubscribeError("Error filter: {{0}} has no {{1}}".format(nType, name))
+        
+        checks = []     # [(field name, offset, length, acceptable values)]
+        if macs is not None :
+            (name, offset, length) = getField('macAddress')
+            checks.append((name, offset, length, set([''.join(chr(b) for b in mac) for mac in macs])))
+        if srcPorts is not None :
+            (name, offset, length) = getField('srcPort')
+            checks.append((name, offset, length, set([chr(p >> 8) + chr(p & 0xff) for p in srcPorts])))
+        if dstPorts is not None :
+            (name, offset, length) = getField('dstPort')
+            checks.append((name, offset, length, set([chr(p >> 8) + chr(p & 0xff) for p in dstPorts])))
+        if payloadPrefix is not None :
+            (name, offset, length) = getField('payload', isVariable = True)
+            checks.append((name, offset, len(payloadPrefix), set([''.join(chr(b) for b in payloadPrefix)])))
+        if not checks :
+            return (None, None)
+        
+        minLen = max([offset + length for (name, offset, length, values) in checks])
+        def check(payload) :
+            if len(payload) < minLen :
+                return False
+            for (name, offset, length, values) in checks :
+                if payload[offset:offset + length].tobytes() not in values :
+                    return False
+            return True
+        def checkFields(notifParams) :
+            for (name, offset, length, values) in checks :
+                value = getattr(notifParams, name, None)
+                if isinstance(value, (int, long)) :
+                    value = chr(value >> 8) + chr(value & 0xff)
+                elif value is not None :
+                    value = str(bytearray(value[:length]))
+                if value not in values :
+                    return False
+            return True
+        return (check, checkFields)
+    
+    def _getCallback(self, name) :
+        res = (None, False, None)
+
+        self._lock.acquire()
+        if name in self._callback :
+            res = (self._callback[name][1], self._callback[name][3], self._callback[name][5])
+        self._lock.release()
+        
+        return res
+'''
+
+#============================ main ============================================
+
+NOTIFICATION_ID = 20
+ERROR_NOTIF     = "error" 
+FINISH_NOTIF    = "finish"
+ALLNOTIF        = "ALLNOTIF"
+
+_SPACE = ' ' * 80
+def indent(pos, s):
+    return ''.join([_SPACE[:pos], s])
+
+def genFile(apiDefFileName, fileName, classComment):
+    
+    
+    nameConst = ''
+    eventDict = ''
+    subscribeDict = ''
+    commentNotifType = ''
+    commentFun = ''
+    notifList = []
+    
+    apiDefName  = os.path.splitext(os.path.basename(apiDefFileName))[0]
+    apiDefClass = globals()[apiDefName]
+    apiDef      = apiDefClass()
+    notifName   = apiDef.idToName(apiDef.NOTIFICATION, NOTIFICATION_ID)
+    notifSubNames = apiDef.getNames(apiDef.NOTIFICATION, [notifName])
+    exNotifList = [ERROR_NOTIF, FINISH_NOTIF]  + notifSubNames 
+    strListNameConst = []
+    for subName in exNotifList:
+        strListNameConst.append(indent(4, '{0:20s} = "{1}"\n'.format(subName.upper(), subName)))
+        notifList.append(subName)
+    strListNameConst.append(indent(4, '{0:20s} = [{1}]\n'.format(ALLNOTIF, ', '.join([n.upper() for n in notifSubNames])))) 
+        
+    # generate comments with list of notification types     
+    commentNotifType = indent(12, ', '.join([n.upper() for n in exNotifList+[ALLNOTIF]])) + '\n'
+    
+    #Generate subscribe masks
+    strList = []
+    for subName in exNotifList :
+        try :
+            val = 1 << apiDef.getDefinition(apiDef.NOTIFICATION, [notifName, subName])['id']
+        except ApiException.CommandError:
+            val = 0 # Ignore error for two reserved 
+        strList.append(indent(12, 'self.{0:17s} : [0x{1:02x}, None, True, False, None, None],\n'.format(subName.upper(), val)))
+    subscribeDict = ''.join(strList)
+    
+    # Generate dictionary for sub-sub notification (events)
+    strList = []
+    for subNotif in apiDef.getNames(apiDef.NOTIFICATION, [notifName]) :
+        try :
+            subSubNames = apiDef.getNames(apiDef.NOTIFICATION, [notifName, subNotif])
+            notifList.remove(subNotif)
+            for name in subSubNames :
+                notifList.append(name)
+                strListNameConst.append(indent(4, '{0:20s} = "{1}"\n'.format(name.upper(), name)))
+                strList.append(indent(4, '"{0}" : "{1}",\n'.format(name, subNotif))) 
+        except Exception :
+            pass
+    nameConst  = ''.join(strListNameConst)
+    eventDict  = ''.join(strList)
+    
+    # Generate the raw layout of the notifications, for the filters
+    subIdList     = []
+    rawFieldsList = []
+    for subName in notifSubNames :
+        definition = apiDef.getDefinition(apiDef.NOTIFICATION, [notifName, subName])
+        subIdList.append(indent(4, '{0} : "{1}",\n'.format(definition['id'], subName)))
+        offset = 1  # the subId of the notification
+        fieldList = []
+        fieldDefs = definition['response'].values()[0]  # a single group, 'FIELDS' or 'System'
+        for (fieldName, fieldType, fieldLen, _) in fieldDefs :
+            if not fieldName.startswith('_') :
+                fieldList.append('"{0}" : ({1}, {2})'.format(fieldName, offset, fieldLen))
+            if fieldLen is None :
+                break
+            offset += fieldLen
+        rawFieldsList.append(indent(4, '"{0}" : {{{1}}},\n'.format(subName, ', '.join(fieldList))))
+    subIdDict     = ''.join(subIdList)
+    rawFieldsDict = ''.join(rawFieldsList)
+    
+    strList = []
+    strList.append(indent(8, '<table>\n'))
+    strList.append(indent(12, '<tr><th>{0:20s}</th><th>{1}</th>\n'.format('Notification Name', 'Parameter')))
+    for n in notifList :
+        if n == ERROR_NOTIF :
+            res = 'Exception'
+        elif n == FINISH_NOTIF :
+            res = "''"
+        else :
+            res = 'Tuple_' + n
+        strList.append(indent(12, '<tr><td>{0:20s}</td><td>{1}</td>\n'.format(n.upper(), res)))
+    strList.append(indent(8, '</table>'))
+    commentFun  = ''.join(strList)
+    
+    s = TMPL.format(BRIEF_DESCRIPTION = classComment, 
+                    CONST_NAME = nameConst,
+                    EVENT_DICT = eventDict,
+                    NOTIF_ID = NOTIFICATION_ID,
+                    SUBID_DICT = subIdDict,
+                    RAW_FIELDS_DICT = rawFieldsDict,
+                    SUBSCRIBE_DICT = subscribeDict,
+                    COMMENT_NOTIF_TYPE = commentNotifType,
+                    COMMENT_FUN = commentFun)
+    
+    with open(fileName, "wt") as f :
+        f.write(s)
+    
+def main():
+    if len(sys.argv) < 3:
+        print "Usage: GenIpMgrSubscribe <apiDefinitionFile> <resultFile> [<comment>]"
+        sys.exit(1)
+    
+    comment = ''
+    if len(sys.argv) > 3:
+        comment = sys.argv[3]
+    genFile(sys.argv[1], sys.argv[2], comment)
+    
+if __name__ == '__main__':
+    main()
+
@@ -1,11 +1,14 @@
 import copy
+import threading
+import Queue
 import xmlrpclib
 
 from NotifReader                  import NotifReader
+from XmlRpcPool                   import XmlRpcPool
 
 from SmartMeshSDK                 import ApiException
 from SmartMeshSDK.ApiConnector    import ApiConnector
-from SmartMeshSDK.ApiDefinition   import HartMgrDefinition
+from SmartMeshSDK.ApiDefinition   import DefinitionLoader
 
 # Add a log handler for the HART Manager
 
@@ -29,18 +32,24 @@ class HartMgrConnectorInternal(ApiConnector):
     DEFAULT_PORT = 4445
     DEFAULT_USER = 'admin'
     DEFAULT_PASS = 'admin'
+    DEFAULT_NUM_CONNECTIONS = 4
+    MAX_BATCH_SIZE = 50   # commands per system.multicall request
 
-    DEFAULT_CONNECT_PARAMS = {'host':     DEFAULT_HOST,
-                              'port':     DEFAULT_PORT,
-                              'user':     DEFAULT_USER,
-                              'password': DEFAULT_PASS,
-                              'use_ssl':  False,
+    # num_connections: XML-RPC connections opened for calls made in parallel
+    # use_multicall:   let sendBatch() use system.multicall (if supported)
+    DEFAULT_CONNECT_PARAMS = {'host':            DEFAULT_HOST,
+                              'port':            DEFAULT_PORT,
+                              'user':            DEFAULT_USER,
+                              'password':        DEFAULT_PASS,
+                              'use_ssl':         False,
+                              'num_connections': DEFAULT_NUM_CONNECTIONS,
+                              'use_multicall':   True,
                               }
 
     def __init__(self):
         # TODO: init super?
         ApiConnector.__init__(self) # TODO: maxQSize
-        self.apidef = HartMgrDefinition.HartMgrDefinition()
+        self.apidef = DefinitionLoader.getDefinition('HartMgrDefinition')
         self.manager = None
         self.login_token = None
         self.notif_token = None
@@ -49,10 +58,12 @@ class HartMgrConnectorInternal(ApiConnector):
     def getApiDefinition(self):
         return self.apidef
 
-    def _init_xmlrpc(self, host, port, use_ssl = False):
+    def _init_xmlrpc(self, host, port, use_ssl = False, num_connections = 1):
         scheme = 'http' if not use_ssl else 'https'
         xmlrpc_url = "%s://%s:%d" % (scheme, host, port)
-        rpc_client = xmlrpclib.ServerProxy(xmlrpc_url)        
+        # the pool is called like a xmlrpclib.ServerProxy, and keeps its
+        # connections alive between calls
+        rpc_client = XmlRpcPool(xmlrpc_url, num_connections)
         # xmlrpclib.Fault exceptions are passed up to the caller
         return rpc_client
         
@@ -64,7 +75,8 @@ class HartMgrConnectorInternal(ApiConnector):
         try:
             self.manager = self._init_xmlrpc(self.connect_params['host'],
                                              int(self.connect_params['port']),
-                                             bool(self.connect_params['use_ssl']))
+                                             bool(self.connect_params['use_ssl']),
+                                             int(self.connect_params['num_connections']))
 
             self.login(self.connect_params['user'], self.connect_params['password'])
 
@@ -77,6 +89,7 @@ class HartMgrConnectorInternal(ApiConnector):
     def disconnect(self, reason = None):
         self.unsubscribe_override(['unsubscribe'], {})
         self.logout()
+        self.manager.close()
         log.info('Disconnected from %s' % self.connect_params['host'])
         ApiConnector.disconnect(self, reason)
         
@@ -93,26 +106,117 @@ class HartMgrConnectorInternal(ApiConnector):
             resp = cmd_override(cmd_name, cmd_params)
             return resp
         
+        (cmd_id, params) = self._serialize(cmd_name, cmd_params)
+        try: 
+            xmlrpc_resp = self.manager.call(cmd_id, *params)
+        except xmlrpclib.Fault as ex:
+            log.error(str(ex))
+            raise ApiException.APIError(cmd_name[0], str(ex))
+
+        return self._deserialize(cmd_name, cmd_metadata, xmlrpc_resp)
+
+    def sendBatch(self, requests):
+        '''\brief Send several commands, and wait for all their responses.
+
+        The commands are boxcarred into system.multicall requests of up to
+        MAX_BATCH_SIZE commands, sent in parallel on the connections of the
+        pool. If the manager does not implement system.multicall (or the
+        'use_multicall' connection parameter is False), the commands are sent
+        one by one, still in parallel.
+
+        \param requests A list of (cmd_name, cmd_params) tuples, as passed to
+                        send(), e.g. (['getMoteStatistics'], {'macAddr': ..}).
+
+        \returns The list of the responses to the commands, in order: the
+                 dictionary send() would return or, for a command which failed,
+                 the ApiException.APIError send() would raise.
+        '''
+        if not self.login_token:
+            raise ApiException.ConnectionError('not connected')
+
+        responses = [None] * len(requests)
+        calls = []       # (index in requests, cmd_id, params)
+        for i, (cmd_name, cmd_params) in enumerate(requests):
+            cmd_metadata = self.apidef.getDefinition(self.apidef.COMMAND, cmd_name)
+            if 'command_override' in cmd_metadata:
+                # e.g. subscribe, which is not a plain XML-RPC call
+                responses[i] = self.send(cmd_name, cmd_params)
+            else:
+                calls.append((i,) + self._serialize(cmd_name, cmd_params))
+
+        if self.connect_params['use_multicall']:
+            batches = [calls[i:i+self.MAX_BATCH_SIZE] for i in range(0, len(calls), self.MAX_BATCH_SIZE)]
+        else:
+            batches = [[call] for call in calls]
+        batch_queue = Queue.Queue()
+        for batch in batches:
+            batch_queue.put(batch)
+        errors = []
+
+        def send_batches():
+            while not errors:
+                try:
+                    batch = batch_queue.get_nowait()
+                except Queue.Empty:
+                    return
+                try:
+                    if len(batch) == 1:
+                        (i, cmd_id, params) = batch[0]
+                        try:
+                            results = [self.manager.call(cmd_id, *params)]
+                        except xmlrpclib.Fault as ex:
+                            results = [ex]
+                    else:
+                        results = self.manager.multicall([(cmd_id, params) for (i, cmd_id, params) in batch])
+                except Exception as ex:
+                    # e.g. the connection to the manager failed
+                    errors.append(ex)
+                    return
+                for (i, cmd_id, params), xmlrpc_resp in zip(batch, results):
+                    responses[i] = xmlrpc_resp
+
+        num_threads = min(len(batches), int(self.connect_params['num_connections']))
+        threads = [threading.Thread(target=send_batches) for _ in range(num_threads - 1)]
+        for t in threads:
+            t.start()
+        send_batches()
+        for t in threads:
+            t.join()
+        if errors:
+            if isinstance(errors[0], xmlrpclib.Fault):
+                log.error(str(errors[0]))
+                raise ApiException.APIError('system.multicall', str(errors[0]))
+            raise errors[0]
+
+        for (i, cmd_id, params) in calls:
+            cmd_name = requests[i][0]
+            if isinstance(responses[i], xmlrpclib.Fault):
+                log.error(str(responses[i]))
+                responses[i] = ApiException.APIError(cmd_name[0], str(responses[i]))
+            else:
+                cmd_metadata = self.apidef.getDefinition(self.apidef.COMMAND, cmd_name)
+                responses[i] = self._deserialize(cmd_name, cmd_metadata, responses[i])
+        return responses
+
+    def _serialize(self, cmd_name, cmd_params):
+        'Returns the XML-RPC method and parameter list of a command'
         # construct the XML-RPC parameter list
         # validation happens automatically as part of serialization
         param_list = self.apidef.serialize(cmd_name, cmd_params)
-        log.info('Sending %s: %s' % (cmd_name, param_list))
+        log.info('Sending %s: %s', cmd_name, param_list)
 
         # call method by string name, params is a list of the parameters
         params = [self.login_token] + param_list
         cmd_id = self.apidef.nameToId(self.apidef.COMMAND, cmd_name)
-        try: 
-            xmlrpc_resp = getattr(self.manager, cmd_id)(*params)
-        except xmlrpclib.Fault as ex:
-            log.error(str(ex))
-            raise ApiException.APIError(cmd_name[0], str(ex))
+        return (cmd_id, params)
 
-        log.info('Received response %s: %s' % (cmd_name, xmlrpc_resp))
+    def _deserialize(self, cmd_name, cmd_metadata, xmlrpc_resp):
+        'Parse the XML-RPC response to a command into a dict'
+        log.info('Received response %s: %s', cmd_name, xmlrpc_resp)
         # call deserialize to parse the response into a dict
         resp = self.apidef.deserialize(cmd_name, xmlrpc_resp)
         
         # call a command-specific post-processor method
-        cmd_metadata = self.apidef.getDefinition(self.apidef.COMMAND, cmd_name)
         if 'post_processor' in cmd_metadata:
             post_processor = getattr(self, cmd_metadata['post_processor'])
             post_processor(resp)
@@ -191,12 +295,12 @@ class HartMgrConnectorInternal(ApiConnector):
         'Handle a disconnection from the notification channel'
         self.queue.putDisconnectNotification(reason)
 
-    def handle_notif(self, notif_name, notif_str):
-        'Parse a notification'
+    def handle_notif(self, notif_name, notif_obj):
+        'Parse a notification, read by the NotifParser'
         try:
-            notif = self.apidef.parse_notif([notif_name], notif_str)
-            log.info('Received notification %s: %s', notif_name, str(notif))
+            notif = self.apidef.parse_notif_obj([notif_name], notif_obj)
+            log.info('Received notification %s: %s', notif_name, notif)
             self.putNotification(notif)
         except ApiException.CommandError as ex:
-            log.warn('Unknown notification type %s: %s', notif_name, notif_str)
+            log.warn('Unknown notification type %s: %s', notif_name, notif_obj)
         
@@ -4,6 +4,7 @@ import socket
 import ssl
 import threading
 import traceback
+from xml.parsers import expat
 
 from SmartMeshSDK import ApiException
 
@@ -19,6 +20,8 @@ log = logging.getLogger('HartManager')
 log.setLevel(logging.INFO)
 log.addHandler(NullHandler())
 
+NOTIF_READ_SIZE = 65536     # bytes read from the notification channel at once
+
 
 class NotifSeparator(object):
     """Notification Separator
@@ -28,7 +31,8 @@ class NotifSeparator(object):
     from the stream and treats the notification as a string.
 
     In the HartMgrConnector, the notification XML string is parsed by
-    the HartMgrDefinition. 
+    the HartMgrDefinition. NotifReader uses the NotifParser, which parses
+    the stream once.
     """
     NOTIF_TYPES = [ 'data', 'event', 'measurement', 'log', 'cli', 'stdMoteReport', 'vendorMoteReport' ]
 
@@ -77,6 +81,101 @@ class NotifSeparator(object):
             log.debug(traceback.format_exc())
 
 
+class NotifParser(object):
+    """Streaming Notification Parser
+
+    Parses the notification stream incrementally, with expat, as it is read
+    from the socket: each byte is parsed once, and each notification is
+    passed to the callback as the dict of its child elements, built from the
+    parser events rather than from a DOM tree. The dict is the one
+    xmlutils.element_to_dict builds, ready for
+    HartMgrDefinition.parse_notif_obj.
+
+    Elements outside of a notification (e.g. the authentication response)
+    are skipped. On malformed XML, the parser logs the error, skips the
+    offending tag and resumes with the next one.
+    """
+    NOTIF_TYPES = NotifSeparator.NOTIF_TYPES
+    STREAM_ROOT = '<notifStream>'   # wraps the stream, which has no root element
+
+    def __init__(self, cb):
+        self.notif_handler = cb
+        self.notif_types = set(self.NOTIF_TYPES)
+        self._reset()
+
+    def _reset(self):
+        self.parser = expat.ParserCreate()
+        self.parser.returns_unicode = False
+        self.parser.buffer_text = True
+        self.parser.StartElementHandler = self._start_element
+        self.parser.EndElementHandler = self._end_element
+        self.parser.CharacterDataHandler = self._char_data
+        # elements open in the current notification, as
+        # [name, list of text pieces, dict of child elements or None]
+        self.stack = []
+        self.parser.Parse(self.STREAM_ROOT, False)
+        self.num_parsed = len(self.STREAM_ROOT)
+
+    def parse(self, input_str):
+        while input_str:
+            try:
+                self.parser.Parse(input_str, False)
+                self.num_parsed += len(input_str)
+                return
+            except expat.ExpatError as ex:
+                # resume after the offending tag
+                error_index = max(self.parser.ErrorByteIndex - self.num_parsed, 0)
+                log.error('Exception parsing notification stream: %s', ex)
+                tag_end = input_str.find('>', error_index)
+                if tag_end == -1:
+                    input_str = ''
+                else:
+                    input_str = input_str[tag_end+1:]
+                self._reset()
+
+    def _start_element(self, name, attrs):
+        stack = self.stack
+        if stack:
+            parent = stack[-1]
+            if parent[2] is None:
+                parent[2] = {}
+            for attr_name, val in attrs.items():
+                parent[2][name + attr_name.capitalize()] = val
+        elif name not in self.notif_types:
+            return
+        stack.append([name, [], None])
+
+    def _char_data(self, data):
+        if self.stack:
+            self.stack[-1][1].append(data)
+
+    def _end_element(self, name):
+        stack = self.stack
+        if not stack:
+            return
+        (name, text, children) = stack.pop()
+        if stack:
+            # the value of an element is its child elements, or its text
+            value = children if children is not None else ''.join(text)
+            siblings = stack[-1][2]
+            if name in siblings:
+                if not type(siblings[name]) is list:
+                    siblings[name] = [siblings[name]]
+                siblings[name].append(value)
+            else:
+                siblings[name] = value
+        else:
+            self._handle_notif(name, children or {})
+
+    def _handle_notif(self, notif_type, notif_obj):
+        'Pass the notification to the callback handler'
+        try:
+            self.notif_handler(notif_type, notif_obj)
+        except Exception, ex:
+            log.error('Exception handling notif: ' + str(ex))
+            log.debug(traceback.format_exc())
+
+
 class NotifReader(threading.Thread):
     '''NotifReader listens to the notification channel (TCP socket) and
     pushes notifications into the notification queue in the HartMgrConnector
@@ -93,7 +192,7 @@ class NotifReader(threading.Thread):
         self.use_ssl = use_ssl
         self.connected = False
         self.disconnect_callback = disconnect_callback
-        self.notif_parser = NotifSeparator(notif_callback)
+        self.notif_parser = NotifParser(notif_callback)
 
     def _build_auth(self):
         return '<dustnet><authrq><token>%s</token></authrq></dustnet>' % self.notif_token
@@ -117,12 +216,11 @@ class NotifReader(threading.Thread):
         try:
             while True:
                 # read from notif socket
-                input_data = self.notif_socket.recv(1024)
+                input_data = self.notif_socket.recv(NOTIF_READ_SIZE)
                 if not input_data:
                     log.info('Notification channel closed')
                     break
-                msg = 'Notif input [%d]: %s' % (len(input_data), input_data)
-                log.debug(msg)
+                log.debug('Notif input [%d]: %s', len(input_data), input_data)
                 try:
                     self.notif_parser.parse(input_data)
                 except Exception, e:
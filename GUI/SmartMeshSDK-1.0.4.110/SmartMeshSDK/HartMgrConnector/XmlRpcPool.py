@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+import Queue
+import threading
+import xmlrpclib
+
+# Set up logging
+
+import logging
+
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+
+log = logging.getLogger('HartManager')
+log.setLevel(logging.INFO)
+log.addHandler(NullHandler())
+
+
+class _PoolMethod(object):
+    'A method of the manager, called on a connection of the pool'
+
+    def __init__(self, pool, name):
+        self.pool = pool
+        self.name = name
+
+    def __getattr__(self, name):
+        # dotted method names, e.g. system.listMethods
+        return _PoolMethod(self.pool, '%s.%s' % (self.name, name))
+
+    def __call__(self, *params):
+        return self.pool.call(self.name, *params)
+
+
+class XmlRpcPool(object):
+    '''XmlRpcPool keeps up to pool_size HTTP/1.1 connections to the manager's
+    XML-RPC server open, and shares them between threads.
+
+    A xmlrpclib.ServerProxy holds a single connection, which two threads
+    cannot use at once. The pool lends each call a ServerProxy of its own,
+    opening a new one only when all are busy, so parallel calls use parallel
+    connections and sequential calls reuse the same kept-alive connection.
+
+    Methods of the manager are called as on a ServerProxy:
+    pool.login(user, password). multicall() boxcars several calls into a
+    single request, with system.multicall.
+    '''
+
+    def __init__(self, url, pool_size=1):
+        self.url = url
+        self.pool_size = pool_size
+        self.idle = Queue.LifoQueue()   # most recently used connection first
+        self.lock = threading.Lock()
+        self.proxies = []
+        self.multicall_supported = None # unknown until the first multicall
+        self.num_calls = 0
+        self.num_multicalls = 0
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _PoolMethod(self, name)
+
+    def _acquire(self):
+        try:
+            return self.idle.get_nowait()
+        except Queue.Empty:
+            pass
+        with self.lock:
+            if len(self.proxies) < self.pool_size:
+                proxy = xmlrpclib.ServerProxy(self.url)
+                self.proxies.append(proxy)
+                log.debug('Opened XML-RPC connection %d to %s', len(self.proxies), self.url)
+                return proxy
+        return self.idle.get()
+
+    def _release(self, proxy):
+        self.idle.put(proxy)
+
+    def call(self, method_name, *params):
+        '''Call a method of the manager on an idle connection, waiting for one
+        if pool_size calls are already in progress.
+
+        xmlrpclib.Fault exceptions are passed up to the caller.
+        '''
+        proxy = self._acquire()
+        try:
+            self.num_calls += 1
+            return getattr(proxy, method_name)(*params)
+        finally:
+            self._release(proxy)
+
+    def multicall(self, calls):
+        '''Call several methods of the manager in a single request.
+
+        calls is a list of (method_name, params) tuples. Returns the list of
+        their results, in order, with an xmlrpclib.Fault in place of the
+        result of a call which failed.
+
+        If the manager does not implement system.multicall, the calls are
+        made one by one, on the same connection.
+        '''
+        proxy = self._acquire()
+        try:
+            if self.multicall_supported is not False:
+                batch = xmlrpclib.MultiCall(proxy)
+                for method_name, params in calls:
+                    getattr(batch, method_name)(*params)
+                try:
+                    self.num_multicalls += 1
+                    results = batch().results
+                    self.multicall_supported = True
+                except xmlrpclib.Fault as ex:
+                    if self.multicall_supported:
+                        raise
+                    log.info('system.multicall not supported (%s), calling one by one', ex)
+                    self.multicall_supported = False
+                else:
+                    return [self._multicall_result(r) for r in results]
+
+            results = []
+            for method_name, params in calls:
+                self.num_calls += 1
+                try:
+                    results.append(getattr(proxy, method_name)(*params))
+                except xmlrpclib.Fault as ex:
+                    results.append(ex)
+            return results
+        finally:
+            self._release(proxy)
+
+    def _multicall_result(self, result):
+        if type(result) is dict:
+            return xmlrpclib.Fault(result['faultCode'], result['faultString'])
+        return result[0]
+
+    def getStats(self):
+        'Returns the number of connections, calls and multicalls made'
+        return {'num_connections': len(self.proxies),
+                'num_calls':       self.num_calls,
+                'num_multicalls':  self.num_multicalls,
+                }
+
+    def close(self):
+        'Close the connections of the pool'
+        with self.lock:
+            for proxy in self.proxies:
+                proxy('close')()
+            self.proxies = []
+            self.idle = Queue.LifoQueue()
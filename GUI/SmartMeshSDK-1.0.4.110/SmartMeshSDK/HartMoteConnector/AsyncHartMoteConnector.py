@@ -0,0 +1,24 @@
+from SmartMeshSDK.ApiDefinition   import DefinitionLoader
+from SmartMeshSDK.SerialConnector import AsyncSerialConnector
+
+import HartMoteConnectorInternal
+import HartMoteConnector
+
+class AsyncHartMoteConnector(HartMoteConnectorInternal.HartMoteHeader,AsyncSerialConnector.AsyncSerialConnector):
+    '''
+    \ingroup ApiConnector
+    
+    \brief Public class for HART mote connector, over Serial, driven by an
+           asyncio event loop.
+    
+    Its dn_*() methods are coroutines, with the same parameters and return
+    values as the ones of HartMoteConnector.
+    '''
+    
+    def __init__(self, maxQSize=100, loop=None):
+        api_def = DefinitionLoader.getDefinition('HartMoteDefinition')
+        AsyncSerialConnector.AsyncSerialConnector.__init__(self,api_def, maxQSize, loop)
+
+AsyncSerialConnector.addDnCalls(AsyncHartMoteConnector,
+                                HartMoteConnector.HartMoteConnector,
+                                DefinitionLoader.getDefinition('HartMoteDefinition'))
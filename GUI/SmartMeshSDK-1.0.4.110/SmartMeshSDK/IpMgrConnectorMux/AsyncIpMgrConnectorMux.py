@@ -0,0 +1,396 @@
+#!/usr/bin/python
+
+'''
+asyncio flavour of IpMgrConnectorMux.
+
+The threaded IpMgrConnectorMux runs one thread per Serial Mux connection,
+reading its socket. Here, a single event loop drives the connections to any
+number of managers: the socket is read by the loop, split into messages by a
+MuxMsg in a MuxProtocol, and the commands and notifications are exchanged
+through coroutines. As with IpMgrConnectorMux, several commands can be in
+flight on each connection, matched to their acknowledges by their Serial Mux
+command ID.
+
+Python 2 has no asyncio; this module uses its backport, trollius, as
+AsyncSerialConnector does.
+
+Example:
+\code
+    @asyncio.coroutine
+    def run(host):
+        connector = AsyncIpMgrConnectorMux.AsyncIpMgrConnectorMux()
+        yield From(connector.connect({'host': host}))
+        res = yield From(connector.dn_getNetworkConfig())
+        for notifFuture in connector.iterNotifications():
+            notif = yield From(notifFuture)
+
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(asyncio.wait([run(h) for h in hosts]))
+\endcode
+'''
+
+import collections
+import socket
+import struct
+
+import MuxMsg
+import IpMgrConnectorMux
+import IpMgrConnectorMuxInternal
+
+from   SmartMeshSDK.ApiException      import ConnectionError,     \
+                                             CommandTimeoutError, \
+                                             NotificationError
+from   SmartMeshSDK.ApiDefinition     import DefinitionLoader
+from   SmartMeshSDK.SerialConnector   import AsyncSerialConnector
+
+try:
+    import trollius as asyncio
+    from trollius import From, \
+                         Return
+except ImportError:
+    output  = ''
+    output += 'Could not load the trollius module (asyncio for Python 2).\n'
+    output += 'Please install it from https://pypi.python.org/pypi/trollius,\n'
+    output += 'then run this script again.\n'
+    raise ImportError(output)
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('AsyncIpMgrConnectorMux')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+#============================ protocol ========================================
+
+class MuxProtocol(asyncio.Protocol):
+    '''
+    \brief asyncio protocol splitting a Serial Mux stream into messages.
+    '''
+
+    def __init__(self,cmdcallback,connectcallback):
+
+        # store params
+        self.connectcallback = connectcallback
+
+        # local variables
+        self.muxMsg          = MuxMsg.MuxMsg(cmdcallback)
+        self.transport       = None
+
+    def connection_made(self,transport):
+        self.transport       = transport
+
+    def data_received(self,data):
+        self.muxMsg.parse(data)
+
+    def connection_lost(self,exc):
+        self.transport       = None
+        self.connectcallback(exc)
+
+    #======================== public ==========================================
+
+    def send(self,cmdType,payload,tag):
+        self.transport.write(self.muxMsg.build_message(cmdType,payload,tag))
+
+    def close(self):
+        if self.transport:
+            self.transport.write("stop")
+            self.transport.close()
+
+#============================ connector =======================================
+
+class AsyncIpMgrConnectorMux(object):
+    '''
+    \ingroup ApiConnector
+
+    \brief Public class for IP manager connector, over SerialMux, driven by
+           an asyncio event loop.
+
+    Its dn_*() methods are coroutines, with the same parameters and return
+    values as the ones of IpMgrConnectorMux. Independent commands overlap
+    when run as separate tasks, up to maxInFlight at once.
+    '''
+
+    PARAM_HOST                = IpMgrConnectorMuxInternal.IpMgrConnectorMuxInternal.PARAM_HOST
+    PARAM_PORT                = IpMgrConnectorMuxInternal.IpMgrConnectorMuxInternal.PARAM_PORT
+    PARAM_ISSENDHELLO         = IpMgrConnectorMuxInternal.IpMgrConnectorMuxInternal.PARAM_ISSENDHELLO
+    PARAM_MAXINFLIGHT         = IpMgrConnectorMuxInternal.IpMgrConnectorMuxInternal.PARAM_MAXINFLIGHT
+    PARAM_TIMEOUT             = IpMgrConnectorMuxInternal.IpMgrConnectorMuxInternal.PARAM_TIMEOUT
+
+    DEFAULT_PARAM_HOST        = IpMgrConnectorMuxInternal.IpMgrConnectorMuxInternal.DEFAULT_PARAM_HOST
+    DEFAULT_PARAM_PORT        = IpMgrConnectorMuxInternal.IpMgrConnectorMuxInternal.DEFAULT_PARAM_PORT
+    DEFAULT_PARAM_MAXINFLIGHT = IpMgrConnectorMuxInternal.IpMgrConnectorMuxInternal.DEFAULT_PARAM_MAXINFLIGHT
+    DEFAULT_PARAM_TIMEOUT     = IpMgrConnectorMuxInternal.IpMgrConnectorMuxInternal.DEFAULT_PARAM_TIMEOUT
+
+    _MAX_TAG                  = IpMgrConnectorMuxInternal.IpMgrConnectorMuxInternal._MAX_TAG
+
+    def __init__(self, maxQSize=100, loop=None):
+
+        # log
+        log.info("creating object")
+
+        # store params
+        self.maxQSize        = maxQSize
+        if loop is None:
+            loop             = asyncio.get_event_loop()
+        self.loop            = loop
+
+        # local variables
+        self.apiDef          = DefinitionLoader.getDefinition('IpMgrDefinition')
+        self.notifIds        = self.apiDef.getIds(self.apiDef.NOTIFICATION)
+        self.isConnected     = False
+        self.disconnectReason= ''
+        self.protocol        = None                   ##< MuxProtocol of the connection
+        self.pending         = collections.OrderedDict() ##< futures of the outstanding commands, by Serial Mux command ID
+        self.lastTag         = 0
+        self.maxInFlight     = self.DEFAULT_PARAM_MAXINFLIGHT
+        self.timeoutSec      = self.DEFAULT_PARAM_TIMEOUT
+        self.inFlight        = None                   ##< semaphore limiting the outstanding commands
+        self.notifQueue      = asyncio.Queue(maxQSize,loop=loop)
+
+    #======================== public ==========================================
+
+    @asyncio.coroutine
+    def connect(self, params={}):
+        '''
+        \brief Connect to the Serial Mux (coroutine).
+
+        \param params Dictionary of connection parameters, as for
+                      IpMgrConnectorMux.connect().
+        '''
+        host        = self.DEFAULT_PARAM_HOST
+        port        = self.DEFAULT_PARAM_PORT
+        isSendHello = True
+        self.maxInFlight = self.DEFAULT_PARAM_MAXINFLIGHT
+        self.timeoutSec  = self.DEFAULT_PARAM_TIMEOUT
+        if self.PARAM_HOST in params and params[self.PARAM_HOST]:
+            host = params[self.PARAM_HOST]
+        if self.PARAM_PORT in params and params[self.PARAM_PORT]:
+            port = int(params[self.PARAM_PORT])
+        if self.PARAM_ISSENDHELLO in params:
+            isSendHello = params[self.PARAM_ISSENDHELLO]
+        if self.PARAM_MAXINFLIGHT in params and params[self.PARAM_MAXINFLIGHT]:
+            self.maxInFlight = int(params[self.PARAM_MAXINFLIGHT])
+        if self.PARAM_TIMEOUT in params:
+            self.timeoutSec  = params[self.PARAM_TIMEOUT]
+
+        if self.isConnected:
+            raise ConnectionError("Already connected")
+
+        # empty the notification queue
+        while not self.notifQueue.empty():
+            self.notifQueue.get_nowait()
+
+        try:
+            (transport,self.protocol) = yield From(self.loop.create_connection(
+                lambda: MuxProtocol(self._processCmd,self._connectionLost),
+                host,
+                port,
+            ))
+        except (socket.error,OSError) as err:
+            raise ConnectionError(str(err))
+        self.pending.clear()
+        self.inFlight         = asyncio.Semaphore(self.maxInFlight,loop=self.loop)
+        self.disconnectReason = ''
+        self.isConnected      = True
+        if isSendHello:
+            yield From(self.sendHelloCmd())
+
+    def disconnect(self, reason=""):
+        '''
+        \brief Close the connection to the Serial Mux.
+
+        The outstanding commands fail with a ConnectionError, and so does
+        getNotification() once the notifications received are consumed.
+        '''
+        if not self.isConnected:
+            return
+        self.isConnected      = False
+        self.disconnectReason = reason
+
+        if self.protocol:
+            self.protocol.close()
+
+        futures = self.pending.values()
+        self.pending.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(ConnectionError(reason))
+
+        # wake up getNotification(), making room if needed
+        if self.notifQueue.full():
+            self.notifQueue.get_nowait()
+        self.notifQueue.put_nowait(AsyncSerialConnector._DISCONNECTED)
+
+    @asyncio.coroutine
+    def send(self, cmdNames, params, timeoutSec=None):
+        '''
+        \brief Send a command and wait for its acknowledge (coroutine).
+
+        \param timeoutSec Seconds to wait for the acknowledge, None for the
+                          timeout of the connection.
+
+        \returns The dictionary of acknowledge fields.
+        '''
+        if not self.isConnected:
+            raise ConnectionError("Disconnected")
+        log.debug("IO OUT.    {0} : {1}".format(cmdNames, params))
+        (cmdId, paramsBinList) = self.apiDef.serialize(cmdNames, params)
+        paramsBin = struct.pack('!'+str(len(paramsBinList))+'B', *paramsBinList)
+        res = yield From(self._sendPayload(cmdNames, cmdId, paramsBin, timeoutSec))
+        raise Return(res)
+
+    @asyncio.coroutine
+    def sendHelloCmd(self):
+        '''
+        \brief Send Hello command (coroutine).
+        '''
+        res = yield From(self.send(["mux_hello"], {"version": MuxMsg.VERSION, "secret": MuxMsg.AUTH}))
+        raise Return(res)
+
+    @asyncio.coroutine
+    def getNotification(self, timeoutSec=None):
+        '''
+        \brief Get the next notification (coroutine).
+
+        \param timeoutSec Number of seconds to wait, None to wait forever.
+
+        \exception ConnectionError disconnected from the Serial Mux
+        \exception NotificationError unknown notification
+        \returns A tuple (notifName,notifTuple), as the getNotification()
+                 method of IpMgrConnectorMux, or None after timeoutSec
+                 seconds without notification.
+        '''
+        try:
+            notif = yield From(asyncio.wait_for(self.notifQueue.get(),
+                                                timeoutSec,
+                                                loop=self.loop))
+        except asyncio.TimeoutError:
+            raise Return(None)
+
+        if notif is AsyncSerialConnector._DISCONNECTED:
+            # leave it for other consumers
+            self.notifQueue.put_nowait(AsyncSerialConnector._DISCONNECTED)
+            raise ConnectionError(self.disconnectReason)
+
+        (ids, param) = notif
+        try:
+            if  self.notifTupleTable[ids[-1]]:
+                raise Return((ids[-1], self.notifTupleTable[ids[-1]](**param)))
+            else:
+                raise Return((ids[-1], None))
+        except KeyError:
+            raise NotificationError(ids, param)
+
+    def iterNotifications(self):
+        '''
+        \brief Iterate over the notifications.
+
+        Yields one future per notification, to wait on with "yield From()".
+        The iteration ends after disconnection, the last future resolving
+        to None.
+        '''
+        while self.isConnected or self.notifQueue.qsize()>1:
+            yield asyncio.ensure_future(self._getNotificationOrNone(),loop=self.loop)
+
+    def getNumPending(self):
+        '''
+        \brief Returns the number of commands waiting for their acknowledge.
+        '''
+        return len(self.pending)
+
+    #======================== private =========================================
+
+    @asyncio.coroutine
+    def _sendPayload(self, cmdNames, cmdId, paramsBin, timeoutSec):
+        if timeoutSec is None:
+            timeoutSec = self.timeoutSec
+
+        with (yield From(self.inFlight)):
+            if not self.isConnected:
+                raise ConnectionError(self.disconnectReason or "Disconnected")
+
+            # take a tag not used by a pending command
+            tag = self.lastTag
+            while True:
+                tag = tag % self._MAX_TAG + 1
+                if tag not in self.pending:
+                    break
+            self.lastTag      = tag
+            future            = asyncio.Future(loop=self.loop)
+            self.pending[tag] = future
+
+            try:
+                self.protocol.send(cmdId, paramsBin, tag)
+                # wait for acknowledge. future resolved by _processCmd()
+                (ackCmdId, ackBuf) = yield From(asyncio.wait_for(future, timeoutSec, loop=self.loop))
+            except asyncio.TimeoutError:
+                raise CommandTimeoutError(cmdNames)
+            finally:
+                if self.pending.get(tag) is future:
+                    del self.pending[tag]
+
+        # process acknowledge
+        cmdId = self.apiDef.nameToId(self.apiDef.COMMAND, (cmdNames[0],))
+        if ackCmdId != cmdId:
+            reason = "Unexpected acknowledge {0} for command {1} ({2})".format(ackCmdId, cmdId, cmdNames)
+            self.disconnect(reason)
+            raise ConnectionError(reason)
+        ackList = struct.unpack('!'+str(len(ackBuf))+'B', ackBuf)
+        (resCmdName, resParams) = self.apiDef.deserialize(self.apiDef.COMMAND, ackCmdId, ackList)
+        log.debug("IO INP.    {0} : {1}".format(resCmdName, resParams))
+        IpMgrConnectorMuxInternal.checkRc(self.apiDef, resCmdName, resParams)
+        raise Return(resParams)
+
+    @asyncio.coroutine
+    def _getNotificationOrNone(self):
+        try:
+            notif = yield From(self.getNotification())
+        except ConnectionError:
+            notif = None
+        raise Return(notif)
+
+    #======================== protocol callbacks ==============================
+
+    def _connectionLost(self, exc):
+        if exc:
+            reason = "Disconnect. Reason: {0}".format(exc)
+        else:
+            reason = "Disconnect. Reason: Connection close"
+        self.disconnect(reason)
+
+    def _processCmd(self, tag, cmdId, payload):
+        '''
+        \brief Called by MuxProtocol for each message received.
+
+        Same as IpMgrConnectorMuxInternal.processCmd(), except that it runs
+        in the event loop, and so never blocks.
+        '''
+        if cmdId in self.notifIds:
+            try:
+                payloadList = struct.unpack('!'+str(len(payload))+'B', payload)
+                (notifNames, params) = self.apiDef.deserialize(self.apiDef.NOTIFICATION, cmdId, payloadList)
+            except Exception as err:
+                log.error("Deserialization command {0}. Error {1}".format(cmdId, err))
+                return
+            log.debug("IO INP.    {0} : {1}".format(notifNames, params))
+            try:
+                self.notifQueue.put_nowait((notifNames, params))
+            except asyncio.QueueFull:
+                log.error("Queue overflowed, dropping {0}".format(notifNames))
+            return
+
+        future = self.pending.pop(tag, None)
+        if future is None and tag == 0 and self.pending:
+            # a Serial Mux which does not echo the command IDs: the
+            # acknowledges come in the order of the commands
+            (_, future) = self.pending.popitem(last=False)
+        if future is None or future.done():
+            log.warning("Dropping acknowledge {0} of unknown command ({1})".format(cmdId, tag))
+            return
+        future.set_result((cmdId, payload.tobytes()))
+
+AsyncSerialConnector.addDnCalls(AsyncIpMgrConnectorMux,
+                                IpMgrConnectorMux.IpMgrConnectorMux,
+                                DefinitionLoader.getDefinition('IpMgrDefinition'))
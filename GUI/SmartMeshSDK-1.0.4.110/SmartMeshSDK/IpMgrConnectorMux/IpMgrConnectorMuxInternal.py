@@ -1,229 +1,543 @@
-import threading
-import socket
-import select
-import struct
-
-import MuxMsg
-
-from   SmartMeshSDK import ApiException,                   \
-                           ApiConnector
-from   SmartMeshSDK.ApiDefinition import IpMgrDefinition
-
-class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
-    '''
-    \ingroup ApiConnector
-    
-    \brief Internal class for IP manager connector, through Serial Mux.
-    
-    Members of class
-        acknowledgeBuf - binary payload of acknowledge
-        ackCmdId       - command ID from acknowledge
-        sendSemaphor   - semaphore to wait for acknowledgement of command (threading.Semaphore)
-        inputThread    - thread for processing input packets (threading.Thread) 
-        socket         - TCP socket for connection with Serial Mux   
-    '''
-    PARAM_HOST         = 'host'
-    PARAM_PORT         = 'port'
-    PARAM_ISSENDHELLO  = 'isSendHello'
-
-    DEFAULT_PARAM_HOST = '127.0.0.1'
-    DEFAULT_PARAM_PORT = 9900
-    
-    _RC_OK         = 0  
-    _RC_TIMEOUT    = 5
-    
-    def __init__(self, maxQSize = 100) :
-        ApiConnector.ApiConnector.__init__(self, maxQSize)
-        self.acknowledgeBuf = None
-        self.ackCmdId = -1
-        self.sendSemaphor = threading.BoundedSemaphore(1)
-        self.sendLock = threading.Lock()
-        self.socket = None
-        self.inputThread = None
-        self.muxMsg = MuxMsg.MuxMsg(self.processCmd)
-        self.apiDef = IpMgrDefinition.IpMgrDefinition()
-        self.notifIds = self.apiDef.getIds(self.apiDef.NOTIFICATION) 
-        
-    def connect(self, params = {}) :
-        '''
-        \brief Connect to device
-        
-        \param params Dictionary of connection parameters:
-            - 'host' - IP address of Mux (default: '127.0.0.1')
-            - 'port' - port of Mux (default: 9900)
-            - 'isSendHello' - send Hello message after connection (default True)
-        '''
-        
-        host = self.DEFAULT_PARAM_HOST 
-        port = self.DEFAULT_PARAM_PORT
-        isSendHello = True
-        if self.PARAM_HOST in params and params[self.PARAM_HOST] :
-            host = params[self.PARAM_HOST]
-        if self.PARAM_PORT in params and params[self.PARAM_PORT] :
-            port = int(params[self.PARAM_PORT])
-        if self.PARAM_ISSENDHELLO in params :
-            isSendHello = params[self.PARAM_ISSENDHELLO]
-        
-        if self.inputThread :   # Wait finish disconnect process
-            try :
-                self.inputThread.join(1.0)
-                if  self.inputThread.isAlive() :
-                    raise ApiException.ConnectionError("Already connected")
-            except RuntimeError :
-                pass    # Ignore join error
-            self.inputThread = None 
-        
-        try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.connect( (host, port) )
-            self.socket.setblocking(1)
-        except socket.error as ex:
-            raise ApiException.ConnectionError(str(ex))
-        
-        self.sendSemaphor.acquire(False)    # Clear semaphore
-        # Start thread for processing input stream
-        self.inputThread = threading.Thread(target = self.inputProcess)
-        self.inputThread.name = "IpMgrConnectorMuxInternal"
-        self.inputThread.start()
-        ApiConnector.ApiConnector.connect(self)
-        if isSendHello :
-            self.sendHelloCmd()
-        
-    def disconnect(self, reason="") :
-        if not self.isConnected :
-            return
-        try :
-            self.socket.send("stop")
-            self.socket.shutdown(socket.SHUT_RD)    # start disconnection
-            self.socket.close()
-        except socket.error :
-            pass    # Ignore socket error 
-        ApiConnector.ApiConnector.disconnect(self, reason)
-        
-    def send(self, cmdNames, params) :
-        self.sendLock.acquire()
-        try :
-            if not self.isConnected :
-                raise ApiException.ConnectionError("Disconnected")
-    
-            # Send data
-            ApiConnector.log.debug("IO OUT.    {0} : {1}".format(cmdNames, params))
-            (cmdId, paramsBinList) = self.apiDef.serialize(cmdNames, params)
-            paramsBin = struct.pack('!'+str(len(paramsBinList))+'B', *paramsBinList) 
-            ApiConnector.logDump(paramsBin, "RawIO OUT. Command ID: {0}".format(cmdId))
-            packet = self.muxMsg.build_message(cmdId, paramsBin)
-            self.acknowledgeBuf = None
-            self.ackCmdId = -1
-            try :
-                self.socket.sendall(packet)
-            except socket.error, way:
-                # Socket error. Disconnect from device. Stop command processing
-                reason = "IO output error [{0}] {1}".format(way.args[0], way.args[1])
-                self.disconnect(reason)
-                raise ApiException.ConnectionError(reason)
-            
-            # Waiting acknowledge
-            self.sendSemaphor.acquire()
-            if not self.isConnected :         # Disconnect happened during waiting ack.  
-                raise ApiException.ConnectionError(self.disconnectReason)
-                                                        
-            # Process acknowledge
-            cmdId = self.apiDef.nameToId(self.apiDef.COMMAND, (cmdNames[0],))
-            if self.ackCmdId != cmdId :
-                reason = "Unexpected acknowledge {0} for command {1} ({2})".format(self.ackCmdId, cmdId, cmdNames)
-                self.disconnect(reason)
-                raise ApiException.ConnectionError(reason)
-    
-            # Parse acknowledge
-            ackList = struct.unpack('!'+str(len(self.acknowledgeBuf))+'B', self.acknowledgeBuf)
-            (resCmdName, resParams) = self.apiDef.deserialize(self.apiDef.COMMAND, self.ackCmdId, ackList) 
-            ApiConnector.log.debug("IO INP.    {0} : {1}".format(resCmdName, resParams))
-            
-            if self.apiDef.RC in resParams and resParams[self.apiDef.RC] != self._RC_OK : 
-                if resParams[self.apiDef.RC] == self._RC_TIMEOUT :
-                    raise ApiException.CommandTimeoutError(resCmdName)
-                try:
-                    desc = '({0})\n{1}'.format(
-                        self.apiDef.responseFieldValueToDesc(
-                            resCmdName,
-                            self.apiDef.RC,
-                            resParams[self.apiDef.RC],
-                        ),
-                        self.apiDef.rcToDescription(
-                            resParams[self.apiDef.RC],
-                            resCmdName,
-                        ),
-                    )
-                except:
-                    desc = None
-                raise   ApiException.APIError(
-                            cmd=resCmdName,
-                            rc=resParams[self.apiDef.RC],
-                            desc=desc
-                        )
-            
-            self.ackCmdId = -1
-            self.acknowledgeBuf = None
-        finally:
-            self.sendLock.release()
-        return resParams
-            
-    def ackSignal(self):
-        '''
-        \brief Send signal 'Acknowledge received'
-        '''
-        try    : 
-            self.sendSemaphor.release()
-        except ValueError : 
-            pass
-
-    def inputProcess(self):
-        '''
-        \brief Processing device input 
-        '''
-        try :
-            while True :
-                select.select([self.socket], [], [self.socket])
-                buf = self.socket.recv(4096)
-                if not buf :
-                    raise socket.error(0, "Connection close")
-                self.muxMsg.parse(buf)
-        except socket.error, way:
-            # Disconnect process -------------------------------------------------
-            if way.args[0] == 9 :   # 
-                way = socket.error(0, "Connection close")
-            ApiConnector.ApiConnector.disconnect(self, "Disconnect. Reason: {0} [{1}]".format(way.args[1], way.args[0]))
-            self.acknowledgeBuf = None
-            self.ackCmdId = -1
-            self.ackSignal()
-            try :
-                self.socket.close()
-            except socket.error :
-                pass    # Ignore socket error 
-    
-    def processCmd(self, reserved, cmdId, payload):
-        '''
-        \brief deserialize and process command
-        '''
-        ApiConnector.logDump(payload, "RawIO INP. Command ID: {0}".format(cmdId))
-        if cmdId in self.notifIds :
-            try :
-                payloadList = struct.unpack('!'+str(len(payload))+'B', payload)
-                (notifNames, params) = self.apiDef.deserialize(self.apiDef.NOTIFICATION, cmdId, payloadList)
-                ApiConnector.log.debug("IO INP.    {0} : {1}".format(notifNames, params))
-                self.putNotification((notifNames, params))
-            except ApiException.ConnectionError as ex:
-                raise socket.error(0, ex.value)    # Initiate disconnection
-            except Exception as ex :
-                ApiConnector.log.error("Deserialization command {0}. Error {1}".format(cmdId, ex))
-        else :
-            self.ackCmdId = cmdId
-            self.acknowledgeBuf = payload
-            self.ackSignal()
-    
-    def sendHelloCmd(self):
-        '''
-        \brief Send Hello command
-        '''
-        res = self.send(["mux_hello"], {"version" : self.muxMsg.getVer(), "secret" :  self.muxMsg.getAuth()})
-        return res
+import threading
+import socket
+import select
+import struct
+import time
+import collections
+
+import MuxMsg
+
+from   SmartMeshSDK import ApiException,                   \
+                           ApiConnector
+from   SmartMeshSDK.ApiDefinition import DefinitionLoader
+
+_RC_OK         = 0
+_RC_TIMEOUT    = 5
+
+def checkRc(apiDef, resCmdName, resParams) :
+    '''
+    \brief Raise the exception for the RC of an acknowledge, if it is not OK.
+
+    \param apiDef     The IpMgrDefinition.
+    \param resCmdName The name of the command acknowledged.
+    \param resParams  The acknowledge fields, as returned by deserialize().
+
+    \exception CommandTimeoutError The RC is COMMAND_TIMEOUT.
+    \exception APIError Any other RC but RC_OK.
+    '''
+    if apiDef.RC in resParams and resParams[apiDef.RC] != _RC_OK :
+        if resParams[apiDef.RC] == _RC_TIMEOUT :
+            raise ApiException.CommandTimeoutError(resCmdName)
+        try:
+            desc = '({0})\n{1}'.format(
+                apiDef.responseFieldValueToDesc(
+                    resCmdName,
+                    apiDef.RC,
+                    resParams[apiDef.RC],
+                ),
+                apiDef.rcToDescription(
+                    resParams[apiDef.RC],
+                    resCmdName,
+                ),
+            )
+        except:
+            desc = None
+        raise   ApiException.APIError(
+                    cmd=resCmdName,
+                    rc=resParams[apiDef.RC],
+                    desc=desc
+                )
+
+class CommandFuture(object) :
+    '''
+    \ingroup ApiConnector
+
+    \brief The response to a command sent without waiting for it, by
+           sendAsync(), sendSerializedAsync() or the dn_*_async() methods of
+           IpMgrConnectorMux.
+
+    The acknowledge is only parsed when result() is first called, in the
+    thread calling it, which also gets the exceptions the synchronous
+    methods raise.
+    '''
+
+    def __init__(self, connector, cmdNames, cmdId, parser, formatter, timeoutSec) :
+        self.connector      = connector
+        self.cmdNames       = cmdNames
+        self.cmdId          = cmdId        ##< command ID the acknowledge must have
+        self.parser         = parser       ##< fast path parser of the acknowledge, or None
+        self.formatter      = formatter    ##< called with the acknowledge fields from the generic deserializer, or None
+        self.tag            = None         ##< Serial Mux command ID of the request, set when sent
+        self.timeoutSec     = timeoutSec   ##< seconds to wait for the acknowledge once sent, None for ever
+        self.deadline       = None         ##< time after which the request expires, set when sent, None for never
+        self.ackCmdId       = -1
+        self.acknowledgeBuf = None
+        self.error          = None         ##< exception result() raises
+        self.response       = None
+        self.isProcessed    = False
+        self.lock           = threading.Lock()
+        self.doneEvent      = threading.Event()
+        self.callbacks      = []
+
+    #======================== public ==========================================
+
+    def done(self) :
+        '''
+        \brief Returns whether the acknowledge arrived, or the command failed.
+        '''
+        return self.doneEvent.isSet()
+
+    def result(self) :
+        '''
+        \brief Wait for the acknowledge of the command, and return it.
+
+        \returns What the synchronous method returns.
+
+        \exception CommandTimeoutError No acknowledge arrived before the
+                   timeout of the command.
+        \exception ConnectionError The connection was lost.
+        \exception APIError The command returned an error.
+        '''
+        while not self.doneEvent.isSet() :
+            if self.deadline is None :
+                self.doneEvent.wait()
+            else :
+                self.doneEvent.wait(max(self.deadline - time.time(), 0))
+                if not self.doneEvent.isSet() :
+                    self.connector._expireCmds()
+        with self.lock :
+            if not self.isProcessed :
+                try :
+                    self.response = self.connector._processAck(self)
+                except Exception as err :
+                    self.error = err
+                self.isProcessed = True
+                self.acknowledgeBuf = None
+        if self.error :
+            raise self.error
+        return self.response
+
+    def addDoneCallback(self, callback) :
+        '''
+        \brief Call callback(future) when the acknowledge arrives, or the
+               command fails; right away if it already did.
+
+        The callback is called in the thread reading the Serial Mux, and must
+        not block.
+        '''
+        with self.lock :
+            if not self.doneEvent.isSet() :
+                self.callbacks.append(callback)
+                return
+        self._callCallback(callback)
+
+    #======================== private =========================================
+
+    def _setAck(self, ackCmdId, payload) :
+        self.ackCmdId       = ackCmdId
+        self.acknowledgeBuf = payload
+        self._setDone()
+
+    def _setError(self, error) :
+        self.error          = error
+        self.isProcessed    = True
+        self._setDone()
+
+    def _setDone(self) :
+        with self.lock :
+            self.doneEvent.set()
+            callbacks       = self.callbacks
+            self.callbacks  = []
+        for callback in callbacks :
+            self._callCallback(callback)
+
+    def _callCallback(self, callback) :
+        try :
+            callback(self)
+        except Exception as err :
+            ApiConnector.log.error("Callback of command {0}. Error {1}".format(self.cmdNames, err))
+
+class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
+    '''
+    \ingroup ApiConnector
+
+    \brief Internal class for IP manager connector, through Serial Mux.
+
+    Each command is tagged with its own Serial Mux command ID, which the
+    Serial Mux echoes in the acknowledge. Up to maxInFlight commands, sent by
+    any number of threads or with the asynchronous methods, are outstanding
+    at once.
+
+    Members of class
+        pending        - outstanding commands, by Serial Mux command ID (collections.OrderedDict of CommandFuture)
+        pendingCond    - protects pending, notified when a command completes (threading.Condition)
+        sendLock       - serializes the writes to the socket (threading.Lock)
+        notifFilter    - decides which notifications to deserialize, None for all (see setNotifFilter())
+        numFilteredNotifs - notifications dropped by notifFilter
+        inputThread    - thread for processing input packets (threading.Thread)
+        socket         - TCP socket for connection with Serial Mux
+    '''
+    PARAM_HOST         = 'host'
+    PARAM_PORT         = 'port'
+    PARAM_ISSENDHELLO  = 'isSendHello'
+    PARAM_MAXINFLIGHT  = 'maxInFlight'
+    PARAM_TIMEOUT      = 'timeout'
+
+    DEFAULT_PARAM_HOST = '127.0.0.1'
+    DEFAULT_PARAM_PORT = 9900
+    DEFAULT_PARAM_MAXINFLIGHT = 16
+    DEFAULT_PARAM_TIMEOUT     = None    # wait for acknowledges forever
+
+    _MAX_TAG       = 0xffff  # Serial Mux command IDs are 2 bytes, 0 is not used for commands
+    _EXPIRE_PERIOD = 1.0     # maximum seconds between two checks of the timeouts of the commands
+
+    RESPONSE_HEX_TYPE  = tuple  # type of the HEXDATA fields of the responses
+
+    def __init__(self, maxQSize = 100) :
+        ApiConnector.ApiConnector.__init__(self, maxQSize)
+        self.pending = collections.OrderedDict()
+        self.pendingCond = threading.Condition()
+        self.lastTag = 0
+        self.maxInFlight = self.DEFAULT_PARAM_MAXINFLIGHT
+        self.timeoutSec = self.DEFAULT_PARAM_TIMEOUT
+        self.sendLock = threading.Lock()
+        self.socket = None
+        self.inputThread = None
+        self.muxMsg = MuxMsg.MuxMsg(self.processCmd)
+        self.apiDef = DefinitionLoader.getDefinition('IpMgrDefinition')
+        self.notifIds = self.apiDef.getIds(self.apiDef.NOTIFICATION)
+        self.notifFilter = None
+        self.numFilteredNotifs = 0
+
+    def connect(self, params = {}) :
+        '''
+        \brief Connect to device
+
+        \param params Dictionary of connection parameters:
+            - 'host' - IP address of Mux (default: '127.0.0.1')
+            - 'port' - port of Mux (default: 9900)
+            - 'isSendHello' - send Hello message after connection (default True)
+            - 'maxInFlight' - maximum number of commands waiting for their
+              acknowledge at once; more wait to be sent (default 16)
+            - 'timeout' - seconds to wait for the acknowledge of a command
+              before it raises CommandTimeoutError, None to wait forever
+              (default None)
+        '''
+
+        host = self.DEFAULT_PARAM_HOST
+        port = self.DEFAULT_PARAM_PORT
+        isSendHello = True
+        self.maxInFlight = self.DEFAULT_PARAM_MAXINFLIGHT
+        self.timeoutSec = self.DEFAULT_PARAM_TIMEOUT
+        if self.PARAM_HOST in params and params[self.PARAM_HOST] :
+            host = params[self.PARAM_HOST]
+        if self.PARAM_PORT in params and params[self.PARAM_PORT] :
+            port = int(params[self.PARAM_PORT])
+        if self.PARAM_ISSENDHELLO in params :
+            isSendHello = params[self.PARAM_ISSENDHELLO]
+        if self.PARAM_MAXINFLIGHT in params and params[self.PARAM_MAXINFLIGHT] :
+            self.maxInFlight = int(params[self.PARAM_MAXINFLIGHT])
+        if self.PARAM_TIMEOUT in params :
+            self.timeoutSec = params[self.PARAM_TIMEOUT]
+
+        if self.inputThread :   # Wait finish disconnect process
+            try :
+                self.inputThread.join(1.0)
+                if  self.inputThread.isAlive() :
+                    raise ApiException.ConnectionError("Already connected")
+            except RuntimeError :
+                pass    # Ignore join error
+            self.inputThread = None
+
+        try:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.connect( (host, port) )
+            self.socket.setblocking(1)
+        except socket.error as ex:
+            raise ApiException.ConnectionError(str(ex))
+
+        with self.pendingCond :
+            self.pending.clear()
+        # Start thread for processing input stream
+        self.inputThread = threading.Thread(target = self.inputProcess)
+        self.inputThread.name = "IpMgrConnectorMuxInternal"
+        self.inputThread.start()
+        ApiConnector.ApiConnector.connect(self)
+        if isSendHello :
+            self.sendHelloCmd()
+
+    def disconnect(self, reason="") :
+        if not self.isConnected :
+            return
+        try :
+            self.socket.send("stop")
+            self.socket.shutdown(socket.SHUT_RD)    # start disconnection
+            self.socket.close()
+        except socket.error :
+            pass    # Ignore socket error
+        ApiConnector.ApiConnector.disconnect(self, reason)
+
+    def send(self, cmdNames, params) :
+        return self.sendAsync(cmdNames, params).result()
+
+    def sendSerialized(self, cmdNames, cmdId, paramsBin, parser) :
+        '''
+        \brief Send a command already serialized, and wait for its acknowledge.
+
+        This is the fast path of the dn_*() methods generated by
+        GenApiConnectors, which serialize the command and parse the
+        acknowledge without going through the API definition.
+
+        \param cmdNames  The (sub)command name.
+        \param cmdId     The ID of the command.
+        \param paramsBin The serialized command, a string.
+        \param parser    Called with the acknowledge payload (a memoryview)
+                         and RESPONSE_HEX_TYPE; returns the acknowledge
+                         formatted as a named tuple, or None to have the
+                         generic deserializer parse it.
+
+        \returns What the parser returned or, if it returned None, the
+                 dictionary of acknowledge fields.
+        '''
+        return self.sendSerializedAsync(cmdNames, cmdId, paramsBin, parser).result()
+
+    def sendAsync(self, cmdNames, params, timeoutSec=None, formatter=None) :
+        '''
+        \brief Send a command, without waiting for its acknowledge.
+
+        \param cmdNames   The (sub)command name.
+        \param params     The dictionary of the command fields.
+        \param timeoutSec Seconds to wait for the acknowledge, None for the
+                          timeout of the connection.
+        \param formatter  Called with the dictionary of acknowledge fields;
+                          what it returns is the result of the future. None
+                          to have the dictionary.
+
+        \returns A CommandFuture.
+        '''
+        if not self.isConnected :
+            raise ApiException.ConnectionError("Disconnected")
+        ApiConnector.log.debug("IO OUT.    {0} : {1}".format(cmdNames, params))
+        (cmdId, paramsBinList) = self.apiDef.serialize(cmdNames, params)
+        paramsBin = struct.pack('!'+str(len(paramsBinList))+'B', *paramsBinList)
+        return self._sendPayload(cmdNames, cmdId, paramsBin, None, timeoutSec, formatter)
+
+    def sendSerializedAsync(self, cmdNames, cmdId, paramsBin, parser, timeoutSec=None, formatter=None) :
+        '''
+        \brief Send a command already serialized, without waiting for its
+               acknowledge.
+
+        See sendSerialized() and sendAsync() for the parameters. The
+        formatter is only called when the parser returned None.
+
+        \returns A CommandFuture.
+        '''
+        if not self.isConnected :
+            raise ApiException.ConnectionError("Disconnected")
+        return self._sendPayload(cmdNames, cmdId, paramsBin, parser, timeoutSec, formatter)
+
+    def getNumPending(self) :
+        '''
+        \brief Returns the number of commands waiting for their acknowledge.
+        '''
+        return len(self.pending)
+
+    def setNotifFilter(self, notifFilter) :
+        '''
+        \brief Set the function deciding which notifications are deserialized
+               and queued.
+
+        \param notifFilter Called by the input thread with the command ID and
+               the raw payload (a memoryview, only valid during the call) of
+               each notification received; the notification is dropped, before
+               being deserialized, unless it returns True. None to keep all
+               the notifications.
+        '''
+        self.notifFilter = notifFilter
+
+    def _sendPayload(self, cmdNames, cmdId, paramsBin, parser, timeoutSec, formatter) :
+        '''
+        \brief Register a serialized command as pending, and send it.
+        '''
+        if timeoutSec is None :
+            timeoutSec = self.timeoutSec
+        future = CommandFuture(
+            self,
+            cmdNames,
+            self.apiDef.nameToId(self.apiDef.COMMAND, (cmdNames[0],)),
+            parser,
+            formatter,
+            timeoutSec,
+        )
+
+        # wait for a free slot, then take a tag not used by a pending command
+        with self.pendingCond :
+            while self.isConnected and len(self.pending) >= self.maxInFlight :
+                self.pendingCond.wait()
+            if not self.isConnected :
+                raise ApiException.ConnectionError(self.disconnectReason or "Disconnected")
+            tag = self.lastTag
+            while True :
+                tag = tag % self._MAX_TAG + 1
+                if tag not in self.pending :
+                    break
+            self.lastTag = tag
+            future.tag = tag
+            # the timeout runs from the moment the command is sent, not while
+            # it waits for a slot, so that it does not expire once sent
+            if future.timeoutSec is not None :
+                future.deadline = time.time() + future.timeoutSec
+            self.pending[tag] = future
+
+        ApiConnector.logDump(paramsBin, "RawIO OUT. Command ID: {0} ({1})".format(cmdId, tag))
+        packet = self.muxMsg.build_message(cmdId, paramsBin, tag)
+        try :
+            with self.sendLock :
+                self.socket.sendall(packet)
+        except socket.error, way:
+            # Socket error. Disconnect from device. Stop command processing
+            with self.pendingCond :
+                self.pending.pop(tag, None)
+                self.pendingCond.notify()
+            reason = "IO output error [{0}] {1}".format(way.args[0], way.args[1])
+            self.disconnect(reason)
+            raise ApiException.ConnectionError(reason)
+        return future
+
+    def _processAck(self, future) :
+        '''
+        \brief Parse the acknowledge of a command; called by
+               CommandFuture.result().
+        '''
+        if future.ackCmdId != future.cmdId :
+            reason = "Unexpected acknowledge {0} for command {1} ({2})".format(future.ackCmdId, future.cmdId, future.cmdNames)
+            self.disconnect(reason)
+            raise ApiException.ConnectionError(reason)
+
+        # Parse acknowledge, with the parser of the command if it has one
+        if future.parser :
+            res = future.parser(memoryview(future.acknowledgeBuf), self.RESPONSE_HEX_TYPE)
+            if res is not None :
+                ApiConnector.log.debug("IO INP.    {0} : {1}".format(future.cmdNames, res))
+                return res
+        ackList = struct.unpack('!'+str(len(future.acknowledgeBuf))+'B', future.acknowledgeBuf)
+        (resCmdName, resParams) = self.apiDef.deserialize(self.apiDef.COMMAND, future.ackCmdId, ackList)
+        ApiConnector.log.debug("IO INP.    {0} : {1}".format(resCmdName, resParams))
+
+        checkRc(self.apiDef, resCmdName, resParams)
+
+        if future.formatter :
+            return future.formatter(resParams)
+        return resParams
+
+    def _completeCmd(self, tag, cmdId, payload):
+        '''
+        \brief Hand an acknowledge to the pending command it answers.
+        '''
+        with self.pendingCond :
+            future = self.pending.pop(tag, None)
+            if future is None and tag == 0 and self.pending :
+                # a Serial Mux which does not echo the command IDs: the
+                # acknowledges come in the order of the commands
+                (_, future) = self.pending.popitem(last=False)
+            if future is not None :
+                self.pendingCond.notify()
+        if future is None :
+            ApiConnector.log.warning("Dropping acknowledge {0} of unknown command ({1})".format(cmdId, tag))
+            return
+        future._setAck(cmdId, payload)
+
+    def _expireCmds(self):
+        '''
+        \brief Fail the pending commands whose timeout has passed.
+
+        \returns The number of seconds until the next check.
+        '''
+        now = time.time()
+        expired = []
+        nextTimeout = self._EXPIRE_PERIOD
+        with self.pendingCond :
+            for (tag, future) in self.pending.items() :
+                if future.deadline is None :
+                    continue
+                if future.deadline <= now :
+                    del self.pending[tag]
+                    expired.append(future)
+                elif future.deadline - now < nextTimeout :
+                    nextTimeout = future.deadline - now
+            if expired :
+                self.pendingCond.notifyAll()
+        for future in expired :
+            future._setError(ApiException.CommandTimeoutError(future.cmdNames))
+        return nextTimeout
+
+    def _failCmds(self, reason):
+        '''
+        \brief Fail all the pending commands, on disconnection.
+        '''
+        with self.pendingCond :
+            futures = self.pending.values()
+            self.pending.clear()
+            self.pendingCond.notifyAll()
+        for future in futures :
+            future._setError(ApiException.ConnectionError(reason))
+
+    def inputProcess(self):
+        '''
+        \brief Processing device input
+        '''
+        try :
+            while True :
+                (readable, _, errored) = select.select([self.socket], [], [self.socket], self._expireCmds())
+                if not (readable or errored) :
+                    continue    # timeout of a command
+                if not self.muxMsg.recv_from(self.socket) :
+                    raise socket.error(0, "Connection close")
+        except socket.error, way:
+            # Disconnect process -------------------------------------------------
+            if way.args[0] == 9 :   #
+                way = socket.error(0, "Connection close")
+            ApiConnector.ApiConnector.disconnect(self, "Disconnect. Reason: {0} [{1}]".format(way.args[1], way.args[0]))
+            self._failCmds(self.disconnectReason)
+            try :
+                self.socket.close()
+            except socket.error :
+                pass    # Ignore socket error
+
+    def processCmd(self, tag, cmdId, payload):
+        '''
+        \brief deserialize and process command
+
+        \param tag     Serial Mux command ID, of the command acknowledged
+        \param payload memoryview of the input buffer of the MuxMsg, only
+               valid during the call
+        '''
+        ApiConnector.logDump(payload, "RawIO INP. Command ID: {0} ({1})".format(cmdId, tag))
+        if cmdId in self.notifIds :
+            try :
+                notifFilter = self.notifFilter
+                if notifFilter :
+                    if not isinstance(payload, memoryview) :
+                        payload = memoryview(payload)
+                    if not notifFilter(cmdId, payload) :
+                        self.numFilteredNotifs += 1
+                        return
+                payloadList = struct.unpack('!'+str(len(payload))+'B', payload)
+                (notifNames, params) = self.apiDef.deserialize(self.apiDef.NOTIFICATION, cmdId, payloadList)
+                ApiConnector.log.debug("IO INP.    {0} : {1}".format(notifNames, params))
+                self.putNotification((notifNames, params))
+            except ApiException.ConnectionError as ex:
+                raise socket.error(0, ex.value)    # Initiate disconnection
+            except Exception as ex :
+                ApiConnector.log.error("Deserialization command {0}. Error {1}".format(cmdId, ex))
+        else :
+            if isinstance(payload, memoryview) :
+                payload = payload.tobytes()     # kept after the call
+            self._completeCmd(tag, cmdId, payload)
+
+    def sendHelloCmd(self):
+        '''
+        \brief Send Hello command
+        '''
+        res = self.send(["mux_hello"], {"version" : self.muxMsg.getVer(), "secret" :  self.muxMsg.getAuth()})
+        return res
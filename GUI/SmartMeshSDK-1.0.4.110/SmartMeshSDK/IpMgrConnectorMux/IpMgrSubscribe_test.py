@@ -0,0 +1,222 @@
+#!/usr/bin/python
+
+'''
+Tests of IpMgrSubscribe with connectors other than IpMgrConnectorMux: the
+serial connector, which filters the raw notifications as the Serial Mux
+connector does, and a connector which cannot filter them.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import struct
+import threading
+import unittest
+import Queue
+
+from SmartMeshSDK                      import ApiException, \
+                                              NotifDispatcher
+from SmartMeshSDK.IpMgrConnectorMux    import IpMgrSubscribe
+from SmartMeshSDK.IpMgrConnectorSerial import IpMgrConnectorSerial
+
+#============================ defines =========================================
+
+NOTIF_TYPE         = 20
+SUBID_NOTIFDATA    = 4
+SUBID_NOTIFLOG     = 2
+MAC_1              = [0x00, 0x17, 0x0d, 0x00, 0x00, 0x00, 0x00, 0x01]
+MAC_2              = [0x00, 0x17, 0x0d, 0x00, 0x00, 0x00, 0x00, 0x02]
+DATA               = [0x0a, 0x0b, 0x0c]
+TIMEOUT            = 5.0
+
+#============================ helpers =========================================
+
+def buildNotifData(mac, dstPort):
+    macAddress = sum([b << (8*(7-i)) for (i, b) in enumerate(mac)])
+    payload    = struct.pack('>BQIQHH', SUBID_NOTIFDATA, 0, 0, macAddress, 0xf0b8, dstPort)
+    return bytearray(payload) + bytearray(DATA)
+
+def buildFrame(packetId, payload):
+    # unreliable notification: the connector does not acknowledge it
+    return bytearray([0x00, NOTIF_TYPE, packetId, len(payload)]) + payload
+
+class OfflineSerialConnector(IpMgrConnectorSerial.IpMgrConnectorSerial):
+    '''
+    \brief A serial connector fed with frames by the test, not connected to a
+           manager.
+    '''
+    def dn_subscribe(self, filter, unackFilter):
+        pass
+
+class UnfilteredConnector(object):
+    '''
+    \brief A connector without setNotifFilter(), returning the notifications
+           the test queues.
+    '''
+    def __init__(self):
+        self.queue = Queue.Queue()
+
+    def dn_subscribe(self, filter, unackFilter):
+        pass
+
+    def getNotification(self, timeoutSec=-1):
+        notif = self.queue.get()
+        if notif is None:
+            raise ApiException.QueueError()
+        return notif
+
+    def getNotifications(self, maxCount, timeoutSec=-1):
+        return [self.getNotification()]
+
+class Listener(object):
+    '''
+    \brief Records the notifications a subscriber passes, until FINISH.
+    '''
+    def __init__(self, connector, batchSize=1):
+        self.notifs     = []
+        self.errors     = []
+        self.finished   = threading.Event()
+        self.subscriber = IpMgrSubscribe.IpMgrSubscribe(connector)
+        self.subscriber.start(batchSize=batchSize)
+        self.subscriber.subscribe(
+            [IpMgrSubscribe.IpMgrSubscribe.ERROR, IpMgrSubscribe.IpMgrSubscribe.FINISH],
+            self._end,
+            True,
+        )
+
+    def _notif(self, notifName, notifParams):
+        self.notifs.append((notifName, notifParams))
+
+    def _end(self, notifName, notifParams):
+        if notifName==IpMgrSubscribe.IpMgrSubscribe.ERROR:
+            self.errors.append(notifParams)
+        else:
+            self.finished.set()
+
+#============================ tests ===========================================
+
+class IpMgrSubscribe_SerialConnector(unittest.TestCase):
+    ''' Subscribe to the notifications of an IpMgrConnectorSerial '''
+
+    def setUp(self):
+        self.connector = OfflineSerialConnector()
+        self.connector.isConnected = True
+
+    def _receive(self, payloads):
+        for (packetId, payload) in enumerate(payloads):
+            self.connector._hdlcRxCb(buildFrame(packetId, payload))
+        self.connector.disconnect("done")
+
+    def testRawFilter(self):
+        """ The filters are checked before deserializing """
+        listener = Listener(self.connector)
+        listener.subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.NOTIFDATA, listener._notif, False, macs=[MAC_1])
+        self.assertEqual(self.connector.notifFilter, listener.subscriber._isWanted)
+
+        self._receive([
+            buildNotifData(MAC_1, 60000),
+            buildNotifData(MAC_2, 60000),
+            bytearray([SUBID_NOTIFLOG]) + bytearray(MAC_1) + bytearray('log'),
+            buildNotifData(MAC_1, 60001),
+        ])
+        self.assertTrue(listener.finished.wait(TIMEOUT))
+
+        self.assertEqual([name for (name, params) in listener.notifs], ['notifData', 'notifData'])
+        self.assertEqual([params.dstPort for (name, params) in listener.notifs], [60000, 60001])
+        self.assertEqual([list(params.macAddress) for (name, params) in listener.notifs], [MAC_1, MAC_1])
+        self.assertEqual(self.connector.numFilteredNotifs, 2)
+
+    def testBatch(self):
+        """ Same, taking the notifications in batches """
+        listener = Listener(self.connector, batchSize=10)
+        listener.subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.NOTIFDATA, listener._notif, False, dstPorts=[60001])
+
+        self._receive([
+            buildNotifData(MAC_1, 60000),
+            buildNotifData(MAC_2, 60001),
+        ])
+        self.assertTrue(listener.finished.wait(TIMEOUT))
+
+        self.assertEqual([list(params.macAddress) for (name, params) in listener.notifs], [MAC_2])
+        self.assertEqual(self.connector.numFilteredNotifs, 1)
+
+class IpMgrSubscribe_UnfilteredConnector(unittest.TestCase):
+    ''' Subscribe to the notifications of a connector without setNotifFilter() '''
+
+    def _receive(self, listener, connector, notifs):
+        for notif in notifs:
+            connector.queue.put(notif)
+        connector.queue.put(None)
+        self.assertTrue(listener.finished.wait(TIMEOUT))
+
+    def _notifData(self, mac, dstPort, data=DATA):
+        return (
+            'notifData',
+            IpMgrConnectorSerial.IpMgrConnectorSerial.Tuple_notifData(
+                utcSecs    = 0,
+                utcUsecs   = 0,
+                macAddress = mac,
+                srcPort    = 0xf0b8,
+                dstPort    = dstPort,
+                data       = data,
+            ),
+        )
+
+    def testFilterDeserialized(self):
+        """ The filters are checked on the deserialized notifications """
+        for batchSize in [1, 10]:
+            connector = UnfilteredConnector()
+            listener  = Listener(connector, batchSize=batchSize)
+            listener.subscriber.subscribe(
+                IpMgrSubscribe.IpMgrSubscribe.NOTIFDATA,
+                listener._notif,
+                False,
+                macs          = [MAC_2],
+                payloadPrefix = DATA[:2],
+            )
+            self._receive(listener, connector, [
+                self._notifData(MAC_1, 60000),
+                self._notifData(MAC_2, 60001),
+                self._notifData(MAC_2, 60002, data=[0x0a]),
+                self._notifData(MAC_2, 60003, data=[0x0b, 0x0a]),
+            ])
+            self.assertEqual(listener.errors, [])
+            self.assertEqual([params.dstPort for (name, params) in listener.notifs], [60001])
+
+    def testNoFilter(self):
+        """ Without filters, all the notifications subscribed to are passed """
+        connector = UnfilteredConnector()
+        listener  = Listener(connector)
+        listener.subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.NOTIFDATA, listener._notif, False)
+        self._receive(listener, connector, [
+            self._notifData(MAC_1, 60000),
+            self._notifData(MAC_2, 60001),
+        ])
+        self.assertEqual([params.dstPort for (name, params) in listener.notifs], [60000, 60001])
+
+class IpMgrSubscribe_Dispatcher(unittest.TestCase):
+    ''' Call the callbacks on the lanes of a NotifDispatcher '''
+
+    def testProcessLanes(self):
+        """ A dispatcher running its lanes in processes is rejected """
+        dispatcher = NotifDispatcher.NotifDispatcher(numLanes=1, useProcesses=True)
+        try:
+            subscriber = IpMgrSubscribe.IpMgrSubscribe(UnfilteredConnector())
+            self.assertRaises(
+                IpMgrSubscribe.IpMgrSubscribe.SubscribeError,
+                subscriber.start,
+                dispatcher=dispatcher,
+            )
+        finally:
+            dispatcher.close()
+
+# Make this test module runnable from the command prompt
+if __name__ == "__main__":
+    unittest.main()
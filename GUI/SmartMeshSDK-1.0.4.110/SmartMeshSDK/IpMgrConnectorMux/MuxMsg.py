@@ -12,15 +12,30 @@ LOCATION_MAGIC = struct.pack('BBBB', 0x73, 0x03, 0xc6, 0x5d)
 AUTH    = [ 48, 49, 50, 51, 52, 53, 54, 55 ]  # TODO: randomize me!
 VERSION = 4
 
+# Size of the input buffer, grown if a message does not fit in it
+BUFFER_SIZE = 65536
+# Minimum room left in the input buffer for each recv_into()
+MIN_RECV_SIZE = 4096
+
 # Message Parser
 
 class MuxMsg(object):
-    def __init__(self, cb, ver = VERSION, magic = MAGIC, auth = AUTH):
+    '''Serial Mux message builder and stream parser
+    The received bytes are kept in a preallocated bytearray, between the
+    offsets input_start and input_end, and parsed in place: the callback
+    gets the payload of each message as a memoryview of this buffer. The
+    memoryview is only valid during the call; the callback must copy what it
+    keeps (e.g. with tobytes())
+    '''
+    def __init__(self, cb, ver = VERSION, magic = MAGIC, auth = AUTH, buffer_size = BUFFER_SIZE):
         self.callback = cb
         self.ver = ver
         self.auth = auth
         self.magic = magic
-        self.input_buffer = ''
+        self.input_buffer = bytearray(buffer_size)
+        self.input_view = memoryview(self.input_buffer)
+        self.input_start = 0    # offset of the first byte not parsed yet
+        self.input_end = 0      # offset of the end of the received bytes
     
     def getVer(self) :
         return self.ver
@@ -42,39 +57,123 @@ class MuxMsg(object):
         '''
         if not data:
             return
-        self.input_buffer += data
-        while self.parse_one():
-            pass
-
-    def parse_one(self):
-        '''Parse a single command from input_data
-        Returns: whether a command was found
+        self._make_room(len(data))
+        self.input_buffer[self.input_end:self.input_end+len(data)] = data
+        self.input_end += len(data)
+        self.parse_buffer()
+    
+    def recv_from(self, sock):
         '''
-        msg_start = self.input_buffer.find(self.magic)
-        if msg_start >= 0:
+        Receive data from a socket directly into the input buffer, and parse it
+        Calls the registered callback when complete message is received
+        Returns: the number of bytes received, 0 if the connection is closed
+        '''
+        self._make_room(MIN_RECV_SIZE)
+        num_bytes = sock.recv_into(self.input_view[self.input_end:])
+        if num_bytes:
+            self.input_end += num_bytes
+            self.parse_buffer()
+        return num_bytes
+    
+    def parse_buffer(self):
+        '''Parse all the complete commands of the input buffer'''
+        buf = self.input_buffer
+        end = self.input_end
+        while True:
+            index = self.input_start
+            msg_start = buf.find(self.magic, index, end)
+            if msg_start < 0:
+                # if the token doesn't appear, ignore all but the last 3 characters
+                self.input_start = max(index, end - 3)
+                break
             # strip the ignored input
-            self.input_buffer = self.input_buffer[msg_start:]
+            index = self.input_start = msg_start
             # verify input is long enough
-            if len(self.input_buffer) < 6:
-                return False
+            if end < index + 6:
+                break
             # parse message header
-            bin_len = self.input_buffer[4:6]
-            msg_len = struct.unpack('!H', bin_len)[0]
+            msg_len = struct.unpack_from('!H', buf, index + 4)[0]
             # TODO: limit the length of valid messages
-            index_end = 6 + msg_len
+            index_end = index + 6 + msg_len
             # verify the message is complete
-            if len(self.input_buffer) < index_end:
-                return False
-            
-            msg = self.input_buffer[6:index_end]
-            (cmd_id, cmd_type) = struct.unpack('!HB', msg[0:3])
-            data = msg[3:]
+            if end < index_end:
+                break
+            # consume the message before the callback, so it is not parsed again if it raises
+            self.input_start = index_end
+            if msg_len < 3:
+                continue
+            (cmd_id, cmd_type) = struct.unpack_from('!HB', buf, index + 6)
             if self.callback:
-                self.callback(cmd_id, cmd_type, data)
-            self.input_buffer = self.input_buffer[index_end:]
-            return True
+                self.callback(cmd_id, cmd_type, self.input_view[index + 9:index_end])
+        if self.input_start == self.input_end:
+            self.input_start = self.input_end = 0
+    
+    def _make_room(self, num_bytes):
+        '''Make room for num_bytes at the end of the input buffer, moving the
+        bytes not parsed yet to its beginning, or into a larger buffer
+        '''
+        if len(self.input_buffer) - self.input_end >= num_bytes:
+            return
+        pending = self.input_end - self.input_start
+        size = len(self.input_buffer)
+        while size - pending < num_bytes:
+            size *= 2
+        if size == len(self.input_buffer):
+            # copy the (overlapping) bytes through a temporary bytearray
+            self.input_buffer[:pending] = self.input_buffer[self.input_start:self.input_end]
         else:
-            # if the token doesn't appear, ignore all but the last 3 characters
-            self.input_buffer = self.input_buffer[-3:]
-            return False
+            # a new buffer rather than resizing, which memoryviews prevent
+            new_buffer = bytearray(size)
+            new_buffer[:pending] = self.input_view[self.input_start:self.input_end]
+            self.input_buffer = new_buffer
+            self.input_view = memoryview(new_buffer)
+        self.input_start = 0
+        self.input_end = pending
             
+
+# Batch parsing
+
+def splitMessages(buf, magic = MAGIC):
+    '''Split a buffer into the Serial Mux messages it holds, without copying
+    Returns: (messages, consumed), messages being a list of
+    (cmd_id, cmd_type, data) tuples with data a memoryview of buf, and
+    consumed the number of bytes of buf which can be discarded, the rest
+    being the beginning of an incomplete message
+    '''
+    messages = []
+    view = memoryview(buf)
+    index = 0
+    while True:
+        msg_start = buf.find(magic, index)
+        if msg_start < 0:
+            # the token doesn't appear, keep the last 3 characters
+            return (messages, max(index, len(buf) - 3))
+        index = msg_start
+        # verify input is long enough
+        if len(buf) < index + 6:
+            return (messages, index)
+        # parse message header
+        msg_len = struct.unpack_from('!H', buf, index + 4)[0]
+        index_end = index + 6 + msg_len
+        # verify the message is complete
+        if len(buf) < index_end:
+            return (messages, index)
+        if msg_len >= 3:
+            (cmd_id, cmd_type) = struct.unpack_from('!HB', buf, index + 6)
+            messages.append((cmd_id, cmd_type, view[index + 9:index_end]))
+        index = index_end
+
+def deserializeMessages(apiDef, buf, columnar = False, errors = None, magic = MAGIC):
+    '''Deserialize the notifications held in a buffer of Serial Mux messages,
+    as one batch (see ByteArraySerializer.deserializeBatch)
+    The messages which are not notifications (e.g. command responses) are
+    skipped; positions in the result and in errors count notifications only
+    Returns: (result, consumed), result as returned by
+    apiDef.deserializeBatch() and consumed as returned by splitMessages()
+    '''
+    (messages, consumed) = splitMessages(buf, magic)
+    notifIds = set(apiDef.getIds(apiDef.NOTIFICATION))
+    packets = [(apiDef.NOTIFICATION, cmd_type, data)
+               for (cmd_id, cmd_type, data) in messages
+               if cmd_type in notifIds]
+    return (apiDef.deserializeBatch(packets, columnar, errors), consumed)
@@ -0,0 +1,471 @@
+'''
+A Serial Mux, in Python: shares the serial API of an IP manager between
+several TCP clients, such as IpMgrConnectorMux and AsyncIpMgrConnectorMux.
+'''
+
+import threading
+import socket
+import select
+import struct
+import errno
+import Queue
+
+import MuxMsg
+
+from SmartMeshSDK.IpMgrConnectorSerial import IpMgrConnectorSerialInternal
+from SmartMeshSDK.ApiException         import ConnectionError, \
+                                              APIError
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('SerialMuxServer')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+#============================ defines =========================================
+
+DEFAULT_TCP_HOST    = '127.0.0.1'
+DEFAULT_TCP_PORT    = 9900
+MAX_CLIENT_BUFFER   = 1048576 # bytes of notifications buffered for a slow client
+FLUSH_PERIOD        = 0.050   # in seconds, to send what is buffered for clients
+
+CMD_MUX_HELLO       = 1       # the command type of 'mux_hello'
+CMD_NOTIFICATION    = 20      # the command type of the notifications
+CMD_SUBSCRIBE       = 22      # the command type of 'subscribe'
+RC_OK               = 0
+RC_INVALID_ARGUMENT = 2
+RC_INVALID_AUTH     = 3
+RC_INVALID_VERSION  = 4
+RC_COMMAND_TIMEOUT  = 5
+
+#============================ helpers =========================================
+
+def _copyPayload(payload, hexType):
+    '''
+    \brief Response "parser" returning the response as received.
+    '''
+    return payload.tobytes()
+
+class _MgrLink(IpMgrConnectorSerialInternal.IpMgrConnectorSerialInternal):
+    '''
+    \brief The serial connection to the manager, which hands notifications to
+           the server without deserializing them.
+    '''
+
+    def __init__(self, server):
+        IpMgrConnectorSerialInternal.IpMgrConnectorSerialInternal.__init__(self)
+        self.server = server
+
+    def disconnect(self, reason=""):
+        isConnected = self.isConnected
+        IpMgrConnectorSerialInternal.IpMgrConnectorSerialInternal.disconnect(self, reason)
+        if isConnected:
+            self.server._linkDisconnected(reason)
+
+    def _handleNotification(self, cmdId, payload):
+        if cmdId in self.helloCmdIds:
+            return
+        self.server._forwardNotification(cmdId, payload)
+
+class MuxClient(object):
+    '''
+    \brief A TCP client of the Serial Mux.
+
+    Writes never block: what the socket does not take right away is buffered,
+    and sent by the server thread. Past maxBuffer bytes buffered,
+    notifications are dropped (and counted); responses never are.
+    '''
+
+    def __init__(self, sock, address, maxBuffer):
+        self.sock            = sock                   ##< non-blocking TCP socket
+        self.address         = address                ##< (host, port) of the client
+        self.maxBuffer       = maxBuffer              ##< bytes buffered before dropping notifications
+        self.muxMsg          = None                   ##< parser of the commands received, set by the server
+        self.outBuffer       = bytearray()            ##< bytes waiting to be sent
+        self.lock            = threading.Lock()       ##< protects outBuffer and the socket writes
+        self.isHelloDone     = False                  ##< True once a valid mux_hello was received
+        self.filter          = 0                      ##< notification types subscribed to, as in 'subscribe'
+        self.unackFilter     = 0                      ##< those of them to send unacknowledged
+        self.isClosed        = False
+        self.numCmds         = 0                      ##< commands received
+        self.numNotifs       = 0                      ##< notifications sent or buffered
+        self.numDroppedNotifs = 0                     ##< notifications dropped because of a full buffer
+        self.sock.setblocking(0)
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def write(self, packet, isNotif=False):
+        '''
+        \brief Send a Serial Mux packet, or buffer it.
+
+        \returns False if the packet was a notification and was dropped.
+        '''
+        with self.lock:
+            if self.isClosed:
+                return False
+            if isNotif:
+                if len(self.outBuffer)>=self.maxBuffer:
+                    self.numDroppedNotifs += 1
+                    return False
+                self.numNotifs += 1
+            if not self.outBuffer:
+                try:
+                    numBytes = self.sock.send(packet)
+                except socket.error as err:
+                    if err.args[0] not in [errno.EAGAIN, errno.EWOULDBLOCK]:
+                        # the server thread sees the error when reading
+                        return True
+                    numBytes = 0
+                if numBytes==len(packet):
+                    return True
+                packet = buffer(packet, numBytes)
+            self.outBuffer += packet
+            return True
+
+    def isSubscribed(self, notifBit):
+        '''
+        \brief Returns whether the client subscribed to the notifications of
+               a type, given by its bit in the subscribe filter (None for
+               those which cannot be subscribed to).
+        '''
+        return self.isHelloDone and (notifBit is None or (self.filter & notifBit)!=0)
+
+    def hasOutput(self):
+        return len(self.outBuffer)>0
+
+    def flush(self):
+        '''
+        \brief Send what is buffered, as much as the socket takes.
+        '''
+        with self.lock:
+            if not self.outBuffer or self.isClosed:
+                return
+            try:
+                numBytes = self.sock.send(self.outBuffer)
+            except socket.error as err:
+                if err.args[0] not in [errno.EAGAIN, errno.EWOULDBLOCK]:
+                    raise
+                return
+            del self.outBuffer[:numBytes]
+
+    def close(self):
+        with self.lock:
+            self.isClosed  = True
+            self.outBuffer = bytearray()
+        try:
+            self.sock.close()
+        except socket.error:
+            pass
+
+#============================ server ==========================================
+
+class SerialMuxServer(object):
+    '''
+    \ingroup ApiConnector
+
+    \brief Shares the serial API of an IP manager between TCP clients, as
+           the Serial Mux does.
+
+    Each notification received from the manager is wrapped into a Serial Mux
+    packet once, and sent to the clients which completed the mux_hello
+    handshake and subscribed to its type; a slow client gets its
+    notifications buffered, then dropped, without slowing the others down.
+    The commands of the clients are sent to the manager one at a time, in
+    the order received, and their responses returned to the client which
+    sent them, with its tag. The subscribe commands are answered by the
+    server: the manager is subscribed to the notifications any client
+    subscribed to, unacknowledged only if all these clients asked for them
+    unacknowledged.
+
+    Threads: the HDLC thread of the serial link forwards the notifications,
+    the server thread accepts clients and reads their commands, and the
+    command thread sends these to the manager.
+    '''
+
+    PARAM_TCPHOST       = 'tcpHost'
+    PARAM_TCPPORT       = 'tcpPort'
+    PARAM_MAXCLIENTBUFFER = 'maxClientBuffer'
+
+    def __init__(self):
+        self.link            = None                   ##< serial connection to the manager
+        self.listener        = None                   ##< listening TCP socket
+        self.clients         = []                     ##< connected MuxClients
+        self.clientsLock     = threading.Lock()       ##< protects clients
+        self.cmdQueue        = Queue.Queue()          ##< commands to send, (client, tag, cmdType, payload)
+        self.muxMsg          = MuxMsg.MuxMsg(None)    ##< packet builder
+        self.maxClientBuffer = MAX_CLIENT_BUFFER
+        self.isRunning       = False
+        self.serverThread    = None
+        self.cmdThread       = None
+        self.numNotifs       = 0                      ##< notifications received from the manager
+        self.numCmds         = 0                      ##< commands sent to the manager
+        self.numCmdFailures  = 0                      ##< commands the manager did not answer
+        self.mgrSubscription = (0, 0)                 ##< (filter, unackFilter) last sent to the manager
+
+    #======================== public ==========================================
+
+    def connect(self, params):
+        '''
+        \brief Connect to the manager, and start accepting clients.
+
+        \param params Dictionary of connection parameters:
+            - 'port' - serial port of the manager's API (required)
+            - 'baudrate', 'bulkRx', ... - passed to the serial connector
+            - 'tcpHost' - interface to listen on (default 127.0.0.1)
+            - 'tcpPort' - TCP port to listen on (default 9900, 0 to pick one)
+            - 'maxClientBuffer' - bytes of notifications buffered for a client
+              before dropping them (default 1MB)
+        '''
+        tcpHost = DEFAULT_TCP_HOST
+        tcpPort = DEFAULT_TCP_PORT
+        if self.PARAM_TCPHOST in params :
+            tcpHost = params[self.PARAM_TCPHOST]
+        if self.PARAM_TCPPORT in params :
+            tcpPort = params[self.PARAM_TCPPORT]
+        if self.PARAM_MAXCLIENTBUFFER in params :
+            self.maxClientBuffer = params[self.PARAM_MAXCLIENTBUFFER]
+
+        # connect to the manager
+        linkParams = dict((k, v) for (k, v) in params.items()
+                          if k not in [self.PARAM_TCPHOST, self.PARAM_TCPPORT, self.PARAM_MAXCLIENTBUFFER])
+        self.link = _MgrLink(self)
+        self.link.connect(linkParams)
+        self.mgrSubscription = (0, 0) # a new session is subscribed to nothing
+
+        # listen for clients
+        try :
+            self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.listener.bind((tcpHost, tcpPort))
+            self.listener.listen(5)
+        except socket.error as ex:
+            self.link.disconnect()
+            raise ConnectionError(str(ex))
+
+        self.isRunning    = True
+        self.serverThread = threading.Thread(target=self._serverLoop, name='SerialMuxServer')
+        self.serverThread.daemon = True
+        self.serverThread.start()
+        self.cmdThread    = threading.Thread(target=self._cmdLoop, name='SerialMuxCmd')
+        self.cmdThread.daemon = True
+        self.cmdThread.start()
+
+    def disconnect(self, reason=""):
+        '''
+        \brief Disconnect the clients, and from the manager.
+        '''
+        if not self.isRunning:
+            return
+        self.isRunning = False
+        self.cmdQueue.put(None)
+        if self.link:
+            self.link.disconnect(reason)
+        for thread in [self.serverThread, self.cmdThread]:
+            if thread and thread is not threading.currentThread():
+                thread.join()
+
+    def getTcpPort(self):
+        '''
+        \brief Returns the TCP port the server listens on.
+        '''
+        return self.listener.getsockname()[1]
+
+    def getStats(self):
+        '''
+        \brief Returns the counters of the server.
+
+        \returns A dictionary with the following keys:
+                 - 'numClients': clients connected
+                 - 'numNotifs': notifications received from the manager
+                 - 'numCmds': commands sent to the manager
+                 - 'numCmdFailures': commands the manager did not answer
+                 - 'numDroppedNotifs': notifications dropped, all clients
+                 - 'numBufferedBytes': bytes waiting to be sent, all clients
+        '''
+        with self.clientsLock:
+            clients = list(self.clients)
+        return {
+            'numClients':       len(clients),
+            'numNotifs':        self.numNotifs,
+            'numCmds':          self.numCmds,
+            'numCmdFailures':   self.numCmdFailures,
+            'numDroppedNotifs': sum(c.numDroppedNotifs for c in clients),
+            'numBufferedBytes': sum(len(c.outBuffer) for c in clients),
+        }
+
+    #======================== private =========================================
+
+    #===== serial link (HDLC thread)
+
+    def _forwardNotification(self, cmdId, payload):
+        self.numNotifs += 1
+        notifBit = None
+        if cmdId==CMD_NOTIFICATION and len(payload)>0:
+            notifBit = 1<<ord(payload[0])
+        packet = self.muxMsg.build_message(cmdId, payload.tobytes(), 0)
+        with self.clientsLock:
+            clients = list(self.clients)
+        for client in clients:
+            if client.isSubscribed(notifBit):
+                client.write(packet, isNotif=True)
+
+    def _linkDisconnected(self, reason):
+        if not self.isRunning:
+            return
+        log.error("disconnected from the manager: {0}".format(reason))
+        thread = threading.Thread(target=self.disconnect, args=(reason,))
+        thread.daemon = True
+        thread.start()
+
+    #===== clients (server thread)
+
+    def _serverLoop(self):
+        try:
+            while self.isRunning:
+                with self.clientsLock:
+                    clients = list(self.clients)
+                rlist = [self.listener] + clients
+                wlist = [c for c in clients if c.hasOutput()]
+                try:
+                    (readable, writable, _) = select.select(rlist, wlist, [], FLUSH_PERIOD)
+                except select.error as err:
+                    if err.args[0]==errno.EINTR:
+                        continue
+                    raise
+                for client in writable:
+                    try:
+                        client.flush()
+                    except socket.error as err:
+                        self._removeClient(client, str(err))
+                # flush what the HDLC thread buffered since the select
+                for client in clients:
+                    if client.hasOutput() and client not in writable:
+                        try:
+                            client.flush()
+                        except socket.error as err:
+                            self._removeClient(client, str(err))
+                for r in readable:
+                    if r is self.listener:
+                        self._acceptClient()
+                    else:
+                        self._readClient(r)
+        finally:
+            with self.clientsLock:
+                clients      = self.clients
+                self.clients = []
+            for client in clients:
+                client.close()
+            self.listener.close()
+
+    def _acceptClient(self):
+        try:
+            (sock, address) = self.listener.accept()
+        except socket.error:
+            return
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client = MuxClient(sock, address, self.maxClientBuffer)
+        client.muxMsg = MuxMsg.MuxMsg(
+            lambda tag, cmdType, payload: self._handleCmd(client, tag, cmdType, payload)
+        )
+        log.info("client {0} connected".format(address))
+        with self.clientsLock:
+            self.clients.append(client)
+
+    def _readClient(self, client):
+        try:
+            numBytes = client.muxMsg.recv_from(client.sock)
+        except socket.error as err:
+            if err.args[0] in [errno.EAGAIN, errno.EWOULDBLOCK]:
+                return
+            self._removeClient(client, str(err))
+            return
+        if not numBytes:
+            self._removeClient(client, "connection closed")
+
+    def _removeClient(self, client, reason):
+        log.info("client {0} disconnected: {1}".format(client.address, reason))
+        with self.clientsLock:
+            if client in self.clients:
+                self.clients.remove(client)
+        client.close()
+        self._updateSubscription()
+
+    def _handleCmd(self, client, tag, cmdType, payload):
+        if client.isClosed:
+            return
+        client.numCmds += 1
+        if cmdType==CMD_MUX_HELLO:
+            if len(payload)<1 or ord(payload[0])!=self.muxMsg.getVer():
+                rc = RC_INVALID_VERSION
+            elif [ord(b) for b in payload[1:9]]!=self.muxMsg.getAuth():
+                rc = RC_INVALID_AUTH
+            else:
+                rc = RC_OK
+            client.write(self.muxMsg.build_message(cmdType, struct.pack('>BB', rc, self.muxMsg.getVer()), tag))
+            if rc==RC_OK:
+                client.isHelloDone = True
+            else:
+                client.flush()
+                self._removeClient(client, "mux_hello failed, RC={0}".format(rc))
+        elif not client.isHelloDone:
+            self._removeClient(client, "command before mux_hello")
+        elif cmdType==CMD_SUBSCRIBE:
+            if len(payload)<8:
+                rc = RC_INVALID_ARGUMENT
+            else:
+                rc = RC_OK
+                (client.filter, client.unackFilter) = struct.unpack('>II', payload[:8].tobytes())
+            client.write(self.muxMsg.build_message(cmdType, struct.pack('>B', rc), tag))
+            self._updateSubscription()
+        else:
+            self.cmdQueue.put((client, tag, cmdType, payload.tobytes()))
+
+    def _updateSubscription(self):
+        '''
+        \brief Subscribe the manager to the notifications the clients
+               subscribed to, if they changed.
+        '''
+        with self.clientsLock:
+            clients = [c for c in self.clients if c.isHelloDone]
+        filter      = 0
+        for client in clients:
+            filter |= client.filter
+        # a type is sent acknowledged if any client wants it acknowledged
+        unackFilter = filter
+        for client in clients:
+            unackFilter &= client.unackFilter | (~client.filter & 0xffffffff)
+        if (filter, unackFilter)==self.mgrSubscription:
+            return
+        self.mgrSubscription = (filter, unackFilter)
+        self.cmdQueue.put((None, 0, CMD_SUBSCRIBE, struct.pack('>II', filter, unackFilter)))
+
+    #===== commands (command thread)
+
+    def _cmdLoop(self):
+        while True:
+            item = self.cmdQueue.get()
+            if item is None or not self.isRunning:
+                return
+            (client, tag, cmdType, payload) = item
+            if client and client.isClosed:
+                continue
+            try:
+                response = self.link.sendSerialized(None, cmdType, payload, _copyPayload)
+            except ConnectionError as err:
+                if not self.link.isConnected:
+                    return
+                log.warning("command {0} not answered: {1}".format(cmdType, err))
+                self.numCmdFailures += 1
+                response = struct.pack('>B', RC_COMMAND_TIMEOUT)
+            except APIError as err:
+                # the response was not parsed as expected, return its RC
+                response = struct.pack('>B', err.rc)
+            self.numCmds += 1
+            if client:
+                client.write(self.muxMsg.build_message(cmdType, response, tag))
+            elif ord(response[0])!=RC_OK:
+                # the server's own subscribe
+                log.warning("command {0} failed, RC={1}".format(cmdType, ord(response[0])))
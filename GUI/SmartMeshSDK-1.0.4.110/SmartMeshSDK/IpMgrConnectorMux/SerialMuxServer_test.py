@@ -0,0 +1,201 @@
+#!/usr/bin/python
+
+'''
+Tests of the subscriptions of the clients of SerialMuxServer, connected to a
+stand-in manager speaking the serial API on a pseudo-terminal.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import select
+import struct
+import threading
+import time
+import unittest
+
+from SmartMeshSDK.IpMgrConnectorMux import IpMgrConnectorMux, \
+                                           SerialMuxServer
+from SmartMeshSDK.SerialConnector   import Hdlc
+
+#============================ defines =========================================
+
+CMD_HELLO          = 1
+CMD_HELLO_RESPONSE = 2
+CMD_NOTIFICATION   = 20
+CMD_SUBSCRIBE      = 22
+SUBID_NOTIFLOG     = 2
+SUBID_NOTIFDATA    = 4
+SUBID_NOTIFHEALTHREPORT = 6
+RC_OK              = 0
+TIMEOUT            = 5.0
+
+MAC                = struct.pack('>Q', 0x00170d0000000001)
+
+#============================ helpers =========================================
+
+def bitsOf(subId):
+    return [0, 0, 0, 1<<subId]
+
+class PtyWriter(object):
+    '''
+    \brief Stands for the pyserial handler of Hdlc, on a file descriptor.
+    '''
+    def __init__(self, fd):
+        self.fd = fd
+
+    def write(self, data):
+        data = str(data)
+        numWritten = 0
+        while numWritten<len(data):
+            numWritten += os.write(self.fd, data[numWritten:])
+        return numWritten
+
+class StandInManager(threading.Thread):
+    '''
+    \brief Answers the hello and subscribe commands on the master side of a
+           pseudo-terminal, and sends notifications on demand.
+    '''
+    def __init__(self):
+        import tty
+        (self.masterFd, slaveFd) = os.openpty()
+        tty.setraw(slaveFd)
+        self.port          = os.ttyname(slaveFd)
+        self.frames        = []
+        self.subscriptions = []   # (filter, unackFilter) of each subscribe received
+        self.hdlc          = Hdlc.Hdlc(self.frames.append, None, bulkRx=True)
+        self.hdlc.pyserialHandler = PtyWriter(self.masterFd)
+        self.hdlc.connected       = True
+        self.sendLock      = threading.Lock()
+        self.isRunning     = True
+        threading.Thread.__init__(self)
+        self.daemon        = True
+
+    def run(self):
+        while self.isRunning:
+            (readable, _, _) = select.select([self.masterFd], [], [], 0.1)
+            if not readable:
+                continue
+            try:
+                data = os.read(self.masterFd, 4096)
+            except OSError:
+                return
+            if not data:
+                return
+            self.hdlc.receive(data)
+            while self.frames:
+                self._handleFrame(self.frames.pop(0))
+
+    def close(self):
+        self.isRunning = False
+        self.join()
+        os.close(self.masterFd)
+
+    def sendNotif(self, subId, fields):
+        self._send(0x00, CMD_NOTIFICATION, 0, chr(subId)+fields)
+
+    def waitForSubscription(self, subscription):
+        endTime = time.time()+TIMEOUT
+        while time.time()<endTime:
+            if self.subscriptions and self.subscriptions[-1]==subscription:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def _send(self, control, cmdId, packetId, payload):
+        with self.sendLock:
+            self.hdlc.send([control, cmdId, packetId, len(payload)] + [ord(b) for b in payload])
+
+    def _handleFrame(self, frame):
+        (control, cmdId, packetId) = (frame[0], frame[1], frame[2])
+        payload = str(frame[4:])
+        if control & 0x01:
+            return # ACK
+        if cmdId==CMD_HELLO:
+            cliSeqNo = ord(payload[1])
+            self._send(0x00, CMD_HELLO_RESPONSE, 0,
+                       struct.pack('>BBBBB', RC_OK, 4, 0, cliSeqNo, 0))
+        elif cmdId==CMD_SUBSCRIBE:
+            self.subscriptions.append(struct.unpack('>II', payload[:8]))
+            self._send(0x01, cmdId, packetId, struct.pack('>B', RC_OK))
+
+#============================ tests ===========================================
+
+@unittest.skipUnless(hasattr(os, 'openpty'), 'needs pseudo-terminals')
+class SerialMuxServer_Subscriptions(unittest.TestCase):
+    ''' Two clients of a SerialMuxServer, subscribed to different notifications '''
+
+    def setUp(self):
+        self.manager = StandInManager()
+        self.manager.start()
+        self.server  = SerialMuxServer.SerialMuxServer()
+        self.server.connect({'port': self.manager.port, 'bulkRx': True, 'tcpPort': 0})
+        self.clients = []
+
+    def tearDown(self):
+        for client in self.clients:
+            client.disconnect()
+        self.manager.close()
+        self.server.disconnect()
+
+    def _connectClient(self):
+        client = IpMgrConnectorMux.IpMgrConnectorMux()
+        client.connect({'port': self.server.getTcpPort()})
+        self.clients.append(client)
+        return client
+
+    def _getNotifNames(self, client, numNotifs):
+        names = []
+        for _ in range(numNotifs):
+            notif = client.getNotification(TIMEOUT)
+            self.assertTrue(notif)
+            names.append(notif[0])
+        return names
+
+    def testSubscriptions(self):
+        """ Each client gets the notifications it subscribed to """
+        dataClient = self._connectClient()
+        logClient  = self._connectClient()
+        dataClient.dn_subscribe(bitsOf(SUBID_NOTIFDATA), bitsOf(SUBID_NOTIFDATA))
+        logClient.dn_subscribe(bitsOf(SUBID_NOTIFLOG), [0, 0, 0, 0])
+
+        # the manager is subscribed to both, the logs acknowledged
+        self.assertTrue(self.manager.waitForSubscription((0x14, 0x10)))
+
+        data   = struct.pack('>QI', 1400000000, 0) + MAC + struct.pack('>HH', 0xf0b8, 0xf0b8) + 'data'
+        log    = MAC + 'log'
+        report = MAC + 'report'
+        self.manager.sendNotif(SUBID_NOTIFDATA,         data)
+        self.manager.sendNotif(SUBID_NOTIFLOG,          log)
+        self.manager.sendNotif(SUBID_NOTIFHEALTHREPORT, report)
+        self.manager.sendNotif(SUBID_NOTIFLOG,          log)
+        self.manager.sendNotif(SUBID_NOTIFDATA,         data)
+
+        self.assertEqual(self._getNotifNames(dataClient, 2), ['notifData', 'notifData'])
+        self.assertEqual(self._getNotifNames(logClient,  2), ['notifLog',  'notifLog'])
+        # the last notification was forwarded, so were the ones before it
+        self.assertEqual(sorted(c.numNotifs for c in self.server.clients), [2, 2])
+        self.assertEqual(self.server.getStats()['numNotifs'], 5)
+
+    def testUnsubscribe(self):
+        """ The subscriptions of a client which leaves are dropped """
+        dataClient = self._connectClient()
+        logClient  = self._connectClient()
+        dataClient.dn_subscribe(bitsOf(SUBID_NOTIFDATA), [0, 0, 0, 0])
+        logClient.dn_subscribe(bitsOf(SUBID_NOTIFLOG), bitsOf(SUBID_NOTIFLOG))
+        self.assertTrue(self.manager.waitForSubscription((0x14, 0x04)))
+
+        self.clients.remove(logClient)
+        logClient.disconnect()
+        self.assertTrue(self.manager.waitForSubscription((0x10, 0x00)))
+
+# Make this test module runnable from the command prompt
+if __name__ == "__main__":
+    unittest.main()
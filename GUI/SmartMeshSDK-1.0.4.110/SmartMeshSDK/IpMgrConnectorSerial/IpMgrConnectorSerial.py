@@ -1,2301 +1,3777 @@
-'''
-This module was generated automatically. Do not edit directly.
-'''
-
-import collections
-from   SmartMeshSDK import ApiException
-from   IpMgrConnectorSerialInternal import IpMgrConnectorSerialInternal
-
-##
-# \addtogroup IpMgrConnectorSerial
-# \{
-# 
-
-class IpMgrConnectorSerial(IpMgrConnectorSerialInternal):
-    '''
-    \brief Public class for IP manager connector, over Serial.
-    '''
-
-    #======================== commands ========================================
-
-    ##
-    # The named tuple returned by the dn_mux_hello() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>version</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_mux_hello = collections.namedtuple("Tuple_dn_mux_hello", ['RC', 'version'])
-
-    ##
-    # Sent by the manager to initiate a new session with a client.
-    # 
-    # \param version 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param secret 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_mux_hello named tuple.
-    # 
-    def dn_mux_hello(self, version, secret) :
-        res = IpMgrConnectorSerialInternal.send(self, ['mux_hello'], {"version" : version, "secret" : secret})
-        return IpMgrConnectorSerial.Tuple_dn_mux_hello(**res)
-
-    ##
-    # 
-    # 
-    # \param version 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param cliSeqNo 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param mode 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: legacy
-    # 
-    # \returns The response to the command.
-    # 
-    def dn_hello(self, version, cliSeqNo, mode) :
-        res = IpMgrConnectorSerialInternal.send(self, ['hello'], {"version" : version, "cliSeqNo" : cliSeqNo, "mode" : mode})
-        return res
-
-    ##
-    # The named tuple returned by the dn_hello_response() function.
-    # 
-    # - <tt>successCode</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: success
-    #      - 1: unsupported_version
-    #      - 2: invalid_mode
-    # - <tt>version</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>mgrSeqNo</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>cliSeqNo</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>mode</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: legacy
-    # 
-    Tuple_dn_hello_response = collections.namedtuple("Tuple_dn_hello_response", ['successCode', 'version', 'mgrSeqNo', 'cliSeqNo', 'mode'])
-
-    ##
-    # 
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_hello_response named tuple.
-    # 
-    def dn_hello_response(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['hello_response'], {})
-        return IpMgrConnectorSerial.Tuple_dn_hello_response(**res)
-
-    ##
-    # The named tuple returned by the dn_reset() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_reset = collections.namedtuple("Tuple_dn_reset", ['RC', 'macAddress'])
-
-    ##
-    # The reset command is used to reset various objects. The command argument is an object type, and if the object is a mote the MAC address must be specified (otherwise that argument is ignored).
-    # 
-    # \param type 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: resetSystem
-    #      - 2: resetMote
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_reset named tuple.
-    # 
-    def dn_reset(self, type, macAddress) :
-        res = IpMgrConnectorSerialInternal.send(self, ['reset'], {"type" : type, "macAddress" : macAddress})
-        return IpMgrConnectorSerial.Tuple_dn_reset(**res)
-
-    ##
-    # The named tuple returned by the dn_subscribe() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_subscribe = collections.namedtuple("Tuple_dn_subscribe", ['RC'])
-
-    ##
-    # The subscribe command indicates that the manager should send the external application the specified notifications. It contains two filter fields:
-    # 
-    # -filter is a bitmask of flags indicating the types of notifications that the client wants to receive
-    # -unackFilter allows the client to select which of the notifications selected in filter should be sent acknowledged. If a notification is sent as 'acknowledged', thesubsequent notification packets will be queued while waiting for response.
-    # 
-    # Each subscription request overwrites the previous one. If an application is subscribed to data and then decides he also wants events he should send a subscribe command with both the data and event flags set. To clear all subscriptions, the client should send a subscribe command with the filter set to zero. When a session is initiated between the manager and a client, the subscription filter is initialized to zero.
-    # 
-    # The subscribe bitmap uses the values of the notification type enumeration. Some values are unused to provide backwards compatibility with earlier APIs.
-    # 
-    # \param filter 4-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # \param unackFilter 4-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_subscribe named tuple.
-    # 
-    def dn_subscribe(self, filter, unackFilter) :
-        res = IpMgrConnectorSerialInternal.send(self, ['subscribe'], {"filter" : filter, "unackFilter" : unackFilter})
-        return IpMgrConnectorSerial.Tuple_dn_subscribe(**res)
-
-    ##
-    # The named tuple returned by the dn_getTime() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>uptime</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>utcSecs</tt>: 8-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>utcUsecs</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>asn</tt>: 5-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>asnOffset</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getTime = collections.namedtuple("Tuple_dn_getTime", ['RC', 'uptime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset'])
-
-    ##
-    # The getTime command returns the current manager UTC time and current absolute slot number (ASN). The time values returned by this command are delayed by queuing and transfer time over the serial connection. For additional precision, an external application should trigger the networkTime notification using the Time Pin.
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getTime named tuple.
-    # 
-    def dn_getTime(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getTime'], {})
-        return IpMgrConnectorSerial.Tuple_dn_getTime(**res)
-
-    ##
-    # The named tuple returned by the dn_setNetworkConfig() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_setNetworkConfig = collections.namedtuple("Tuple_dn_setNetworkConfig", ['RC'])
-
-    ##
-    # The setNetworkConfig command changes network configuration parameters. The response code indicates whether the changes were successfully applied.This change is persistent.
-    # 
-    # Generally, changes to network configuration will take effect when the manager reboots. Exceptions are detailed below:
-    # 
-    # 
-    # -Max Motes: The new maxMotes value is used as soon as new motes try to join the network, but motes are not removed from the network if the value is set to a number lower than numMotes.
-    # -Base Bandwidth: Changing baseBandwidth while the network is running does not reallocate bandwidth to Operational motes.
-    # 
-    # \param networkId 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param apTxPower 1-byte field formatted as a ints.<br/>
-    #     There is no restriction on the value of this field.
-    # \param frameProfile 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 1: Profile_01
-    # \param maxMotes 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param baseBandwidth 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param downFrameMultVal 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param numParents 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param ccaMode 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: off
-    #      - 1: energy
-    #      - 2: carrier
-    #      - 3: both
-    # \param channelList 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param autoStartNetwork 1-byte field formatted as a bool.<br/>
-    #     There is no restriction on the value of this field.
-    # \param locMode 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param bbMode 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: off
-    #      - 1: upstream
-    #      - 2: bidirectional
-    # \param bbSize 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param isRadioTest 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param bwMult 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param oneChannel 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_setNetworkConfig named tuple.
-    # 
-    def dn_setNetworkConfig(self, networkId, apTxPower, frameProfile, maxMotes, baseBandwidth, downFrameMultVal, numParents, ccaMode, channelList, autoStartNetwork, locMode, bbMode, bbSize, isRadioTest, bwMult, oneChannel) :
-        res = IpMgrConnectorSerialInternal.send(self, ['setNetworkConfig'], {"networkId" : networkId, "apTxPower" : apTxPower, "frameProfile" : frameProfile, "maxMotes" : maxMotes, "baseBandwidth" : baseBandwidth, "downFrameMultVal" : downFrameMultVal, "numParents" : numParents, "ccaMode" : ccaMode, "channelList" : channelList, "autoStartNetwork" : autoStartNetwork, "locMode" : locMode, "bbMode" : bbMode, "bbSize" : bbSize, "isRadioTest" : isRadioTest, "bwMult" : bwMult, "oneChannel" : oneChannel})
-        return IpMgrConnectorSerial.Tuple_dn_setNetworkConfig(**res)
-
-    ##
-    # The named tuple returned by the dn_clearStatistics() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_clearStatistics = collections.namedtuple("Tuple_dn_clearStatistics", ['RC'])
-
-    ##
-    # The clearStatistics command clears the accumulated network statistics. The command does not clear path quality or mote statistics.
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_clearStatistics named tuple.
-    # 
-    def dn_clearStatistics(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['clearStatistics'], {})
-        return IpMgrConnectorSerial.Tuple_dn_clearStatistics(**res)
-
-    ##
-    # The named tuple returned by the dn_exchangeMoteJoinKey() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_exchangeMoteJoinKey = collections.namedtuple("Tuple_dn_exchangeMoteJoinKey", ['RC', 'callbackId'])
-
-    ##
-    # The exchangeMoteJoinKey command triggers the manager to send a new join key to the specified mote and update the manager's ACL entry for the mote. The response contains a callbackId. A commandFinished event notification with this callbackId will be sent when the operation is complete. This change is persistent.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # \param key 16-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_exchangeMoteJoinKey named tuple.
-    # 
-    def dn_exchangeMoteJoinKey(self, macAddress, key) :
-        res = IpMgrConnectorSerialInternal.send(self, ['exchangeMoteJoinKey'], {"macAddress" : macAddress, "key" : key})
-        return IpMgrConnectorSerial.Tuple_dn_exchangeMoteJoinKey(**res)
-
-    ##
-    # The named tuple returned by the dn_exchangeNetworkId() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_exchangeNetworkId = collections.namedtuple("Tuple_dn_exchangeNetworkId", ['RC', 'callbackId'])
-
-    ##
-    # The exchangeNetworkId command triggers the manager to distribute a new network ID to all the motes in the network. AcallbackId is returned in the response. A commandFinished notification with this callbackId will be sent when the operation is complete.This change is persistent.
-    # 
-    # \param id 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_exchangeNetworkId named tuple.
-    # 
-    def dn_exchangeNetworkId(self, id) :
-        res = IpMgrConnectorSerialInternal.send(self, ['exchangeNetworkId'], {"id" : id})
-        return IpMgrConnectorSerial.Tuple_dn_exchangeNetworkId(**res)
-
-    ##
-    # The named tuple returned by the dn_radiotestTx() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_radiotestTx = collections.namedtuple("Tuple_dn_radiotestTx", ['RC'])
-
-    ##
-    # The radiotestTx command allows the user to initiate a radio transmission test. It may only be executed if the manager has been booted up in radiotest mode (see setNetworkConfig command). Three types of transmission tests are supported:
-    # 
-    # -Packet transmission
-    # -Continuous modulation
-    # -Continuous wave (unmodulated signal)
-    # 
-    # In a packet transmission test, the device generates a repeatCnt number of packet sequences. Each sequence consists of up to 10 packets with configurable size and delays.Each packet starts with a PHY preamble (5 bytes), followed by a PHY length field (1 byte), followed by data payload of up to 125 bytes, and finally a 2-byte 802.15.4 CRC at the end. Byte 0 of the payload contains stationId of the sender. Bytes 1 and 2 contain the packet number (in big-endian format) that increments with every packet transmitted. Bytes 3..N contain a counter (from 0..N-2) that increments with every byte inside payload. Transmissions occur on the set of channels defined bychanMask, selected inpseudo-randomorder.
-    # 
-    # In a continuous modulation test, the device generates continuous pseudo-random modulated signal, centered at the specified channel. The test is stopped by resetting the device.
-    # 
-    # In a continuous wave test, the device generates an unmodulated tone, centered at the specified channel. The test tone is stopped by resetting the device.
-    # 
-    # 
-    # 
-    # Channel numbering is 0-15, corresponding to IEEE 2.4 GHz channels 11-26.
-    # 
-    # \param testType 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param chanMask 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param repeatCnt 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param txPower 1-byte field formatted as a ints.<br/>
-    #     There is no restriction on the value of this field.
-    # \param seqSize 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param pkLen_1 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param delay_1 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param pkLen_2 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param delay_2 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param pkLen_3 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param delay_3 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param pkLen_4 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param delay_4 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param pkLen_5 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param delay_5 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param pkLen_6 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param delay_6 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param pkLen_7 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param delay_7 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param pkLen_8 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param delay_8 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param pkLen_9 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param delay_9 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param pkLen_10 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param delay_10 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_radiotestTx named tuple.
-    # 
-    def dn_radiotestTx(self, testType, chanMask, repeatCnt, txPower, seqSize, pkLen_1, delay_1, pkLen_2, delay_2, pkLen_3, delay_3, pkLen_4, delay_4, pkLen_5, delay_5, pkLen_6, delay_6, pkLen_7, delay_7, pkLen_8, delay_8, pkLen_9, delay_9, pkLen_10, delay_10) :
-        res = IpMgrConnectorSerialInternal.send(self, ['radiotestTx'], {"testType" : testType, "chanMask" : chanMask, "repeatCnt" : repeatCnt, "txPower" : txPower, "seqSize" : seqSize, "pkLen_1" : pkLen_1, "delay_1" : delay_1, "pkLen_2" : pkLen_2, "delay_2" : delay_2, "pkLen_3" : pkLen_3, "delay_3" : delay_3, "pkLen_4" : pkLen_4, "delay_4" : delay_4, "pkLen_5" : pkLen_5, "delay_5" : delay_5, "pkLen_6" : pkLen_6, "delay_6" : delay_6, "pkLen_7" : pkLen_7, "delay_7" : delay_7, "pkLen_8" : pkLen_8, "delay_8" : delay_8, "pkLen_9" : pkLen_9, "delay_9" : delay_9, "pkLen_10" : pkLen_10, "delay_10" : delay_10})
-        return IpMgrConnectorSerial.Tuple_dn_radiotestTx(**res)
-
-    ##
-    # The named tuple returned by the dn_radiotestRx() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_radiotestRx = collections.namedtuple("Tuple_dn_radiotestRx", ['RC'])
-
-    ##
-    # The radiotestRx command clears all previously collected statistics and initiates radio reception on the specified channel. It may only be executed if the manager has been booted up in radiotest mode (see setNetworkConfig command).During the test, the device keeps statistics about the number of packets received (with and without error). Note that the station id specified in this command must match the transmitter's station id. This is necessary to isolate traffic if multiple tests are running in the same radio space.The test results may be retrieved using the getRadiotestStatistics command.
-    # 
-    # 
-    # 
-    # Channel numbering is 0-15, corresponding to IEEE 2.4 GHz channels 11-26.
-    # 
-    # \param mask 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param duration 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param stationId 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_radiotestRx named tuple.
-    # 
-    def dn_radiotestRx(self, mask, duration, stationId) :
-        res = IpMgrConnectorSerialInternal.send(self, ['radiotestRx'], {"mask" : mask, "duration" : duration, "stationId" : stationId})
-        return IpMgrConnectorSerial.Tuple_dn_radiotestRx(**res)
-
-    ##
-    # The named tuple returned by the dn_getRadiotestStatistics() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>rxOk</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>rxFail</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getRadiotestStatistics = collections.namedtuple("Tuple_dn_getRadiotestStatistics", ['RC', 'rxOk', 'rxFail'])
-
-    ##
-    # This command retrieves statistics from a previously run radiotestRx command.It may only be executed if the manager has been booted up in radiotest mode (see setNetworkConfig command).
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getRadiotestStatistics named tuple.
-    # 
-    def dn_getRadiotestStatistics(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getRadiotestStatistics'], {})
-        return IpMgrConnectorSerial.Tuple_dn_getRadiotestStatistics(**res)
-
-    ##
-    # The named tuple returned by the dn_setACLEntry() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_setACLEntry = collections.namedtuple("Tuple_dn_setACLEntry", ['RC'])
-
-    ##
-    # The setACLEntry command adds a new entry or updates an existing entry in the Access Control List (ACL).This change is persistent.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # \param joinKey 16-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_setACLEntry named tuple.
-    # 
-    def dn_setACLEntry(self, macAddress, joinKey) :
-        res = IpMgrConnectorSerialInternal.send(self, ['setACLEntry'], {"macAddress" : macAddress, "joinKey" : joinKey})
-        return IpMgrConnectorSerial.Tuple_dn_setACLEntry(**res)
-
-    ##
-    # The named tuple returned by the dn_getNextACLEntry() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>joinKey</tt>: 16-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getNextACLEntry = collections.namedtuple("Tuple_dn_getNextACLEntry", ['RC', 'macAddress', 'joinKey'])
-
-    ##
-    # The getNextACLEntry command returns information about next mote entry in the access control list (ACL). To begin a search (find the first mote in ACL), a zero MAC address (0000000000000000) should be sent.There is no mechanism for reading the ACL entry of a specific mote. This call is an iterator. If you call getNextACLEntry with mote A as the argument, your response is the ACL entry for mote B, where B is the next mote in the ACL.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getNextACLEntry named tuple.
-    # 
-    def dn_getNextACLEntry(self, macAddress) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getNextACLEntry'], {"macAddress" : macAddress})
-        return IpMgrConnectorSerial.Tuple_dn_getNextACLEntry(**res)
-
-    ##
-    # The named tuple returned by the dn_deleteACLEntry() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_deleteACLEntry = collections.namedtuple("Tuple_dn_deleteACLEntry", ['RC'])
-
-    ##
-    # The deleteACLEntry command deletes the specified mote from the access control list (ACL). If the macAddress parameter is set to all 0xFFs or all 0x00s, the entire ACL is cleared. This change is persistent.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_deleteACLEntry named tuple.
-    # 
-    def dn_deleteACLEntry(self, macAddress) :
-        res = IpMgrConnectorSerialInternal.send(self, ['deleteACLEntry'], {"macAddress" : macAddress})
-        return IpMgrConnectorSerial.Tuple_dn_deleteACLEntry(**res)
-
-    ##
-    # The named tuple returned by the dn_pingMote() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_pingMote = collections.namedtuple("Tuple_dn_pingMote", ['RC', 'callbackId'])
-
-    ##
-    # The pingMote command sends a ping (echo request) to the mote specified by MAC address. A unique callbackId is generated and returned with the response. When the response is received from the mote, the manager generates a pingResponse notification with the measured round trip delay and several other parameters. The request is sent using unacknowledged transport, so the mote is not guaranteed to receive the request.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_pingMote named tuple.
-    # 
-    def dn_pingMote(self, macAddress) :
-        res = IpMgrConnectorSerialInternal.send(self, ['pingMote'], {"macAddress" : macAddress})
-        return IpMgrConnectorSerial.Tuple_dn_pingMote(**res)
-
-    ##
-    # The named tuple returned by the dn_getLog() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_getLog = collections.namedtuple("Tuple_dn_getLog", ['RC'])
-
-    ##
-    # The getLog command retrieves diagnostic logs from the manager or a mote specified by MAC address.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getLog named tuple.
-    # 
-    def dn_getLog(self, macAddress) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getLog'], {"macAddress" : macAddress})
-        return IpMgrConnectorSerial.Tuple_dn_getLog(**res)
-
-    ##
-    # The named tuple returned by the dn_sendData() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_sendData = collections.namedtuple("Tuple_dn_sendData", ['RC', 'callbackId'])
-
-    ##
-    # The sendData command sends a packet to a mote in the network. The response contains a callbackId. When the manager injects the packet into the network, it will generate a packetSent notification. It is the responsibility of the customer'sapplication layer at the mote to send a response. It is also the responsibility of thecustomer's application layer to timeout if no response is received at the manager if one is expected.
-    # 
-    # The sendData command should be used by applications that communicate directly with the manager. If end-to-end (application to mote) IP connectivity is required, the application should use the sendIP command. For a more comprehensive discussion of the distinction, see the SmartMesh IPNetwork User Guide.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # \param priority 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: Low
-    #      - 1: Medium
-    #      - 2: High
-    # \param srcPort 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param dstPort 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param options 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param data None-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_sendData named tuple.
-    # 
-    def dn_sendData(self, macAddress, priority, srcPort, dstPort, options, data) :
-        res = IpMgrConnectorSerialInternal.send(self, ['sendData'], {"macAddress" : macAddress, "priority" : priority, "srcPort" : srcPort, "dstPort" : dstPort, "options" : options, "data" : data})
-        return IpMgrConnectorSerial.Tuple_dn_sendData(**res)
-
-    ##
-    # The named tuple returned by the dn_startNetwork() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_startNetwork = collections.namedtuple("Tuple_dn_startNetwork", ['RC'])
-
-    ##
-    # The startNetwork command tells the manager to allow the network to start forming (begin accepting join requests from devices). The external application must issue the startNetwork command if the autoStartNetwork flag is not set (seesetNetworkConfig).
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_startNetwork named tuple.
-    # 
-    def dn_startNetwork(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['startNetwork'], {})
-        return IpMgrConnectorSerial.Tuple_dn_startNetwork(**res)
-
-    ##
-    # The named tuple returned by the dn_getSystemInfo() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>hwModel</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>hwRev</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>swMajor</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>swMinor</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>swPatch</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>swBuild</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getSystemInfo = collections.namedtuple("Tuple_dn_getSystemInfo", ['RC', 'macAddress', 'hwModel', 'hwRev', 'swMajor', 'swMinor', 'swPatch', 'swBuild'])
-
-    ##
-    # The getSystemInfo command returns system-level information about the hardware and software versions.
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getSystemInfo named tuple.
-    # 
-    def dn_getSystemInfo(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getSystemInfo'], {})
-        return IpMgrConnectorSerial.Tuple_dn_getSystemInfo(**res)
-
-    ##
-    # The named tuple returned by the dn_getMoteConfig() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>isAP</tt>: 1-byte field formatted as a bool.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>state</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: lost
-    #      - 1: negotiating
-    #      - 4: operational
-    # - <tt>reserved</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>isRouting</tt>: 1-byte field formatted as a bool.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getMoteConfig = collections.namedtuple("Tuple_dn_getMoteConfig", ['RC', 'macAddress', 'moteId', 'isAP', 'state', 'reserved', 'isRouting'])
-
-    ##
-    # The getMoteConfig command returns a single mote description as the response. The command takes two arguments, a MAC Address and a flag indicating whether the MAC Address refers to the requested mote or to the next mote in managers memory. This command may be used to iterate through all motes known by the manager by starting with the macAddress parameter set to 0 and next set to true, and then using the MAC Address of that response as the input to the next call.
-    # 
-    # The mote MAC address is used in all query commands, but space constraints require the neighbor health reports to use the Mote ID for identification. Therefore, both identifiers are present in the mote structure.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # \param next 1-byte field formatted as a bool.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getMoteConfig named tuple.
-    # 
-    def dn_getMoteConfig(self, macAddress, next) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getMoteConfig'], {"macAddress" : macAddress, "next" : next})
-        return IpMgrConnectorSerial.Tuple_dn_getMoteConfig(**res)
-
-    ##
-    # The named tuple returned by the dn_getPathInfo() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>source</tt>: 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>dest</tt>: 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>direction</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: none
-    #      - 1: unused
-    #      - 2: upstream
-    #      - 3: downstream
-    # - <tt>numLinks</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>quality</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>rssiSrcDest</tt>: 1-byte field formatted as a ints.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>rssiDestSrc</tt>: 1-byte field formatted as a ints.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getPathInfo = collections.namedtuple("Tuple_dn_getPathInfo", ['RC', 'source', 'dest', 'direction', 'numLinks', 'quality', 'rssiSrcDest', 'rssiDestSrc'])
-
-    ##
-    # The getPathInfo command returns parameters of requested path.
-    # 
-    # \param source 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # \param dest 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getPathInfo named tuple.
-    # 
-    def dn_getPathInfo(self, source, dest) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getPathInfo'], {"source" : source, "dest" : dest})
-        return IpMgrConnectorSerial.Tuple_dn_getPathInfo(**res)
-
-    ##
-    # The named tuple returned by the dn_getNextPathInfo() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>pathId</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>source</tt>: 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>dest</tt>: 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>direction</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: none
-    #      - 1: unused
-    #      - 2: upstream
-    #      - 3: downstream
-    # - <tt>numLinks</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>quality</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>rssiSrcDest</tt>: 1-byte field formatted as a ints.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>rssiDestSrc</tt>: 1-byte field formatted as a ints.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getNextPathInfo = collections.namedtuple("Tuple_dn_getNextPathInfo", ['RC', 'pathId', 'source', 'dest', 'direction', 'numLinks', 'quality', 'rssiSrcDest', 'rssiDestSrc'])
-
-    ##
-    # The getNextPathInfo command allows iteration across paths connected to a particular mote. The pathId parameter indicates the previous value in the iteration. Setting pathId to 0 returns the first path. A pathId can not be used as a unique identifier for a path. It is only valid when associated with a particular mote.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # \param filter 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: all
-    #      - 1: upstream
-    # \param pathId 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getNextPathInfo named tuple.
-    # 
-    def dn_getNextPathInfo(self, macAddress, filter, pathId) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getNextPathInfo'], {"macAddress" : macAddress, "filter" : filter, "pathId" : pathId})
-        return IpMgrConnectorSerial.Tuple_dn_getNextPathInfo(**res)
-
-    ##
-    # The named tuple returned by the dn_setAdvertising() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_setAdvertising = collections.namedtuple("Tuple_dn_setAdvertising", ['RC', 'callbackId'])
-
-    ##
-    # The setAdvertising command tells the manager to activate or deactivate advertising. The response is acallbackId. A commandFinished notification with thecallbackId is generated when the command propagation is complete.
-    # 
-    # \param activate 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: on
-    #      - 1: off
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_setAdvertising named tuple.
-    # 
-    def dn_setAdvertising(self, activate) :
-        res = IpMgrConnectorSerialInternal.send(self, ['setAdvertising'], {"activate" : activate})
-        return IpMgrConnectorSerial.Tuple_dn_setAdvertising(**res)
-
-    ##
-    # The named tuple returned by the dn_setDownstreamFrameMode() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_setDownstreamFrameMode = collections.namedtuple("Tuple_dn_setDownstreamFrameMode", ['RC', 'callbackId'])
-
-    ##
-    # The setDownstreamFrameMode command tells the manager to shorten or extend the downstream frame. The base slotframe length will be multiplied by the downFrameMultValfor "normal" speed. For "fast" speed the downstream slotframe is the base length.Once this command is executed, the manager switches to manual mode and no longer changes slotframesize automatically. The response is acallbackId. A commandFinished notification with the callbackId is generated when the command propagation is complete.
-    # 
-    # \param frameMode 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: normal
-    #      - 1: fast
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_setDownstreamFrameMode named tuple.
-    # 
-    def dn_setDownstreamFrameMode(self, frameMode) :
-        res = IpMgrConnectorSerialInternal.send(self, ['setDownstreamFrameMode'], {"frameMode" : frameMode})
-        return IpMgrConnectorSerial.Tuple_dn_setDownstreamFrameMode(**res)
-
-    ##
-    # The named tuple returned by the dn_getManagerStatistics() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>serTxCnt</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>serRxCnt</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>serRxCRCErr</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>serRxOverruns</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>apiEstabConn</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>apiDroppedConn</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>apiTxOk</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>apiTxErr</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>apiTxFail</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>apiRxOk</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>apiRxProtErr</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getManagerStatistics = collections.namedtuple("Tuple_dn_getManagerStatistics", ['RC', 'serTxCnt', 'serRxCnt', 'serRxCRCErr', 'serRxOverruns', 'apiEstabConn', 'apiDroppedConn', 'apiTxOk', 'apiTxErr', 'apiTxFail', 'apiRxOk', 'apiRxProtErr'])
-
-    ##
-    # The getManagerStatistics command returns dynamic information and statistics about the manager API. The statistics counts are cleared together with all current statistics using clearStatistics.
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getManagerStatistics named tuple.
-    # 
-    def dn_getManagerStatistics(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getManagerStatistics'], {})
-        return IpMgrConnectorSerial.Tuple_dn_getManagerStatistics(**res)
-
-    ##
-    # The named tuple returned by the dn_setTime() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_setTime = collections.namedtuple("Tuple_dn_setTime", ['RC'])
-
-    ##
-    # The setTime command sets the UTC time on the manager. This command may only be executed when the network is not running. If the trigger flag is false, the manager sets the specified time as soon as it receives the setTime command. When the manager receives a Time Pin trigger, it temporarily stores the current time. If a setTime request is received within a short period of time following the trigger, the manager calculates the delay since the trigger and adjust the time such that the trigger was received at the specified time value.
-    # 
-    # \param trigger 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param utcSecs 8-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param utcUsecs 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_setTime named tuple.
-    # 
-    def dn_setTime(self, trigger, utcSecs, utcUsecs) :
-        res = IpMgrConnectorSerialInternal.send(self, ['setTime'], {"trigger" : trigger, "utcSecs" : utcSecs, "utcUsecs" : utcUsecs})
-        return IpMgrConnectorSerial.Tuple_dn_setTime(**res)
-
-    ##
-    # The named tuple returned by the dn_getLicense() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>license</tt>: 13-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getLicense = collections.namedtuple("Tuple_dn_getLicense", ['RC', 'license'])
-
-    ##
-    # The getLicense command returns the current license key.
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getLicense named tuple.
-    # 
-    def dn_getLicense(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getLicense'], {})
-        return IpMgrConnectorSerial.Tuple_dn_getLicense(**res)
-
-    ##
-    # The named tuple returned by the dn_setLicense() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_setLicense = collections.namedtuple("Tuple_dn_setLicense", ['RC'])
-
-    ##
-    # The setLicense command validates and updates the software license key stored in flash. Features enabled or disabled by the license key change will take effect after the device is restarted.If the license parameter is set to all 0x0s, the manager restores the default license. This change is persistent.
-    # 
-    # \param license 13-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_setLicense named tuple.
-    # 
-    def dn_setLicense(self, license) :
-        res = IpMgrConnectorSerialInternal.send(self, ['setLicense'], {"license" : license})
-        return IpMgrConnectorSerial.Tuple_dn_setLicense(**res)
-
-    ##
-    # The named tuple returned by the dn_setCLIUser() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_setCLIUser = collections.namedtuple("Tuple_dn_setCLIUser", ['RC'])
-
-    ##
-    # The setUser command sets the password that must be used to log into the command line for a particular user role. The user roles are:
-    # 
-    # -Viewer - read-only access to non-sensitive information
-    # -User - read-write accessThis change is persistent.
-    # 
-    # \param role 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: viewer
-    #      - 1: user
-    # \param password 16-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_setCLIUser named tuple.
-    # 
-    def dn_setCLIUser(self, role, password) :
-        res = IpMgrConnectorSerialInternal.send(self, ['setCLIUser'], {"role" : role, "password" : password})
-        return IpMgrConnectorSerial.Tuple_dn_setCLIUser(**res)
-
-    ##
-    # The named tuple returned by the dn_sendIP() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_sendIP = collections.namedtuple("Tuple_dn_sendIP", ['RC', 'callbackId'])
-
-    ##
-    # The sendIP command sends a6LoWPANpacket to a mote in the network. The response contains a callbackId. When the manager injects the packet into the network, it will generate a packetSent notification with the calllbackId. The application is responsible for constructing a valid 6LoWPANpacket.The packet is sent to the mote best-effort, so the application should deal with responses and timeouts, if any.
-    # 
-    # The sendIP command should be used by applications that require end-to-end IP connectivity. For applications that do not require end-to-end IP connectivity, the sendData command provides a simpler interface without requiring the application to understand 6LoWPAN encapsulation. For a more comprehensive discussion of the distinction, see theSmartMesh IP Network User Guide.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # \param priority 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: Low
-    #      - 1: Medium
-    #      - 2: High
-    # \param options 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param encryptedOffset 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # \param data None-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_sendIP named tuple.
-    # 
-    def dn_sendIP(self, macAddress, priority, options, encryptedOffset, data) :
-        res = IpMgrConnectorSerialInternal.send(self, ['sendIP'], {"macAddress" : macAddress, "priority" : priority, "options" : options, "encryptedOffset" : encryptedOffset, "data" : data})
-        return IpMgrConnectorSerial.Tuple_dn_sendIP(**res)
-
-    ##
-    # The named tuple returned by the dn_restoreFactoryDefaults() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_restoreFactoryDefaults = collections.namedtuple("Tuple_dn_restoreFactoryDefaults", ['RC'])
-
-    ##
-    # The restoreFactoryDefaults command restores the default configuration and clears the ACL. This command does not affect the license.This change is persistent.
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_restoreFactoryDefaults named tuple.
-    # 
-    def dn_restoreFactoryDefaults(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['restoreFactoryDefaults'], {})
-        return IpMgrConnectorSerial.Tuple_dn_restoreFactoryDefaults(**res)
-
-    ##
-    # The named tuple returned by the dn_getMoteInfo() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>state</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: lost
-    #      - 1: negotiating
-    #      - 4: operational
-    # - <tt>numNbrs</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>numGoodNbrs</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>requestedBw</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>totalNeededBw</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>assignedBw</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>packetsReceived</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>packetsLost</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>avgLatency</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getMoteInfo = collections.namedtuple("Tuple_dn_getMoteInfo", ['RC', 'macAddress', 'state', 'numNbrs', 'numGoodNbrs', 'requestedBw', 'totalNeededBw', 'assignedBw', 'packetsReceived', 'packetsLost', 'avgLatency'])
-
-    ##
-    # The getMoteInfo command returns dynamic information for the specified mote.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getMoteInfo named tuple.
-    # 
-    def dn_getMoteInfo(self, macAddress) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getMoteInfo'], {"macAddress" : macAddress})
-        return IpMgrConnectorSerial.Tuple_dn_getMoteInfo(**res)
-
-    ##
-    # The named tuple returned by the dn_getNetworkConfig() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>networkId</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>apTxPower</tt>: 1-byte field formatted as a ints.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>frameProfile</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 1: Profile_01
-    # - <tt>maxMotes</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>baseBandwidth</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>downFrameMultVal</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>numParents</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>ccaMode</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: off
-    #      - 1: energy
-    #      - 2: carrier
-    #      - 3: both
-    # - <tt>channelList</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>autoStartNetwork</tt>: 1-byte field formatted as a bool.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>locMode</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>bbMode</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: off
-    #      - 1: upstream
-    #      - 2: bidirectional
-    # - <tt>bbSize</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>isRadioTest</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>bwMult</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>oneChannel</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getNetworkConfig = collections.namedtuple("Tuple_dn_getNetworkConfig", ['RC', 'networkId', 'apTxPower', 'frameProfile', 'maxMotes', 'baseBandwidth', 'downFrameMultVal', 'numParents', 'ccaMode', 'channelList', 'autoStartNetwork', 'locMode', 'bbMode', 'bbSize', 'isRadioTest', 'bwMult', 'oneChannel'])
-
-    ##
-    # The getNetworkConfig command returns general network configuration parameters, including the Network ID, bandwidth parameters and number of motes.
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getNetworkConfig named tuple.
-    # 
-    def dn_getNetworkConfig(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getNetworkConfig'], {})
-        return IpMgrConnectorSerial.Tuple_dn_getNetworkConfig(**res)
-
-    ##
-    # The named tuple returned by the dn_getNetworkInfo() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>numMotes</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>asnSize</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>advertisementState</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: on
-    #      - 1: off
-    # - <tt>downFrameState</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: normal
-    #      - 1: fast
-    # - <tt>netReliability</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>netPathStability</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>netLatency</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>netState</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: operational
-    #      - 1: radiotest
-    #      - 2: notStarted
-    #      - 3: errorStartup
-    #      - 4: errorConfig
-    #      - 5: errorLicense
-    # - <tt>ipv6Address</tt>: 16-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>numLostPackets</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>numArrivedPackets</tt>: 8-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>maxNumbHops</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getNetworkInfo = collections.namedtuple("Tuple_dn_getNetworkInfo", ['RC', 'numMotes', 'asnSize', 'advertisementState', 'downFrameState', 'netReliability', 'netPathStability', 'netLatency', 'netState', 'ipv6Address', 'numLostPackets', 'numArrivedPackets', 'maxNumbHops'])
-
-    ##
-    # The getNetworkInfo command returns dynamic network information and statistics.
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getNetworkInfo named tuple.
-    # 
-    def dn_getNetworkInfo(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getNetworkInfo'], {})
-        return IpMgrConnectorSerial.Tuple_dn_getNetworkInfo(**res)
-
-    ##
-    # The named tuple returned by the dn_getMoteConfigById() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>isAP</tt>: 1-byte field formatted as a bool.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>state</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: lost
-    #      - 1: negotiating
-    #      - 4: operational
-    # - <tt>reserved</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>isRouting</tt>: 1-byte field formatted as a bool.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getMoteConfigById = collections.namedtuple("Tuple_dn_getMoteConfigById", ['RC', 'macAddress', 'moteId', 'isAP', 'state', 'reserved', 'isRouting'])
-
-    ##
-    # The getMoteConfigById command returns a single mote description as the response. The command takes one argument, the short address of a mote (Mote ID). The command returns the same response structure as the getMoteConfig command.
-    # 
-    # \param moteId 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getMoteConfigById named tuple.
-    # 
-    def dn_getMoteConfigById(self, moteId) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getMoteConfigById'], {"moteId" : moteId})
-        return IpMgrConnectorSerial.Tuple_dn_getMoteConfigById(**res)
-
-    ##
-    # The named tuple returned by the dn_setCommonJoinKey() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_setCommonJoinKey = collections.namedtuple("Tuple_dn_setCommonJoinKey", ['RC'])
-
-    ##
-    # The setCommonJoinKey command will set a new value for the common join key. The common join key is used to decrypt join messages only if the ACL is empty.
-    # 
-    # \param key 16-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_setCommonJoinKey named tuple.
-    # 
-    def dn_setCommonJoinKey(self, key) :
-        res = IpMgrConnectorSerialInternal.send(self, ['setCommonJoinKey'], {"key" : key})
-        return IpMgrConnectorSerial.Tuple_dn_setCommonJoinKey(**res)
-
-    ##
-    # The named tuple returned by the dn_getIPConfig() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>ipv6Address</tt>: 16-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>mask</tt>: 16-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getIPConfig = collections.namedtuple("Tuple_dn_getIPConfig", ['RC', 'ipv6Address', 'mask'])
-
-    ##
-    # The getIPConfig command returns the manager's IP configuration parameters, including the IPv6 address and mask.
-    # 
-    # 
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getIPConfig named tuple.
-    # 
-    def dn_getIPConfig(self, ) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getIPConfig'], {})
-        return IpMgrConnectorSerial.Tuple_dn_getIPConfig(**res)
-
-    ##
-    # The named tuple returned by the dn_setIPConfig() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_setIPConfig = collections.namedtuple("Tuple_dn_setIPConfig", ['RC'])
-
-    ##
-    # The setIPConfig command sets the IPv6 prefix of the mesh network. Only the upper 8 bytes of the IPv6 address are relevant: the lower 8 bytes of the IPv6 address are ignored, and lower 8 bytes of the mask field are reserved and should be set to 0.This change is persistent.
-    # 
-    # \param ipv6Address 16-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # \param mask 16-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_setIPConfig named tuple.
-    # 
-    def dn_setIPConfig(self, ipv6Address, mask) :
-        res = IpMgrConnectorSerialInternal.send(self, ['setIPConfig'], {"ipv6Address" : ipv6Address, "mask" : mask})
-        return IpMgrConnectorSerial.Tuple_dn_setIPConfig(**res)
-
-    ##
-    # The named tuple returned by the dn_deleteMote() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # 
-    Tuple_dn_deleteMote = collections.namedtuple("Tuple_dn_deleteMote", ['RC'])
-
-    ##
-    # The deleteMote command deletes a mote from the manager's list. A mote can only be deleted if it in the Lost or Unknown states. This change is persistent.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_deleteMote named tuple.
-    # 
-    def dn_deleteMote(self, macAddress) :
-        res = IpMgrConnectorSerialInternal.send(self, ['deleteMote'], {"macAddress" : macAddress})
-        return IpMgrConnectorSerial.Tuple_dn_deleteMote(**res)
-
-    ##
-    # The named tuple returned by the dn_getMoteLinks() function.
-    # 
-    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: RC_OK
-    #      - 1: RC_INVALID_COMMAND
-    #      - 2: RC_INVALID_ARGUMENT
-    #      - 3: INVALID_AUTHENTICATION
-    #      - 4: INVALID_API_VERSION
-    #      - 5: COMMAND_TIMEOUT
-    #      - 11: RC_NOT_FOUND
-    #      - 12: RC_NO_RESOURCES
-    #      - 13: RC_IN_PROGRESS
-    #      - 14: RC_NACK
-    #      - 15: RC_WRITE_FAIL
-    #      - 16: RC_VALIDATION_ERROR
-    #      - 17: RC_INV_STATE
-    #      - 18: RC_END_OF_LIST
-    # - <tt>idx</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>utilization</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>numLinks</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>frameId_1</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>slot_1</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>channelOffset_1</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId_1</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>flags_1</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>frameId_2</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>slot_2</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>channelOffset_2</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId_2</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>flags_2</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>frameId_3</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>slot_3</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>channelOffset_3</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId_3</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>flags_3</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>frameId_4</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>slot_4</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>channelOffset_4</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId_4</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>flags_4</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>frameId_5</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>slot_5</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>channelOffset_5</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId_5</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>flags_5</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>frameId_6</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>slot_6</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>channelOffset_6</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId_6</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>flags_6</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>frameId_7</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>slot_7</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>channelOffset_7</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId_7</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>flags_7</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>frameId_8</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>slot_8</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>channelOffset_8</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId_8</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>flags_8</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>frameId_9</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>slot_9</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>channelOffset_9</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId_9</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>flags_9</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>frameId_10</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>slot_10</tt>: 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>channelOffset_10</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>moteId_10</tt>: 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # - <tt>flags_10</tt>: 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    Tuple_dn_getMoteLinks = collections.namedtuple("Tuple_dn_getMoteLinks", ['RC', 'idx', 'utilization', 'numLinks', 'frameId_1', 'slot_1', 'channelOffset_1', 'moteId_1', 'flags_1', 'frameId_2', 'slot_2', 'channelOffset_2', 'moteId_2', 'flags_2', 'frameId_3', 'slot_3', 'channelOffset_3', 'moteId_3', 'flags_3', 'frameId_4', 'slot_4', 'channelOffset_4', 'moteId_4', 'flags_4', 'frameId_5', 'slot_5', 'channelOffset_5', 'moteId_5', 'flags_5', 'frameId_6', 'slot_6', 'channelOffset_6', 'moteId_6', 'flags_6', 'frameId_7', 'slot_7', 'channelOffset_7', 'moteId_7', 'flags_7', 'frameId_8', 'slot_8', 'channelOffset_8', 'moteId_8', 'flags_8', 'frameId_9', 'slot_9', 'channelOffset_9', 'moteId_9', 'flags_9', 'frameId_10', 'slot_10', 'channelOffset_10', 'moteId_10', 'flags_10'])
-
-    ##
-    # ThegetMoteLinkscommand returns information about links assigned to the mote. The response contains a list of links starting with Nth link on the mote, where N is supplied as theidxparameter in the request. To retrieve all links on the device the user can call this command withidxthat increments by number of links returned with priorresponse, until the command returns RC_END_OF_LIST response code. Note that links assigned to a mote may change between API calls.
-    # 
-    # \param macAddress 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    # \param idx 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    # 
-    # \returns The response to the command, formatted as a #Tuple_dn_getMoteLinks named tuple.
-    # 
-    def dn_getMoteLinks(self, macAddress, idx) :
-        res = IpMgrConnectorSerialInternal.send(self, ['getMoteLinks'], {"macAddress" : macAddress, "idx" : idx})
-        return IpMgrConnectorSerial.Tuple_dn_getMoteLinks(**res)
-
-    #======================== notifications ===================================
-    
-    ##
-    # Dictionary of all notification tuples.
-    #
-    notifTupleTable = {}
-    
-    ##
-    # \brief MANAGER_HELLO notification.
-    # 
-    # Sent by the manager to a initiate new session with a client.
-    #
-    # Formatted as a Tuple_manager_hello named tuple. It contains the following fields:
-    #   - <tt>version</tt> 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>mode</tt> 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    MANAGER_HELLO = "manager_hello"
-    notifTupleTable[MANAGER_HELLO] = Tuple_manager_hello = collections.namedtuple("Tuple_manager_hello", ['version', 'mode'])
-
-    ##
-    # \brief EVENTMOTERESET notification.
-    # 
-    # This notification is sent when a user-initiated reset is executed by the manager.
-    #
-    # Formatted as a Tuple_eventMoteReset named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    EVENTMOTERESET = "eventMoteReset"
-    notifTupleTable[EVENTMOTERESET] = Tuple_eventMoteReset = collections.namedtuple("Tuple_eventMoteReset", ['eventId', 'macAddress'])
-
-    ##
-    # \brief EVENTNETWORKRESET notification.
-    # 
-    # This notification is sent when the manager starts the network. This event has no eventData fields.
-    #
-    # Formatted as a Tuple_eventNetworkReset named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    EVENTNETWORKRESET = "eventNetworkReset"
-    notifTupleTable[EVENTNETWORKRESET] = Tuple_eventNetworkReset = collections.namedtuple("Tuple_eventNetworkReset", ['eventId'])
-
-    ##
-    # \brief EVENTCOMMANDFINISHED notification.
-    # 
-    # The commandFinished notification is used when a reliable command response is received.
-    #
-    # Formatted as a Tuple_eventCommandFinished named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>callbackId</tt> 4-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>rc</tt> 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: OK
-    #      - 1: nack
-    #      - 2: commandTimeout    
-    # 
-    EVENTCOMMANDFINISHED = "eventCommandFinished"
-    notifTupleTable[EVENTCOMMANDFINISHED] = Tuple_eventCommandFinished = collections.namedtuple("Tuple_eventCommandFinished", ['eventId', 'callbackId', 'rc'])
-
-    ##
-    # \brief EVENTMOTEJOIN notification.
-    # 
-    # This notification is sent when a mote joins the network.
-    #
-    # Formatted as a Tuple_eventMoteJoin named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    EVENTMOTEJOIN = "eventMoteJoin"
-    notifTupleTable[EVENTMOTEJOIN] = Tuple_eventMoteJoin = collections.namedtuple("Tuple_eventMoteJoin", ['eventId', 'macAddress'])
-
-    ##
-    # \brief EVENTMOTEOPERATIONAL notification.
-    # 
-    # This notification is sent when a mote that joins the network becomes operational.
-    #
-    # Formatted as a Tuple_eventMoteOperational named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    EVENTMOTEOPERATIONAL = "eventMoteOperational"
-    notifTupleTable[EVENTMOTEOPERATIONAL] = Tuple_eventMoteOperational = collections.namedtuple("Tuple_eventMoteOperational", ['eventId', 'macAddress'])
-
-    ##
-    # \brief EVENTMOTELOST notification.
-    # 
-    # This notification is sent when a mote's state changes to Lost, which indicates that the mote is not responding to downstream messages.
-    #
-    # Formatted as a Tuple_eventMoteLost named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    EVENTMOTELOST = "eventMoteLost"
-    notifTupleTable[EVENTMOTELOST] = Tuple_eventMoteLost = collections.namedtuple("Tuple_eventMoteLost", ['eventId', 'macAddress'])
-
-    ##
-    # \brief EVENTNETWORKTIME notification.
-    # 
-    # The time notification is triggered by the client asserting the TIME pin or by calling the getTime command. This notification contains the time when the TIME pin was asserted (or the getTime command was processed) expressed as:
-    # 
-    # -ASNThe absolute slot number (the number of timeslots since "7/2/2002 8:00:00 PM PST"if UTC is set on manager, otherwise since Jan 1, 1970)
-    # 
-    # 
-    # -UptimeThe number of seconds since the device was booted
-    # -UnixtimeThe number of seconds and microseconds since Jan 1, 1970 in UTC
-    #
-    # Formatted as a Tuple_eventNetworkTime named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>uptime</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>utcSecs</tt> 8-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>utcUsecs</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>asn</tt> 5-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>asnOffset</tt> 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    EVENTNETWORKTIME = "eventNetworkTime"
-    notifTupleTable[EVENTNETWORKTIME] = Tuple_eventNetworkTime = collections.namedtuple("Tuple_eventNetworkTime", ['eventId', 'uptime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset'])
-
-    ##
-    # \brief EVENTPINGRESPONSE notification.
-    # 
-    # This notification is sent when a reply is received from a mote ping.
-    #
-    # Formatted as a Tuple_eventPingResponse named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>callbackId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>delay</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>voltage</tt> 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>temperature</tt> 1-byte field formatted as a ints.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    EVENTPINGRESPONSE = "eventPingResponse"
-    notifTupleTable[EVENTPINGRESPONSE] = Tuple_eventPingResponse = collections.namedtuple("Tuple_eventPingResponse", ['eventId', 'callbackId', 'macAddress', 'delay', 'voltage', 'temperature'])
-
-    ##
-    # \brief EVENTPATHCREATE notification.
-    # 
-    # This notification is sent when the manager creates a connection (path) between two motes.
-    #
-    # Formatted as a Tuple_eventPathCreate named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>source</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>dest</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>direction</tt> 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: none
-    #      - 1: unused
-    #      - 2: upstream
-    #      - 3: downstream    
-    # 
-    EVENTPATHCREATE = "eventPathCreate"
-    notifTupleTable[EVENTPATHCREATE] = Tuple_eventPathCreate = collections.namedtuple("Tuple_eventPathCreate", ['eventId', 'source', 'dest', 'direction'])
-
-    ##
-    # \brief EVENTPATHDELETE notification.
-    # 
-    # This notification is sent when the manager removes a connection (path) between two motes.
-    #
-    # Formatted as a Tuple_eventPathDelete named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>source</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>dest</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>direction</tt> 1-byte field formatted as a int.<br/>
-    #     This field can only take one of the following values:
-    #      - 0: none
-    #      - 1: unused
-    #      - 2: upstream
-    #      - 3: downstream    
-    # 
-    EVENTPATHDELETE = "eventPathDelete"
-    notifTupleTable[EVENTPATHDELETE] = Tuple_eventPathDelete = collections.namedtuple("Tuple_eventPathDelete", ['eventId', 'source', 'dest', 'direction'])
-
-    ##
-    # \brief EVENTPACKETSENT notification.
-    # 
-    # The packetSent notification is generated when client's packet is removed from manager's queue and sent into the wireless network.
-    #
-    # Formatted as a Tuple_eventPacketSent named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>callbackId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>rc</tt> 1-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    EVENTPACKETSENT = "eventPacketSent"
-    notifTupleTable[EVENTPACKETSENT] = Tuple_eventPacketSent = collections.namedtuple("Tuple_eventPacketSent", ['eventId', 'callbackId', 'rc'])
-
-    ##
-    # \brief EVENTMOTECREATE notification.
-    # 
-    # This event is sent when a mote joins the manager for the first time.
-    #
-    # Formatted as a Tuple_eventMoteCreate named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>moteId</tt> 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    EVENTMOTECREATE = "eventMoteCreate"
-    notifTupleTable[EVENTMOTECREATE] = Tuple_eventMoteCreate = collections.namedtuple("Tuple_eventMoteCreate", ['eventId', 'macAddress', 'moteId'])
-
-    ##
-    # \brief EVENTMOTEDELETE notification.
-    # 
-    # This notification is sent when a mote is deleted as a result of moteDelete command.
-    #
-    # Formatted as a Tuple_eventMoteDelete named tuple. It contains the following fields:
-    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>moteId</tt> 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    EVENTMOTEDELETE = "eventMoteDelete"
-    notifTupleTable[EVENTMOTEDELETE] = Tuple_eventMoteDelete = collections.namedtuple("Tuple_eventMoteDelete", ['eventId', 'macAddress', 'moteId'])
-
-    ##
-    # \brief NOTIFLOG notification.
-    # 
-    # A log notifications is generated in response to the getLog command. Each log notification contains a message from the mote's log.
-    #
-    # Formatted as a Tuple_notifLog named tuple. It contains the following fields:
-    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>logMsg</tt> None-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    NOTIFLOG = "notifLog"
-    notifTupleTable[NOTIFLOG] = Tuple_notifLog = collections.namedtuple("Tuple_notifLog", ['macAddress', 'logMsg'])
-
-    ##
-    # \brief NOTIFDATA notification.
-    # 
-    # The data notification contains a header and a variable length array of binary data. The length of the data is determined based on the length of the notification.
-    # 
-    # The manager forwards all packets received on its IP address and non-manager ports as data notifications.
-    #
-    # Formatted as a Tuple_notifData named tuple. It contains the following fields:
-    #   - <tt>utcSecs</tt> 8-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>utcUsecs</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>srcPort</tt> 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>dstPort</tt> 2-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>data</tt> None-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    NOTIFDATA = "notifData"
-    notifTupleTable[NOTIFDATA] = Tuple_notifData = collections.namedtuple("Tuple_notifData", ['utcSecs', 'utcUsecs', 'macAddress', 'srcPort', 'dstPort', 'data'])
-
-    ##
-    # \brief NOTIFIPDATA notification.
-    # 
-    # The ipData notification contains full IP packet sent by the mote, including 6Lowpan header, UDP header, and the UDP payload. Manager generates this notification when it receives packet from a mote with destination other than manager's own IP address. The size of thedata field can be calculated by subtracting the fixed header size (up to macAddress)from the size of overall notification packet.
-    #
-    # Formatted as a Tuple_notifIpData named tuple. It contains the following fields:
-    #   - <tt>utcSecs</tt> 8-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>utcUsecs</tt> 4-byte field formatted as a int.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>data</tt> None-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    NOTIFIPDATA = "notifIpData"
-    notifTupleTable[NOTIFIPDATA] = Tuple_notifIpData = collections.namedtuple("Tuple_notifIpData", ['utcSecs', 'utcUsecs', 'macAddress', 'data'])
-
-    ##
-    # \brief NOTIFHEALTHREPORT notification.
-    # 
-    # The healthReport notifications include the raw payload of health reports received from devices. The payload contains one or more specific health report messages. Each message contains an identifier, length and variable-sized data. The individual healthReport message structures are defined below.
-    #
-    # Formatted as a Tuple_notifHealthReport named tuple. It contains the following fields:
-    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.
-    #   - <tt>payload</tt> None-byte field formatted as a hex.<br/>
-    #     There is no restriction on the value of this field.    
-    # 
-    NOTIFHEALTHREPORT = "notifHealthReport"
-    notifTupleTable[NOTIFHEALTHREPORT] = Tuple_notifHealthReport = collections.namedtuple("Tuple_notifHealthReport", ['macAddress', 'payload'])
-
-    ##
-    # \brief Get a notification from the notification queue, and returns
-    #        it properly formatted.
-    #
-    # \exception NotificationError if unknown notification.
-    # 
-    def getNotification(self, timeoutSec=-1) :
-        temp = self.getNotificationInternal(timeoutSec)
-        if not temp:
-            return temp
-        (ids, param) = temp
-        try :
-            if  IpMgrConnectorSerial.notifTupleTable[ids[-1]] :
-                return (ids[-1], IpMgrConnectorSerial.notifTupleTable[ids[-1]](**param))
-            else :
-                return (ids[-1], None)
-        except KeyError :
-            raise ApiException.NotificationError(ids, param)
-
-##
-# end of IpMgrConnectorSerial
-# \}
-# 
+'''
+This module was generated automatically. Do not edit directly.
+'''
+
+import collections
+import struct
+from   SmartMeshSDK import FastPathUtils
+from   SmartMeshSDK import ApiException
+from   IpMgrConnectorSerialInternal import IpMgrConnectorSerialInternal
+
+##
+# \addtogroup IpMgrConnectorSerial
+# \{
+# 
+
+class IpMgrConnectorSerial(IpMgrConnectorSerialInternal):
+    '''
+    \brief Public class for IP manager connector, over Serial.
+    '''
+
+    #======================== commands ========================================
+
+    ##
+    # The named tuple returned by the dn_mux_hello() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>version</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_mux_hello = collections.namedtuple("Tuple_dn_mux_hello", ['RC', 'version'])
+
+    ##
+    # Sent by the manager to initiate a new session with a client.
+    # 
+    # \param version 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param secret 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_mux_hello named tuple.
+    # 
+    def dn_mux_hello(self, version, secret) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_mux_hello(version, secret)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['mux_hello'], {"version" : version, "secret" : secret})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['mux_hello'], 1, serializedFields, IpMgrConnectorSerial._parse_dn_mux_hello)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_mux_hello(**res)
+        return res
+
+    _Request_dn_mux_hello  = struct.Struct('>B8s')
+    _Response_dn_mux_hello = struct.Struct('>BB')
+
+    ##
+    # Serializes the request of dn_mux_hello() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_mux_hello(version, secret) :
+        secret = FastPathUtils.toBytes(secret, 8)
+        if (type(version) is not int or not 0 <= version <= 0xff or
+            secret is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_mux_hello.pack(version, secret)
+
+    ##
+    # Parses the response of dn_mux_hello() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_mux_hello named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_mux_hello(payload, hexType) :
+        if len(payload) < 2 :
+            return None
+        (RC, version) = IpMgrConnectorSerial._Response_dn_mux_hello.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_mux_hello(RC, version)
+
+    ##
+    # 
+    # 
+    # \param version 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param cliSeqNo 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param mode 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: legacy
+    # 
+    # \returns The response to the command.
+    # 
+    def dn_hello(self, version, cliSeqNo, mode) :
+        res = IpMgrConnectorSerialInternal.send(self, ['hello'], {"version" : version, "cliSeqNo" : cliSeqNo, "mode" : mode})
+        return res
+
+    ##
+    # The named tuple returned by the dn_hello_response() function.
+    # 
+    # - <tt>successCode</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: success
+    #      - 1: unsupported_version
+    #      - 2: invalid_mode
+    # - <tt>version</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>mgrSeqNo</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>cliSeqNo</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>mode</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: legacy
+    # 
+    Tuple_dn_hello_response = collections.namedtuple("Tuple_dn_hello_response", ['successCode', 'version', 'mgrSeqNo', 'cliSeqNo', 'mode'])
+
+    ##
+    # 
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_hello_response named tuple.
+    # 
+    def dn_hello_response(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_hello_response()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['hello_response'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['hello_response'], 2, serializedFields, IpMgrConnectorSerial._parse_dn_hello_response)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_hello_response(**res)
+        return res
+
+    _Request_dn_hello_response  = struct.Struct('>')
+    _Response_dn_hello_response = struct.Struct('>BBBBB')
+
+    ##
+    # Serializes the request of dn_hello_response() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_hello_response() :
+        return IpMgrConnectorSerial._Request_dn_hello_response.pack()
+
+    ##
+    # Parses the response of dn_hello_response() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_hello_response named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_hello_response(payload, hexType) :
+        if len(payload) < 5 :
+            return None
+        (successCode, version, mgrSeqNo, cliSeqNo, mode) = IpMgrConnectorSerial._Response_dn_hello_response.unpack_from(payload)
+        if (successCode not in (0, 1, 2) or
+            mode not in (0,)) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_hello_response(successCode, version, mgrSeqNo, cliSeqNo, mode)
+
+    ##
+    # The named tuple returned by the dn_reset() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_reset = collections.namedtuple("Tuple_dn_reset", ['RC', 'macAddress'])
+
+    ##
+    # The reset command is used to reset various objects. The command argument is an object type, and if the object is a mote the MAC address must be specified (otherwise that argument is ignored).
+    # 
+    # \param type 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: resetSystem
+    #      - 2: resetMote
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_reset named tuple.
+    # 
+    def dn_reset(self, type, macAddress) :
+        res = IpMgrConnectorSerialInternal.send(self, ['reset'], {"type" : type, "macAddress" : macAddress})
+        return IpMgrConnectorSerial.Tuple_dn_reset(**res)
+
+    ##
+    # The named tuple returned by the dn_subscribe() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_subscribe = collections.namedtuple("Tuple_dn_subscribe", ['RC'])
+
+    ##
+    # The subscribe command indicates that the manager should send the external application the specified notifications. It contains two filter fields:
+    # 
+    # -filter is a bitmask of flags indicating the types of notifications that the client wants to receive
+    # -unackFilter allows the client to select which of the notifications selected in filter should be sent acknowledged. If a notification is sent as 'acknowledged', thesubsequent notification packets will be queued while waiting for response.
+    # 
+    # Each subscription request overwrites the previous one. If an application is subscribed to data and then decides he also wants events he should send a subscribe command with both the data and event flags set. To clear all subscriptions, the client should send a subscribe command with the filter set to zero. When a session is initiated between the manager and a client, the subscription filter is initialized to zero.
+    # 
+    # The subscribe bitmap uses the values of the notification type enumeration. Some values are unused to provide backwards compatibility with earlier APIs.
+    # 
+    # \param filter 4-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # \param unackFilter 4-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_subscribe named tuple.
+    # 
+    def dn_subscribe(self, filter, unackFilter) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_subscribe(filter, unackFilter)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['subscribe'], {"filter" : filter, "unackFilter" : unackFilter})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['subscribe'], 22, serializedFields, IpMgrConnectorSerial._parse_dn_subscribe)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_subscribe(**res)
+        return res
+
+    _Request_dn_subscribe  = struct.Struct('>4s4s')
+    _Response_dn_subscribe = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_subscribe() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_subscribe(filter, unackFilter) :
+        filter = FastPathUtils.toBytes(filter, 4)
+        unackFilter = FastPathUtils.toBytes(unackFilter, 4)
+        if (filter is None or
+            unackFilter is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_subscribe.pack(filter, unackFilter)
+
+    ##
+    # Parses the response of dn_subscribe() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_subscribe named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_subscribe(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_subscribe.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_subscribe(RC)
+
+    ##
+    # The named tuple returned by the dn_getTime() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>uptime</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>utcSecs</tt>: 8-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>utcUsecs</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>asn</tt>: 5-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>asnOffset</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getTime = collections.namedtuple("Tuple_dn_getTime", ['RC', 'uptime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset'])
+
+    ##
+    # The getTime command returns the current manager UTC time and current absolute slot number (ASN). The time values returned by this command are delayed by queuing and transfer time over the serial connection. For additional precision, an external application should trigger the networkTime notification using the Time Pin.
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getTime named tuple.
+    # 
+    def dn_getTime(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getTime()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getTime'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getTime'], 23, serializedFields, IpMgrConnectorSerial._parse_dn_getTime)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getTime(**res)
+        return res
+
+    _Request_dn_getTime  = struct.Struct('>')
+    _Response_dn_getTime = struct.Struct('>BIQI5sH')
+
+    ##
+    # Serializes the request of dn_getTime() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getTime() :
+        return IpMgrConnectorSerial._Request_dn_getTime.pack()
+
+    ##
+    # Parses the response of dn_getTime() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getTime named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getTime(payload, hexType) :
+        if len(payload) < 24 :
+            return None
+        (RC, uptime, utcSecs, utcUsecs, asn, asnOffset) = IpMgrConnectorSerial._Response_dn_getTime.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getTime(RC, uptime, utcSecs, utcUsecs, hexType(bytearray(asn)), asnOffset)
+
+    ##
+    # The named tuple returned by the dn_setNetworkConfig() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_setNetworkConfig = collections.namedtuple("Tuple_dn_setNetworkConfig", ['RC'])
+
+    ##
+    # The setNetworkConfig command changes network configuration parameters. The response code indicates whether the changes were successfully applied.This change is persistent.
+    # 
+    # Generally, changes to network configuration will take effect when the manager reboots. Exceptions are detailed below:
+    # 
+    # 
+    # -Max Motes: The new maxMotes value is used as soon as new motes try to join the network, but motes are not removed from the network if the value is set to a number lower than numMotes.
+    # -Base Bandwidth: Changing baseBandwidth while the network is running does not reallocate bandwidth to Operational motes.
+    # 
+    # \param networkId 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param apTxPower 1-byte field formatted as a ints.<br/>
+    #     There is no restriction on the value of this field.
+    # \param frameProfile 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 1: Profile_01
+    # \param maxMotes 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param baseBandwidth 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param downFrameMultVal 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param numParents 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param ccaMode 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: off
+    #      - 1: energy
+    #      - 2: carrier
+    #      - 3: both
+    # \param channelList 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param autoStartNetwork 1-byte field formatted as a bool.<br/>
+    #     There is no restriction on the value of this field.
+    # \param locMode 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param bbMode 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: off
+    #      - 1: upstream
+    #      - 2: bidirectional
+    # \param bbSize 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param isRadioTest 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param bwMult 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param oneChannel 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_setNetworkConfig named tuple.
+    # 
+    def dn_setNetworkConfig(self, networkId, apTxPower, frameProfile, maxMotes, baseBandwidth, downFrameMultVal, numParents, ccaMode, channelList, autoStartNetwork, locMode, bbMode, bbSize, isRadioTest, bwMult, oneChannel) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_setNetworkConfig(networkId, apTxPower, frameProfile, maxMotes, baseBandwidth, downFrameMultVal, numParents, ccaMode, channelList, autoStartNetwork, locMode, bbMode, bbSize, isRadioTest, bwMult, oneChannel)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['setNetworkConfig'], {"networkId" : networkId, "apTxPower" : apTxPower, "frameProfile" : frameProfile, "maxMotes" : maxMotes, "baseBandwidth" : baseBandwidth, "downFrameMultVal" : downFrameMultVal, "numParents" : numParents, "ccaMode" : ccaMode, "channelList" : channelList, "autoStartNetwork" : autoStartNetwork, "locMode" : locMode, "bbMode" : bbMode, "bbSize" : bbSize, "isRadioTest" : isRadioTest, "bwMult" : bwMult, "oneChannel" : oneChannel})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['setNetworkConfig'], 26, serializedFields, IpMgrConnectorSerial._parse_dn_setNetworkConfig)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_setNetworkConfig(**res)
+        return res
+
+    _Request_dn_setNetworkConfig  = struct.Struct('>HbBHHBBBHBBBBBHB')
+    _Response_dn_setNetworkConfig = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_setNetworkConfig() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_setNetworkConfig(networkId, apTxPower, frameProfile, maxMotes, baseBandwidth, downFrameMultVal, numParents, ccaMode, channelList, autoStartNetwork, locMode, bbMode, bbSize, isRadioTest, bwMult, oneChannel) :
+        if (type(networkId) is not int or not 0 <= networkId <= 0xffff or
+            type(apTxPower) is not int or not -128 <= apTxPower <= 127 or
+            type(frameProfile) is not int or not 0 <= frameProfile <= 0xff or frameProfile not in (1,) or
+            type(maxMotes) is not int or not 0 <= maxMotes <= 0xffff or
+            type(baseBandwidth) is not int or not 0 <= baseBandwidth <= 0xffff or
+            type(downFrameMultVal) is not int or not 0 <= downFrameMultVal <= 0xff or
+            type(numParents) is not int or not 0 <= numParents <= 0xff or
+            type(ccaMode) is not int or not 0 <= ccaMode <= 0xff or ccaMode not in (0, 1, 2, 3) or
+            type(channelList) is not int or not 0 <= channelList <= 0xffff or
+            type(autoStartNetwork) is not bool or
+            type(locMode) is not int or not 0 <= locMode <= 0xff or
+            type(bbMode) is not int or not 0 <= bbMode <= 0xff or bbMode not in (0, 1, 2) or
+            type(bbSize) is not int or not 0 <= bbSize <= 0xff or
+            type(isRadioTest) is not int or not 0 <= isRadioTest <= 0xff or
+            type(bwMult) is not int or not 0 <= bwMult <= 0xffff or
+            type(oneChannel) is not int or not 0 <= oneChannel <= 0xff) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_setNetworkConfig.pack(networkId, apTxPower, frameProfile, maxMotes, baseBandwidth, downFrameMultVal, numParents, ccaMode, channelList, autoStartNetwork, locMode, bbMode, bbSize, isRadioTest, bwMult, oneChannel)
+
+    ##
+    # Parses the response of dn_setNetworkConfig() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_setNetworkConfig named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_setNetworkConfig(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_setNetworkConfig.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_setNetworkConfig(RC)
+
+    ##
+    # The named tuple returned by the dn_clearStatistics() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_clearStatistics = collections.namedtuple("Tuple_dn_clearStatistics", ['RC'])
+
+    ##
+    # The clearStatistics command clears the accumulated network statistics. The command does not clear path quality or mote statistics.
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_clearStatistics named tuple.
+    # 
+    def dn_clearStatistics(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_clearStatistics()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['clearStatistics'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['clearStatistics'], 31, serializedFields, IpMgrConnectorSerial._parse_dn_clearStatistics)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_clearStatistics(**res)
+        return res
+
+    _Request_dn_clearStatistics  = struct.Struct('>')
+    _Response_dn_clearStatistics = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_clearStatistics() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_clearStatistics() :
+        return IpMgrConnectorSerial._Request_dn_clearStatistics.pack()
+
+    ##
+    # Parses the response of dn_clearStatistics() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_clearStatistics named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_clearStatistics(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_clearStatistics.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_clearStatistics(RC)
+
+    ##
+    # The named tuple returned by the dn_exchangeMoteJoinKey() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_exchangeMoteJoinKey = collections.namedtuple("Tuple_dn_exchangeMoteJoinKey", ['RC', 'callbackId'])
+
+    ##
+    # The exchangeMoteJoinKey command triggers the manager to send a new join key to the specified mote and update the manager's ACL entry for the mote. The response contains a callbackId. A commandFinished event notification with this callbackId will be sent when the operation is complete. This change is persistent.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # \param key 16-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_exchangeMoteJoinKey named tuple.
+    # 
+    def dn_exchangeMoteJoinKey(self, macAddress, key) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_exchangeMoteJoinKey(macAddress, key)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['exchangeMoteJoinKey'], {"macAddress" : macAddress, "key" : key})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['exchangeMoteJoinKey'], 33, serializedFields, IpMgrConnectorSerial._parse_dn_exchangeMoteJoinKey)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_exchangeMoteJoinKey(**res)
+        return res
+
+    _Request_dn_exchangeMoteJoinKey  = struct.Struct('>8s16s')
+    _Response_dn_exchangeMoteJoinKey = struct.Struct('>BI')
+
+    ##
+    # Serializes the request of dn_exchangeMoteJoinKey() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_exchangeMoteJoinKey(macAddress, key) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        key = FastPathUtils.toBytes(key, 16)
+        if (macAddress is None or
+            key is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_exchangeMoteJoinKey.pack(macAddress, key)
+
+    ##
+    # Parses the response of dn_exchangeMoteJoinKey() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_exchangeMoteJoinKey named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_exchangeMoteJoinKey(payload, hexType) :
+        if len(payload) < 5 :
+            return None
+        (RC, callbackId) = IpMgrConnectorSerial._Response_dn_exchangeMoteJoinKey.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_exchangeMoteJoinKey(RC, callbackId)
+
+    ##
+    # The named tuple returned by the dn_exchangeNetworkId() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_exchangeNetworkId = collections.namedtuple("Tuple_dn_exchangeNetworkId", ['RC', 'callbackId'])
+
+    ##
+    # The exchangeNetworkId command triggers the manager to distribute a new network ID to all the motes in the network. AcallbackId is returned in the response. A commandFinished notification with this callbackId will be sent when the operation is complete.This change is persistent.
+    # 
+    # \param id 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_exchangeNetworkId named tuple.
+    # 
+    def dn_exchangeNetworkId(self, id) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_exchangeNetworkId(id)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['exchangeNetworkId'], {"id" : id})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['exchangeNetworkId'], 34, serializedFields, IpMgrConnectorSerial._parse_dn_exchangeNetworkId)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_exchangeNetworkId(**res)
+        return res
+
+    _Request_dn_exchangeNetworkId  = struct.Struct('>H')
+    _Response_dn_exchangeNetworkId = struct.Struct('>BI')
+
+    ##
+    # Serializes the request of dn_exchangeNetworkId() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_exchangeNetworkId(id) :
+        if (type(id) is not int or not 0 <= id <= 0xffff) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_exchangeNetworkId.pack(id)
+
+    ##
+    # Parses the response of dn_exchangeNetworkId() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_exchangeNetworkId named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_exchangeNetworkId(payload, hexType) :
+        if len(payload) < 5 :
+            return None
+        (RC, callbackId) = IpMgrConnectorSerial._Response_dn_exchangeNetworkId.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_exchangeNetworkId(RC, callbackId)
+
+    ##
+    # The named tuple returned by the dn_radiotestTx() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_radiotestTx = collections.namedtuple("Tuple_dn_radiotestTx", ['RC'])
+
+    ##
+    # The radiotestTx command allows the user to initiate a radio transmission test. It may only be executed if the manager has been booted up in radiotest mode (see setNetworkConfig command). Three types of transmission tests are supported:
+    # 
+    # -Packet transmission
+    # -Continuous modulation
+    # -Continuous wave (unmodulated signal)
+    # 
+    # In a packet transmission test, the device generates a repeatCnt number of packet sequences. Each sequence consists of up to 10 packets with configurable size and delays.Each packet starts with a PHY preamble (5 bytes), followed by a PHY length field (1 byte), followed by data payload of up to 125 bytes, and finally a 2-byte 802.15.4 CRC at the end. Byte 0 of the payload contains stationId of the sender. Bytes 1 and 2 contain the packet number (in big-endian format) that increments with every packet transmitted. Bytes 3..N contain a counter (from 0..N-2) that increments with every byte inside payload. Transmissions occur on the set of channels defined bychanMask, selected inpseudo-randomorder.
+    # 
+    # In a continuous modulation test, the device generates continuous pseudo-random modulated signal, centered at the specified channel. The test is stopped by resetting the device.
+    # 
+    # In a continuous wave test, the device generates an unmodulated tone, centered at the specified channel. The test tone is stopped by resetting the device.
+    # 
+    # 
+    # 
+    # Channel numbering is 0-15, corresponding to IEEE 2.4 GHz channels 11-26.
+    # 
+    # \param testType 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param chanMask 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param repeatCnt 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param txPower 1-byte field formatted as a ints.<br/>
+    #     There is no restriction on the value of this field.
+    # \param seqSize 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param pkLen_1 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param delay_1 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param pkLen_2 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param delay_2 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param pkLen_3 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param delay_3 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param pkLen_4 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param delay_4 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param pkLen_5 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param delay_5 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param pkLen_6 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param delay_6 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param pkLen_7 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param delay_7 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param pkLen_8 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param delay_8 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param pkLen_9 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param delay_9 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param pkLen_10 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param delay_10 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_radiotestTx named tuple.
+    # 
+    def dn_radiotestTx(self, testType, chanMask, repeatCnt, txPower, seqSize, pkLen_1, delay_1, pkLen_2, delay_2, pkLen_3, delay_3, pkLen_4, delay_4, pkLen_5, delay_5, pkLen_6, delay_6, pkLen_7, delay_7, pkLen_8, delay_8, pkLen_9, delay_9, pkLen_10, delay_10) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_radiotestTx(testType, chanMask, repeatCnt, txPower, seqSize, pkLen_1, delay_1, pkLen_2, delay_2, pkLen_3, delay_3, pkLen_4, delay_4, pkLen_5, delay_5, pkLen_6, delay_6, pkLen_7, delay_7, pkLen_8, delay_8, pkLen_9, delay_9, pkLen_10, delay_10)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['radiotestTx'], {"testType" : testType, "chanMask" : chanMask, "repeatCnt" : repeatCnt, "txPower" : txPower, "seqSize" : seqSize, "pkLen_1" : pkLen_1, "delay_1" : delay_1, "pkLen_2" : pkLen_2, "delay_2" : delay_2, "pkLen_3" : pkLen_3, "delay_3" : delay_3, "pkLen_4" : pkLen_4, "delay_4" : delay_4, "pkLen_5" : pkLen_5, "delay_5" : delay_5, "pkLen_6" : pkLen_6, "delay_6" : delay_6, "pkLen_7" : pkLen_7, "delay_7" : delay_7, "pkLen_8" : pkLen_8, "delay_8" : delay_8, "pkLen_9" : pkLen_9, "delay_9" : delay_9, "pkLen_10" : pkLen_10, "delay_10" : delay_10})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['radiotestTx'], 35, serializedFields, IpMgrConnectorSerial._parse_dn_radiotestTx)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_radiotestTx(**res)
+        return res
+
+    _Request_dn_radiotestTx  = struct.Struct('>BHHbBBHBHBHBHBHBHBHBHBHBH')
+    _Response_dn_radiotestTx = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_radiotestTx() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_radiotestTx(testType, chanMask, repeatCnt, txPower, seqSize, pkLen_1, delay_1, pkLen_2, delay_2, pkLen_3, delay_3, pkLen_4, delay_4, pkLen_5, delay_5, pkLen_6, delay_6, pkLen_7, delay_7, pkLen_8, delay_8, pkLen_9, delay_9, pkLen_10, delay_10) :
+        if (type(testType) is not int or not 0 <= testType <= 0xff or
+            type(chanMask) is not int or not 0 <= chanMask <= 0xffff or
+            type(repeatCnt) is not int or not 0 <= repeatCnt <= 0xffff or
+            type(txPower) is not int or not -128 <= txPower <= 127 or
+            type(seqSize) is not int or not 0 <= seqSize <= 0xff or
+            type(pkLen_1) is not int or not 0 <= pkLen_1 <= 0xff or
+            type(delay_1) is not int or not 0 <= delay_1 <= 0xffff or
+            type(pkLen_2) is not int or not 0 <= pkLen_2 <= 0xff or
+            type(delay_2) is not int or not 0 <= delay_2 <= 0xffff or
+            type(pkLen_3) is not int or not 0 <= pkLen_3 <= 0xff or
+            type(delay_3) is not int or not 0 <= delay_3 <= 0xffff or
+            type(pkLen_4) is not int or not 0 <= pkLen_4 <= 0xff or
+            type(delay_4) is not int or not 0 <= delay_4 <= 0xffff or
+            type(pkLen_5) is not int or not 0 <= pkLen_5 <= 0xff or
+            type(delay_5) is not int or not 0 <= delay_5 <= 0xffff or
+            type(pkLen_6) is not int or not 0 <= pkLen_6 <= 0xff or
+            type(delay_6) is not int or not 0 <= delay_6 <= 0xffff or
+            type(pkLen_7) is not int or not 0 <= pkLen_7 <= 0xff or
+            type(delay_7) is not int or not 0 <= delay_7 <= 0xffff or
+            type(pkLen_8) is not int or not 0 <= pkLen_8 <= 0xff or
+            type(delay_8) is not int or not 0 <= delay_8 <= 0xffff or
+            type(pkLen_9) is not int or not 0 <= pkLen_9 <= 0xff or
+            type(delay_9) is not int or not 0 <= delay_9 <= 0xffff or
+            type(pkLen_10) is not int or not 0 <= pkLen_10 <= 0xff or
+            type(delay_10) is not int or not 0 <= delay_10 <= 0xffff) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_radiotestTx.pack(testType, chanMask, repeatCnt, txPower, seqSize, pkLen_1, delay_1, pkLen_2, delay_2, pkLen_3, delay_3, pkLen_4, delay_4, pkLen_5, delay_5, pkLen_6, delay_6, pkLen_7, delay_7, pkLen_8, delay_8, pkLen_9, delay_9, pkLen_10, delay_10)
+
+    ##
+    # Parses the response of dn_radiotestTx() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_radiotestTx named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_radiotestTx(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_radiotestTx.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_radiotestTx(RC)
+
+    ##
+    # The named tuple returned by the dn_radiotestRx() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_radiotestRx = collections.namedtuple("Tuple_dn_radiotestRx", ['RC'])
+
+    ##
+    # The radiotestRx command clears all previously collected statistics and initiates radio reception on the specified channel. It may only be executed if the manager has been booted up in radiotest mode (see setNetworkConfig command).During the test, the device keeps statistics about the number of packets received (with and without error). Note that the station id specified in this command must match the transmitter's station id. This is necessary to isolate traffic if multiple tests are running in the same radio space.The test results may be retrieved using the getRadiotestStatistics command.
+    # 
+    # 
+    # 
+    # Channel numbering is 0-15, corresponding to IEEE 2.4 GHz channels 11-26.
+    # 
+    # \param mask 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param duration 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param stationId 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_radiotestRx named tuple.
+    # 
+    def dn_radiotestRx(self, mask, duration, stationId) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_radiotestRx(mask, duration, stationId)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['radiotestRx'], {"mask" : mask, "duration" : duration, "stationId" : stationId})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['radiotestRx'], 37, serializedFields, IpMgrConnectorSerial._parse_dn_radiotestRx)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_radiotestRx(**res)
+        return res
+
+    _Request_dn_radiotestRx  = struct.Struct('>HHB')
+    _Response_dn_radiotestRx = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_radiotestRx() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_radiotestRx(mask, duration, stationId) :
+        if (type(mask) is not int or not 0 <= mask <= 0xffff or
+            type(duration) is not int or not 0 <= duration <= 0xffff or
+            type(stationId) is not int or not 0 <= stationId <= 0xff) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_radiotestRx.pack(mask, duration, stationId)
+
+    ##
+    # Parses the response of dn_radiotestRx() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_radiotestRx named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_radiotestRx(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_radiotestRx.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_radiotestRx(RC)
+
+    ##
+    # The named tuple returned by the dn_getRadiotestStatistics() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>rxOk</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>rxFail</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getRadiotestStatistics = collections.namedtuple("Tuple_dn_getRadiotestStatistics", ['RC', 'rxOk', 'rxFail'])
+
+    ##
+    # This command retrieves statistics from a previously run radiotestRx command.It may only be executed if the manager has been booted up in radiotest mode (see setNetworkConfig command).
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getRadiotestStatistics named tuple.
+    # 
+    def dn_getRadiotestStatistics(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getRadiotestStatistics()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getRadiotestStatistics'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getRadiotestStatistics'], 38, serializedFields, IpMgrConnectorSerial._parse_dn_getRadiotestStatistics)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getRadiotestStatistics(**res)
+        return res
+
+    _Request_dn_getRadiotestStatistics  = struct.Struct('>')
+    _Response_dn_getRadiotestStatistics = struct.Struct('>BHH')
+
+    ##
+    # Serializes the request of dn_getRadiotestStatistics() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getRadiotestStatistics() :
+        return IpMgrConnectorSerial._Request_dn_getRadiotestStatistics.pack()
+
+    ##
+    # Parses the response of dn_getRadiotestStatistics() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getRadiotestStatistics named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getRadiotestStatistics(payload, hexType) :
+        if len(payload) < 5 :
+            return None
+        (RC, rxOk, rxFail) = IpMgrConnectorSerial._Response_dn_getRadiotestStatistics.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getRadiotestStatistics(RC, rxOk, rxFail)
+
+    ##
+    # The named tuple returned by the dn_setACLEntry() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_setACLEntry = collections.namedtuple("Tuple_dn_setACLEntry", ['RC'])
+
+    ##
+    # The setACLEntry command adds a new entry or updates an existing entry in the Access Control List (ACL).This change is persistent.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # \param joinKey 16-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_setACLEntry named tuple.
+    # 
+    def dn_setACLEntry(self, macAddress, joinKey) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_setACLEntry(macAddress, joinKey)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['setACLEntry'], {"macAddress" : macAddress, "joinKey" : joinKey})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['setACLEntry'], 39, serializedFields, IpMgrConnectorSerial._parse_dn_setACLEntry)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_setACLEntry(**res)
+        return res
+
+    _Request_dn_setACLEntry  = struct.Struct('>8s16s')
+    _Response_dn_setACLEntry = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_setACLEntry() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_setACLEntry(macAddress, joinKey) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        joinKey = FastPathUtils.toBytes(joinKey, 16)
+        if (macAddress is None or
+            joinKey is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_setACLEntry.pack(macAddress, joinKey)
+
+    ##
+    # Parses the response of dn_setACLEntry() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_setACLEntry named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_setACLEntry(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_setACLEntry.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_setACLEntry(RC)
+
+    ##
+    # The named tuple returned by the dn_getNextACLEntry() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>joinKey</tt>: 16-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getNextACLEntry = collections.namedtuple("Tuple_dn_getNextACLEntry", ['RC', 'macAddress', 'joinKey'])
+
+    ##
+    # The getNextACLEntry command returns information about next mote entry in the access control list (ACL). To begin a search (find the first mote in ACL), a zero MAC address (0000000000000000) should be sent.There is no mechanism for reading the ACL entry of a specific mote. This call is an iterator. If you call getNextACLEntry with mote A as the argument, your response is the ACL entry for mote B, where B is the next mote in the ACL.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getNextACLEntry named tuple.
+    # 
+    def dn_getNextACLEntry(self, macAddress) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getNextACLEntry(macAddress)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getNextACLEntry'], {"macAddress" : macAddress})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getNextACLEntry'], 40, serializedFields, IpMgrConnectorSerial._parse_dn_getNextACLEntry)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getNextACLEntry(**res)
+        return res
+
+    _Request_dn_getNextACLEntry  = struct.Struct('>8s')
+    _Response_dn_getNextACLEntry = struct.Struct('>B8s16s')
+
+    ##
+    # Serializes the request of dn_getNextACLEntry() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getNextACLEntry(macAddress) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        if (macAddress is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_getNextACLEntry.pack(macAddress)
+
+    ##
+    # Parses the response of dn_getNextACLEntry() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getNextACLEntry named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getNextACLEntry(payload, hexType) :
+        if len(payload) < 25 :
+            return None
+        (RC, macAddress, joinKey) = IpMgrConnectorSerial._Response_dn_getNextACLEntry.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getNextACLEntry(RC, hexType(bytearray(macAddress)), hexType(bytearray(joinKey)))
+
+    ##
+    # The named tuple returned by the dn_deleteACLEntry() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_deleteACLEntry = collections.namedtuple("Tuple_dn_deleteACLEntry", ['RC'])
+
+    ##
+    # The deleteACLEntry command deletes the specified mote from the access control list (ACL). If the macAddress parameter is set to all 0xFFs or all 0x00s, the entire ACL is cleared. This change is persistent.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_deleteACLEntry named tuple.
+    # 
+    def dn_deleteACLEntry(self, macAddress) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_deleteACLEntry(macAddress)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['deleteACLEntry'], {"macAddress" : macAddress})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['deleteACLEntry'], 41, serializedFields, IpMgrConnectorSerial._parse_dn_deleteACLEntry)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_deleteACLEntry(**res)
+        return res
+
+    _Request_dn_deleteACLEntry  = struct.Struct('>8s')
+    _Response_dn_deleteACLEntry = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_deleteACLEntry() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_deleteACLEntry(macAddress) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        if (macAddress is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_deleteACLEntry.pack(macAddress)
+
+    ##
+    # Parses the response of dn_deleteACLEntry() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_deleteACLEntry named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_deleteACLEntry(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_deleteACLEntry.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_deleteACLEntry(RC)
+
+    ##
+    # The named tuple returned by the dn_pingMote() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_pingMote = collections.namedtuple("Tuple_dn_pingMote", ['RC', 'callbackId'])
+
+    ##
+    # The pingMote command sends a ping (echo request) to the mote specified by MAC address. A unique callbackId is generated and returned with the response. When the response is received from the mote, the manager generates a pingResponse notification with the measured round trip delay and several other parameters. The request is sent using unacknowledged transport, so the mote is not guaranteed to receive the request.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_pingMote named tuple.
+    # 
+    def dn_pingMote(self, macAddress) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_pingMote(macAddress)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['pingMote'], {"macAddress" : macAddress})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['pingMote'], 42, serializedFields, IpMgrConnectorSerial._parse_dn_pingMote)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_pingMote(**res)
+        return res
+
+    _Request_dn_pingMote  = struct.Struct('>8s')
+    _Response_dn_pingMote = struct.Struct('>BI')
+
+    ##
+    # Serializes the request of dn_pingMote() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_pingMote(macAddress) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        if (macAddress is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_pingMote.pack(macAddress)
+
+    ##
+    # Parses the response of dn_pingMote() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_pingMote named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_pingMote(payload, hexType) :
+        if len(payload) < 5 :
+            return None
+        (RC, callbackId) = IpMgrConnectorSerial._Response_dn_pingMote.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_pingMote(RC, callbackId)
+
+    ##
+    # The named tuple returned by the dn_getLog() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_getLog = collections.namedtuple("Tuple_dn_getLog", ['RC'])
+
+    ##
+    # The getLog command retrieves diagnostic logs from the manager or a mote specified by MAC address.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getLog named tuple.
+    # 
+    def dn_getLog(self, macAddress) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getLog(macAddress)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getLog'], {"macAddress" : macAddress})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getLog'], 43, serializedFields, IpMgrConnectorSerial._parse_dn_getLog)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getLog(**res)
+        return res
+
+    _Request_dn_getLog  = struct.Struct('>8s')
+    _Response_dn_getLog = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_getLog() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getLog(macAddress) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        if (macAddress is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_getLog.pack(macAddress)
+
+    ##
+    # Parses the response of dn_getLog() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getLog named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getLog(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_getLog.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getLog(RC)
+
+    ##
+    # The named tuple returned by the dn_sendData() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_sendData = collections.namedtuple("Tuple_dn_sendData", ['RC', 'callbackId'])
+
+    ##
+    # The sendData command sends a packet to a mote in the network. The response contains a callbackId. When the manager injects the packet into the network, it will generate a packetSent notification. It is the responsibility of the customer'sapplication layer at the mote to send a response. It is also the responsibility of thecustomer's application layer to timeout if no response is received at the manager if one is expected.
+    # 
+    # The sendData command should be used by applications that communicate directly with the manager. If end-to-end (application to mote) IP connectivity is required, the application should use the sendIP command. For a more comprehensive discussion of the distinction, see the SmartMesh IPNetwork User Guide.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # \param priority 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: Low
+    #      - 1: Medium
+    #      - 2: High
+    # \param srcPort 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param dstPort 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param options 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param data None-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_sendData named tuple.
+    # 
+    def dn_sendData(self, macAddress, priority, srcPort, dstPort, options, data) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_sendData(macAddress, priority, srcPort, dstPort, options, data)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['sendData'], {"macAddress" : macAddress, "priority" : priority, "srcPort" : srcPort, "dstPort" : dstPort, "options" : options, "data" : data})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['sendData'], 44, serializedFields, IpMgrConnectorSerial._parse_dn_sendData)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_sendData(**res)
+        return res
+
+    _Request_dn_sendData  = struct.Struct('>8sBHHB')
+    _Response_dn_sendData = struct.Struct('>BI')
+
+    ##
+    # Serializes the request of dn_sendData() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_sendData(macAddress, priority, srcPort, dstPort, options, data) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        data = FastPathUtils.toBytes(data, None)
+        if (macAddress is None or
+            type(priority) is not int or not 0 <= priority <= 0xff or priority not in (0, 1, 2) or
+            type(srcPort) is not int or not 0 <= srcPort <= 0xffff or
+            type(dstPort) is not int or not 0 <= dstPort <= 0xffff or
+            type(options) is not int or not 0 <= options <= 0xff or
+            data is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_sendData.pack(macAddress, priority, srcPort, dstPort, options) + data
+
+    ##
+    # Parses the response of dn_sendData() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_sendData named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_sendData(payload, hexType) :
+        if len(payload) < 5 :
+            return None
+        (RC, callbackId) = IpMgrConnectorSerial._Response_dn_sendData.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_sendData(RC, callbackId)
+
+    ##
+    # The named tuple returned by the dn_startNetwork() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_startNetwork = collections.namedtuple("Tuple_dn_startNetwork", ['RC'])
+
+    ##
+    # The startNetwork command tells the manager to allow the network to start forming (begin accepting join requests from devices). The external application must issue the startNetwork command if the autoStartNetwork flag is not set (seesetNetworkConfig).
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_startNetwork named tuple.
+    # 
+    def dn_startNetwork(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_startNetwork()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['startNetwork'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['startNetwork'], 45, serializedFields, IpMgrConnectorSerial._parse_dn_startNetwork)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_startNetwork(**res)
+        return res
+
+    _Request_dn_startNetwork  = struct.Struct('>')
+    _Response_dn_startNetwork = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_startNetwork() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_startNetwork() :
+        return IpMgrConnectorSerial._Request_dn_startNetwork.pack()
+
+    ##
+    # Parses the response of dn_startNetwork() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_startNetwork named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_startNetwork(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_startNetwork.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_startNetwork(RC)
+
+    ##
+    # The named tuple returned by the dn_getSystemInfo() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>hwModel</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>hwRev</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>swMajor</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>swMinor</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>swPatch</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>swBuild</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getSystemInfo = collections.namedtuple("Tuple_dn_getSystemInfo", ['RC', 'macAddress', 'hwModel', 'hwRev', 'swMajor', 'swMinor', 'swPatch', 'swBuild'])
+
+    ##
+    # The getSystemInfo command returns system-level information about the hardware and software versions.
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getSystemInfo named tuple.
+    # 
+    def dn_getSystemInfo(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getSystemInfo()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getSystemInfo'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getSystemInfo'], 46, serializedFields, IpMgrConnectorSerial._parse_dn_getSystemInfo)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getSystemInfo(**res)
+        return res
+
+    _Request_dn_getSystemInfo  = struct.Struct('>')
+    _Response_dn_getSystemInfo = struct.Struct('>B8sBBBBBH')
+
+    ##
+    # Serializes the request of dn_getSystemInfo() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getSystemInfo() :
+        return IpMgrConnectorSerial._Request_dn_getSystemInfo.pack()
+
+    ##
+    # Parses the response of dn_getSystemInfo() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getSystemInfo named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getSystemInfo(payload, hexType) :
+        if len(payload) < 16 :
+            return None
+        (RC, macAddress, hwModel, hwRev, swMajor, swMinor, swPatch, swBuild) = IpMgrConnectorSerial._Response_dn_getSystemInfo.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getSystemInfo(RC, hexType(bytearray(macAddress)), hwModel, hwRev, swMajor, swMinor, swPatch, swBuild)
+
+    ##
+    # The named tuple returned by the dn_getMoteConfig() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>isAP</tt>: 1-byte field formatted as a bool.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>state</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: lost
+    #      - 1: negotiating
+    #      - 4: operational
+    # - <tt>reserved</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>isRouting</tt>: 1-byte field formatted as a bool.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getMoteConfig = collections.namedtuple("Tuple_dn_getMoteConfig", ['RC', 'macAddress', 'moteId', 'isAP', 'state', 'reserved', 'isRouting'])
+
+    ##
+    # The getMoteConfig command returns a single mote description as the response. The command takes two arguments, a MAC Address and a flag indicating whether the MAC Address refers to the requested mote or to the next mote in managers memory. This command may be used to iterate through all motes known by the manager by starting with the macAddress parameter set to 0 and next set to true, and then using the MAC Address of that response as the input to the next call.
+    # 
+    # The mote MAC address is used in all query commands, but space constraints require the neighbor health reports to use the Mote ID for identification. Therefore, both identifiers are present in the mote structure.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # \param next 1-byte field formatted as a bool.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getMoteConfig named tuple.
+    # 
+    def dn_getMoteConfig(self, macAddress, next) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getMoteConfig(macAddress, next)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getMoteConfig'], {"macAddress" : macAddress, "next" : next})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getMoteConfig'], 47, serializedFields, IpMgrConnectorSerial._parse_dn_getMoteConfig)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getMoteConfig(**res)
+        return res
+
+    _Request_dn_getMoteConfig  = struct.Struct('>8sB')
+    _Response_dn_getMoteConfig = struct.Struct('>B8sHBBBB')
+
+    ##
+    # Serializes the request of dn_getMoteConfig() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getMoteConfig(macAddress, next) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        if (macAddress is None or
+            type(next) is not bool) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_getMoteConfig.pack(macAddress, next)
+
+    ##
+    # Parses the response of dn_getMoteConfig() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getMoteConfig named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getMoteConfig(payload, hexType) :
+        if len(payload) < 15 :
+            return None
+        (RC, macAddress, moteId, isAP, state, reserved, isRouting) = IpMgrConnectorSerial._Response_dn_getMoteConfig.unpack_from(payload)
+        if (RC != 0 or
+            isAP > 1 or
+            state not in (0, 1, 4) or
+            isRouting > 1) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getMoteConfig(RC, hexType(bytearray(macAddress)), moteId, isAP == 1, state, reserved, isRouting == 1)
+
+    ##
+    # The named tuple returned by the dn_getPathInfo() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>source</tt>: 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>dest</tt>: 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>direction</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: none
+    #      - 1: unused
+    #      - 2: upstream
+    #      - 3: downstream
+    # - <tt>numLinks</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>quality</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>rssiSrcDest</tt>: 1-byte field formatted as a ints.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>rssiDestSrc</tt>: 1-byte field formatted as a ints.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getPathInfo = collections.namedtuple("Tuple_dn_getPathInfo", ['RC', 'source', 'dest', 'direction', 'numLinks', 'quality', 'rssiSrcDest', 'rssiDestSrc'])
+
+    ##
+    # The getPathInfo command returns parameters of requested path.
+    # 
+    # \param source 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # \param dest 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getPathInfo named tuple.
+    # 
+    def dn_getPathInfo(self, source, dest) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getPathInfo(source, dest)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getPathInfo'], {"source" : source, "dest" : dest})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getPathInfo'], 48, serializedFields, IpMgrConnectorSerial._parse_dn_getPathInfo)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getPathInfo(**res)
+        return res
+
+    _Request_dn_getPathInfo  = struct.Struct('>8s8s')
+    _Response_dn_getPathInfo = struct.Struct('>B8s8sBBBbb')
+
+    ##
+    # Serializes the request of dn_getPathInfo() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getPathInfo(source, dest) :
+        source = FastPathUtils.toBytes(source, 8)
+        dest = FastPathUtils.toBytes(dest, 8)
+        if (source is None or
+            dest is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_getPathInfo.pack(source, dest)
+
+    ##
+    # Parses the response of dn_getPathInfo() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getPathInfo named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getPathInfo(payload, hexType) :
+        if len(payload) < 22 :
+            return None
+        (RC, source, dest, direction, numLinks, quality, rssiSrcDest, rssiDestSrc) = IpMgrConnectorSerial._Response_dn_getPathInfo.unpack_from(payload)
+        if (RC != 0 or
+            direction not in (0, 1, 2, 3)) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getPathInfo(RC, hexType(bytearray(source)), hexType(bytearray(dest)), direction, numLinks, quality, rssiSrcDest, rssiDestSrc)
+
+    ##
+    # The named tuple returned by the dn_getNextPathInfo() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>pathId</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>source</tt>: 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>dest</tt>: 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>direction</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: none
+    #      - 1: unused
+    #      - 2: upstream
+    #      - 3: downstream
+    # - <tt>numLinks</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>quality</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>rssiSrcDest</tt>: 1-byte field formatted as a ints.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>rssiDestSrc</tt>: 1-byte field formatted as a ints.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getNextPathInfo = collections.namedtuple("Tuple_dn_getNextPathInfo", ['RC', 'pathId', 'source', 'dest', 'direction', 'numLinks', 'quality', 'rssiSrcDest', 'rssiDestSrc'])
+
+    ##
+    # The getNextPathInfo command allows iteration across paths connected to a particular mote. The pathId parameter indicates the previous value in the iteration. Setting pathId to 0 returns the first path. A pathId can not be used as a unique identifier for a path. It is only valid when associated with a particular mote.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # \param filter 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: all
+    #      - 1: upstream
+    # \param pathId 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getNextPathInfo named tuple.
+    # 
+    def dn_getNextPathInfo(self, macAddress, filter, pathId) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getNextPathInfo(macAddress, filter, pathId)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getNextPathInfo'], {"macAddress" : macAddress, "filter" : filter, "pathId" : pathId})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getNextPathInfo'], 49, serializedFields, IpMgrConnectorSerial._parse_dn_getNextPathInfo)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getNextPathInfo(**res)
+        return res
+
+    _Request_dn_getNextPathInfo  = struct.Struct('>8sBH')
+    _Response_dn_getNextPathInfo = struct.Struct('>BH8s8sBBBbb')
+
+    ##
+    # Serializes the request of dn_getNextPathInfo() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getNextPathInfo(macAddress, filter, pathId) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        if (macAddress is None or
+            type(filter) is not int or not 0 <= filter <= 0xff or filter not in (0, 1) or
+            type(pathId) is not int or not 0 <= pathId <= 0xffff) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_getNextPathInfo.pack(macAddress, filter, pathId)
+
+    ##
+    # Parses the response of dn_getNextPathInfo() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getNextPathInfo named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getNextPathInfo(payload, hexType) :
+        if len(payload) < 24 :
+            return None
+        (RC, pathId, source, dest, direction, numLinks, quality, rssiSrcDest, rssiDestSrc) = IpMgrConnectorSerial._Response_dn_getNextPathInfo.unpack_from(payload)
+        if (RC != 0 or
+            direction not in (0, 1, 2, 3)) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getNextPathInfo(RC, pathId, hexType(bytearray(source)), hexType(bytearray(dest)), direction, numLinks, quality, rssiSrcDest, rssiDestSrc)
+
+    ##
+    # The named tuple returned by the dn_setAdvertising() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_setAdvertising = collections.namedtuple("Tuple_dn_setAdvertising", ['RC', 'callbackId'])
+
+    ##
+    # The setAdvertising command tells the manager to activate or deactivate advertising. The response is acallbackId. A commandFinished notification with thecallbackId is generated when the command propagation is complete.
+    # 
+    # \param activate 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: on
+    #      - 1: off
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_setAdvertising named tuple.
+    # 
+    def dn_setAdvertising(self, activate) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_setAdvertising(activate)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['setAdvertising'], {"activate" : activate})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['setAdvertising'], 50, serializedFields, IpMgrConnectorSerial._parse_dn_setAdvertising)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_setAdvertising(**res)
+        return res
+
+    _Request_dn_setAdvertising  = struct.Struct('>B')
+    _Response_dn_setAdvertising = struct.Struct('>BI')
+
+    ##
+    # Serializes the request of dn_setAdvertising() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_setAdvertising(activate) :
+        if (type(activate) is not int or not 0 <= activate <= 0xff or activate not in (0, 1)) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_setAdvertising.pack(activate)
+
+    ##
+    # Parses the response of dn_setAdvertising() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_setAdvertising named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_setAdvertising(payload, hexType) :
+        if len(payload) < 5 :
+            return None
+        (RC, callbackId) = IpMgrConnectorSerial._Response_dn_setAdvertising.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_setAdvertising(RC, callbackId)
+
+    ##
+    # The named tuple returned by the dn_setDownstreamFrameMode() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_setDownstreamFrameMode = collections.namedtuple("Tuple_dn_setDownstreamFrameMode", ['RC', 'callbackId'])
+
+    ##
+    # The setDownstreamFrameMode command tells the manager to shorten or extend the downstream frame. The base slotframe length will be multiplied by the downFrameMultValfor "normal" speed. For "fast" speed the downstream slotframe is the base length.Once this command is executed, the manager switches to manual mode and no longer changes slotframesize automatically. The response is acallbackId. A commandFinished notification with the callbackId is generated when the command propagation is complete.
+    # 
+    # \param frameMode 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: normal
+    #      - 1: fast
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_setDownstreamFrameMode named tuple.
+    # 
+    def dn_setDownstreamFrameMode(self, frameMode) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_setDownstreamFrameMode(frameMode)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['setDownstreamFrameMode'], {"frameMode" : frameMode})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['setDownstreamFrameMode'], 51, serializedFields, IpMgrConnectorSerial._parse_dn_setDownstreamFrameMode)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_setDownstreamFrameMode(**res)
+        return res
+
+    _Request_dn_setDownstreamFrameMode  = struct.Struct('>B')
+    _Response_dn_setDownstreamFrameMode = struct.Struct('>BI')
+
+    ##
+    # Serializes the request of dn_setDownstreamFrameMode() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_setDownstreamFrameMode(frameMode) :
+        if (type(frameMode) is not int or not 0 <= frameMode <= 0xff or frameMode not in (0, 1)) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_setDownstreamFrameMode.pack(frameMode)
+
+    ##
+    # Parses the response of dn_setDownstreamFrameMode() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_setDownstreamFrameMode named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_setDownstreamFrameMode(payload, hexType) :
+        if len(payload) < 5 :
+            return None
+        (RC, callbackId) = IpMgrConnectorSerial._Response_dn_setDownstreamFrameMode.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_setDownstreamFrameMode(RC, callbackId)
+
+    ##
+    # The named tuple returned by the dn_getManagerStatistics() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>serTxCnt</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>serRxCnt</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>serRxCRCErr</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>serRxOverruns</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>apiEstabConn</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>apiDroppedConn</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>apiTxOk</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>apiTxErr</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>apiTxFail</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>apiRxOk</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>apiRxProtErr</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getManagerStatistics = collections.namedtuple("Tuple_dn_getManagerStatistics", ['RC', 'serTxCnt', 'serRxCnt', 'serRxCRCErr', 'serRxOverruns', 'apiEstabConn', 'apiDroppedConn', 'apiTxOk', 'apiTxErr', 'apiTxFail', 'apiRxOk', 'apiRxProtErr'])
+
+    ##
+    # The getManagerStatistics command returns dynamic information and statistics about the manager API. The statistics counts are cleared together with all current statistics using clearStatistics.
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getManagerStatistics named tuple.
+    # 
+    def dn_getManagerStatistics(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getManagerStatistics()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getManagerStatistics'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getManagerStatistics'], 53, serializedFields, IpMgrConnectorSerial._parse_dn_getManagerStatistics)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getManagerStatistics(**res)
+        return res
+
+    _Request_dn_getManagerStatistics  = struct.Struct('>')
+    _Response_dn_getManagerStatistics = struct.Struct('>BHHHHHHHHHHH')
+
+    ##
+    # Serializes the request of dn_getManagerStatistics() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getManagerStatistics() :
+        return IpMgrConnectorSerial._Request_dn_getManagerStatistics.pack()
+
+    ##
+    # Parses the response of dn_getManagerStatistics() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getManagerStatistics named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getManagerStatistics(payload, hexType) :
+        if len(payload) < 23 :
+            return None
+        (RC, serTxCnt, serRxCnt, serRxCRCErr, serRxOverruns, apiEstabConn, apiDroppedConn, apiTxOk, apiTxErr, apiTxFail, apiRxOk, apiRxProtErr) = IpMgrConnectorSerial._Response_dn_getManagerStatistics.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getManagerStatistics(RC, serTxCnt, serRxCnt, serRxCRCErr, serRxOverruns, apiEstabConn, apiDroppedConn, apiTxOk, apiTxErr, apiTxFail, apiRxOk, apiRxProtErr)
+
+    ##
+    # The named tuple returned by the dn_setTime() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_setTime = collections.namedtuple("Tuple_dn_setTime", ['RC'])
+
+    ##
+    # The setTime command sets the UTC time on the manager. This command may only be executed when the network is not running. If the trigger flag is false, the manager sets the specified time as soon as it receives the setTime command. When the manager receives a Time Pin trigger, it temporarily stores the current time. If a setTime request is received within a short period of time following the trigger, the manager calculates the delay since the trigger and adjust the time such that the trigger was received at the specified time value.
+    # 
+    # \param trigger 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param utcSecs 8-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param utcUsecs 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_setTime named tuple.
+    # 
+    def dn_setTime(self, trigger, utcSecs, utcUsecs) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_setTime(trigger, utcSecs, utcUsecs)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['setTime'], {"trigger" : trigger, "utcSecs" : utcSecs, "utcUsecs" : utcUsecs})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['setTime'], 54, serializedFields, IpMgrConnectorSerial._parse_dn_setTime)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_setTime(**res)
+        return res
+
+    _Request_dn_setTime  = struct.Struct('>BQI')
+    _Response_dn_setTime = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_setTime() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_setTime(trigger, utcSecs, utcUsecs) :
+        if (type(trigger) is not int or not 0 <= trigger <= 0xff or
+            type(utcSecs) is not int or not 0 <= utcSecs <= 0xffffffffffffffff or
+            type(utcUsecs) is not int or not 0 <= utcUsecs <= 0xffffffff) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_setTime.pack(trigger, utcSecs, utcUsecs)
+
+    ##
+    # Parses the response of dn_setTime() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_setTime named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_setTime(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_setTime.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_setTime(RC)
+
+    ##
+    # The named tuple returned by the dn_getLicense() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>license</tt>: 13-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getLicense = collections.namedtuple("Tuple_dn_getLicense", ['RC', 'license'])
+
+    ##
+    # The getLicense command returns the current license key.
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getLicense named tuple.
+    # 
+    def dn_getLicense(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getLicense()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getLicense'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getLicense'], 55, serializedFields, IpMgrConnectorSerial._parse_dn_getLicense)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getLicense(**res)
+        return res
+
+    _Request_dn_getLicense  = struct.Struct('>')
+    _Response_dn_getLicense = struct.Struct('>B13s')
+
+    ##
+    # Serializes the request of dn_getLicense() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getLicense() :
+        return IpMgrConnectorSerial._Request_dn_getLicense.pack()
+
+    ##
+    # Parses the response of dn_getLicense() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getLicense named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getLicense(payload, hexType) :
+        if len(payload) < 14 :
+            return None
+        (RC, license) = IpMgrConnectorSerial._Response_dn_getLicense.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getLicense(RC, hexType(bytearray(license)))
+
+    ##
+    # The named tuple returned by the dn_setLicense() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_setLicense = collections.namedtuple("Tuple_dn_setLicense", ['RC'])
+
+    ##
+    # The setLicense command validates and updates the software license key stored in flash. Features enabled or disabled by the license key change will take effect after the device is restarted.If the license parameter is set to all 0x0s, the manager restores the default license. This change is persistent.
+    # 
+    # \param license 13-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_setLicense named tuple.
+    # 
+    def dn_setLicense(self, license) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_setLicense(license)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['setLicense'], {"license" : license})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['setLicense'], 56, serializedFields, IpMgrConnectorSerial._parse_dn_setLicense)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_setLicense(**res)
+        return res
+
+    _Request_dn_setLicense  = struct.Struct('>13s')
+    _Response_dn_setLicense = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_setLicense() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_setLicense(license) :
+        license = FastPathUtils.toBytes(license, 13)
+        if (license is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_setLicense.pack(license)
+
+    ##
+    # Parses the response of dn_setLicense() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_setLicense named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_setLicense(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_setLicense.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_setLicense(RC)
+
+    ##
+    # The named tuple returned by the dn_setCLIUser() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_setCLIUser = collections.namedtuple("Tuple_dn_setCLIUser", ['RC'])
+
+    ##
+    # The setUser command sets the password that must be used to log into the command line for a particular user role. The user roles are:
+    # 
+    # -Viewer - read-only access to non-sensitive information
+    # -User - read-write accessThis change is persistent.
+    # 
+    # \param role 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: viewer
+    #      - 1: user
+    # \param password 16-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_setCLIUser named tuple.
+    # 
+    def dn_setCLIUser(self, role, password) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_setCLIUser(role, password)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['setCLIUser'], {"role" : role, "password" : password})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['setCLIUser'], 58, serializedFields, IpMgrConnectorSerial._parse_dn_setCLIUser)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_setCLIUser(**res)
+        return res
+
+    _Request_dn_setCLIUser  = struct.Struct('>B16s')
+    _Response_dn_setCLIUser = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_setCLIUser() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_setCLIUser(role, password) :
+        password = FastPathUtils.toBytes(password, 16)
+        if (type(role) is not int or not 0 <= role <= 0xff or role not in (0, 1) or
+            password is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_setCLIUser.pack(role, password)
+
+    ##
+    # Parses the response of dn_setCLIUser() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_setCLIUser named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_setCLIUser(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_setCLIUser.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_setCLIUser(RC)
+
+    ##
+    # The named tuple returned by the dn_sendIP() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_sendIP = collections.namedtuple("Tuple_dn_sendIP", ['RC', 'callbackId'])
+
+    ##
+    # The sendIP command sends a6LoWPANpacket to a mote in the network. The response contains a callbackId. When the manager injects the packet into the network, it will generate a packetSent notification with the calllbackId. The application is responsible for constructing a valid 6LoWPANpacket.The packet is sent to the mote best-effort, so the application should deal with responses and timeouts, if any.
+    # 
+    # The sendIP command should be used by applications that require end-to-end IP connectivity. For applications that do not require end-to-end IP connectivity, the sendData command provides a simpler interface without requiring the application to understand 6LoWPAN encapsulation. For a more comprehensive discussion of the distinction, see theSmartMesh IP Network User Guide.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # \param priority 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: Low
+    #      - 1: Medium
+    #      - 2: High
+    # \param options 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param encryptedOffset 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # \param data None-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_sendIP named tuple.
+    # 
+    def dn_sendIP(self, macAddress, priority, options, encryptedOffset, data) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_sendIP(macAddress, priority, options, encryptedOffset, data)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['sendIP'], {"macAddress" : macAddress, "priority" : priority, "options" : options, "encryptedOffset" : encryptedOffset, "data" : data})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['sendIP'], 59, serializedFields, IpMgrConnectorSerial._parse_dn_sendIP)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_sendIP(**res)
+        return res
+
+    _Request_dn_sendIP  = struct.Struct('>8sBBB')
+    _Response_dn_sendIP = struct.Struct('>BI')
+
+    ##
+    # Serializes the request of dn_sendIP() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_sendIP(macAddress, priority, options, encryptedOffset, data) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        data = FastPathUtils.toBytes(data, None)
+        if (macAddress is None or
+            type(priority) is not int or not 0 <= priority <= 0xff or priority not in (0, 1, 2) or
+            type(options) is not int or not 0 <= options <= 0xff or
+            type(encryptedOffset) is not int or not 0 <= encryptedOffset <= 0xff or
+            data is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_sendIP.pack(macAddress, priority, options, encryptedOffset) + data
+
+    ##
+    # Parses the response of dn_sendIP() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_sendIP named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_sendIP(payload, hexType) :
+        if len(payload) < 5 :
+            return None
+        (RC, callbackId) = IpMgrConnectorSerial._Response_dn_sendIP.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_sendIP(RC, callbackId)
+
+    ##
+    # The named tuple returned by the dn_restoreFactoryDefaults() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_restoreFactoryDefaults = collections.namedtuple("Tuple_dn_restoreFactoryDefaults", ['RC'])
+
+    ##
+    # The restoreFactoryDefaults command restores the default configuration and clears the ACL. This command does not affect the license.This change is persistent.
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_restoreFactoryDefaults named tuple.
+    # 
+    def dn_restoreFactoryDefaults(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_restoreFactoryDefaults()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['restoreFactoryDefaults'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['restoreFactoryDefaults'], 61, serializedFields, IpMgrConnectorSerial._parse_dn_restoreFactoryDefaults)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_restoreFactoryDefaults(**res)
+        return res
+
+    _Request_dn_restoreFactoryDefaults  = struct.Struct('>')
+    _Response_dn_restoreFactoryDefaults = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_restoreFactoryDefaults() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_restoreFactoryDefaults() :
+        return IpMgrConnectorSerial._Request_dn_restoreFactoryDefaults.pack()
+
+    ##
+    # Parses the response of dn_restoreFactoryDefaults() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_restoreFactoryDefaults named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_restoreFactoryDefaults(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_restoreFactoryDefaults.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_restoreFactoryDefaults(RC)
+
+    ##
+    # The named tuple returned by the dn_getMoteInfo() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>state</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: lost
+    #      - 1: negotiating
+    #      - 4: operational
+    # - <tt>numNbrs</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>numGoodNbrs</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>requestedBw</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>totalNeededBw</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>assignedBw</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>packetsReceived</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>packetsLost</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>avgLatency</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getMoteInfo = collections.namedtuple("Tuple_dn_getMoteInfo", ['RC', 'macAddress', 'state', 'numNbrs', 'numGoodNbrs', 'requestedBw', 'totalNeededBw', 'assignedBw', 'packetsReceived', 'packetsLost', 'avgLatency'])
+
+    ##
+    # The getMoteInfo command returns dynamic information for the specified mote.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getMoteInfo named tuple.
+    # 
+    def dn_getMoteInfo(self, macAddress) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getMoteInfo(macAddress)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getMoteInfo'], {"macAddress" : macAddress})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getMoteInfo'], 62, serializedFields, IpMgrConnectorSerial._parse_dn_getMoteInfo)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getMoteInfo(**res)
+        return res
+
+    _Request_dn_getMoteInfo  = struct.Struct('>8s')
+    _Response_dn_getMoteInfo = struct.Struct('>B8sBBBIIIIII')
+
+    ##
+    # Serializes the request of dn_getMoteInfo() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getMoteInfo(macAddress) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        if (macAddress is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_getMoteInfo.pack(macAddress)
+
+    ##
+    # Parses the response of dn_getMoteInfo() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getMoteInfo named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getMoteInfo(payload, hexType) :
+        if len(payload) < 36 :
+            return None
+        (RC, macAddress, state, numNbrs, numGoodNbrs, requestedBw, totalNeededBw, assignedBw, packetsReceived, packetsLost, avgLatency) = IpMgrConnectorSerial._Response_dn_getMoteInfo.unpack_from(payload)
+        if (RC != 0 or
+            state not in (0, 1, 4)) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getMoteInfo(RC, hexType(bytearray(macAddress)), state, numNbrs, numGoodNbrs, requestedBw, totalNeededBw, assignedBw, packetsReceived, packetsLost, avgLatency)
+
+    ##
+    # The named tuple returned by the dn_getNetworkConfig() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>networkId</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>apTxPower</tt>: 1-byte field formatted as a ints.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>frameProfile</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 1: Profile_01
+    # - <tt>maxMotes</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>baseBandwidth</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>downFrameMultVal</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>numParents</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>ccaMode</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: off
+    #      - 1: energy
+    #      - 2: carrier
+    #      - 3: both
+    # - <tt>channelList</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>autoStartNetwork</tt>: 1-byte field formatted as a bool.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>locMode</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>bbMode</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: off
+    #      - 1: upstream
+    #      - 2: bidirectional
+    # - <tt>bbSize</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>isRadioTest</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>bwMult</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>oneChannel</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getNetworkConfig = collections.namedtuple("Tuple_dn_getNetworkConfig", ['RC', 'networkId', 'apTxPower', 'frameProfile', 'maxMotes', 'baseBandwidth', 'downFrameMultVal', 'numParents', 'ccaMode', 'channelList', 'autoStartNetwork', 'locMode', 'bbMode', 'bbSize', 'isRadioTest', 'bwMult', 'oneChannel'])
+
+    ##
+    # The getNetworkConfig command returns general network configuration parameters, including the Network ID, bandwidth parameters and number of motes.
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getNetworkConfig named tuple.
+    # 
+    def dn_getNetworkConfig(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getNetworkConfig()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getNetworkConfig'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getNetworkConfig'], 63, serializedFields, IpMgrConnectorSerial._parse_dn_getNetworkConfig)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getNetworkConfig(**res)
+        return res
+
+    _Request_dn_getNetworkConfig  = struct.Struct('>')
+    _Response_dn_getNetworkConfig = struct.Struct('>BHbBHHBBBHBBBBBHB')
+
+    ##
+    # Serializes the request of dn_getNetworkConfig() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getNetworkConfig() :
+        return IpMgrConnectorSerial._Request_dn_getNetworkConfig.pack()
+
+    ##
+    # Parses the response of dn_getNetworkConfig() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getNetworkConfig named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getNetworkConfig(payload, hexType) :
+        if len(payload) < 22 :
+            return None
+        (RC, networkId, apTxPower, frameProfile, maxMotes, baseBandwidth, downFrameMultVal, numParents, ccaMode, channelList, autoStartNetwork, locMode, bbMode, bbSize, isRadioTest, bwMult, oneChannel) = IpMgrConnectorSerial._Response_dn_getNetworkConfig.unpack_from(payload)
+        if (RC != 0 or
+            frameProfile not in (1,) or
+            ccaMode not in (0, 1, 2, 3) or
+            autoStartNetwork > 1 or
+            bbMode not in (0, 1, 2)) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getNetworkConfig(RC, networkId, apTxPower, frameProfile, maxMotes, baseBandwidth, downFrameMultVal, numParents, ccaMode, channelList, autoStartNetwork == 1, locMode, bbMode, bbSize, isRadioTest, bwMult, oneChannel)
+
+    ##
+    # The named tuple returned by the dn_getNetworkInfo() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>numMotes</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>asnSize</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>advertisementState</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: on
+    #      - 1: off
+    # - <tt>downFrameState</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: normal
+    #      - 1: fast
+    # - <tt>netReliability</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>netPathStability</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>netLatency</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>netState</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: operational
+    #      - 1: radiotest
+    #      - 2: notStarted
+    #      - 3: errorStartup
+    #      - 4: errorConfig
+    #      - 5: errorLicense
+    # - <tt>ipv6Address</tt>: 16-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>numLostPackets</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>numArrivedPackets</tt>: 8-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>maxNumbHops</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getNetworkInfo = collections.namedtuple("Tuple_dn_getNetworkInfo", ['RC', 'numMotes', 'asnSize', 'advertisementState', 'downFrameState', 'netReliability', 'netPathStability', 'netLatency', 'netState', 'ipv6Address', 'numLostPackets', 'numArrivedPackets', 'maxNumbHops'])
+
+    ##
+    # The getNetworkInfo command returns dynamic network information and statistics.
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getNetworkInfo named tuple.
+    # 
+    def dn_getNetworkInfo(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getNetworkInfo()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getNetworkInfo'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getNetworkInfo'], 64, serializedFields, IpMgrConnectorSerial._parse_dn_getNetworkInfo)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getNetworkInfo(**res)
+        return res
+
+    _Request_dn_getNetworkInfo  = struct.Struct('>')
+    _Response_dn_getNetworkInfo = struct.Struct('>BHHBBBBIB16sIQB')
+
+    ##
+    # Serializes the request of dn_getNetworkInfo() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getNetworkInfo() :
+        return IpMgrConnectorSerial._Request_dn_getNetworkInfo.pack()
+
+    ##
+    # Parses the response of dn_getNetworkInfo() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getNetworkInfo named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getNetworkInfo(payload, hexType) :
+        if len(payload) < 43 :
+            return None
+        (RC, numMotes, asnSize, advertisementState, downFrameState, netReliability, netPathStability, netLatency, netState, ipv6Address, numLostPackets, numArrivedPackets, maxNumbHops) = IpMgrConnectorSerial._Response_dn_getNetworkInfo.unpack_from(payload)
+        if (RC != 0 or
+            advertisementState not in (0, 1) or
+            downFrameState not in (0, 1) or
+            netState not in (0, 1, 2, 3, 4, 5)) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getNetworkInfo(RC, numMotes, asnSize, advertisementState, downFrameState, netReliability, netPathStability, netLatency, netState, hexType(bytearray(ipv6Address)), numLostPackets, numArrivedPackets, maxNumbHops)
+
+    ##
+    # The named tuple returned by the dn_getMoteConfigById() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>isAP</tt>: 1-byte field formatted as a bool.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>state</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: lost
+    #      - 1: negotiating
+    #      - 4: operational
+    # - <tt>reserved</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>isRouting</tt>: 1-byte field formatted as a bool.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getMoteConfigById = collections.namedtuple("Tuple_dn_getMoteConfigById", ['RC', 'macAddress', 'moteId', 'isAP', 'state', 'reserved', 'isRouting'])
+
+    ##
+    # The getMoteConfigById command returns a single mote description as the response. The command takes one argument, the short address of a mote (Mote ID). The command returns the same response structure as the getMoteConfig command.
+    # 
+    # \param moteId 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getMoteConfigById named tuple.
+    # 
+    def dn_getMoteConfigById(self, moteId) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getMoteConfigById(moteId)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getMoteConfigById'], {"moteId" : moteId})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getMoteConfigById'], 65, serializedFields, IpMgrConnectorSerial._parse_dn_getMoteConfigById)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getMoteConfigById(**res)
+        return res
+
+    _Request_dn_getMoteConfigById  = struct.Struct('>H')
+    _Response_dn_getMoteConfigById = struct.Struct('>B8sHBBBB')
+
+    ##
+    # Serializes the request of dn_getMoteConfigById() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getMoteConfigById(moteId) :
+        if (type(moteId) is not int or not 0 <= moteId <= 0xffff) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_getMoteConfigById.pack(moteId)
+
+    ##
+    # Parses the response of dn_getMoteConfigById() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getMoteConfigById named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getMoteConfigById(payload, hexType) :
+        if len(payload) < 15 :
+            return None
+        (RC, macAddress, moteId, isAP, state, reserved, isRouting) = IpMgrConnectorSerial._Response_dn_getMoteConfigById.unpack_from(payload)
+        if (RC != 0 or
+            isAP > 1 or
+            state not in (0, 1, 4) or
+            isRouting > 1) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getMoteConfigById(RC, hexType(bytearray(macAddress)), moteId, isAP == 1, state, reserved, isRouting == 1)
+
+    ##
+    # The named tuple returned by the dn_setCommonJoinKey() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_setCommonJoinKey = collections.namedtuple("Tuple_dn_setCommonJoinKey", ['RC'])
+
+    ##
+    # The setCommonJoinKey command will set a new value for the common join key. The common join key is used to decrypt join messages only if the ACL is empty.
+    # 
+    # \param key 16-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_setCommonJoinKey named tuple.
+    # 
+    def dn_setCommonJoinKey(self, key) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_setCommonJoinKey(key)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['setCommonJoinKey'], {"key" : key})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['setCommonJoinKey'], 66, serializedFields, IpMgrConnectorSerial._parse_dn_setCommonJoinKey)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_setCommonJoinKey(**res)
+        return res
+
+    _Request_dn_setCommonJoinKey  = struct.Struct('>16s')
+    _Response_dn_setCommonJoinKey = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_setCommonJoinKey() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_setCommonJoinKey(key) :
+        key = FastPathUtils.toBytes(key, 16)
+        if (key is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_setCommonJoinKey.pack(key)
+
+    ##
+    # Parses the response of dn_setCommonJoinKey() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_setCommonJoinKey named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_setCommonJoinKey(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_setCommonJoinKey.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_setCommonJoinKey(RC)
+
+    ##
+    # The named tuple returned by the dn_getIPConfig() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>ipv6Address</tt>: 16-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>mask</tt>: 16-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getIPConfig = collections.namedtuple("Tuple_dn_getIPConfig", ['RC', 'ipv6Address', 'mask'])
+
+    ##
+    # The getIPConfig command returns the manager's IP configuration parameters, including the IPv6 address and mask.
+    # 
+    # 
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getIPConfig named tuple.
+    # 
+    def dn_getIPConfig(self, ) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getIPConfig()
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getIPConfig'], {})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getIPConfig'], 67, serializedFields, IpMgrConnectorSerial._parse_dn_getIPConfig)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getIPConfig(**res)
+        return res
+
+    _Request_dn_getIPConfig  = struct.Struct('>')
+    _Response_dn_getIPConfig = struct.Struct('>B16s16s')
+
+    ##
+    # Serializes the request of dn_getIPConfig() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getIPConfig() :
+        return IpMgrConnectorSerial._Request_dn_getIPConfig.pack()
+
+    ##
+    # Parses the response of dn_getIPConfig() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getIPConfig named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getIPConfig(payload, hexType) :
+        if len(payload) < 33 :
+            return None
+        (RC, ipv6Address, mask) = IpMgrConnectorSerial._Response_dn_getIPConfig.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getIPConfig(RC, hexType(bytearray(ipv6Address)), hexType(bytearray(mask)))
+
+    ##
+    # The named tuple returned by the dn_setIPConfig() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_setIPConfig = collections.namedtuple("Tuple_dn_setIPConfig", ['RC'])
+
+    ##
+    # The setIPConfig command sets the IPv6 prefix of the mesh network. Only the upper 8 bytes of the IPv6 address are relevant: the lower 8 bytes of the IPv6 address are ignored, and lower 8 bytes of the mask field are reserved and should be set to 0.This change is persistent.
+    # 
+    # \param ipv6Address 16-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # \param mask 16-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_setIPConfig named tuple.
+    # 
+    def dn_setIPConfig(self, ipv6Address, mask) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_setIPConfig(ipv6Address, mask)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['setIPConfig'], {"ipv6Address" : ipv6Address, "mask" : mask})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['setIPConfig'], 68, serializedFields, IpMgrConnectorSerial._parse_dn_setIPConfig)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_setIPConfig(**res)
+        return res
+
+    _Request_dn_setIPConfig  = struct.Struct('>16s16s')
+    _Response_dn_setIPConfig = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_setIPConfig() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_setIPConfig(ipv6Address, mask) :
+        ipv6Address = FastPathUtils.toBytes(ipv6Address, 16)
+        mask = FastPathUtils.toBytes(mask, 16)
+        if (ipv6Address is None or
+            mask is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_setIPConfig.pack(ipv6Address, mask)
+
+    ##
+    # Parses the response of dn_setIPConfig() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_setIPConfig named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_setIPConfig(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_setIPConfig.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_setIPConfig(RC)
+
+    ##
+    # The named tuple returned by the dn_deleteMote() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # 
+    Tuple_dn_deleteMote = collections.namedtuple("Tuple_dn_deleteMote", ['RC'])
+
+    ##
+    # The deleteMote command deletes a mote from the manager's list. A mote can only be deleted if it in the Lost or Unknown states. This change is persistent.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_deleteMote named tuple.
+    # 
+    def dn_deleteMote(self, macAddress) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_deleteMote(macAddress)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['deleteMote'], {"macAddress" : macAddress})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['deleteMote'], 69, serializedFields, IpMgrConnectorSerial._parse_dn_deleteMote)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_deleteMote(**res)
+        return res
+
+    _Request_dn_deleteMote  = struct.Struct('>8s')
+    _Response_dn_deleteMote = struct.Struct('>B')
+
+    ##
+    # Serializes the request of dn_deleteMote() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_deleteMote(macAddress) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        if (macAddress is None) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_deleteMote.pack(macAddress)
+
+    ##
+    # Parses the response of dn_deleteMote() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_deleteMote named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_deleteMote(payload, hexType) :
+        if len(payload) < 1 :
+            return None
+        (RC, ) = IpMgrConnectorSerial._Response_dn_deleteMote.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_deleteMote(RC)
+
+    ##
+    # The named tuple returned by the dn_getMoteLinks() function.
+    # 
+    # - <tt>RC</tt>: 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: RC_OK
+    #      - 1: RC_INVALID_COMMAND
+    #      - 2: RC_INVALID_ARGUMENT
+    #      - 3: INVALID_AUTHENTICATION
+    #      - 4: INVALID_API_VERSION
+    #      - 5: COMMAND_TIMEOUT
+    #      - 11: RC_NOT_FOUND
+    #      - 12: RC_NO_RESOURCES
+    #      - 13: RC_IN_PROGRESS
+    #      - 14: RC_NACK
+    #      - 15: RC_WRITE_FAIL
+    #      - 16: RC_VALIDATION_ERROR
+    #      - 17: RC_INV_STATE
+    #      - 18: RC_END_OF_LIST
+    # - <tt>idx</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>utilization</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>numLinks</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>frameId_1</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>slot_1</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>channelOffset_1</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId_1</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>flags_1</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>frameId_2</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>slot_2</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>channelOffset_2</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId_2</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>flags_2</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>frameId_3</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>slot_3</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>channelOffset_3</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId_3</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>flags_3</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>frameId_4</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>slot_4</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>channelOffset_4</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId_4</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>flags_4</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>frameId_5</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>slot_5</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>channelOffset_5</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId_5</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>flags_5</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>frameId_6</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>slot_6</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>channelOffset_6</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId_6</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>flags_6</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>frameId_7</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>slot_7</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>channelOffset_7</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId_7</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>flags_7</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>frameId_8</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>slot_8</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>channelOffset_8</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId_8</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>flags_8</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>frameId_9</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>slot_9</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>channelOffset_9</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId_9</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>flags_9</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>frameId_10</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>slot_10</tt>: 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>channelOffset_10</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>moteId_10</tt>: 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # - <tt>flags_10</tt>: 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    Tuple_dn_getMoteLinks = collections.namedtuple("Tuple_dn_getMoteLinks", ['RC', 'idx', 'utilization', 'numLinks', 'frameId_1', 'slot_1', 'channelOffset_1', 'moteId_1', 'flags_1', 'frameId_2', 'slot_2', 'channelOffset_2', 'moteId_2', 'flags_2', 'frameId_3', 'slot_3', 'channelOffset_3', 'moteId_3', 'flags_3', 'frameId_4', 'slot_4', 'channelOffset_4', 'moteId_4', 'flags_4', 'frameId_5', 'slot_5', 'channelOffset_5', 'moteId_5', 'flags_5', 'frameId_6', 'slot_6', 'channelOffset_6', 'moteId_6', 'flags_6', 'frameId_7', 'slot_7', 'channelOffset_7', 'moteId_7', 'flags_7', 'frameId_8', 'slot_8', 'channelOffset_8', 'moteId_8', 'flags_8', 'frameId_9', 'slot_9', 'channelOffset_9', 'moteId_9', 'flags_9', 'frameId_10', 'slot_10', 'channelOffset_10', 'moteId_10', 'flags_10'])
+
+    ##
+    # ThegetMoteLinkscommand returns information about links assigned to the mote. The response contains a list of links starting with Nth link on the mote, where N is supplied as theidxparameter in the request. To retrieve all links on the device the user can call this command withidxthat increments by number of links returned with priorresponse, until the command returns RC_END_OF_LIST response code. Note that links assigned to a mote may change between API calls.
+    # 
+    # \param macAddress 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    # \param idx 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    # 
+    # \returns The response to the command, formatted as a #Tuple_dn_getMoteLinks named tuple.
+    # 
+    def dn_getMoteLinks(self, macAddress, idx) :
+        serializedFields = IpMgrConnectorSerial._serialize_dn_getMoteLinks(macAddress, idx)
+        if serializedFields is None :
+            res = IpMgrConnectorSerialInternal.send(self, ['getMoteLinks'], {"macAddress" : macAddress, "idx" : idx})
+        else :
+            res = IpMgrConnectorSerialInternal.sendSerialized(self, ['getMoteLinks'], 70, serializedFields, IpMgrConnectorSerial._parse_dn_getMoteLinks)
+        if type(res) is dict :
+            res = IpMgrConnectorSerial.Tuple_dn_getMoteLinks(**res)
+        return res
+
+    _Request_dn_getMoteLinks  = struct.Struct('>8sH')
+    _Response_dn_getMoteLinks = struct.Struct('>BHBBBIBHBBIBHBBIBHBBIBHBBIBHBBIBHBBIBHBBIBHBBIBHBBIBHB')
+
+    ##
+    # Serializes the request of dn_getMoteLinks() with a precompiled struct format.
+    # 
+    # \returns The serialized request, or None if a field needs the generic serializer.
+    # 
+    @staticmethod
+    def _serialize_dn_getMoteLinks(macAddress, idx) :
+        macAddress = FastPathUtils.toBytes(macAddress, 8)
+        if (macAddress is None or
+            type(idx) is not int or not 0 <= idx <= 0xffff) :
+            return None
+        return IpMgrConnectorSerial._Request_dn_getMoteLinks.pack(macAddress, idx)
+
+    ##
+    # Parses the response of dn_getMoteLinks() with a precompiled struct format.
+    # 
+    # \returns The response as a #Tuple_dn_getMoteLinks named tuple, or None if it needs the generic deserializer.
+    # 
+    @staticmethod
+    def _parse_dn_getMoteLinks(payload, hexType) :
+        if len(payload) < 95 :
+            return None
+        (RC, idx, utilization, numLinks, frameId_1, slot_1, channelOffset_1, moteId_1, flags_1, frameId_2, slot_2, channelOffset_2, moteId_2, flags_2, frameId_3, slot_3, channelOffset_3, moteId_3, flags_3, frameId_4, slot_4, channelOffset_4, moteId_4, flags_4, frameId_5, slot_5, channelOffset_5, moteId_5, flags_5, frameId_6, slot_6, channelOffset_6, moteId_6, flags_6, frameId_7, slot_7, channelOffset_7, moteId_7, flags_7, frameId_8, slot_8, channelOffset_8, moteId_8, flags_8, frameId_9, slot_9, channelOffset_9, moteId_9, flags_9, frameId_10, slot_10, channelOffset_10, moteId_10, flags_10) = IpMgrConnectorSerial._Response_dn_getMoteLinks.unpack_from(payload)
+        if (RC != 0) :
+            return None
+        return IpMgrConnectorSerial.Tuple_dn_getMoteLinks(RC, idx, utilization, numLinks, frameId_1, slot_1, channelOffset_1, moteId_1, flags_1, frameId_2, slot_2, channelOffset_2, moteId_2, flags_2, frameId_3, slot_3, channelOffset_3, moteId_3, flags_3, frameId_4, slot_4, channelOffset_4, moteId_4, flags_4, frameId_5, slot_5, channelOffset_5, moteId_5, flags_5, frameId_6, slot_6, channelOffset_6, moteId_6, flags_6, frameId_7, slot_7, channelOffset_7, moteId_7, flags_7, frameId_8, slot_8, channelOffset_8, moteId_8, flags_8, frameId_9, slot_9, channelOffset_9, moteId_9, flags_9, frameId_10, slot_10, channelOffset_10, moteId_10, flags_10)
+
+    #======================== notifications ===================================
+    
+    ##
+    # Dictionary of all notification tuples.
+    #
+    notifTupleTable = {}
+    
+    ##
+    # \brief MANAGER_HELLO notification.
+    # 
+    # Sent by the manager to a initiate new session with a client.
+    #
+    # Formatted as a Tuple_manager_hello named tuple. It contains the following fields:
+    #   - <tt>version</tt> 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>mode</tt> 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    MANAGER_HELLO = "manager_hello"
+    notifTupleTable[MANAGER_HELLO] = Tuple_manager_hello = collections.namedtuple("Tuple_manager_hello", ['version', 'mode'])
+
+    ##
+    # \brief EVENTMOTERESET notification.
+    # 
+    # This notification is sent when a user-initiated reset is executed by the manager.
+    #
+    # Formatted as a Tuple_eventMoteReset named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    EVENTMOTERESET = "eventMoteReset"
+    notifTupleTable[EVENTMOTERESET] = Tuple_eventMoteReset = collections.namedtuple("Tuple_eventMoteReset", ['eventId', 'macAddress'])
+
+    ##
+    # \brief EVENTNETWORKRESET notification.
+    # 
+    # This notification is sent when the manager starts the network. This event has no eventData fields.
+    #
+    # Formatted as a Tuple_eventNetworkReset named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    EVENTNETWORKRESET = "eventNetworkReset"
+    notifTupleTable[EVENTNETWORKRESET] = Tuple_eventNetworkReset = collections.namedtuple("Tuple_eventNetworkReset", ['eventId'])
+
+    ##
+    # \brief EVENTCOMMANDFINISHED notification.
+    # 
+    # The commandFinished notification is used when a reliable command response is received.
+    #
+    # Formatted as a Tuple_eventCommandFinished named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>callbackId</tt> 4-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>rc</tt> 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: OK
+    #      - 1: nack
+    #      - 2: commandTimeout    
+    # 
+    EVENTCOMMANDFINISHED = "eventCommandFinished"
+    notifTupleTable[EVENTCOMMANDFINISHED] = Tuple_eventCommandFinished = collections.namedtuple("Tuple_eventCommandFinished", ['eventId', 'callbackId', 'rc'])
+
+    ##
+    # \brief EVENTMOTEJOIN notification.
+    # 
+    # This notification is sent when a mote joins the network.
+    #
+    # Formatted as a Tuple_eventMoteJoin named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    EVENTMOTEJOIN = "eventMoteJoin"
+    notifTupleTable[EVENTMOTEJOIN] = Tuple_eventMoteJoin = collections.namedtuple("Tuple_eventMoteJoin", ['eventId', 'macAddress'])
+
+    ##
+    # \brief EVENTMOTEOPERATIONAL notification.
+    # 
+    # This notification is sent when a mote that joins the network becomes operational.
+    #
+    # Formatted as a Tuple_eventMoteOperational named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    EVENTMOTEOPERATIONAL = "eventMoteOperational"
+    notifTupleTable[EVENTMOTEOPERATIONAL] = Tuple_eventMoteOperational = collections.namedtuple("Tuple_eventMoteOperational", ['eventId', 'macAddress'])
+
+    ##
+    # \brief EVENTMOTELOST notification.
+    # 
+    # This notification is sent when a mote's state changes to Lost, which indicates that the mote is not responding to downstream messages.
+    #
+    # Formatted as a Tuple_eventMoteLost named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    EVENTMOTELOST = "eventMoteLost"
+    notifTupleTable[EVENTMOTELOST] = Tuple_eventMoteLost = collections.namedtuple("Tuple_eventMoteLost", ['eventId', 'macAddress'])
+
+    ##
+    # \brief EVENTNETWORKTIME notification.
+    # 
+    # The time notification is triggered by the client asserting the TIME pin or by calling the getTime command. This notification contains the time when the TIME pin was asserted (or the getTime command was processed) expressed as:
+    # 
+    # -ASNThe absolute slot number (the number of timeslots since "7/2/2002 8:00:00 PM PST"if UTC is set on manager, otherwise since Jan 1, 1970)
+    # 
+    # 
+    # -UptimeThe number of seconds since the device was booted
+    # -UnixtimeThe number of seconds and microseconds since Jan 1, 1970 in UTC
+    #
+    # Formatted as a Tuple_eventNetworkTime named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>uptime</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>utcSecs</tt> 8-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>utcUsecs</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>asn</tt> 5-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>asnOffset</tt> 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    EVENTNETWORKTIME = "eventNetworkTime"
+    notifTupleTable[EVENTNETWORKTIME] = Tuple_eventNetworkTime = collections.namedtuple("Tuple_eventNetworkTime", ['eventId', 'uptime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset'])
+
+    ##
+    # \brief EVENTPINGRESPONSE notification.
+    # 
+    # This notification is sent when a reply is received from a mote ping.
+    #
+    # Formatted as a Tuple_eventPingResponse named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>callbackId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>delay</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>voltage</tt> 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>temperature</tt> 1-byte field formatted as a ints.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    EVENTPINGRESPONSE = "eventPingResponse"
+    notifTupleTable[EVENTPINGRESPONSE] = Tuple_eventPingResponse = collections.namedtuple("Tuple_eventPingResponse", ['eventId', 'callbackId', 'macAddress', 'delay', 'voltage', 'temperature'])
+
+    ##
+    # \brief EVENTPATHCREATE notification.
+    # 
+    # This notification is sent when the manager creates a connection (path) between two motes.
+    #
+    # Formatted as a Tuple_eventPathCreate named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>source</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>dest</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>direction</tt> 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: none
+    #      - 1: unused
+    #      - 2: upstream
+    #      - 3: downstream    
+    # 
+    EVENTPATHCREATE = "eventPathCreate"
+    notifTupleTable[EVENTPATHCREATE] = Tuple_eventPathCreate = collections.namedtuple("Tuple_eventPathCreate", ['eventId', 'source', 'dest', 'direction'])
+
+    ##
+    # \brief EVENTPATHDELETE notification.
+    # 
+    # This notification is sent when the manager removes a connection (path) between two motes.
+    #
+    # Formatted as a Tuple_eventPathDelete named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>source</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>dest</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>direction</tt> 1-byte field formatted as a int.<br/>
+    #     This field can only take one of the following values:
+    #      - 0: none
+    #      - 1: unused
+    #      - 2: upstream
+    #      - 3: downstream    
+    # 
+    EVENTPATHDELETE = "eventPathDelete"
+    notifTupleTable[EVENTPATHDELETE] = Tuple_eventPathDelete = collections.namedtuple("Tuple_eventPathDelete", ['eventId', 'source', 'dest', 'direction'])
+
+    ##
+    # \brief EVENTPACKETSENT notification.
+    # 
+    # The packetSent notification is generated when client's packet is removed from manager's queue and sent into the wireless network.
+    #
+    # Formatted as a Tuple_eventPacketSent named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>callbackId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>rc</tt> 1-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    EVENTPACKETSENT = "eventPacketSent"
+    notifTupleTable[EVENTPACKETSENT] = Tuple_eventPacketSent = collections.namedtuple("Tuple_eventPacketSent", ['eventId', 'callbackId', 'rc'])
+
+    ##
+    # \brief EVENTMOTECREATE notification.
+    # 
+    # This event is sent when a mote joins the manager for the first time.
+    #
+    # Formatted as a Tuple_eventMoteCreate named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>moteId</tt> 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    EVENTMOTECREATE = "eventMoteCreate"
+    notifTupleTable[EVENTMOTECREATE] = Tuple_eventMoteCreate = collections.namedtuple("Tuple_eventMoteCreate", ['eventId', 'macAddress', 'moteId'])
+
+    ##
+    # \brief EVENTMOTEDELETE notification.
+    # 
+    # This notification is sent when a mote is deleted as a result of moteDelete command.
+    #
+    # Formatted as a Tuple_eventMoteDelete named tuple. It contains the following fields:
+    #   - <tt>eventId</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>moteId</tt> 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    EVENTMOTEDELETE = "eventMoteDelete"
+    notifTupleTable[EVENTMOTEDELETE] = Tuple_eventMoteDelete = collections.namedtuple("Tuple_eventMoteDelete", ['eventId', 'macAddress', 'moteId'])
+
+    ##
+    # \brief NOTIFLOG notification.
+    # 
+    # A log notifications is generated in response to the getLog command. Each log notification contains a message from the mote's log.
+    #
+    # Formatted as a Tuple_notifLog named tuple. It contains the following fields:
+    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>logMsg</tt> None-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    NOTIFLOG = "notifLog"
+    notifTupleTable[NOTIFLOG] = Tuple_notifLog = collections.namedtuple("Tuple_notifLog", ['macAddress', 'logMsg'])
+
+    ##
+    # \brief NOTIFDATA notification.
+    # 
+    # The data notification contains a header and a variable length array of binary data. The length of the data is determined based on the length of the notification.
+    # 
+    # The manager forwards all packets received on its IP address and non-manager ports as data notifications.
+    #
+    # Formatted as a Tuple_notifData named tuple. It contains the following fields:
+    #   - <tt>utcSecs</tt> 8-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>utcUsecs</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>srcPort</tt> 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>dstPort</tt> 2-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>data</tt> None-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    NOTIFDATA = "notifData"
+    notifTupleTable[NOTIFDATA] = Tuple_notifData = collections.namedtuple("Tuple_notifData", ['utcSecs', 'utcUsecs', 'macAddress', 'srcPort', 'dstPort', 'data'])
+
+    ##
+    # \brief NOTIFIPDATA notification.
+    # 
+    # The ipData notification contains full IP packet sent by the mote, including 6Lowpan header, UDP header, and the UDP payload. Manager generates this notification when it receives packet from a mote with destination other than manager's own IP address. The size of thedata field can be calculated by subtracting the fixed header size (up to macAddress)from the size of overall notification packet.
+    #
+    # Formatted as a Tuple_notifIpData named tuple. It contains the following fields:
+    #   - <tt>utcSecs</tt> 8-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>utcUsecs</tt> 4-byte field formatted as a int.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>data</tt> None-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    NOTIFIPDATA = "notifIpData"
+    notifTupleTable[NOTIFIPDATA] = Tuple_notifIpData = collections.namedtuple("Tuple_notifIpData", ['utcSecs', 'utcUsecs', 'macAddress', 'data'])
+
+    ##
+    # \brief NOTIFHEALTHREPORT notification.
+    # 
+    # The healthReport notifications include the raw payload of health reports received from devices. The payload contains one or more specific health report messages. Each message contains an identifier, length and variable-sized data. The individual healthReport message structures are defined below.
+    #
+    # Formatted as a Tuple_notifHealthReport named tuple. It contains the following fields:
+    #   - <tt>macAddress</tt> 8-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.
+    #   - <tt>payload</tt> None-byte field formatted as a hex.<br/>
+    #     There is no restriction on the value of this field.    
+    # 
+    NOTIFHEALTHREPORT = "notifHealthReport"
+    notifTupleTable[NOTIFHEALTHREPORT] = Tuple_notifHealthReport = collections.namedtuple("Tuple_notifHealthReport", ['macAddress', 'payload'])
+
+    ##
+    # \brief Get a notification from the notification queue, and returns
+    #        it properly formatted.
+    #
+    # \exception NotificationError if unknown notification.
+    # 
+    def getNotification(self, timeoutSec=-1) :
+        temp = self.getNotificationInternal(timeoutSec)
+        if not temp:
+            return temp
+        (ids, param) = temp
+        try :
+            if  IpMgrConnectorSerial.notifTupleTable[ids[-1]] :
+                return (ids[-1], IpMgrConnectorSerial.notifTupleTable[ids[-1]](**param))
+            else :
+                return (ids[-1], None)
+        except KeyError :
+            raise ApiException.NotificationError(ids, param)
+
+    ##
+    # \brief Get up to maxCount notifications from the notification queue,
+    #        and returns them properly formatted.
+    #
+    # Waits for the first notification as getNotification() does, then takes
+    # the notifications already queued, in a single acquisition of the queue
+    # lock.
+    #
+    # \exception NotificationError if unknown notification. The notifications
+    #            taken before it are returned first, and the ones after it
+    #            put back in the queue, for the next calls.
+    # \returns A list of (name, tuple) tuples, empty if the queue is empty.
+    # 
+    def getNotifications(self, maxCount, timeoutSec=-1) :
+        returnVal = []
+        notifs = self.getNotificationsInternal(maxCount, timeoutSec)
+        for (i, (ids, param)) in enumerate(notifs) :
+            try :
+                tupleClass = IpMgrConnectorSerial.notifTupleTable[ids[-1]]
+            except KeyError :
+                if returnVal :
+                    self.putBackNotificationsInternal(notifs[i:])
+                    return returnVal
+                self.putBackNotificationsInternal(notifs[i+1:])
+                raise ApiException.NotificationError(ids, param)
+            if tupleClass :
+                returnVal.append((ids[-1], tupleClass(**param)))
+            else :
+                returnVal.append((ids[-1], None))
+        return returnVal
+
+##
+# end of IpMgrConnectorSerial
+# \}
+# 
@@ -0,0 +1,24 @@
+from SmartMeshSDK.ApiDefinition   import DefinitionLoader
+from SmartMeshSDK.SerialConnector import AsyncSerialConnector
+
+import IpMoteConnectorInternal
+import IpMoteConnector
+
+class AsyncIpMoteConnector(IpMoteConnectorInternal.IpMoteHeader,AsyncSerialConnector.AsyncSerialConnector):
+    '''
+    \ingroup ApiConnector
+    
+    \brief Public class for IP mote connector, over Serial, driven by an
+           asyncio event loop.
+    
+    Its dn_*() methods are coroutines, with the same parameters and return
+    values as the ones of IpMoteConnector.
+    '''
+    
+    def __init__(self, maxQSize=100, loop=None):
+        api_def = DefinitionLoader.getDefinition('IpMoteDefinition')
+        AsyncSerialConnector.AsyncSerialConnector.__init__(self,api_def, maxQSize, loop)
+
+AsyncSerialConnector.addDnCalls(AsyncIpMoteConnector,
+                                IpMoteConnector.IpMoteConnector,
+                                DefinitionLoader.getDefinition('IpMoteDefinition'))
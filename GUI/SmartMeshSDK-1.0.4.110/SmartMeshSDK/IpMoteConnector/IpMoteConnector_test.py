@@ -0,0 +1,101 @@
+#!/usr/bin/python
+
+'''
+Tests of the responses an IpMoteConnector takes for the request it waits
+for, fed frames as the HDLC thread would, not connected to a mote.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import threading
+import unittest
+import Queue
+
+from SmartMeshSDK.IpMoteConnector import IpMoteConnector
+
+#============================ defines =========================================
+
+CMDID_GETPARAMETER = 0x02
+PARAMID_MACADDRESS = 0x01
+RC_OK              = 0
+MAC_1              = [0x00, 0x17, 0x0d, 0x00, 0x00, 0x00, 0x00, 0x01]
+MAC_2              = [0x00, 0x17, 0x0d, 0x00, 0x00, 0x00, 0x00, 0x02]
+TIMEOUT            = 5.0
+
+#============================ helpers =========================================
+
+def buildResponse(packetId, mac):
+    payload = [RC_OK, PARAMID_MACADDRESS] + mac
+    return bytearray([CMDID_GETPARAMETER, len(payload), 0x01 | (packetId<<1)] + payload)
+
+class FakeHdlc(object):
+    '''
+    \brief Stands for the HDLC module, recording the packets sent.
+    '''
+    def __init__(self):
+        self.sent = Queue.Queue()
+
+    def send(self, packet):
+        self.sent.put(bytearray(packet))
+
+    def disconnect(self):
+        pass
+
+#============================ tests ===========================================
+
+class IpMoteConnector_Responses(unittest.TestCase):
+    ''' Match the responses received to the request outstanding '''
+
+    def setUp(self):
+        self.hdlc      = FakeHdlc()
+        self.connector = IpMoteConnector.IpMoteConnector()
+        self.connector.hdlc        = self.hdlc
+        self.connector.isConnected = True
+
+    def tearDown(self):
+        self.connector.disconnect("done")
+
+    def _request(self):
+        '''
+        \brief Calls dn_getParameter_macAddress() in a thread.
+
+        \returns The thread, the list its result is appended to, and the
+                 packetId of the request sent.
+        '''
+        results = []
+        thread  = threading.Thread(target=lambda: results.append(self.connector.dn_getParameter_macAddress()))
+        thread.daemon = True
+        thread.start()
+        packet  = self.hdlc.sent.get(timeout=TIMEOUT)
+        return (thread, results, (packet[2]>>1) & 0x01)
+
+    def testStalePacketId(self):
+        """ A late response with the packetId of the previous request is dropped """
+        (thread, results, packetId1) = self._request()
+        self.connector._hdlcRxCb(buildResponse(packetId1, MAC_1))
+        thread.join(TIMEOUT)
+        self.assertEqual(list(bytearray(results[0].macAddress)), MAC_1)
+
+        (thread, results, packetId2) = self._request()
+        self.assertNotEqual(packetId1, packetId2)
+        # duplicate of the response to the first request
+        self.connector._hdlcRxCb(buildResponse(packetId1, MAC_1))
+        self.assertEqual(results, [])
+        self.assertEqual(self.connector.linkStats.numRxStaleResponses, 1)
+
+        self.connector._hdlcRxCb(buildResponse(packetId2, MAC_2))
+        thread.join(TIMEOUT)
+        self.assertEqual(list(bytearray(results[0].macAddress)), MAC_2)
+        self.assertEqual(self.connector.linkStats.numRxStaleResponses, 1)
+
+# Make this test module runnable from the command prompt
+if __name__ == "__main__":
+    unittest.main()
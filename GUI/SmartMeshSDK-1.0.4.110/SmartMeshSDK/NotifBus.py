@@ -0,0 +1,240 @@
+#!/usr/bin/python
+
+'''
+In-process fan-out of the notifications of a connector.
+
+A connector's notification queue can only be read by one consumer. A
+NotifBus reads it, and hands each notification to every subscriber
+interested in it. Each subscriber (a NotifBusSubscriber) has its own bounded
+queue and overflow policy: a subscriber which does not keep up loses
+notifications, according to its policy, without slowing down the bus or the
+other subscribers.
+
+The notifications are formatted once by the connector, and the same
+(name, namedtuple) tuples are handed to all subscribers. So that no
+subscriber can modify what the others receive, the list fields of the
+namedtuples (the HEXDATA fields of the serial connectors) are turned into
+tuples.
+'''
+
+import threading
+
+import ApiConnector
+import ApiException
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('NotifBus')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+#============================ defines =========================================
+
+DEFAULT_BATCH_SIZE = 100
+
+#============================ helpers =========================================
+
+def freeze(notif):
+    '''
+    \brief Turn the list fields of a formatted notification into tuples.
+
+    \param notif The (name, namedtuple) tuple returned by getNotification().
+
+    \returns The notification, itself if it has no list field.
+    '''
+    params = notif[1]
+    if params is None:
+        return notif
+    lists = {}
+    for (name,value) in zip(params._fields,params):
+        if type(value) is list:
+            lists[name] = tuple(value)
+    if not lists:
+        return notif
+    return (notif[0],params._replace(**lists))
+
+#============================ classes =========================================
+
+class NotifBusSubscriber(ApiConnector.ApiConnector):
+    '''
+    \brief A subscriber to a NotifBus, read as a connector.
+
+    getNotification() and getNotifications() behave as the ones of a
+    connector: when the connector of the bus disconnects, they raise
+    ConnectionError once, return the notifications still queued, then raise
+    QueueError.
+    '''
+
+    def __init__(self,bus,notifNames,maxQSize):
+
+        # store params
+        self.bus             = bus
+        self.notifNames      = notifNames   ##< names of the notifications to receive, None for all
+
+        # initialize parent class
+        ApiConnector.ApiConnector.__init__(self,maxQSize)
+        self.queue.setOverflowPolicy(ApiConnector.OVERFLOW_DROP_OLDEST)
+
+    #======================== public ==========================================
+
+    def getNotification(self,timeoutSec=-1):
+        '''
+        \brief Get a notification, as the connector's getNotification() returns it.
+
+        \returns The (name, namedtuple) tuple, or None if the queue is empty.
+        '''
+        return self.getNotificationInternal(timeoutSec)
+
+    def getNotifications(self,maxCount,timeoutSec=-1):
+        '''
+        \brief Get up to maxCount notifications, as the connector's
+               getNotifications() returns them.
+        '''
+        return self.getNotificationsInternal(maxCount,timeoutSec)
+
+    def setOverflowPolicy(self,policy,**options):
+        '''
+        \brief Set what happens to a notification when the queue of the
+               subscriber is full.
+
+        See NotifQueue.setOverflowPolicy(). OVERFLOW_RAISE and OVERFLOW_BLOCK
+        would stall the bus, and are not allowed. The default policy of a
+        subscriber is OVERFLOW_DROP_OLDEST.
+        '''
+        if policy in [ApiConnector.OVERFLOW_RAISE,ApiConnector.OVERFLOW_BLOCK]:
+            raise ValueError("overflow policy {0} would block the bus".format(policy))
+        ApiConnector.ApiConnector.setOverflowPolicy(self,policy,**options)
+
+    def unsubscribe(self):
+        '''
+        \brief Stop receiving notifications.
+        '''
+        self.bus.unsubscribe(self)
+
+class NotifBus(threading.Thread):
+    '''
+    \brief Reads the notifications of a connector, and hands them to its
+           subscribers.
+    '''
+
+    def __init__(self,connector,batchSize=DEFAULT_BATCH_SIZE):
+        '''
+        \param connector The connector to read the notifications of. It must
+                         not be read by anyone else.
+        \param batchSize Maximum number of notifications read from the
+                         connector at once.
+        '''
+
+        # store params
+        self.connector       = connector
+        self.batchSize       = batchSize
+
+        # local variables
+        self.subscribersLock = threading.Lock()
+        self.subscribers     = []           ##< list of NotifBusSubscriber, replaced (not modified) on (un)subscribe
+        self.goOn            = True
+        self.numNotifs       = 0            ##< notifications read from the connector
+
+        # initialize parent class
+        threading.Thread.__init__(self)
+        self.name            = 'NotifBus'
+        self.daemon          = True
+
+    #======================== public ==========================================
+
+    def subscribe(self,notifNames=None,maxQSize=ApiConnector.DEFAULT_Q_SIZE):
+        '''
+        \brief Add a subscriber.
+
+        \param notifNames The names of the notifications to receive (the
+                          first element of the tuples getNotification()
+                          returns, e.g. 'notifData' or 'eventMoteJoin'),
+                          None for all.
+        \param maxQSize   The size of the queue of the subscriber. See
+                          NotifBusSubscriber.setOverflowPolicy() for what
+                          happens when it is full.
+
+        \returns The NotifBusSubscriber.
+        '''
+        if isinstance(notifNames,str):
+            notifNames = [notifNames]
+        if notifNames is not None:
+            notifNames = frozenset(notifNames)
+        subscriber = NotifBusSubscriber(self,notifNames,maxQSize)
+        ApiConnector.ApiConnector.connect(subscriber)
+        with self.subscribersLock:
+            self.subscribers = self.subscribers+[subscriber]
+        return subscriber
+
+    def unsubscribe(self,subscriber):
+        '''
+        \brief Remove a subscriber.
+
+        Its queued notifications can still be read.
+        '''
+        with self.subscribersLock:
+            self.subscribers = [s for s in self.subscribers if s is not subscriber]
+        subscriber.disconnect('unsubscribed')
+
+    def close(self):
+        '''
+        \brief Stop the bus, once the notification it is waiting for has
+               arrived, or the connector disconnects.
+        '''
+        self.goOn = False
+
+    def getStats(self):
+        '''
+        \brief Returns the number of notifications read from the connector,
+               and the queue counters of each subscriber.
+
+        \returns A dictionary with the keys 'numNotifs' and 'subscribers', a
+                 list of the NotifQueue.getStats() of each subscriber.
+        '''
+        return {
+            'numNotifs':     self.numNotifs,
+            'subscribers':   [s.getQueueStats() for s in self.subscribers],
+        }
+
+    #======================== private =========================================
+
+    def run(self):
+        reason = 'bus closed'
+        try:
+            while self.goOn:
+                try:
+                    notifs = self.connector.getNotifications(self.batchSize)
+                except ApiException.ConnectionError as err:
+                    # keep reading what the connector received before disconnecting
+                    reason = err.value
+                    continue
+                except ApiException.QueueError:
+                    break
+                except ApiException.NotificationError as err:
+                    log.error('dropping notifications: {0}'.format(err))
+                    continue
+                self.numNotifs += len(notifs)
+                self.publish([freeze(notif) for notif in notifs])
+        except Exception as err:
+            log.error('notification bus stopped: {0}'.format(err))
+            reason = str(err)
+        finally:
+            with self.subscribersLock:
+                subscribers      = self.subscribers
+                self.subscribers = []
+            for subscriber in subscribers:
+                subscriber.disconnect(reason)
+
+    def publish(self,notifs):
+        '''
+        \brief Hand notifications to the subscribers interested in them.
+        '''
+        for subscriber in self.subscribers:
+            if subscriber.notifNames is None:
+                subscriber.queue.putNotifications(notifs)
+            else:
+                subscriber.queue.putNotifications(
+                    [notif for notif in notifs if notif[0] in subscriber.notifNames]
+                )
@@ -0,0 +1,233 @@
+#!/usr/bin/python
+
+'''
+Runs notification callbacks on a pool of worker lanes.
+
+A subscriber calling its callbacks inline stops reading notifications while
+a callback runs: a slow callback (e.g. an HTTP request) delays the
+notifications of the whole network. A NotifDispatcher runs the callbacks on
+numLanes lanes instead, each a queue and a worker. The notifications of a
+mote always go to the same lane, chosen by hashing its MAC address, so the
+callbacks of a mote are called in the order its notifications arrived, while
+the motes of different lanes are handled in parallel.
+
+The workers are threads, or, for callbacks which are CPU-bound, processes.
+'''
+
+import threading
+import Queue
+import collections
+import multiprocessing
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('NotifDispatcher')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+#============================ defines =========================================
+
+DEFAULT_NUM_LANES  = 8
+DEFAULT_LANE_SIZE  = 1000
+
+#============================ helpers =========================================
+
+class _PortableTuple(object):
+    '''
+    \brief A named tuple, sent to a worker process.
+
+    The named tuples of the connectors are defined inside their class, where
+    pickle does not find them; the worker process rebuilds them.
+    '''
+    def __init__(self,namedTuple):
+        self.typeName = type(namedTuple).__name__
+        self.fields   = namedTuple._fields
+        self.values   = tuple(namedTuple)
+
+_tupleTypes = {}   ##< named tuple types rebuilt by the worker process
+
+def _toPortable(arg):
+    if isinstance(arg,tuple) and hasattr(arg,'_fields'):
+        return _PortableTuple(arg)
+    if isinstance(arg,(list,tuple)):
+        return type(arg)([_toPortable(a) for a in arg])
+    return arg
+
+def _fromPortable(arg):
+    if isinstance(arg,_PortableTuple):
+        key = (arg.typeName,arg.fields)
+        if key not in _tupleTypes:
+            _tupleTypes[key] = collections.namedtuple(arg.typeName,arg.fields)
+        return _tupleTypes[key](*arg.values)
+    if isinstance(arg,(list,tuple)):
+        return type(arg)([_fromPortable(a) for a in arg])
+    return arg
+
+def _callInProcess(func,args):
+    # runs in the worker process of a lane
+    return func(*_fromPortable(args))
+
+#============================ classes =========================================
+
+class _Lane(threading.Thread):
+    '''
+    \brief A queue of callbacks, and the worker calling them in order.
+    '''
+
+    def __init__(self,index,maxSize,useProcesses):
+        self.queue           = Queue.Queue(maxSize)   ##< (func, args, onError), None to stop
+        self.pool            = None                   ##< worker process, if useProcesses
+        if useProcesses:
+            self.pool        = multiprocessing.Pool(1)
+        self.maxDepth        = 0                      ##< highest number of callbacks queued
+        self.numDispatched   = 0
+        self.numDone         = 0
+        self.numErrors       = 0
+        threading.Thread.__init__(self)
+        self.name            = 'NotifDispatcher lane {0}'.format(index)
+        self.daemon          = True
+
+    def put(self,item):
+        self.queue.put(item)
+        self.numDispatched  += 1
+        depth                = self.queue.qsize()
+        if depth>self.maxDepth:
+            self.maxDepth    = depth
+
+    def run(self):
+        try:
+            while True:
+                item = self.queue.get()
+                try:
+                    if item is None:
+                        break
+                    (func,args,onError) = item
+                    try:
+                        if self.pool:
+                            self.pool.apply(_callInProcess,(func,_toPortable(args)))
+                        else:
+                            func(*args)
+                    except Exception as err:
+                        self.numErrors += 1
+                        if onError:
+                            onError(err)
+                        else:
+                            log.error('callback {0} failed: {1}'.format(func,err))
+                    self.numDone += 1
+                finally:
+                    self.queue.task_done()
+        finally:
+            if self.pool:
+                self.pool.close()
+                self.pool.join()
+
+    def getStats(self):
+        return {
+            'depth':          self.queue.qsize(),
+            'maxDepth':       self.maxDepth,
+            'numDispatched':  self.numDispatched,
+            'numDone':        self.numDone,
+            'numErrors':      self.numErrors,
+        }
+
+class NotifDispatcher(object):
+    '''
+    \brief Calls functions on worker lanes, in order for a given key.
+    '''
+
+    def __init__(self,numLanes=DEFAULT_NUM_LANES,maxLaneSize=DEFAULT_LANE_SIZE,useProcesses=False):
+        '''
+        \param numLanes     Number of lanes, i.e. of callbacks running at once.
+        \param maxLaneSize  Number of callbacks queued on a lane before
+                            dispatch() blocks, which slows the subscriber
+                            down rather than queueing without bounds.
+        \param useProcesses Run the callbacks in a worker process per lane,
+                            rather than in a thread. The callbacks and their
+                            arguments must then be picklable (e.g. functions
+                            defined at the top of a module); the named tuples
+                            of the notifications are rebuilt in the worker
+                            process. The callbacks cannot change the state of
+                            the calling process. Bound methods cannot be
+                            pickled in Python 2, so IpMgrSubscribe, whose
+                            callbacks often are, does not accept such a
+                            dispatcher. Each call also pickles its arguments
+                            to the worker process and waits for it: this only
+                            pays off for callbacks computing much longer than
+                            that round trip.
+        '''
+        self.useProcesses    = useProcesses           ##< True iff the lanes run the callbacks in worker processes
+        self.lanes           = [_Lane(i,maxLaneSize,useProcesses) for i in range(numLanes)]
+        self.isClosed        = False
+        for lane in self.lanes:
+            lane.start()
+
+    #======================== public ==========================================
+
+    def laneOf(self,key):
+        '''
+        \brief Returns the index of the lane of a key.
+
+        \param key A MAC address (a list or tuple of bytes), or any hashable
+                   value. None always goes to the same lane.
+        '''
+        if isinstance(key,list):
+            key = tuple(key)
+        return hash(key)%len(self.lanes)
+
+    def dispatch(self,key,func,args,onError=None):
+        '''
+        \brief Queue a call of func(*args) on the lane of key.
+
+        The calls dispatched with the same key are made in order, one at a
+        time. Blocks while the lane is full.
+
+        \param key     See laneOf().
+        \param func    The function to call.
+        \param args    The tuple of its arguments.
+        \param onError Called, by the lane (in the calling process), with the
+                       exception func raised, if any. By default, the
+                       exception is logged.
+        '''
+        if self.isClosed:
+            raise RuntimeError("dispatcher closed")
+        self.lanes[self.laneOf(key)].put((func,args,onError))
+
+    def getQueueDepths(self):
+        '''
+        \brief Returns the number of calls queued on each lane.
+        '''
+        return [lane.queue.qsize() for lane in self.lanes]
+
+    def getStats(self):
+        '''
+        \brief Returns the counters of each lane.
+
+        \returns A list with, for each lane, a dictionary with the keys:
+                 - 'depth': calls queued
+                 - 'maxDepth': highest number of calls queued
+                 - 'numDispatched', 'numDone': calls queued and made
+                 - 'numErrors': calls which raised an exception
+        '''
+        return [lane.getStats() for lane in self.lanes]
+
+    def join(self):
+        '''
+        \brief Wait until all the calls dispatched are made.
+        '''
+        for lane in self.lanes:
+            lane.queue.join()
+
+    def close(self):
+        '''
+        \brief Make the calls dispatched, then stop the lanes.
+        '''
+        if self.isClosed:
+            return
+        self.isClosed = True
+        for lane in self.lanes:
+            lane.queue.put(None)
+        for lane in self.lanes:
+            if lane is not threading.currentThread():
+                lane.join()
@@ -1,23 +1,34 @@
-#!/usr/bin/python
-
-import threading
-
-from ApiException import ConnectionError
-
-class NotifWaitThread(threading.Thread):
-    
-    def __init__(self,connector,notifCb):
-        self.connector       = connector
-        self.notifCb         = notifCb
-        threading.Thread.__init__(self)
-        self.name            = "NotifWaitThread"
-    
-    def run(self):
-        while (1):
-            try:
-                notif = self.connector.getNotification()
-            except ConnectionError as err:
-                # when we disconnect, kill this thread
-                return
-            self.notifCb(notif)
+#!/usr/bin/python
+
+import threading
+
+from ApiException import ConnectionError
+
+class NotifWaitThread(threading.Thread):
+    
+    def __init__(self,connector,notifCb,batchSize=1):
+        '''
+        \param batchSize Maximum number of notifications taken from the
+                         connector at once. With more than 1, they are taken
+                         with getNotifications(), then passed one at a time
+                         to notifCb.
+        '''
+        self.connector       = connector
+        self.notifCb         = notifCb
+        self.batchSize       = batchSize
+        threading.Thread.__init__(self)
+        self.name            = "NotifWaitThread"
+    
+    def run(self):
+        while (1):
+            try:
+                if self.batchSize>1:
+                    notifs = self.connector.getNotifications(self.batchSize)
+                else:
+                    notifs = [self.connector.getNotification()]
+            except ConnectionError as err:
+                # when we disconnect, kill this thread
+                return
+            for notif in notifs:
+                self.notifCb(notif)
             
\ No newline at end of file
@@ -0,0 +1,678 @@
+#!/usr/bin/python
+
+'''
+asyncio flavour of the serial connector stack.
+
+The threaded SerialConnector runs one Hdlc thread per serial port, plus one
+thread per notification consumer. Here, a single event loop drives any
+number of serial ports: the bytes are read by the loop (SerialTransport),
+deframed by an HdlcProtocol, and the requests and notifications are
+exchanged through coroutines.
+
+Python 2 has no asyncio; this module uses its backport, trollius. Serial
+ports are watched with the loop's add_reader(), which needs a POSIX system.
+
+Example:
+\code
+    @asyncio.coroutine
+    def run(port):
+        connector = AsyncIpMoteConnector.AsyncIpMoteConnector()
+        yield From(connector.connect({'port': port}))
+        res = yield From(connector.dn_getParameter_macAddress())
+        for notifFuture in connector.iterNotifications():
+            notif = yield From(notifFuture)
+    
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(asyncio.wait([run(p) for p in ports]))
+\endcode
+'''
+
+import os
+import errno
+import inspect
+import threading
+import time
+
+import Hdlc
+import LinkStats
+import RttEstimator
+import SerialConnector
+
+from   SmartMeshSDK.ApiException  import ConnectionError, \
+                                         NotificationError
+from   SmartMeshSDK.ApiDefinition import ApiDefinition
+
+try:
+    import trollius as asyncio
+    from trollius import From, \
+                         Return
+except ImportError:
+    output  = ''
+    output += 'Could not load the trollius module (asyncio for Python 2).\n'
+    output += 'Please install it from https://pypi.python.org/pypi/trollius,\n'
+    output += 'then run this script again.\n'
+    raise ImportError(output)
+
+import serial
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('AsyncSerialConnector')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+MAX_READ_SIZE = 4096 # maximum number of bytes read from the serial port at once
+
+#============================ transport =======================================
+
+class SerialTransport(asyncio.Transport):
+    '''
+    \brief asyncio transport over a pyserial port, read by the event loop.
+    '''
+    
+    def __init__(self,loop,protocol,serialPort):
+        
+        # initialize parent class
+        asyncio.Transport.__init__(self,{'serial': serialPort})
+        
+        # store params
+        self.loop            = loop
+        self.protocol        = protocol
+        self.serialPort      = serialPort
+        
+        # local variables
+        self.fd              = serialPort.fileno()
+        self.writeBuffer     = bytearray()
+        self.closing         = False
+        self.closed          = False
+        
+        self.loop.call_soon(self.protocol.connection_made,self)
+        self.loop.add_reader(self.fd,self._readReady)
+    
+    #======================== public ==========================================
+    
+    def write(self,data):
+        '''
+        \brief Write data to the serial port, buffering what cannot be written
+               right away.
+        
+        \returns The number of bytes accepted, i.e. len(data).
+        '''
+        if self.closing:
+            raise ConnectionError("serial port closing")
+        
+        numBytes = len(data)
+        
+        if not self.writeBuffer:
+            try:
+                numWritten = os.write(self.fd,data)
+            except OSError as err:
+                if err.errno not in (errno.EAGAIN,errno.EWOULDBLOCK):
+                    self._fatalError(err)
+                    raise ConnectionError(str(err))
+                numWritten = 0
+            data = data[numWritten:]
+            if not data:
+                return numBytes
+            self.loop.add_writer(self.fd,self._writeReady)
+        
+        self.writeBuffer += data
+        return numBytes
+    
+    def is_closing(self):
+        return self.closing
+    
+    def close(self):
+        if self.closing:
+            return
+        self.closing = True
+        self.loop.remove_reader(self.fd)
+        if not self.writeBuffer:
+            self.loop.call_soon(self._callConnectionLost,None)
+    
+    def abort(self):
+        self._fatalError(None)
+    
+    #======================== private =========================================
+    
+    def _readReady(self):
+        try:
+            data = os.read(self.fd,MAX_READ_SIZE)
+        except OSError as err:
+            if err.errno in (errno.EAGAIN,errno.EWOULDBLOCK,errno.EINTR):
+                return
+            self._fatalError(err)
+            return
+        if not data:
+            # readable but nothing to read: the device is gone
+            self._fatalError(ConnectionError("serial port closed"))
+            return
+        self.protocol.data_received(data)
+    
+    def _writeReady(self):
+        try:
+            numWritten = os.write(self.fd,str(self.writeBuffer))
+        except OSError as err:
+            if err.errno in (errno.EAGAIN,errno.EWOULDBLOCK,errno.EINTR):
+                return
+            self._fatalError(err)
+            return
+        del self.writeBuffer[:numWritten]
+        if not self.writeBuffer:
+            self.loop.remove_writer(self.fd)
+            if self.closing:
+                self._callConnectionLost(None)
+    
+    def _fatalError(self,err):
+        if err:
+            log.error("serial port error: {0}".format(err))
+        self.closing     = True
+        self.loop.remove_reader(self.fd)
+        if self.writeBuffer:
+            self.loop.remove_writer(self.fd)
+            self.writeBuffer = bytearray()
+        self.loop.call_soon(self._callConnectionLost,err)
+    
+    def _callConnectionLost(self,err):
+        if self.closed:
+            return
+        self.closed      = True
+        try:
+            self.protocol.connection_lost(err)
+        finally:
+            self.serialPort.close()
+
+@asyncio.coroutine
+def createSerialConnection(loop,protocolFactory,port,baudrate=Hdlc.Hdlc._BAUDRATE):
+    '''
+    \brief Open a serial port and connect it to a protocol, the way
+           loop.create_connection() does for sockets.
+    
+    \returns A tuple (transport,protocol).
+    '''
+    try:
+        serialPort = serial.Serial(port,baudrate=baudrate,timeout=0)
+        serialPort.setRTS(False)
+        serialPort.setDTR(True)
+    except serial.serialutil.SerialException as err:
+        output = "could not open " + port + ", reason: " + str(err)
+        log.warning(output)
+        raise ConnectionError(output)
+    protocol  = protocolFactory()
+    transport = SerialTransport(loop,protocol,serialPort)
+    raise Return((transport,protocol))
+
+#============================ protocol ========================================
+
+class HdlcProtocol(asyncio.Protocol):
+    '''
+    \brief asyncio protocol framing and deframing HDLC.
+    
+    The framing is done by an Hdlc object, whose thread is not started.
+    '''
+    
+    def __init__(self,rxcallback,connectcallback,stats=None):
+        
+        # store params
+        self.connectcallback = connectcallback
+        
+        # local variables
+        self.hdlc            = Hdlc.Hdlc(rxcallback,connectcallback,bulkRx=True,stats=stats)
+        self.transport       = None
+    
+    def connection_made(self,transport):
+        self.transport              = transport
+        self.hdlc.pyserialHandler   = transport
+        self.hdlc.connected         = True
+        self.connectcallback(True)
+    
+    def data_received(self,data):
+        self.hdlc.receive(data)
+    
+    def connection_lost(self,exc):
+        self.hdlc.connected         = False
+        self.connectcallback(False)
+    
+    #======================== public ==========================================
+    
+    def send(self,packet):
+        self.hdlc.send(packet)
+    
+    def close(self):
+        if self.transport:
+            self.transport.close()
+
+#============================ connector =======================================
+
+class AsyncSerialConnector(object):
+    '''
+    \ingroup ApiConnector
+    
+    \brief The generic serial connector, driven by an asyncio event loop.
+    
+    This class is meant to be inherited by a connector using a serial link,
+    together with the class implementing the header logic of its API (e.g.
+    IpMoteConnectorInternal.IpMoteHeader).
+    '''
+    
+    def __init__(self, api_def, maxQSize=100, loop=None):
+        
+        # log
+        log.info("creating object")
+        
+        # store params
+        self.api_def         = api_def
+        self.maxQSize        = maxQSize
+        if loop is None:
+            loop             = asyncio.get_event_loop()
+        self.loop            = loop
+        
+        # local variables
+        self.isConnected     = False
+        self.disconnectReason= ''
+        self.protocol        = None                   ##< HdlcProtocol of the serial port
+        self.paramLock       = threading.Lock()       ##< used by the header logic; never contended
+        self.RxPacketId      = None                   ##< running id for packets received from device
+        self.TxPacketId      = 0                      ##< running id for packets sent to device
+        self.syncNeeded      = True                   ##< True iff we need to sync to the device
+        self.requestLock     = asyncio.Lock(loop=loop)##< only one request can be outstanding
+        self.responseFuture  = None                   ##< future of the outstanding request, if any
+        self.responseCmdId   = None                   ##< command ID of that request
+        self.tsDataSent      = 0                      ##< timestamp when sent data
+        self.tsRespReceived  = 0                      ##< timestamp when received the last response
+        self.rttEstimator    = RttEstimator.RttEstimator(SerialConnector.RX_TIMEOUT,
+                                                         SerialConnector.MIN_RX_TIMEOUT,
+                                                         SerialConnector.MAX_RX_TIMEOUT)
+        self.notifQueue      = asyncio.Queue(maxQSize,loop=loop)
+        self.linkStats       = LinkStats.LinkStats()  ##< counters and histograms of the serial link
+    
+    #======================== public ==========================================
+    
+    @asyncio.coroutine
+    def connect(self, connectParams):
+        '''
+        \brief Open the serial port (coroutine).
+        
+        \param connectParams Dictionary with the 'port' entry, and optionally
+                             'baudrate', 'minRxTimeout' and 'maxRxTimeout', as
+                             for SerialConnector.
+        '''
+        if 'port' not in connectParams:
+            output = "'port' entry required in connection parameters"
+            log.error(output)
+            raise ValueError(output)
+        
+        baudrate = Hdlc.Hdlc._BAUDRATE
+        if 'baudrate' in connectParams:
+            baudrate = connectParams['baudrate']
+        
+        # bounds of the adaptive time to wait for a response
+        minRxTimeout = SerialConnector.MIN_RX_TIMEOUT
+        maxRxTimeout = SerialConnector.MAX_RX_TIMEOUT
+        if 'minRxTimeout' in connectParams:
+            minRxTimeout = connectParams['minRxTimeout']
+        if 'maxRxTimeout' in connectParams:
+            maxRxTimeout = connectParams['maxRxTimeout']
+        self.rttEstimator = RttEstimator.RttEstimator(SerialConnector.RX_TIMEOUT,
+                                                      minRxTimeout,
+                                                      maxRxTimeout)
+        
+        # empty the notification queue
+        while not self.notifQueue.empty():
+            self.notifQueue.get_nowait()
+        
+        (transport,self.protocol) = yield From(createSerialConnection(
+            self.loop,
+            lambda: HdlcProtocol(self._hdlcRxCb,self._hdlcConnectCb,self.linkStats),
+            connectParams['port'],
+            baudrate,
+        ))
+        yield From(asyncio.sleep(0,loop=self.loop)) # let connection_made() run
+        self.disconnectReason = ''
+        self.isConnected      = True
+    
+    def disconnect(self, reason=""):
+        '''
+        \brief Close the serial port.
+        
+        The outstanding request fails with a ConnectionError, and so does
+        getNotification() once the notifications received are consumed.
+        '''
+        if not self.isConnected:
+            return
+        self.isConnected      = False
+        self.disconnectReason = reason
+        
+        if self.protocol:
+            self.protocol.close()
+        
+        if self.responseFuture and not self.responseFuture.done():
+            self.responseFuture.set_exception(ConnectionError(reason))
+        
+        # wake up getNotification(), making room if needed
+        if self.notifQueue.full():
+            self.notifQueue.get_nowait()
+        self.notifQueue.put_nowait(_DISCONNECTED)
+    
+    @asyncio.coroutine
+    def send(self, commandArray, fields):
+        '''
+        \brief Send a request and wait for its response (coroutine).
+        
+        \returns The dictionary of response fields.
+        '''
+        if not self.isConnected:
+            output = "not connected"
+            log.error(output)
+            raise ConnectionError(output)
+        
+        # serialize the fields
+        cmdId, serializedFields = self.api_def.serialize(commandArray,fields)
+        
+        response = yield From(self._sendRequest(cmdId,serializedFields))
+        raise Return(response)
+    
+    @asyncio.coroutine
+    def getNotification(self, timeoutSec=None):
+        '''
+        \brief Get the next notification (coroutine).
+        
+        \param timeoutSec Number of seconds to wait, None to wait forever.
+        
+        \exception ConnectionError disconnected from device
+        \exception NotificationError unknown notification
+        \returns A tuple (notifName,notifTuple), as the getNotification()
+                 method of the threaded connector, or None after timeoutSec
+                 seconds without notification.
+        '''
+        try:
+            notif = yield From(asyncio.wait_for(self.notifQueue.get(),
+                                                timeoutSec,
+                                                loop=self.loop))
+        except asyncio.TimeoutError:
+            raise Return(None)
+        
+        if notif is _DISCONNECTED:
+            # leave it for other consumers
+            self.notifQueue.put_nowait(_DISCONNECTED)
+            raise ConnectionError(self.disconnectReason)
+        
+        (ids, param) = notif
+        try:
+            if  self.notifTupleTable[ids[-1]]:
+                raise Return((ids[-1], self.notifTupleTable[ids[-1]](**param)))
+            else:
+                raise Return((ids[-1], None))
+        except KeyError:
+            raise NotificationError(ids, param)
+    
+    def iterNotifications(self):
+        '''
+        \brief Iterate over the notifications.
+        
+        Yields one future per notification, to wait on with "yield From()".
+        The iteration ends after disconnection, the last future resolving
+        to None.
+        '''
+        while self.isConnected or self.notifQueue.qsize()>1:
+            yield asyncio.ensure_future(self._getNotificationOrNone(),loop=self.loop)
+    
+    def getRttStats(self):
+        '''
+        \brief Returns the round-trip time estimate and retry statistics,
+               as SerialConnector.getRttStats().
+        '''
+        return self.rttEstimator.getStats()
+    
+    def getLinkStats(self):
+        '''
+        \brief Returns the counters and histograms of the serial link, as
+               SerialConnector.getLinkStats().
+        '''
+        returnVal = self.linkStats.getStats()
+        rttStats  = self.rttEstimator.getStats()
+        for k in ['numRequests','numRetries','numFailures']:
+            returnVal[k] = rttStats[k]
+        return returnVal
+    
+    #======================== private =========================================
+    
+    @asyncio.coroutine
+    def _sendRequest(self,cmdId,serializedFields):
+        
+        with (yield From(self.requestLock)):
+            
+            # build packet to send
+            packet  = bytearray(self._buildTxHeader(cmdId,False,serializedFields))
+            packet += bytearray(serializedFields)
+            
+            retry   = 0
+            self.responseFuture = asyncio.Future(loop=self.loop)
+            self.responseCmdId  = cmdId
+            self.rttEstimator.addRequest()
+            
+            try:
+                while True:
+                    
+                    self.tsDataSent = time.time()
+                    if retry==0:
+                        tsRequestSent = self.tsDataSent
+                    self._hdlcSend(packet)
+                    
+                    # wait for response. future resolved by _hdlcRxCb()
+                    (done,pending) = yield From(asyncio.wait(
+                        [self.responseFuture],
+                        timeout=self.rttEstimator.getTimeout(),
+                        loop=self.loop,
+                    ))
+                    if done:
+                        self.linkStats.responseTime.add(self.tsRespReceived-tsRequestSent)
+                        if retry==0:
+                            self.rttEstimator.addSample(self.tsRespReceived-self.tsDataSent)
+                        break
+                    
+                    log.info("retry {0}".format(retry))
+                    
+                    # Timeout error
+                    if retry >= SerialConnector.MAX_NUM_RETRY:
+                        self.rttEstimator.addFailure()
+                        output = "retried {0} times, max allowed is {1}".format(retry,SerialConnector.MAX_NUM_RETRY)
+                        log.error(output)
+                        raise ConnectionError(output)
+                    self.rttEstimator.backoff()
+                    retry = retry + 1
+                
+                response = self.responseFuture.result()
+            finally:
+                self.responseFuture = None
+            
+            # raise APIError if RC is not OK
+            SerialConnector.checkRc(self.api_def,cmdId,response)
+            
+            raise Return(response)
+    
+    def _sendInternal(self,cmdId,isResponse,serializedFields):
+        # only used by the header logic, to send ACKs
+        packet  = bytearray(self._buildTxHeader(cmdId,isResponse,serializedFields))
+        packet += bytearray(serializedFields)
+        self._hdlcSend(packet)
+    
+    def _hdlcSend(self,packet):
+        if not self.isConnected:
+            output = "not connected"
+            log.error(output)
+            raise ConnectionError(output)
+        self.protocol.send(packet)
+    
+    @asyncio.coroutine
+    def _getNotificationOrNone(self):
+        try:
+            notif = yield From(self.getNotification())
+        except ConnectionError:
+            notif = None
+        raise Return(notif)
+    
+    #======================== HDLC callbacks ==================================
+    
+    def _hdlcConnectCb(self,state):
+        log.info("hdlc notification: connection state="+str(state))
+        if state==False:
+            # we got disconnected
+            self.disconnect("HDLC disconnected")
+    
+    def _hdlcRxCb(self,frameRx):
+        '''
+        \brief called by HdlcProtocol when it's done receiving a complete frame.
+        
+        Same as SerialConnector._hdlcRxCb(), except that it runs in the event
+        loop, and so never blocks.
+        '''
+        
+        if len(frameRx)<3:
+            log.error("received packet too short")
+            return
+        
+        cmdId,length,isResponse,packetId,payload = self._parseRxHeader(frameRx)
+        tsReceived = time.time()
+        
+        # check packetId
+        (wasValidPacketId, isRepeatId, updateRxPacketId) = self.isValidPacketId(cmdId,isResponse,packetId)
+        
+        # update RxPacketId
+        if isResponse==False and (not isRepeatId) and updateRxPacketId:
+            self.RxPacketId = packetId
+        
+        # send ACK if necessary
+        try:
+            self._ackIfNeeded(cmdId,isResponse)
+        except ConnectionError as err:
+            log.error("could not ACK: {0}".format(err))
+            self.disconnect(str(err))
+            return
+        
+        if isResponse or self.isHelloResponse(cmdId):
+            
+            # drop the responses which do not answer the request outstanding
+            # (see SerialConnector._hdlcRxCb())
+            if not (
+                    self.responseFuture and
+                    not self.responseFuture.done() and
+                    wasValidPacketId and
+                    (cmdId==self.responseCmdId or self.isHelloResponse(cmdId))
+                ):
+                self.linkStats.numRxStaleResponses += 1
+                log.warning("dropping unexpected response cmdId={0} packetId={1}".format(cmdId,packetId))
+                return
+            
+            self.tsRespReceived = tsReceived
+            
+            # deserialize received packet
+            try:
+                nameArray, fields = self.api_def.deserialize(
+                                        ApiDefinition.ApiDefinition.COMMAND,
+                                        cmdId,
+                                        payload)
+            except Exception as err:
+                self.responseFuture.set_exception(err)
+            else:
+                self.responseFuture.set_result(fields)
+        
+        else:
+            if not isRepeatId:
+                
+                # deserialize received packet
+                nameArray, fields = self.api_def.deserialize(
+                                        ApiDefinition.ApiDefinition.NOTIFICATION,
+                                        cmdId,
+                                        payload)
+                
+                # put received packet in notification queue
+                try:
+                    self.notifQueue.put_nowait((nameArray, fields))
+                except asyncio.QueueFull:
+                    log.error("Queue overflowed, dropping {0}".format(nameArray))
+        
+        if not wasValidPacketId:
+            log.error("wrong packetId")
+    
+    #======================== virtual methods =================================
+    
+    def isHelloResponse(self, cmdId):
+        return False
+
+#============================ helpers =========================================
+
+class _Disconnected(object):
+    '''
+    \brief Put in the notification queue upon disconnection.
+    '''
+    pass
+
+_DISCONNECTED = _Disconnected()
+
+def _makeDnCall(dnName,commandArray,fieldNames,tupleClass,isResponseArray):
+    
+    @asyncio.coroutine
+    def dnCall(self,*args):
+        if len(args)!=len(fieldNames):
+            raise TypeError("{0}() takes {1} arguments ({2} given)".format(dnName,len(fieldNames),len(args)))
+        res = yield From(self.send(commandArray,dict(zip(fieldNames,args))))
+        if   tupleClass is None:
+            raise Return(res)
+        elif isResponseArray:
+            raise Return([tupleClass(**r) for r in res])
+        else:
+            raise Return(tupleClass(**res))
+    
+    dnCall.__name__ = dnName
+    dnCall.__doc__  = '''
+        \\brief Coroutine flavour of {0}(); see the threaded connector.
+        '''.format(dnName)
+    return dnCall
+
+def _commandArrays(api_def,names=[]):
+    for name in api_def.getNames(api_def.COMMAND,names):
+        if api_def.hasSubcommands(api_def.COMMAND,names+[name]):
+            for commandArray in _commandArrays(api_def,names+[name]):
+                yield commandArray
+        else:
+            yield names+[name]
+
+def addDnCalls(asyncClass,syncClass,api_def):
+    '''
+    \brief Add to asyncClass a coroutine for each dn_*() command of syncClass,
+           a connector generated by GenApiConnectors.
+    
+    Each coroutine takes the same parameters and returns the same named
+    tuples as its threaded counterpart. The named tuples, notification
+    names and notifTupleTable of syncClass are copied as well. Commands with
+    special processing of their parameters are not added.
+    '''
+    
+    # named tuples, notification names and notifTupleTable
+    for (name,value) in syncClass.__dict__.items():
+        if name.startswith('__') or inspect.isfunction(value):
+            continue
+        setattr(asyncClass,name,value)
+    
+    # commands
+    for commandArray in _commandArrays(api_def):
+        dnName = 'dn_'+'_'.join(commandArray)
+        if not hasattr(syncClass,dnName):
+            continue
+        fieldNames = inspect.getargspec(getattr(syncClass,dnName)).args[1:]
+        if [n for n in fieldNames if n not in api_def.getRequestFieldNames(commandArray)]:
+            continue
+        setattr(
+            asyncClass,
+            dnName,
+            _makeDnCall(
+                dnName,
+                commandArray,
+                fieldNames,
+                getattr(syncClass,'Tuple_'+dnName,None),
+                'isResponseArray' in api_def.getDefinition(api_def.COMMAND,commandArray),
+            ),
+        )
@@ -1,283 +1,468 @@
-#!/usr/bin/python
-
-import sys
-import threading
-import traceback
-
-import Crc
-
-
-from SmartMeshSDK.ApiException import ConnectionError, \
-                                      CommandError
-
-try:
-    import serial
-except ImportError:
-    output  = ''
-    output += 'Could not load the serial module.\n'
-    output += 'Please install PySerial from http://pyserial.sourceforge.net/,'
-    output += 'then run this script again.\n'
-    raw_input(output)
-    sys.exit()
-
-import logging
-class NullHandler(logging.Handler):
-    def emit(self, record):
-        pass
-log = logging.getLogger('Hdlc')
-log.setLevel(logging.ERROR)
-log.addHandler(NullHandler())
-
-class Hdlc(threading.Thread):
-    
-    _BAUDRATE      = 115200 # the default baudrate used by this module
-    
-    _HDLC_FLAG     = 0x7e   # the HDLC flag at the beginning/end of a frame
-    _HDLC_ESCAPE   = 0x7d   # escape character when the HDLC flag in payload
-    _HDLC_MASK     = 0x20   # mask used to recover from escape characters
-    
-    _FCS_LENGTH    = 2      # number of bytes in the FCS field
-    
-    def __init__(self,rxcallback,connectcallback):
-        
-        # log
-        log.info('Creating object')
-        
-        # store params
-        self.rxcallback           = rxcallback
-        self.connectcallback      = connectcallback
-        
-        # initialize parent class
-        threading.Thread.__init__(self)
-        self.name                 = 'HDLC'
-        
-        # local variables
-        self.crc                  = Crc.Crc()
-        self.connected            = False
-        self.comPort              = ''
-        self.pyserialHandler      = ''
-        self.busySending          = threading.Lock()
-        self.busyReceiving        = False
-        self.lastRxByte           = self._HDLC_FLAG
-        
-        # initialize state
-        self._restart()
-    
-    def run(self):
-        
-        # log
-        log.info('thread started')
-        
-        try:
-        
-            while self.connected==True:
-                try:
-                    
-                    # received a byte
-                    try:
-                        rxByte = self.pyserialHandler.read(1)
-                    except Exception as err:
-                        # work-around for bug in pyserial
-                        # https://sourceforge.net/tracker/?func=detail&aid=3591432&group_id=46487&atid=446302
-                        raise serial.SerialException(str(err))
-                    if not len(rxByte):
-                        raise serial.SerialException()
-                    
-                    # convert the received byte from a characters to an int
-                    rxByte = ord(rxByte)
-                    
-                    if      (
-                                (not self.busyReceiving)             and
-                                self.lastRxByte==self._HDLC_FLAG     and
-                                rxByte!=self._HDLC_FLAG
-                            ):
-                        # start of frame
-                        
-                        self.busyReceiving            = True
-                        self.receivedFrame            = {}
-                        self.receivedFrame['payload'] = [rxByte]
-                    
-                    elif    (
-                                self.busyReceiving                   and
-                                rxByte!=self._HDLC_FLAG
-                            ):
-                        # middle of frame
-                        
-                        if rxByte==self._HDLC_ESCAPE:
-                            self._escape = True
-                            # do not add this byte to the payload
-                        else:
-                            if self._escape == True:
-                                self.receivedFrame['payload'].append(rxByte^self._HDLC_MASK)
-                                self._escape = False
-                            else:
-                                self.receivedFrame['payload'].append(rxByte)
-                    
-                    elif    (
-                                self.busyReceiving                   and
-                                rxByte==self._HDLC_FLAG
-                            ):
-                        # end of frame
-                        
-                        self.busyReceiving       = False
-                        
-                        # split payload and fcs
-                        if len(self.receivedFrame['payload'])>self._FCS_LENGTH:
-                            temp_payload                   = self.receivedFrame['payload']
-                            self.receivedFrame['payload']  = temp_payload[:-2]
-                            self.receivedFrame['fcs']      = temp_payload[-2:]
-                            
-                            # check fcs, write 'valid' field
-                            recalculatedCrc                = self.crc.calculate(self.receivedFrame['payload'])
-                            if recalculatedCrc==self.receivedFrame['fcs']:
-                                self.receivedFrame['valid'] = True
-                            else:
-                                self.receivedFrame['valid'] = False
-                            
-                            # log
-                            if log.isEnabledFor(logging.DEBUG):
-                                output     = []
-                                output    += ['\nreceivedFrame:']
-                                output    += self._formatFrame(self.receivedFrame)
-                                log.debug('\n'.join(output))
-                            
-                            # callback
-                            if self.receivedFrame['valid']==True:
-                                try:
-                                    self.rxcallback(self.receivedFrame['payload'])
-                                except (ConnectionError,CommandError) as err:
-                                    output = "@Hdlc: {0}".format(err)
-                                    log.error(output)
-                                    print output
-                        else:
-                            output = "@Hdlc: received hdlc frame too short"
-                            log.error(output)
-                            print output
-                        self._restart()
-                    
-                    # remember the last byte I received
-                    self.lastRxByte = rxByte
-                    
-                except serial.SerialException:
-                    self.connected = False
-        
-        except Exception as err:
-            output  = []
-            output += ['===== crash in thread {0} ====='.format(self.name)]
-            output += ['\nerror:\n']
-            output += [str(err)]
-            output += ['\ncall stack:\n']
-            output += [traceback.format_exc()]
-            output  = '\n'.join(output)
-            print output # critical error
-            log.critical(output)
-            raise
-        
-        del self.crc
-        del self.pyserialHandler
-        self.connectcallback(self.connected)
-        
-        # log
-        log.info('thread ended')
-    
-    #======================== public ==========================================
-    
-    def connect(self,comPort,baudrate=_BAUDRATE):
-        self.comPort         = comPort
-        try:
-            self.pyserialHandler = serial.Serial(self.comPort,baudrate=baudrate)
-            self.pyserialHandler.setRTS(False)
-            self.pyserialHandler.setDTR(True)
-        except serial.serialutil.SerialException as err:
-            output = "could not open " + self.comPort + ", reason: " + str(err)
-            log.warning(output)
-            raise ConnectionError(output)
-        else:
-            log.info("opened port "+self.comPort)
-            self._restart()
-            self.connected = True
-            self.connectcallback(self.connected)
-            self.name      = '{0}_HDLC'.format(self.comPort)
-            self.start()
-        return self
-    
-    def send(self,message):
-        
-        if not self.connected:
-            output = 'not connected'
-            log.error(output)
-            raise ConnectionError(output)
-        
-        # calculate fcs
-        packetToSend              = {}
-        packetToSend['payload']   = message
-        packetToSend['fcs']       = self.crc.calculate(packetToSend['payload'])
-        packetToSend['valid']     = True
-        
-        # assemble packet
-        packetBytes               = packetToSend['payload']+packetToSend['fcs']
-        
-        # add HDLC escape characters
-        index = 0
-        while index<len(packetBytes):
-            if packetBytes[index]==self._HDLC_FLAG or packetBytes[index]==self._HDLC_ESCAPE:
-                packetBytes.insert(index,self._HDLC_ESCAPE)
-                index += 1
-                packetBytes[index] = packetBytes[index]^self._HDLC_MASK
-            index += 1
-        
-        # add HDLC flags
-        packetBytes.insert(0,self._HDLC_FLAG)
-        packetBytes.insert(len(packetBytes),self._HDLC_FLAG)
-        
-        # log
-        if log.isEnabledFor(logging.DEBUG):
-            output           = []
-            output          += ['\npacketToSend:']
-            output          += self._formatFrame(packetToSend)
-            log.debug('\n'.join(output))
-        
-        # reconstitute byteArray
-        byteArray            = ''.join([chr(byte) for byte in packetBytes])
-        
-        # send over serial port
-        try:        
-            with self.busySending:
-                numWritten   = self.pyserialHandler.write(byteArray)
-        except IOError, e:
-            raise ConnectionError(str(e))
-
-        if numWritten!=len(packetBytes):
-            output = 'wrote '+str(numWritten)+' bytes, expected '+str(len(packetBytes))
-            log.error(output)
-            raise ConnectionError(output)
-    
-    def disconnect(self):
-        log.info("disconnect")
-        if self.connected==True:
-            self.pyserialHandler.close()
-        self.comPort         = ''
-        self.name            = 'HDLC'
-    
-    #======================== support methods for Python "with" statement =====
-    
-    def __enter__(self):
-        pass
-    
-    def __exit__(self, type, value, tb):
-        self.disconnect()
-
-    #======================== private =========================================
-    
-    def _restart(self):
-        self._escape         = False
-        self.busyReceiving   = False
-        self.lastRxByte      = self._HDLC_FLAG
-    
-    def _formatFrame(self,frame):
-        returnVal  = []
-        returnVal += [' - payload: {0}'.format(' '.join(["%.02x"%b for b in frame['payload']]))]
-        returnVal += [' - fcs:     {0}'.format(' '.join(["%.02x"%b for b in frame['fcs']]))]
-        returnVal += [' - valid:   {0}'.format(frame['valid'])]
-        return returnVal
+#!/usr/bin/python
+
+import sys
+import threading
+import traceback
+import time
+
+import Crc
+import LinkStats
+
+
+from SmartMeshSDK.ApiException import ConnectionError, \
+                                      CommandError
+
+try:
+    import serial
+except ImportError:
+    output  = ''
+    output += 'Could not load the serial module.\n'
+    output += 'Please install PySerial from http://pyserial.sourceforge.net/,'
+    output += 'then run this script again.\n'
+    raw_input(output)
+    sys.exit()
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('Hdlc')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+class Hdlc(threading.Thread):
+    
+    _BAUDRATE      = 115200 # the default baudrate used by this module
+    
+    _HDLC_FLAG     = 0x7e   # the HDLC flag at the beginning/end of a frame
+    _HDLC_ESCAPE   = 0x7d   # escape character when the HDLC flag in payload
+    _HDLC_MASK     = 0x20   # mask used to recover from escape characters
+    
+    _HDLC_FLAG_CHAR   = chr(_HDLC_FLAG)   # _HDLC_FLAG, as received from pyserial
+    _HDLC_ESCAPE_CHAR = chr(_HDLC_ESCAPE) # _HDLC_ESCAPE, as received from pyserial
+    
+    _FCS_LENGTH    = 2      # number of bytes in the FCS field
+    
+    _TAP_MAX_RAW   = 1024   # bytes read one by one per capture record, at most
+    
+    def __init__(self,rxcallback,connectcallback,bulkRx=False,stats=None):
+        
+        # log
+        log.info('Creating object')
+        
+        # store params
+        self.rxcallback           = rxcallback
+        self.connectcallback      = connectcallback
+        self.bulkRx               = bulkRx
+        
+        # initialize parent class
+        threading.Thread.__init__(self)
+        self.name                 = 'HDLC'
+        
+        # local variables
+        self.crc                  = Crc.Crc()
+        self.connected            = False
+        self.comPort              = ''
+        self.pyserialHandler      = ''
+        self.busySending          = threading.Lock()
+        self.busyReceiving        = False
+        self.lastRxByte           = self._HDLC_FLAG
+        self.rxRawFrame           = ''
+        self.tap                  = None     ##< optional HdlcCapture.CaptureWriter recording what is received
+        self.tapRawBytes          = []       ##< bytes read one by one, not yet recorded by the tap
+        self.tapRawTs             = None     ##< time the first of tapRawBytes was read
+        if stats is None:
+            stats                 = LinkStats.LinkStats()
+        self.stats                = stats    ##< LinkStats.LinkStats counters of this link
+        
+        # initialize state
+        self._restart()
+    
+    def run(self):
+        
+        # log
+        log.info('thread started')
+        
+        try:
+        
+            while self.connected==True:
+                try:
+                    
+                    if self.bulkRx:
+                        # receive all the bytes currently available
+                        rxBytes = self._readChunk()
+                        self.stats.numRxBytes += len(rxBytes)
+                        if self.tap:
+                            self.tap.writeRaw(rxBytes)
+                        self._rxChunk(rxBytes)
+                    else:
+                        # receive a single byte
+                        rxByte  = self._readByte()
+                        self.stats.numRxBytes += 1
+                        if self.tap:
+                            self._tapRawByte(rxByte)
+                        self._rxByte(ord(rxByte))
+                    
+                except serial.SerialException:
+                    self.connected = False
+            
+            if self.tap:
+                self._tapRawFlush()
+        
+        except Exception as err:
+            output  = []
+            output += ['===== crash in thread {0} ====='.format(self.name)]
+            output += ['\nerror:\n']
+            output += [str(err)]
+            output += ['\ncall stack:\n']
+            output += [traceback.format_exc()]
+            output  = '\n'.join(output)
+            print output # critical error
+            log.critical(output)
+            raise
+        
+        del self.crc
+        del self.pyserialHandler
+        self.connectcallback(self.connected)
+        
+        # log
+        log.info('thread ended')
+    
+    #======================== public ==========================================
+    
+    def connect(self,comPort,baudrate=_BAUDRATE):
+        self.comPort         = comPort
+        try:
+            self.pyserialHandler = serial.Serial(self.comPort,baudrate=baudrate)
+            try:
+                self.pyserialHandler.setRTS(False)
+                self.pyserialHandler.setDTR(True)
+            except IOError as err:
+                # no modem control lines, e.g. a pseudo-terminal
+                log.warning("could not set RTS/DTR on {0}: {1}".format(self.comPort,err))
+        except serial.serialutil.SerialException as err:
+            output = "could not open " + self.comPort + ", reason: " + str(err)
+            log.warning(output)
+            raise ConnectionError(output)
+        else:
+            log.info("opened port "+self.comPort)
+            self._restart()
+            self.connected = True
+            self.connectcallback(self.connected)
+            self.name      = '{0}_HDLC'.format(self.comPort)
+            self.start()
+        return self
+    
+    def send(self,message):
+        
+        if not self.connected:
+            output = 'not connected'
+            log.error(output)
+            raise ConnectionError(output)
+        
+        # calculate fcs
+        packetToSend              = {}
+        packetToSend['payload']   = bytearray(message)
+        packetToSend['fcs']       = self.crc.calculate(packetToSend['payload'])
+        packetToSend['valid']     = True
+        
+        # assemble packet
+        packetBytes               = packetToSend['payload']+bytearray(packetToSend['fcs'])
+        
+        # add HDLC escape characters (escape character first!)
+        numUnescaped              = len(packetBytes)
+        packetBytes               = packetBytes.replace(
+            self._HDLC_ESCAPE_CHAR,
+            self._HDLC_ESCAPE_CHAR+chr(self._HDLC_ESCAPE^self._HDLC_MASK),
+        )
+        packetBytes               = packetBytes.replace(
+            self._HDLC_FLAG_CHAR,
+            self._HDLC_ESCAPE_CHAR+chr(self._HDLC_FLAG^self._HDLC_MASK),
+        )
+        
+        numEscapes                = len(packetBytes)-numUnescaped
+        
+        # add HDLC flags
+        packetBytes.insert(0,self._HDLC_FLAG)
+        packetBytes.append(self._HDLC_FLAG)
+        
+        # log
+        if log.isEnabledFor(logging.DEBUG):
+            output           = []
+            output          += ['\npacketToSend:']
+            output          += self._formatFrame(packetToSend)
+            log.debug('\n'.join(output))
+        
+        # reconstitute byteArray
+        byteArray            = str(packetBytes)
+        
+        # send over serial port
+        try:        
+            with self.busySending:
+                numWritten   = self.pyserialHandler.write(byteArray)
+                self.stats.numTxBytes   += numWritten
+                self.stats.numTxFrames  += 1
+                self.stats.numTxEscapes += numEscapes
+        except IOError, e:
+            raise ConnectionError(str(e))
+
+        if numWritten!=len(packetBytes):
+            output = 'wrote '+str(numWritten)+' bytes, expected '+str(len(packetBytes))
+            log.error(output)
+            raise ConnectionError(output)
+    
+    def receive(self,rxBytes):
+        '''
+        \brief Deframe bytes read from the serial port by the caller.
+        
+        Used when something else than this thread (e.g. an event loop) reads
+        from the serial port; the thread is then not started.
+        
+        \param rxBytes A string of bytes, as read from the serial port.
+        '''
+        self.stats.numRxBytes += len(rxBytes)
+        if self.tap:
+            self.tap.writeRaw(rxBytes)
+        self._rxChunk(rxBytes)
+    
+    def disconnect(self):
+        log.info("disconnect")
+        if self.connected==True:
+            self.pyserialHandler.close()
+        self.comPort         = ''
+        self.name            = 'HDLC'
+    
+    #======================== support methods for Python "with" statement =====
+    
+    def __enter__(self):
+        pass
+    
+    def __exit__(self, type, value, tb):
+        self.disconnect()
+
+    #======================== private =========================================
+    
+    def _restart(self):
+        self._escape         = False
+        self.busyReceiving   = False
+        self.lastRxByte      = self._HDLC_FLAG
+        self.rxRawFrame      = ''
+    
+    #===== reading from the serial port
+    
+    def _readByte(self):
+        '''
+        \brief Blocking read of a single byte from the serial port.
+        '''
+        try:
+            rxByte = self.pyserialHandler.read(1)
+        except Exception as err:
+            # work-around for bug in pyserial
+            # https://sourceforge.net/tracker/?func=detail&aid=3591432&group_id=46487&atid=446302
+            raise serial.SerialException(str(err))
+        if not len(rxByte):
+            raise serial.SerialException()
+        return rxByte
+    
+    def _readChunk(self):
+        '''
+        \brief Blocking read of all the bytes available on the serial port.
+        
+        Blocks until at least one byte is received, then drains whatever
+        else is already waiting in the driver's receive buffer.
+        '''
+        rxBytes = self._readByte()
+        try:
+            numWaiting = self.pyserialHandler.inWaiting()
+            if numWaiting:
+                rxBytes += self.pyserialHandler.read(numWaiting)
+        except Exception as err:
+            raise serial.SerialException(str(err))
+        return rxBytes
+    
+    #===== capture
+    
+    def _tapRawByte(self,rxByte):
+        '''
+        \brief Record a byte read on its own, one capture record per frame.
+        
+        The bytes are buffered until the flag closing a frame, so the capture
+        does not hold a record header per byte.
+        
+        \param rxByte The byte read, a string.
+        '''
+        if not self.tapRawBytes:
+            self.tapRawTs = time.time()
+        self.tapRawBytes.append(rxByte)
+        if  (
+                (
+                    rxByte==self._HDLC_FLAG_CHAR and
+                    len(self.tapRawBytes)>1      and
+                    self.tapRawBytes[-2]!=self._HDLC_FLAG_CHAR
+                ) or
+                len(self.tapRawBytes)>=self._TAP_MAX_RAW
+            ):
+            self._tapRawFlush()
+    
+    def _tapRawFlush(self):
+        '''
+        \brief Record the bytes buffered by _tapRawByte(), if any.
+        '''
+        if self.tapRawBytes:
+            self.tap.writeRaw(''.join(self.tapRawBytes),self.tapRawTs)
+            self.tapRawBytes = []
+    
+    #===== deframing
+    
+    def _rxByte(self,rxByte):
+        '''
+        \brief Handle a single byte received from the serial port.
+        
+        \param rxByte The byte received, an int.
+        '''
+        
+        if      (
+                    (not self.busyReceiving)             and
+                    self.lastRxByte==self._HDLC_FLAG     and
+                    rxByte!=self._HDLC_FLAG
+                ):
+            # start of frame
+            
+            self.busyReceiving            = True
+            self.receivedFrame            = {}
+            self.receivedFrame['payload'] = bytearray()
+            if rxByte==self._HDLC_ESCAPE:
+                self._escape = True
+                self.stats.numRxEscapes += 1
+            else:
+                self.receivedFrame['payload'].append(rxByte)
+        
+        elif    (
+                    self.busyReceiving                   and
+                    rxByte!=self._HDLC_FLAG
+                ):
+            # middle of frame
+            
+            if rxByte==self._HDLC_ESCAPE:
+                self._escape = True
+                self.stats.numRxEscapes += 1
+                # do not add this byte to the payload
+            else:
+                if self._escape == True:
+                    self.receivedFrame['payload'].append(rxByte^self._HDLC_MASK)
+                    self._escape = False
+                else:
+                    self.receivedFrame['payload'].append(rxByte)
+        
+        elif    (
+                    self.busyReceiving                   and
+                    rxByte==self._HDLC_FLAG
+                ):
+            # end of frame
+            
+            self._rxFrame(self.receivedFrame['payload'])
+            self._restart()
+        
+        # remember the last byte I received
+        self.lastRxByte = rxByte
+    
+    def _rxChunk(self,rxBytes):
+        '''
+        \brief Handle a chunk of bytes received from the serial port.
+        
+        Rather than looking at the chunk byte per byte, split it on the HDLC
+        flags. The (escaped) bytes of a frame which is not complete yet are
+        kept in rxRawFrame until the next chunk comes in.
+        
+        \param rxBytes The bytes received, a string.
+        '''
+        
+        pieces = rxBytes.split(self._HDLC_FLAG_CHAR)
+        
+        # the first piece continues the frame started in a previous chunk
+        self.rxRawFrame += pieces[0]
+        
+        # each subsequent piece is preceded by a flag, i.e. closes the frame
+        for piece in pieces[1:]:
+            if self.rxRawFrame:
+                self._rxFrame(self._unescape(self.rxRawFrame))
+            self.rxRawFrame = piece
+    
+    def _unescape(self,rawFrame):
+        '''
+        \brief Remove the HDLC escape characters from a frame.
+        
+        \param rawFrame The frame, as received (without flags), a string.
+        
+        \returns The unescaped frame, a bytearray.
+        '''
+        
+        if self._HDLC_ESCAPE_CHAR not in rawFrame:
+            return bytearray(rawFrame)
+        
+        pieces    = rawFrame.split(self._HDLC_ESCAPE_CHAR)
+        self.stats.numRxEscapes += len(pieces)-1
+        frame     = bytearray(pieces[0])
+        for piece in pieces[1:]:
+            if piece:
+                # the first byte of each piece was escaped
+                frame.append(ord(piece[0])^self._HDLC_MASK)
+                frame.extend(piece[1:])
+        return frame
+    
+    def _rxFrame(self,frame):
+        '''
+        \brief Handle a complete, unescaped frame.
+        
+        Checks the FCS and passes the frame to rxcallback if it is valid.
+        
+        \param frame The frame received, FCS included, a bytearray. The FCS
+                     is stripped in place before calling rxcallback.
+        '''
+        
+        if len(frame)>self._FCS_LENGTH:
+            
+            # check fcs
+            isValid = Crc.isValid(frame)
+            
+            # log
+            if log.isEnabledFor(logging.DEBUG):
+                output     = []
+                output    += ['\nreceivedFrame:']
+                output    += self._formatFrame({
+                    'payload': frame[:-self._FCS_LENGTH],
+                    'fcs':     frame[-self._FCS_LENGTH:],
+                    'valid':   isValid,
+                })
+                log.debug('\n'.join(output))
+            
+            # callback
+            if isValid:
+                del frame[-self._FCS_LENGTH:]
+                self.stats.numRxFrames += 1
+                if self.tap:
+                    self.tap.writeFrame(frame)
+                startTime = time.time()
+                try:
+                    self.rxcallback(frame)
+                except (ConnectionError,CommandError) as err:
+                    output = "@Hdlc: {0}".format(err)
+                    log.error(output)
+                    print output
+                self.stats.rxCallbackTime.add(time.time()-startTime)
+            else:
+                self.stats.numRxCrcErrors += 1
+                log.warning("received hdlc frame with wrong FCS")
+        else:
+            self.stats.numRxShortFrames += 1
+            output = "@Hdlc: received hdlc frame too short"
+            log.error(output)
+            print output
+    
+    def _formatFrame(self,frame):
+        returnVal  = []
+        returnVal += [' - payload: {0}'.format(' '.join(["%.02x"%b for b in frame['payload']]))]
+        returnVal += [' - fcs:     {0}'.format(' '.join(["%.02x"%b for b in frame['fcs']]))]
+        returnVal += [' - valid:   {0}'.format(frame['valid'])]
+        return returnVal
     
\ No newline at end of file
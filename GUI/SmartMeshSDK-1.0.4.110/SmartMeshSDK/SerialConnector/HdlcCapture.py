@@ -0,0 +1,256 @@
+#!/usr/bin/python
+
+'''
+Capture and replay of what Hdlc receives.
+
+A capture file starts with the 8-byte MAGIC string, followed by records.
+Each record is a 13-byte header, then the record's data:
+
+<table>
+    <tr><th>field    </th><th>format        </th><th>meaning</th>
+    <tr><td>type     </td><td>uint8         </td><td>RECORD_RAW or RECORD_FRAME</td>
+    <tr><td>timestamp</td><td>uint64, big-endian</td><td>reception time, in microseconds since the epoch</td>
+    <tr><td>length   </td><td>uint32, big-endian</td><td>number of bytes of data</td>
+</table>
+
+RECORD_RAW records hold the bytes as read from the serial port (HDLC flags,
+escape characters and FCS included). RECORD_FRAME records hold the frames
+passed to the rxcallback of Hdlc (unescaped, valid FCS stripped).
+
+Captures are written by a CaptureWriter attached to Hdlc as its tap (see
+the 'captureFile' connection parameter of SerialConnector), and replayed
+into a serial connector by Replay.
+'''
+
+import struct
+import threading
+import time
+
+import Hdlc
+
+from SmartMeshSDK.ApiException import ConnectionError, \
+                                      CommandError
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('HdlcCapture')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+MAGIC          = 'HDLCCAP\x01'           # file header, the last byte is the version
+RECORD_RAW     = 0                       # bytes read from the serial port
+RECORD_FRAME   = 1                       # frame passed to rxcallback
+RECORD_HEADER  = struct.Struct('>BQI')   # type, timestamp (us), length
+
+class CaptureWriter(object):
+    '''
+    \brief Writes a capture file.
+    
+    Thread-safe; meant to be used as the tap of an Hdlc object.
+    '''
+    
+    def __init__(self,fileName,captureRaw=True,captureFrames=True):
+        '''
+        \param fileName      The name of the capture file, overwritten.
+        \param captureRaw    Whether to record the bytes read from the port.
+        \param captureFrames Whether to record the frames received.
+        '''
+        
+        # store params
+        self.fileName        = fileName
+        self.captureRaw      = captureRaw
+        self.captureFrames   = captureFrames
+        
+        # local variables
+        self.dataLock        = threading.Lock()
+        self.captureFile     = open(fileName,'wb')
+        self.captureFile.write(MAGIC)
+    
+    #======================== public ==========================================
+    
+    def writeRaw(self,rxBytes,timestamp=None):
+        '''
+        \brief Record bytes read from the serial port, a string.
+        '''
+        if self.captureRaw:
+            self._write(RECORD_RAW,rxBytes,timestamp)
+    
+    def writeFrame(self,frame,timestamp=None):
+        '''
+        \brief Record a received frame, a bytearray or list of ints.
+        '''
+        if self.captureFrames:
+            self._write(RECORD_FRAME,frame,timestamp)
+    
+    def close(self):
+        with self.dataLock:
+            if self.captureFile:
+                self.captureFile.close()
+            self.captureFile = None
+    
+    #======================== private =========================================
+    
+    def _write(self,recordType,data,timestamp):
+        if timestamp is None:
+            timestamp = time.time()
+        data = str(bytearray(data))
+        with self.dataLock:
+            if not self.captureFile:
+                return
+            self.captureFile.write(RECORD_HEADER.pack(recordType,
+                                                      int(timestamp*1000000),
+                                                      len(data)))
+            self.captureFile.write(data)
+
+def readCapture(fileName):
+    '''
+    \brief Iterate over the records of a capture file.
+    
+    \returns A generator of (type,timestamp,data) tuples, with timestamp
+             in seconds and data a string.
+    '''
+    with open(fileName,'rb') as captureFile:
+        if captureFile.read(len(MAGIC))!=MAGIC:
+            raise ValueError("{0} is not an HDLC capture file".format(fileName))
+        while True:
+            header = captureFile.read(RECORD_HEADER.size)
+            if not header:
+                return
+            if len(header)<RECORD_HEADER.size:
+                log.warning("{0} truncated".format(fileName))
+                return
+            (recordType,timestamp,length) = RECORD_HEADER.unpack(header)
+            data   = captureFile.read(length)
+            if len(data)<length:
+                log.warning("{0} truncated".format(fileName))
+                return
+            yield (recordType,timestamp/1000000.0,data)
+
+class _NullPort(object):
+    '''
+    \brief Stands in for the serial port of a replayed connector; what the
+           connector sends (e.g. ACKs) is discarded.
+    '''
+    
+    def write(self,data):
+        return len(data)
+    
+    def close(self):
+        pass
+
+class Replay(object):
+    '''
+    \brief Feeds a capture into a serial connector, as if received from the
+           serial port.
+    
+    The connector does not need to be connected: it is given an Hdlc object
+    writing to nowhere. Its notifications end up in its notification queue,
+    as usual; they should be consumed while replaying, or the queue
+    overflows.
+    '''
+    
+    def __init__(self,connector,fileName,useRaw=False):
+        '''
+        \param connector A SerialConnector (e.g. IpMoteConnector), not connected.
+        \param fileName  The name of the capture file.
+        \param useRaw    If True, replay the RECORD_RAW records through the
+                         deframer; otherwise, the RECORD_FRAME records are
+                         passed directly to the connector's _hdlcRxCb().
+        '''
+        
+        # store params
+        self.connector       = connector
+        self.fileName        = fileName
+        self.useRaw          = useRaw
+        
+        # local variables
+        self.recordType      = RECORD_RAW if useRaw else RECORD_FRAME
+        self.records         = [(t,d) for (r,t,d) in readCapture(fileName) if r==self.recordType]
+    
+    #======================== public ==========================================
+    
+    def run(self,speed=1.0):
+        '''
+        \brief Replay the capture.
+        
+        \param speed 1.0 for original speed, N for N times faster, None (or 0)
+                     for as fast as possible.
+        
+        \returns A dictionary with the replay statistics:
+                 - 'numRecords', 'numBytes': records and bytes replayed
+                 - 'numErrors': records the connector raised an error on
+                 - 'duration': replay duration, in seconds
+                 - 'recordsPerSec', 'bytesPerSec': throughput
+                 - 'minLatency', 'avgLatency', 'maxLatency', 'p99Latency':
+                   time between the moment a record was due and the moment
+                   the connector was done with it, in seconds
+        '''
+        
+        # give the connector somewhere to send to, until the replay is done
+        oldHdlc                   = self.connector.hdlc
+        oldIsConnected            = self.connector.isConnected
+        hdlc                      = Hdlc.Hdlc(self.connector._hdlcRxCb,None,bulkRx=True)
+        hdlc.pyserialHandler      = _NullPort()
+        hdlc.connected            = True
+        self.connector.hdlc       = hdlc
+        self.connector.isConnected= True
+        
+        if self.useRaw:
+            deliver   = hdlc.receive
+        else:
+            deliver   = lambda data: self.connector._hdlcRxCb(bytearray(data))
+        
+        latencies     = []
+        numBytes      = 0
+        numErrors     = 0
+        
+        try:
+            startTime     = time.time()
+            if self.records:
+                firstTs   = self.records[0][0]
+            for (timestamp,data) in self.records:
+            
+                # wait until the record is due
+                if speed:
+                    dueTime = startTime+(timestamp-firstTs)/speed
+                    delay   = dueTime-time.time()
+                    if delay>0:
+                        time.sleep(delay)
+                else:
+                    dueTime = time.time()
+                
+                try:
+                    deliver(data)
+                except (ConnectionError,CommandError) as err:
+                    log.warning("error replaying record: {0}".format(err))
+                    numErrors += 1
+                
+                latencies.append(time.time()-dueTime)
+                numBytes += len(data)
+        finally:
+            self.connector.hdlc        = oldHdlc
+            self.connector.isConnected = oldIsConnected
+        duration      = max(time.time()-startTime,1e-6)
+        
+        # statistics
+        latencies.sort()
+        returnVal = {
+            'numRecords':      len(latencies),
+            'numBytes':        numBytes,
+            'numErrors':       numErrors,
+            'duration':        duration,
+            'recordsPerSec':   len(latencies)/duration,
+            'bytesPerSec':     numBytes/duration,
+            'minLatency':      None,
+            'avgLatency':      None,
+            'maxLatency':      None,
+            'p99Latency':      None,
+        }
+        if latencies:
+            returnVal['minLatency'] = latencies[0]
+            returnVal['avgLatency'] = sum(latencies)/len(latencies)
+            returnVal['maxLatency'] = latencies[-1]
+            returnVal['p99Latency'] = latencies[int(0.99*(len(latencies)-1))]
+        return returnVal
@@ -0,0 +1,137 @@
+#!/usr/bin/python
+
+'''
+Counters and histograms of a serial link.
+
+Each counter and histogram is only ever updated by a single thread (the
+HDLC thread for what is received, the thread holding the send lock for
+what is sent), so they are updated without locking. Readers get a
+snapshot which may be off by the frame being processed.
+'''
+
+import bisect
+
+# upper bounds of the histogram buckets, in seconds
+DEFAULT_BOUNDS = [
+    0.00001, 0.00002, 0.00005,
+    0.0001,  0.0002,  0.0005,
+    0.001,   0.002,   0.005,
+    0.01,    0.02,    0.05,
+    0.1,     0.2,     0.5,
+    1.0,     2.0,     5.0,
+]
+
+class Histogram(object):
+    '''
+    \brief Histogram of durations, with fixed buckets.
+    '''
+    
+    def __init__(self,bounds=DEFAULT_BOUNDS):
+        '''
+        \param bounds The upper bounds of the buckets, sorted. Values larger
+                      than the last bound go in an extra bucket.
+        '''
+        
+        # store params
+        self.bounds          = list(bounds)
+        
+        # local variables
+        self.counts          = [0]*(len(self.bounds)+1)
+        self.count           = 0
+        self.total           = 0.0
+        self.min             = None
+        self.max             = None
+    
+    #======================== public ==========================================
+    
+    def add(self,value):
+        self.counts[bisect.bisect_left(self.bounds,value)] += 1
+        self.count          += 1
+        self.total          += value
+        if self.min is None or value<self.min:
+            self.min         = value
+        if self.max is None or value>self.max:
+            self.max         = value
+    
+    def getStats(self):
+        '''
+        \brief Returns the histogram, as a dictionary.
+        
+        'counts'[i] is the number of values up to 'bounds'[i] (and larger
+        than 'bounds'[i-1]); the last element of 'counts' is the number of
+        values larger than the last bound.
+        '''
+        returnVal = {
+            'bounds':        list(self.bounds),
+            'counts':        list(self.counts),
+            'count':         self.count,
+            'min':           self.min,
+            'max':           self.max,
+            'avg':           None,
+        }
+        if self.count:
+            returnVal['avg'] = self.total/self.count
+        return returnVal
+
+class LinkStats(object):
+    '''
+    \brief Counters and histograms of a serial link, filled in by Hdlc and
+           SerialConnector.
+    '''
+    
+    def __init__(self):
+        self.reset()
+    
+    #======================== public ==========================================
+    
+    def reset(self):
+        '''
+        \brief Reset all counters and histograms.
+        
+        Updates happening at the same time may be lost.
+        '''
+        
+        # received
+        self.numRxBytes      = 0              ##< bytes read from the serial port
+        self.numRxFrames     = 0              ##< frames with a valid FCS
+        self.numRxEscapes    = 0              ##< HDLC escape characters received
+        self.numRxCrcErrors  = 0              ##< frames dropped because of a wrong FCS
+        self.numRxShortFrames= 0              ##< frames dropped because too short
+        self.numRxStaleResponses = 0          ##< responses dropped because not answering the request outstanding
+        self.rxCallbackTime  = Histogram()    ##< time spent in Hdlc's rxcallback, per frame
+        
+        # sent
+        self.numTxBytes      = 0              ##< bytes written to the serial port
+        self.numTxFrames     = 0              ##< frames sent
+        self.numTxEscapes    = 0              ##< HDLC escape characters sent
+        
+        # requests
+        self.responseTime    = Histogram()    ##< time from sending a request to receiving its response, retries included
+    
+    def getStats(self):
+        '''
+        \brief Returns a snapshot of the counters and histograms, as a dictionary.
+        
+        'rxEscapeOverhead' and 'txEscapeOverhead' are the fraction of the
+        bytes on the wire which are HDLC escape characters.
+        '''
+        returnVal = {
+            'numRxBytes':        self.numRxBytes,
+            'numRxFrames':       self.numRxFrames,
+            'numRxEscapes':      self.numRxEscapes,
+            'numRxCrcErrors':    self.numRxCrcErrors,
+            'numRxShortFrames':  self.numRxShortFrames,
+            'numRxStaleResponses': self.numRxStaleResponses,
+            'numTxBytes':        self.numTxBytes,
+            'numTxFrames':       self.numTxFrames,
+            'numTxEscapes':      self.numTxEscapes,
+            'rxEscapeOverhead':  None,
+            'txEscapeOverhead':  None,
+            'rxCallbackTime':    self.rxCallbackTime.getStats(),
+            'responseTime':      self.responseTime.getStats(),
+        }
+        if returnVal['numRxBytes']:
+            returnVal['rxEscapeOverhead'] = float(returnVal['numRxEscapes'])/returnVal['numRxBytes']
+        if returnVal['numTxBytes']:
+            returnVal['txEscapeOverhead'] = float(returnVal['numTxEscapes'])/returnVal['numTxBytes']
+        return returnVal
@@ -0,0 +1,260 @@
+#!/usr/bin/python
+
+'''
+Request queue for serial connectors.
+
+The serial API allows a single request to be outstanding (the packetId of
+a request is a single bit), so requests cannot overlap on the wire. The
+RequestPipeline takes requests from any number of callers without blocking
+them, and hands them back-to-back to the connector from a single thread,
+so the next request goes out as soon as the previous one is acknowledged.
+The outcome of each request is returned to its caller as a RequestFuture.
+'''
+
+import threading
+import Queue
+
+from SmartMeshSDK.ApiException import ConnectionError, \
+                                      CommandTimeoutError
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('RequestPipeline')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+class RequestFuture(object):
+    '''
+    \brief The eventual outcome of a request sent through a serial connector.
+    '''
+    
+    def __init__(self,commandArray):
+    
+        # store params
+        self.commandArray    = commandArray
+        
+        # local variables
+        self.doneEvent       = threading.Event()  ##< set when the outcome is known
+        self.dataLock        = threading.Lock()   ##< lock to ensure atomic access to the outcome
+        self.response        = None               ##< response fields, if the request succeeded
+        self.error           = None               ##< exception raised, if the request failed
+        self.callbacks       = []                 ##< functions to call when done
+    
+    #======================== public ==========================================
+    
+    def done(self):
+        '''
+        \brief Returns True iff the outcome of the request is known.
+        '''
+        return self.doneEvent.isSet()
+    
+    def result(self,timeout=None):
+        '''
+        \brief Wait for the request to complete and return its response.
+        
+        \param timeout Number of seconds to wait, None to wait forever.
+        
+        \exception CommandTimeoutError the request did not complete in time.
+        \exception Any exception raised when sending the request (ConnectionError,
+                   APIError, CommandError).
+        \returns The dictionary of response fields.
+        '''
+        error = self.exception(timeout)
+        if error:
+            raise error
+        return self.response
+    
+    def exception(self,timeout=None):
+        '''
+        \brief Wait for the request to complete and return its exception.
+        
+        \param timeout Number of seconds to wait, None to wait forever.
+        
+        \exception CommandTimeoutError the request did not complete in time.
+        \returns The exception raised by the request, None if it succeeded.
+        '''
+        if not self.doneEvent.wait(timeout):
+            raise CommandTimeoutError(self.commandArray)
+        return self.error
+    
+    def addDoneCallback(self,callback):
+        '''
+        \brief Call a function when the request completes.
+        
+        The function is called with this RequestFuture as only parameter,
+        right away if the request has already completed, otherwise from the
+        thread sending the requests. It should therefore not block.
+        '''
+        with self.dataLock:
+            if not self.done():
+                self.callbacks.append(callback)
+                return
+        self._callCallback(callback)
+    
+    #======================== private =========================================
+    
+    def _setResponse(self,response):
+        with self.dataLock:
+            self.response    = response
+            callbacks        = self._setDone()
+        for callback in callbacks:
+            self._callCallback(callback)
+    
+    def _setError(self,error):
+        with self.dataLock:
+            self.error       = error
+            callbacks        = self._setDone()
+        for callback in callbacks:
+            self._callCallback(callback)
+    
+    def _setDone(self):
+        # called with dataLock held, returns the callbacks to call
+        self.doneEvent.set()
+        callbacks            = self.callbacks
+        self.callbacks       = []
+        return callbacks
+    
+    def _callCallback(self,callback):
+        try:
+            callback(self)
+        except Exception as err:
+            log.error("done callback for {0} raised {1}".format(self.commandArray,err))
+
+class RequestPipeline(threading.Thread):
+    '''
+    \brief Thread sending queued requests one after the other.
+    '''
+    
+    def __init__(self,sendFunc,maxPending):
+        '''
+        \param sendFunc   Function sending a serialized request and waiting
+                          for its response, called as sendFunc(cmdId,serializedFields).
+        \param maxPending Maximum number of requests waiting to be sent; submit()
+                          blocks when that many are queued.
+        '''
+        
+        # log
+        log.info("creating object")
+        
+        # store params
+        self.sendFunc        = sendFunc
+        self.maxPending      = maxPending
+        
+        # initialize parent class
+        threading.Thread.__init__(self)
+        self.name            = 'RequestPipeline'
+        self.daemon          = True
+        
+        # local variables
+        self.requestQueue    = Queue.Queue(maxPending)
+        self.dataLock        = threading.Lock()
+        self.goOn            = True
+        self.closeReason     = ''
+    
+    def run(self):
+    
+        # log
+        log.info("thread started")
+        
+        while True:
+            request = self.requestQueue.get()
+            if request is None:
+                break
+            
+            (future,cmdId,serializedFields) = request
+            
+            if not self.goOn:
+                future._setError(ConnectionError(self.closeReason))
+                if self.requestQueue.empty():
+                    # close() found the queue full and queued no wake-up
+                    break
+                continue
+            
+            try:
+                response = self.sendFunc(cmdId,serializedFields)
+            except Exception as err:
+                future._setError(err)
+            else:
+                future._setResponse(response)
+        
+        # log
+        log.info("thread ended")
+    
+    #======================== public ==========================================
+    
+    def submit(self,commandArray,cmdId,serializedFields):
+        '''
+        \brief Queue a serialized request.
+        
+        \exception ConnectionError the pipeline is closed.
+        \returns A RequestFuture for the request.
+        '''
+        with self.dataLock:
+            if not self.goOn:
+                raise ConnectionError(self.closeReason)
+        
+        future = RequestFuture(commandArray)
+        self.requestQueue.put((future,cmdId,serializedFields))
+        
+        # the pipeline might have been closed while queueing
+        with self.dataLock:
+            closed = not self.goOn
+        if closed:
+            self._failPending()
+        
+        return future
+    
+    def isPipelineThread(self):
+        '''
+        \brief Returns True iff called from the thread sending the requests.
+        '''
+        return threading.current_thread() is self
+    
+    def getNumPending(self):
+        '''
+        \brief Returns the number of requests waiting to be sent.
+        '''
+        return self.requestQueue.qsize()
+    
+    def close(self,reason=""):
+        '''
+        \brief Stop the thread. Requests still queued fail with a ConnectionError.
+        
+        Does not block, so it can be called with the connector's locks held.
+        '''
+        with self.dataLock:
+            if not self.goOn:
+                return
+            self.goOn        = False
+            self.closeReason = reason
+        
+        # fail what is still queued, then wake up the thread
+        self._failPending()
+        self._wakeUp()
+    
+    #======================== private =========================================
+    
+    def _failPending(self):
+        wakeUp = False
+        while True:
+            try:
+                request = self.requestQueue.get_nowait()
+            except Queue.Empty:
+                break
+            if request is None:
+                wakeUp = True
+                continue
+            (future,cmdId,serializedFields) = request
+            future._setError(ConnectionError(self.closeReason))
+        if wakeUp:
+            self._wakeUp()
+    
+    def _wakeUp(self):
+        try:
+            self.requestQueue.put_nowait(None)
+        except Queue.Full:
+            # callers blocked in submit() filled the queue again; the thread
+            # wakes up on their requests, fails them and stops
+            pass
@@ -0,0 +1,158 @@
+#!/usr/bin/python
+
+'''
+Round-trip time estimator for serial connectors.
+
+Computes the retransmission timeout from the smoothed round-trip time
+(SRTT) and its variation (RTTVAR), as TCP does (RFC 6298):
+
+    RTTVAR  = (1-BETA)*RTTVAR + BETA*|SRTT-RTT|
+    SRTT    = (1-ALPHA)*SRTT  + ALPHA*RTT
+    timeout = SRTT + K*RTTVAR, bounded by [minTimeout,maxTimeout]
+
+The timeout doubles (up to maxTimeout) each time a request is
+retransmitted, and round-trip times are only sampled on requests which
+were not retransmitted (Karn's algorithm). Until minSamples round-trip
+times were measured, the timeout does not go below initialTimeout: the
+first samples say little of how long the slower commands take.
+'''
+
+import threading
+
+ALPHA       = 1.0/8 # gain of the SRTT filter
+BETA        = 1.0/4 # gain of the RTTVAR filter
+K           = 4     # number of RTTVAR in the timeout
+MIN_SAMPLES = 16    # RTTs measured before the timeout goes below initialTimeout
+
+class RttEstimator(object):
+    '''
+    \brief Estimates the round-trip time of a serial link, and the
+           resulting time to wait for a response.
+    '''
+    
+    def __init__(self,initialTimeout,minTimeout,maxTimeout,minSamples=MIN_SAMPLES):
+        '''
+        \param initialTimeout Timeout used until a first RTT is measured, in
+                              seconds, and floor of the timeout until
+                              minSamples RTTs are.
+        \param minTimeout     Floor of the timeout, in seconds.
+        \param maxTimeout     Ceiling of the timeout, in seconds.
+        \param minSamples     Number of RTTs measured before the timeout may
+                              go below initialTimeout.
+        '''
+        
+        if minTimeout>maxTimeout:
+            raise ValueError("minTimeout={0} larger than maxTimeout={1}".format(minTimeout,maxTimeout))
+        
+        # store params
+        self.initialTimeout  = initialTimeout
+        self.minTimeout      = minTimeout
+        self.maxTimeout      = maxTimeout
+        self.minSamples      = minSamples
+        
+        # local variables
+        self.dataLock        = threading.Lock()
+        self.srtt            = None
+        self.rttvar          = None
+        self.numSamples      = 0                      # RTTs measured, not reset with the stats
+        self.timeout         = self._bound(initialTimeout)
+        self.stats           = {}
+        
+        # initialize stats
+        self._resetStats()
+    
+    #======================== public ==========================================
+    
+    def getTimeout(self):
+        '''
+        \brief Returns the time to wait for a response, in seconds.
+        '''
+        return self.timeout
+    
+    def addRequest(self):
+        '''
+        \brief Account for a new request (not a retransmission).
+        '''
+        with self.dataLock:
+            self.stats['numRequests']      += 1
+    
+    def addSample(self,rtt):
+        '''
+        \brief Update the estimate with the round-trip time of a request
+               answered without being retransmitted.
+        
+        \param rtt The round-trip time, in seconds.
+        '''
+        with self.dataLock:
+            self.numSamples      += 1
+            if self.srtt is None:
+                self.srtt         = rtt
+                self.rttvar       = rtt/2.0
+            else:
+                self.rttvar       = (1-BETA)*self.rttvar + BETA*abs(self.srtt-rtt)
+                self.srtt         = (1-ALPHA)*self.srtt  + ALPHA*rtt
+            self.timeout          = self._bound(self.srtt+K*self.rttvar)
+            
+            self.stats['numRttSamples']    += 1
+            self.stats['lastRtt']           = rtt
+            if self.stats['minRtt'] is None or rtt<self.stats['minRtt']:
+                self.stats['minRtt']        = rtt
+            if self.stats['maxRtt'] is None or rtt>self.stats['maxRtt']:
+                self.stats['maxRtt']        = rtt
+    
+    def backoff(self):
+        '''
+        \brief Account for a request being retransmitted, doubling the timeout.
+        '''
+        with self.dataLock:
+            self.timeout          = self._bound(2*self.timeout)
+            self.stats['numRetries']       += 1
+    
+    def addFailure(self):
+        '''
+        \brief Account for a request abandoned after the maximum number of retries.
+        '''
+        with self.dataLock:
+            self.stats['numFailures']      += 1
+    
+    def getStats(self):
+        '''
+        \brief Returns the RTT estimate and retry statistics, as a dictionary.
+        
+        Times are in seconds; 'srtt', 'rttvar' and the RTT statistics are
+        None until a first round-trip time is measured.
+        '''
+        with self.dataLock:
+            returnVal = dict(self.stats)
+            returnVal['srtt']               = self.srtt
+            returnVal['rttvar']             = self.rttvar
+            returnVal['timeout']            = self.timeout
+            returnVal['minTimeout']         = self.minTimeout
+            returnVal['maxTimeout']         = self.maxTimeout
+        return returnVal
+    
+    def resetStats(self):
+        '''
+        \brief Reset the statistics, keeping the RTT estimate.
+        '''
+        with self.dataLock:
+            self._resetStats()
+    
+    #======================== private =========================================
+    
+    def _bound(self,timeout):
+        minTimeout = self.minTimeout
+        if self.numSamples<self.minSamples:
+            minTimeout = max(minTimeout,self.initialTimeout)
+        return min(max(timeout,minTimeout),self.maxTimeout)
+    
+    def _resetStats(self):
+        self.stats = {
+            'numRequests':     0,
+            'numRetries':      0,
+            'numFailures':     0,
+            'numRttSamples':   0,
+            'lastRtt':         None,
+            'minRtt':          None,
+            'maxRtt':          None,
+        }
@@ -1,349 +1,639 @@
-import sys
-import os
-
-sys.path.insert(0, os.path.join(sys.path[0], '..'))
-
-import threading
-import socket
-import select
-import time
-
-import Hdlc
-
-from   SmartMeshSDK.ApiException  import ConnectionError, \
-                                         APIError,        \
-                                         CommandError
-from   SmartMeshSDK.ApiConnector  import ApiConnector
-from   SmartMeshSDK.ApiDefinition import ApiDefinition
-
-import logging
-class NullHandler(logging.Handler):
-    def emit(self, record):
-        pass
-log = logging.getLogger('SerialConnector')
-log.setLevel(logging.ERROR)
-log.addHandler(NullHandler())
-
-MAX_NUM_RETRY = 5
-RX_TIMEOUT    = 0.500 # in seconds
-
-class SerialConnector(ApiConnector):
-    '''
-    \ingroup ApiConnector
-    
-    \brief The generic serial connector.
-    This class is meant to be inherited by connector using a serial link.
-    '''
-    
-    def __init__(self, api_def, maxQSize=100) :
-        
-        # log
-        log.info("creating object")
-        
-        # store params
-        self.api_def         = api_def
-        
-        # initialize parent class
-        ApiConnector.__init__(self, maxQSize)
-        
-        # local variables
-        self.waitForResp     = False                  ##< flag to indicate whether we are waiting for an ACK
-        self.waitForRespEvent  = threading.Event()    ##< semaphore used when waiting for a command to be acknowledged
-        self.paramLock       = threading.Lock()       ##< lock to ensure atomic access to parameters
-        self.RxPacketId      = None                   ##< running id for packets received from device
-        self.TxPacketId      = 0                      ##< running id for packets sent to device
-        self.hdlcLock        = threading.Lock()       ##< lock for the HDLC module
-        self.hdlc            = None                   ##< HDLC module (includes CRC)
-        self.syncNeeded      = True                   ##< True iff we need to sync to the device
-        self.requestSendLock = threading.Lock()       ##< lock to prevent concurrent requests to be sent
-        self.tsDataSent      = 0                      ##< timestamp when sent data
-        self.tsDataReceived  = 0                      ##< timestamp when received data
-        
-    #======================== public ==========================================
-    
-    def connect(self, connectParams):
-        if 'port' not in connectParams:
-            output = "'port' entry required in connection parameters"
-            log.error(output)
-            raise ValueError(output)
-        
-        with self.hdlcLock:
-            # create and start HDLC module (includes CRC)
-            self.hdlc            = Hdlc.Hdlc(self._hdlcRxCb,
-                                             self._hdlcConnectCb)
-            # connect HDLC module to serial Port
-            if 'baudrate' in connectParams:
-                self.hdlc.connect(connectParams['port'],baudrate=connectParams['baudrate'])
-            else:
-                self.hdlc.connect(connectParams['port'])
-            # connect the parent class
-            ApiConnector.connect(self)
-    
-    def disconnect(self, reason=""):
-        with self.hdlcLock:
-            # disconnect the parent class
-            ApiConnector.disconnect(self, reason)
-            # disconnect hdlc module
-            if self.hdlc:
-                self.hdlc.disconnect()
-            # delete the hdlc module
-            self.hdlc = None
-    
-    def send(self,commandArray,fields):
-        if not self.isConnected:
-            output = "not connected"
-            log.error(output)
-            raise ConnectionError(output)
-        
-        # serialize the fields
-        cmdId, serializedFields = self.api_def.serialize(commandArray,fields)
-        
-        return self._sendInternal(cmdId,False,serializedFields)
-
-    #======================== virtual methods =================================
-
-    def isValidPacketId(self, cmdId, isResponse, packetId):
-        '''
-        \brief Return whether a received packet is in sequence
-        '''
-        raise NotImplementedError() # to be implemented by child class
-
-    def _buildTxHeader(self, cmdId, isResponse, serializedFields):
-        '''
-        \brief Build the header for a TX packet.
-        '''
-        raise NotImplementedError() # to be implemented by child class
-
-    def _ackIfNeeded(self,cmdId,isResponse):
-        '''
-        \brief Send an ACK if needed.
-        '''
-        raise NotImplementedError() # to be implemented by child class
-
-    def isHelloResponse(self, cmdId):
-        return False
-    
-    #======================== private =========================================
-    
-    def _sendInternal(self,cmdId,isResponse,serializedFields):
-        
-        try:
-            if not isResponse:
-                self.requestSendLock.acquire()
-        
-            # build packet to send
-            packet  = []
-            packet += self._buildTxHeader(cmdId,isResponse,serializedFields)
-            packet += serializedFields
-
-            retry = 0
-            
-            # Prepare for reliable send
-            if not isResponse:
-                self.waitForResp = True
-                self.waitForRespEvent.clear()
-                
-            while True :
-                if log.isEnabledFor(logging.DEBUG):
-                    log.debug("_sendInternal cmdId={0} retry={1} isResponse={2} serializedFields={3}".format(
-                            cmdId,
-                            retry,
-                            isResponse,
-                            serializedFields
-                        )
-                    )
-                
-                if not isResponse:
-                    if log.isEnabledFor(logging.DEBUG):
-                        log.debug("---------- pcToMote DATA ({0}) ---------->".format(self.TxPacketId))
-                        self.tsDataSent = time.time()
-                
-                # send packet through HDLC module
-                with self.hdlcLock:
-                    if not self.hdlc:
-                        output = "no HDLC module, did I just disconnect?"
-                        log.error(output)
-                        raise ConnectionError(output)
-                    self.hdlc.send(packet)
-                
-                if isResponse:
-                    return None
-                
-                # wait for response. semaphore released by _hdlcRxCb()
-                if self.waitForRespEvent.wait(RX_TIMEOUT) :
-                    break
-                
-                log.info("retry {0}".format(retry))
-                
-                # Timeout error
-                if retry >= MAX_NUM_RETRY :
-                    output = "retried {0} times, max allowed is {1}".format(retry,MAX_NUM_RETRY)
-                    log.error(output)
-                    raise ConnectionError(output)
-                retry = retry + 1
-                    
-            if isinstance(self.responseBuf,Exception):
-                log.error("responseBuf contains exception {0}".format(self.responseBuf))
-                raise self.responseBuf
-            
-            if  (
-                    (ApiDefinition.ApiDefinition.RC in self.responseBuf) and
-                    (
-                        self.responseBuf[ApiDefinition.ApiDefinition.RC]!= \
-                            ApiDefinition.ApiDefinition.RC_OK
-                    )
-                ):
-                temp_name = self.api_def.idToName(
-                                    ApiDefinition.ApiDefinition.COMMAND,
-                                    cmdId
-                                )
-                temp_rc   = self.responseBuf[ApiDefinition.ApiDefinition.RC]
-                temp_desc = '({0})\n{1}'.format(
-                    self.api_def.fieldValueToDesc(
-                        ApiDefinition.ApiDefinition.COMMAND,
-                        [temp_name],
-                        ApiDefinition.ApiDefinition.RC,
-                        temp_rc
-                    ),
-                    self.api_def.rcToDescription(
-                        temp_rc,
-                        [temp_name],
-                    ),
-                )
-                if temp_rc not in [11,18]: # rc==11:RC_NOT_FOUND, rc==18:RC_END_OF_LIST
-                    log.warning("received RC={0} for command {1}:\n{2}".format(temp_rc,
-                                                                               temp_name,
-                                                                               temp_desc))
-                raise APIError(temp_name,temp_rc,temp_desc)
-            
-            # return packet received
-            return self.responseBuf
-        
-        finally:
-            if not isResponse:
-                self.requestSendLock.release()
-    
-    def _resetPacketIds(self):
-        self.TxPacketId=0
-        self.RxPacketId=0
-        self.syncNeeded=True
-    
-    #======================== HDLC callbacks ==================================
-    
-    def _hdlcConnectCb(self,state):
-        '''
-        \brief called by HDLC when the connected state has changed.
-       
-        \param state True when the HDLC module is connected to a device,
-                     False otherwise
-        '''
-        log.info("hdlc notification: connection state="+str(state))
-        if state==False:
-            # we got disconnected
-            self.disconnect("HDLC disconnected")
-    
-    def _hdlcRxCb(self,frameRx):
-        '''
-        \brief called by HDLC when it's done receiving a complete frame.
-        
-        \note The frame received does not contain any of the HDLC-specific
-              flags and espace characters
-       
-        \param frameRx The received frame, represented as a byteArray
-        '''
-        
-        if len(frameRx)<3:
-            output = "received packet too short"
-            log.error(output)
-            raise ConnectionError(output)
-        
-        cmdId,length,isResponse,packetId,payload = self._parseRxHeader(frameRx)
-        
-        # log
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug("cmdId={0} length={1} isResponse={2} packetId={3} payload={4}".format(
-                    cmdId,
-                    length,
-                    isResponse,
-                    packetId,
-                    payload
-                )
-            )
-        
-            if isResponse:
-                log.debug("<--------- pcToMote ACK ({0}) after {1:.3f} --------".format(
-                                packetId,
-                                time.time()-self.tsDataSent)
-                         )
-            else:
-                log.debug("<--------- moteToPc DATA ({0}) ----------".format(packetId))
-                self.tsDataReceived = time.time()
-        
-        # check packetId
-        (wasValidPacketId, isRepeatId, updateRxPacketId) = self.isValidPacketId(cmdId,isResponse,packetId)
-            
-        # update RxPacketId
-        self.paramLock.acquire()
-        if isResponse==False and (not isRepeatId) and updateRxPacketId:
-            self.RxPacketId = packetId
-        self.paramLock.release()
-        
-        # send ACK if necessary
-        try :
-            ackSent = self._ackIfNeeded(cmdId,isResponse)
-        except ConnectionError as ex:
-            log.error("putting disconnect notification {0}".format(ex))
-            self.putDisconnectNotification(str(ex))
-            raise ex
-        
-        # log
-        if log.isEnabledFor(logging.DEBUG):
-            if ackSent:
-                log.debug("---------- moteToPc ACK ({0}) after {1:.3f} ------->".format(
-                                self.RxPacketId,
-                                time.time()-self.tsDataReceived)
-                          )
-                log.debug("ack sent")
-            else:
-                log.debug("no ack needed")
-        
-        if isResponse or self.isHelloResponse(cmdId):
-            
-            # deserialize received packet
-            try:
-                nameArray, fields = self.api_def.deserialize(
-                                        ApiDefinition.ApiDefinition.COMMAND,
-                                        cmdId,
-                                        payload)
-            except Exception as err:
-                self.responseBuf = err
-            else:
-                # put received packet in local response buffer
-                self.responseBuf = fields
-            
-            # release semaphore
-            if self.waitForResp:
-                self.waitForResp = False
-                self.waitForRespEvent.set()
-            else:
-                output = "unexpected response"
-                log.error(output)
-                raise ConnectionError(output)
-            
-        else:
-            if not isRepeatId :
-                
-                # deserialize received packet
-                nameArray, fields = self.api_def.deserialize(
-                                        ApiDefinition.ApiDefinition.NOTIFICATION,
-                                        cmdId,
-                                        payload)
-                
-                # put received packet in notification buffer
-                self.putNotification((nameArray, fields))
-        
-        # raise error if packet id is wrong
-        if not wasValidPacketId:
-            output = "wrong packetId"
-            log.error(output)
-            raise ConnectionError(output)
+import sys
+import os
+
+sys.path.insert(0, os.path.join(sys.path[0], '..'))
+
+import threading
+import socket
+import select
+import time
+
+import Hdlc
+import RequestPipeline
+import RttEstimator
+import HdlcCapture
+import LinkStats
+
+from   SmartMeshSDK.ApiException  import ConnectionError, \
+                                         APIError,        \
+                                         CommandError
+from   SmartMeshSDK.ApiConnector  import ApiConnector
+from   SmartMeshSDK.ApiDefinition import ApiDefinition
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('SerialConnector')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+MAX_NUM_RETRY  = 5
+RX_TIMEOUT     = 0.500 # in seconds, before the first round-trip time is measured
+MIN_RX_TIMEOUT = 0.050 # in seconds, default floor of the adaptive timeout, once enough RTTs are measured
+MAX_RX_TIMEOUT = 0.500 # in seconds, default ceiling of the adaptive timeout
+
+def checkRc(api_def,cmdId,response):
+    '''
+    \brief Raise an APIError if a response carries an RC other than RC_OK.
+    
+    \param api_def  The API definition the command belongs to.
+    \param cmdId    The ID of the command answered.
+    \param response The response fields, as returned by deserialize().
+    '''
+    if  (
+            (ApiDefinition.ApiDefinition.RC in response) and
+            (
+                response[ApiDefinition.ApiDefinition.RC]!= \
+                    ApiDefinition.ApiDefinition.RC_OK
+            )
+        ):
+        temp_name = api_def.idToName(
+                            ApiDefinition.ApiDefinition.COMMAND,
+                            cmdId
+                        )
+        temp_rc   = response[ApiDefinition.ApiDefinition.RC]
+        temp_desc = '({0})\n{1}'.format(
+            api_def.fieldValueToDesc(
+                ApiDefinition.ApiDefinition.COMMAND,
+                [temp_name],
+                ApiDefinition.ApiDefinition.RC,
+                temp_rc
+            ),
+            api_def.rcToDescription(
+                temp_rc,
+                [temp_name],
+            ),
+        )
+        if temp_rc not in [11,18]: # rc==11:RC_NOT_FOUND, rc==18:RC_END_OF_LIST
+            log.warning("received RC={0} for command {1}:\n{2}".format(temp_rc,
+                                                                       temp_name,
+                                                                       temp_desc))
+        raise APIError(temp_name,temp_rc,temp_desc)
+
+class SerialConnector(ApiConnector):
+    '''
+    \ingroup ApiConnector
+    
+    \brief The generic serial connector.
+    This class is meant to be inherited by connector using a serial link.
+    '''
+    
+    RESPONSE_HEX_TYPE = list    # type of the HEXDATA fields of the responses
+    
+    def __init__(self, api_def, maxQSize=100) :
+        
+        # log
+        log.info("creating object")
+        
+        # store params
+        self.api_def         = api_def
+        
+        # initialize parent class
+        ApiConnector.__init__(self, maxQSize)
+        
+        # local variables
+        self.waitForResp     = False                  ##< flag to indicate whether we are waiting for an ACK
+        self.waitForRespEvent  = threading.Event()    ##< semaphore used when waiting for a command to be acknowledged
+        self.paramLock       = threading.Lock()       ##< lock to ensure atomic access to parameters
+        self.RxPacketId      = None                   ##< running id for packets received from device
+        self.TxPacketId      = 0                      ##< running id for packets sent to device
+        self.hdlcLock        = threading.Lock()       ##< lock for the HDLC module
+        self.hdlc            = None                   ##< HDLC module (includes CRC)
+        self.syncNeeded      = True                   ##< True iff we need to sync to the device
+        self.requestSendLock = threading.Lock()       ##< lock to prevent concurrent requests to be sent
+        self.tsDataSent      = 0                      ##< timestamp when sent data
+        self.tsDataReceived  = 0                      ##< timestamp when received data
+        self.tsRespReceived  = 0                      ##< timestamp when received the last response
+        self.rttEstimator    = RttEstimator.RttEstimator(RX_TIMEOUT,
+                                                         MIN_RX_TIMEOUT,
+                                                         MAX_RX_TIMEOUT) ##< adaptive time to wait for a response
+        self.requestPipeline = None                   ##< thread sending queued requests, if any
+        self.captureWriter   = None                   ##< records what HDLC receives, if any
+        self.linkStats       = LinkStats.LinkStats()  ##< counters and histograms of the serial link
+        self.responseCmdId   = None                   ##< command ID of the request sent with a response parser
+        self.responseParser  = None                   ##< response parser of that request, if any
+        self.notifFilter     = None                   ##< decides which notifications to deserialize, None for all (see setNotifFilter())
+        self.numFilteredNotifs = 0                    ##< notifications dropped by notifFilter
+        
+    #======================== public ==========================================
+    
+    def connect(self, connectParams):
+        if 'port' not in connectParams:
+            output = "'port' entry required in connection parameters"
+            log.error(output)
+            raise ValueError(output)
+        
+        # optionally, deframe whole chunks of bytes rather than byte per byte
+        bulkRx = False
+        if 'bulkRx' in connectParams:
+            bulkRx = connectParams['bulkRx']
+        
+        # bounds of the adaptive time to wait for a response
+        minRxTimeout = MIN_RX_TIMEOUT
+        maxRxTimeout = MAX_RX_TIMEOUT
+        if 'minRxTimeout' in connectParams:
+            minRxTimeout = connectParams['minRxTimeout']
+        if 'maxRxTimeout' in connectParams:
+            maxRxTimeout = connectParams['maxRxTimeout']
+        self.rttEstimator = RttEstimator.RttEstimator(RX_TIMEOUT,
+                                                      minRxTimeout,
+                                                      maxRxTimeout)
+        
+        # optionally, queue requests and send them from a separate thread
+        maxPendingRequests = 0
+        if 'maxPendingRequests' in connectParams:
+            maxPendingRequests = connectParams['maxPendingRequests']
+        
+        with self.hdlcLock:
+            # create and start HDLC module (includes CRC)
+            self.hdlc            = Hdlc.Hdlc(self._hdlcRxCb,
+                                             self._hdlcConnectCb,
+                                             bulkRx=bulkRx,
+                                             stats=self.linkStats)
+            # optionally, record what HDLC receives (see HdlcCapture)
+            if 'captureFile' in connectParams:
+                self.captureWriter = HdlcCapture.CaptureWriter(connectParams['captureFile'])
+                self.hdlc.tap      = self.captureWriter
+            # connect HDLC module to serial Port
+            if 'baudrate' in connectParams:
+                self.hdlc.connect(connectParams['port'],baudrate=connectParams['baudrate'])
+            else:
+                self.hdlc.connect(connectParams['port'])
+            # connect the parent class
+            ApiConnector.connect(self)
+            # start the request pipeline
+            if maxPendingRequests>0:
+                self.requestPipeline = RequestPipeline.RequestPipeline(
+                    self._sendRequest,
+                    maxPendingRequests,
+                )
+                self.requestPipeline.start()
+    
+    def disconnect(self, reason=""):
+        with self.hdlcLock:
+            # disconnect the parent class
+            ApiConnector.disconnect(self, reason)
+            # stop the request pipeline, failing the requests still queued
+            if self.requestPipeline:
+                self.requestPipeline.close(reason)
+            self.requestPipeline = None
+            # disconnect hdlc module
+            if self.hdlc:
+                self.hdlc.disconnect()
+            # delete the hdlc module
+            self.hdlc = None
+            # close the capture file
+            if self.captureWriter:
+                self.captureWriter.close()
+            self.captureWriter = None
+    
+    def send(self,commandArray,fields):
+        '''
+        \brief Send a request and wait for its response.
+        
+        When the connector was connected with a 'maxPendingRequests'
+        parameter, the request is queued behind the ones sent through
+        sendAsync(), and sent in order.
+        
+        \returns The dictionary of response fields.
+        '''
+        requestPipeline = self.requestPipeline
+        if requestPipeline and not requestPipeline.isPipelineThread():
+            return self.sendAsync(commandArray,fields).result()
+        
+        if not self.isConnected:
+            output = "not connected"
+            log.error(output)
+            raise ConnectionError(output)
+        
+        # serialize the fields
+        cmdId, serializedFields = self.api_def.serialize(commandArray,fields)
+        
+        return self._sendRequest(cmdId,serializedFields)
+    
+    def sendSerialized(self,commandArray,cmdId,serializedFields,parser):
+        '''
+        \brief Send a request already serialized, and wait for its response.
+        
+        This is the fast path of the dn_*() methods generated by
+        GenApiConnectors, which serialize the request and parse the response
+        without going through the API definition.
+        
+        \param commandArray     The (sub)command name.
+        \param cmdId            The ID of the command.
+        \param serializedFields The serialized request, a string.
+        \param parser           Called with the response payload (a
+                                memoryview) and RESPONSE_HEX_TYPE; returns the
+                                response formatted as a named tuple, or None
+                                to have the generic deserializer parse it.
+        
+        \returns What the parser returned or, if it returned None (or the
+                 request was queued, see send()), the dictionary of response
+                 fields.
+        '''
+        requestPipeline = self.requestPipeline
+        if requestPipeline and not requestPipeline.isPipelineThread():
+            return requestPipeline.submit(commandArray,cmdId,serializedFields).result()
+        
+        if not self.isConnected:
+            output = "not connected"
+            log.error(output)
+            raise ConnectionError(output)
+        
+        return self._sendInternal(cmdId,False,serializedFields,parser)
+    
+    def sendAsync(self,commandArray,fields):
+        '''
+        \brief Send a request without waiting for its response.
+        
+        The serial API allows a single request to be outstanding. When the
+        connector was connected with a 'maxPendingRequests' parameter, the
+        request is queued and sent as soon as the requests before it are
+        acknowledged; this call only blocks when that many requests are
+        already queued. Otherwise, the request is sent right away and the
+        future returned is already done.
+        
+        \exception ConnectionError the connector is not connected.
+        \exception CommandError the fields could not be serialized.
+        \returns A RequestPipeline.RequestFuture, whose result() is the
+                 dictionary of response fields.
+        '''
+        if not self.isConnected:
+            output = "not connected"
+            log.error(output)
+            raise ConnectionError(output)
+        
+        # serialize the fields (errors are raised to the caller right away)
+        cmdId, serializedFields = self.api_def.serialize(commandArray,fields)
+        
+        requestPipeline = self.requestPipeline
+        if requestPipeline:
+            return requestPipeline.submit(commandArray,cmdId,serializedFields)
+        
+        future = RequestPipeline.RequestFuture(commandArray)
+        try:
+            response = self._sendRequest(cmdId,serializedFields)
+        except (ConnectionError,APIError,CommandError) as err:
+            future._setError(err)
+        else:
+            future._setResponse(response)
+        return future
+    
+    def getNumPendingRequests(self):
+        '''
+        \brief Returns the number of requests queued and not sent yet.
+        '''
+        requestPipeline = self.requestPipeline
+        if requestPipeline:
+            return requestPipeline.getNumPending()
+        return 0
+    
+    def getRttStats(self):
+        '''
+        \brief Returns the round-trip time estimate and retry statistics.
+        
+        \returns A dictionary with the following keys (times in seconds):
+                 - 'srtt', 'rttvar': smoothed round-trip time and its variation
+                 - 'timeout', 'minTimeout', 'maxTimeout': current time to wait
+                   for a response, and its bounds
+                 - 'numRequests': number of requests sent
+                 - 'numRetries': number of retransmissions
+                 - 'numFailures': number of requests abandoned after
+                   MAX_NUM_RETRY retries
+                 - 'numRttSamples', 'lastRtt', 'minRtt', 'maxRtt': round-trip
+                   times measured (on requests not retransmitted)
+        '''
+        return self.rttEstimator.getStats()
+    
+    def getLinkStats(self):
+        '''
+        \brief Returns the counters and histograms of the serial link.
+        
+        Reading them does not interfere with the HDLC thread; the values
+        may be off by the frame being processed.
+        
+        \returns A dictionary with the following keys:
+                 - 'numRxBytes', 'numRxFrames', 'numRxEscapes': bytes, valid
+                   frames and HDLC escape characters received
+                 - 'numRxCrcErrors', 'numRxShortFrames': frames dropped
+                 - 'numRxStaleResponses': responses dropped because they did
+                   not answer the request outstanding (e.g. late responses
+                   to requests retransmitted)
+                 - 'numTxBytes', 'numTxFrames', 'numTxEscapes': same, sent
+                 - 'rxEscapeOverhead', 'txEscapeOverhead': fraction of the
+                   bytes on the wire which are HDLC escape characters
+                 - 'numRequests', 'numRetries', 'numFailures': as returned by
+                   getRttStats()
+                 - 'rxCallbackTime': histogram of the time spent handling
+                   each frame received (deserialization, ACK, queueing)
+                 - 'responseTime': histogram of the time from sending a
+                   request to receiving its response, retries included
+                 Histograms are dictionaries, see LinkStats.Histogram.getStats().
+        '''
+        returnVal = self.linkStats.getStats()
+        rttStats  = self.rttEstimator.getStats()
+        for k in ['numRequests','numRetries','numFailures']:
+            returnVal[k] = rttStats[k]
+        return returnVal
+    
+    def resetLinkStats(self):
+        '''
+        \brief Reset the counters and histograms of the serial link, and the
+               retry statistics.
+        '''
+        self.linkStats.reset()
+        self.rttEstimator.resetStats()
+    
+    def setNotifFilter(self, notifFilter):
+        '''
+        \brief Set the function deciding which notifications are deserialized
+               and queued.
+        
+        \param notifFilter Called by the HDLC thread with the command ID and
+               the raw payload (a memoryview, only valid during the call) of
+               each notification received; the notification is dropped, before
+               being deserialized, unless it returns True. None to keep all
+               the notifications.
+        '''
+        self.notifFilter = notifFilter
+
+    #======================== virtual methods =================================
+
+    def isValidPacketId(self, cmdId, isResponse, packetId):
+        '''
+        \brief Return whether a received packet is in sequence
+        '''
+        raise NotImplementedError() # to be implemented by child class
+
+    def _buildTxHeader(self, cmdId, isResponse, serializedFields):
+        '''
+        \brief Build the header for a TX packet.
+        '''
+        raise NotImplementedError() # to be implemented by child class
+
+    def _ackIfNeeded(self,cmdId,isResponse):
+        '''
+        \brief Send an ACK if needed.
+        '''
+        raise NotImplementedError() # to be implemented by child class
+
+    def isHelloResponse(self, cmdId):
+        return False
+    
+    def _handleNotification(self,cmdId,payload):
+        '''
+        \brief Deserialize a notification received, and put it in the
+               notification queue.
+        
+        Called by the HDLC thread. A child class may override it to handle
+        the notifications otherwise, e.g. to forward them without
+        deserializing them.
+        
+        \param cmdId   The ID of the notification.
+        \param payload The notification, a memoryview of the frame received,
+                       only valid during the call.
+        '''
+        
+        # drop the notifications nobody wants, before deserializing them
+        notifFilter = self.notifFilter
+        if notifFilter and not notifFilter(cmdId,payload):
+            self.numFilteredNotifs += 1
+            return
+        
+        # deserialize received packet
+        nameArray, fields = self.api_def.deserialize(
+                                ApiDefinition.ApiDefinition.NOTIFICATION,
+                                cmdId,
+                                payload)
+        
+        # put received packet in notification buffer
+        self.putNotification((nameArray, fields))
+    
+    #======================== private =========================================
+    
+    def _sendRequest(self,cmdId,serializedFields):
+        return self._sendInternal(cmdId,False,serializedFields)
+    
+    def _sendInternal(self,cmdId,isResponse,serializedFields,parser=None):
+        
+        try:
+            if not isResponse:
+                self.requestSendLock.acquire()
+                self.responseCmdId  = cmdId
+                self.responseParser = parser
+        
+            # build packet to send
+            packet  = bytearray(self._buildTxHeader(cmdId,isResponse,serializedFields))
+            packet += bytearray(serializedFields)
+
+            retry = 0
+            
+            # Prepare for reliable send
+            if not isResponse:
+                self.waitForResp = True
+                self.waitForRespEvent.clear()
+                self.rttEstimator.addRequest()
+                
+            while True :
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("_sendInternal cmdId={0} retry={1} isResponse={2} serializedFields={3}".format(
+                            cmdId,
+                            retry,
+                            isResponse,
+                            serializedFields
+                        )
+                    )
+                
+                if not isResponse:
+                    self.tsDataSent = time.time()
+                    if retry==0:
+                        tsRequestSent = self.tsDataSent
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("---------- pcToMote DATA ({0}) ---------->".format(self.TxPacketId))
+                
+                # send packet through HDLC module
+                with self.hdlcLock:
+                    if not self.hdlc:
+                        output = "no HDLC module, did I just disconnect?"
+                        log.error(output)
+                        raise ConnectionError(output)
+                    self.hdlc.send(packet)
+                
+                if isResponse:
+                    return None
+                
+                # wait for response. semaphore released by _hdlcRxCb()
+                if self.waitForRespEvent.wait(self.rttEstimator.getTimeout()) :
+                    self.linkStats.responseTime.add(self.tsRespReceived-tsRequestSent)
+                    # only measure the RTT when there is no ambiguity on
+                    # which transmission is answered
+                    if retry==0:
+                        self.rttEstimator.addSample(self.tsRespReceived-self.tsDataSent)
+                    break
+                
+                log.info("retry {0}".format(retry))
+                
+                # Timeout error
+                if retry >= MAX_NUM_RETRY :
+                    self.rttEstimator.addFailure()
+                    output = "retried {0} times, max allowed is {1}".format(retry,MAX_NUM_RETRY)
+                    log.error(output)
+                    raise ConnectionError(output)
+                self.rttEstimator.backoff()
+                retry = retry + 1
+                    
+            if isinstance(self.responseBuf,Exception):
+                log.error("responseBuf contains exception {0}".format(self.responseBuf))
+                raise self.responseBuf
+            
+            # raise APIError if RC is not OK (a response parser only returns
+            # the responses with RC_OK)
+            if isinstance(self.responseBuf,dict):
+                checkRc(self.api_def,cmdId,self.responseBuf)
+            
+            # return packet received
+            return self.responseBuf
+        
+        finally:
+            if not isResponse:
+                self.responseParser = None
+                self.requestSendLock.release()
+    
+    def _resetPacketIds(self):
+        self.TxPacketId=0
+        self.RxPacketId=0
+        self.syncNeeded=True
+    
+    #======================== HDLC callbacks ==================================
+    
+    def _hdlcConnectCb(self,state):
+        '''
+        \brief called by HDLC when the connected state has changed.
+       
+        \param state True when the HDLC module is connected to a device,
+                     False otherwise
+        '''
+        log.info("hdlc notification: connection state="+str(state))
+        if state==False:
+            # we got disconnected
+            self.disconnect("HDLC disconnected")
+    
+    def _hdlcRxCb(self,frameRx):
+        '''
+        \brief called by HDLC when it's done receiving a complete frame.
+        
+        \note The frame received does not contain any of the HDLC-specific
+              flags and espace characters
+       
+        \param frameRx The received frame, represented as a bytearray (a list
+                       of ints is also accepted). The payload passed to the
+                       deserializer is a memoryview into it, not a copy.
+        '''
+        
+        if not isinstance(frameRx,bytearray):
+            frameRx = bytearray(frameRx)
+        
+        if len(frameRx)<3:
+            output = "received packet too short"
+            log.error(output)
+            raise ConnectionError(output)
+        
+        cmdId,length,isResponse,packetId,payload = self._parseRxHeader(frameRx)
+        tsReceived = time.time()
+        
+        # log
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("cmdId={0} length={1} isResponse={2} packetId={3} payload={4}".format(
+                    cmdId,
+                    length,
+                    isResponse,
+                    packetId,
+                    payload.tolist()
+                )
+            )
+        
+            if isResponse:
+                log.debug("<--------- pcToMote ACK ({0}) after {1:.3f} --------".format(
+                                packetId,
+                                time.time()-self.tsDataSent)
+                         )
+            else:
+                log.debug("<--------- moteToPc DATA ({0}) ----------".format(packetId))
+                self.tsDataReceived = time.time()
+        
+        # check packetId
+        (wasValidPacketId, isRepeatId, updateRxPacketId) = self.isValidPacketId(cmdId,isResponse,packetId)
+            
+        # update RxPacketId
+        self.paramLock.acquire()
+        if isResponse==False and (not isRepeatId) and updateRxPacketId:
+            self.RxPacketId = packetId
+        self.paramLock.release()
+        
+        # send ACK if necessary
+        try :
+            ackSent = self._ackIfNeeded(cmdId,isResponse)
+        except ConnectionError as ex:
+            log.error("putting disconnect notification {0}".format(ex))
+            self.putDisconnectNotification(str(ex))
+            raise ex
+        
+        # log
+        if log.isEnabledFor(logging.DEBUG):
+            if ackSent:
+                log.debug("---------- moteToPc ACK ({0}) after {1:.3f} ------->".format(
+                                self.RxPacketId,
+                                time.time()-self.tsDataReceived)
+                          )
+                log.debug("ack sent")
+            else:
+                log.debug("no ack needed")
+        
+        if isResponse or self.isHelloResponse(cmdId):
+            
+            # drop the responses which do not answer the request outstanding,
+            # e.g. the late response to a request retransmitted, which would
+            # otherwise be taken for the response to the next request
+            if not (
+                    self.waitForResp and
+                    wasValidPacketId and
+                    (cmdId==self.responseCmdId or self.isHelloResponse(cmdId))
+                ):
+                self.linkStats.numRxStaleResponses += 1
+                log.warning("dropping unexpected response cmdId={0} packetId={1}".format(cmdId,packetId))
+                return
+            
+            self.tsRespReceived = tsReceived
+            
+            # deserialize received packet, with the parser of the request if
+            # it has one
+            try:
+                fields = None
+                parser = self.responseParser
+                if parser and cmdId==self.responseCmdId:
+                    fields = parser(payload,self.RESPONSE_HEX_TYPE)
+                if fields is None:
+                    nameArray, fields = self.api_def.deserialize(
+                                            ApiDefinition.ApiDefinition.COMMAND,
+                                            cmdId,
+                                            payload)
+            except Exception as err:
+                self.responseBuf = err
+            else:
+                # put received packet in local response buffer
+                self.responseBuf = fields
+            
+            # release semaphore
+            self.waitForResp = False
+            self.waitForRespEvent.set()
+            
+        else:
+            if not isRepeatId :
+                self._handleNotification(cmdId,payload)
+        
+        # raise error if packet id is wrong
+        if not wasValidPacketId:
+            output = "wrong packetId"
+            log.error(output)
+            raise ConnectionError(output)
@@ -1,8 +1,8 @@
-#
-# The version in this file is automatically updated by the release script.
-#
-# PLEASE DO NOT CHANGE THE SYNTAX OF THE VERSION VALUE
-# 
-VERSION = (1, 0, 4, 110)
-
-# END OF FILE
+#
+# The version in this file is automatically updated by the release script.
+#
+# PLEASE DO NOT CHANGE THE SYNTAX OF THE VERSION VALUE
+# 
+VERSION = (1, 0, 4, 110)
+
+# END OF FILE
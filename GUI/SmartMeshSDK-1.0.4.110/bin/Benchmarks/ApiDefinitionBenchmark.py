@@ -0,0 +1,100 @@
+#!/usr/bin/python
+
+'''
+Measures the cost of loading the API definition modules, and of creating an
+API definition object.
+
+Usage: ApiDefinitionBenchmark.py [<numRuns>]
+
+For each API definition, reports the time to:
+- import its module from source, as when its .pyc cannot be written;
+- import its module from compiled code, as from a .pyc or the cache of
+  DefinitionLoader;
+- create an instance and build its lookup tables, as each connector did
+  before sharing the instances;
+- get the shared instance from DefinitionLoader.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import imp
+import marshal
+import time
+
+from SmartMeshSDK.ApiDefinition import DefinitionLoader
+
+#============================ defines =========================================
+
+NUM_RUNS           = 20
+
+#============================ helpers =========================================
+
+def execModule(name,code):
+    module = imp.new_module('SmartMeshSDK.ApiDefinition.'+name)
+    exec code in module.__dict__
+    return module
+
+def runSource(name,sourcePath,source,apiDefClass):
+    execModule(name,compile(source,sourcePath,'exec'))
+
+def runCompiled(name,sourcePath,compiled,apiDefClass):
+    execModule(name,marshal.loads(compiled))
+
+def runConstruct(name,sourcePath,compiled,apiDefClass):
+    apiDefClass()._getIndex()
+
+def runShared(name,sourcePath,compiled,apiDefClass):
+    DefinitionLoader.getDefinition(name)
+
+def measure(func,numRuns,*args):
+    durations = []
+    for _ in range(numRuns):
+        startTime = time.time()
+        func(*args)
+        durations.append(time.time()-startTime)
+    # best of numRuns, to filter out scheduling noise
+    return min(durations)
+
+#============================ main ============================================
+
+def main():
+
+    numRuns = NUM_RUNS
+    if len(sys.argv)>1:
+        numRuns = int(sys.argv[1])
+
+    print '{0:<20} {1:>10} {2:>10} {3:>10} {4:>10}   (ms, best of {5})'.format(
+        'definition','source','compiled','instance','shared',numRuns,
+    )
+    for name in DefinitionLoader.DEFINITIONS:
+        module       = DefinitionLoader.loadModule(name)
+        apiDefClass  = getattr(module,name)
+        sourcePath   = os.path.splitext(module.__file__)[0]+'.py'
+        with open(sourcePath,'rU') as f:
+            source   = f.read()
+        compiled     = marshal.dumps(compile(source,sourcePath,'exec'))
+        DefinitionLoader.getDefinition(name)
+
+        durations    = []
+        for (func,data) in [
+                (runSource,    source),
+                (runCompiled,  compiled),
+                (runConstruct, compiled),
+                (runShared,    compiled),
+            ]:
+            durations.append(measure(func,numRuns,name,sourcePath,data,apiDefClass))
+        print '{0:<20} {1:>10.3f} {2:>10.3f} {3:>10.3f} {4:>10.4f}'.format(
+            name,
+            *[1000*d for d in durations]
+        )
+
+if __name__=="__main__":
+    main()
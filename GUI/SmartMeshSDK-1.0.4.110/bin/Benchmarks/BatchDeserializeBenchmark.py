@@ -0,0 +1,107 @@
+#!/usr/bin/python
+
+'''
+Compares the cost of deserializing a buffer of Serial Mux 'notifData'
+notifications one message at a time (as IpMgrConnectorMux does), as one
+batch, and as one batch with columnar output.
+
+Usage: BatchDeserializeBenchmark.py [<numNotifs> [<numRuns>]]
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import random
+import struct
+import time
+
+from SmartMeshSDK.ApiDefinition     import IpMgrDefinition
+from SmartMeshSDK.IpMgrConnectorMux import MuxMsg
+
+#============================ defines =========================================
+
+NUM_NOTIFS         = 10000
+NUM_RUNS           = 5
+PAYLOAD_LEN        = 60
+
+#============================ helpers =========================================
+
+def buildBuffer(apiDef,numNotifs):
+    '''
+    \brief Build a buffer of Serial Mux 'notifData' notifications.
+    '''
+    notifId      = apiDef.nameToId(apiDef.NOTIFICATION,['notification'])
+    subId        = apiDef.subcommandNameToId(apiDef.NOTIFICATION,['notification'],'notifData')
+    muxMsg       = MuxMsg.MuxMsg(None)
+    rng          = random.Random(0)
+    messages     = []
+    for i in range(numNotifs):
+        payload  = struct.pack('>BQI',subId,1400000000+i,i)                     # subId, utcSecs, utcUsecs
+        payload += ''.join([chr(rng.randint(0x00,0xff)) for _ in range(8)])     # macAddress
+        payload += struct.pack('>HH',0xf0b8,0xf0b8)                             # srcPort, dstPort
+        payload += ''.join([chr(rng.randint(0x00,0xff)) for _ in range(PAYLOAD_LEN)])
+        messages.append(muxMsg.build_message(notifId,payload))
+    return ''.join(messages)
+
+def runPerMessage(apiDef,buf):
+    results = []
+    def processCmd(reserved,cmdId,payload):
+        payloadList = struct.unpack('!'+str(len(payload))+'B', payload)
+        results.append(apiDef.deserialize(apiDef.NOTIFICATION,cmdId,payloadList))
+    MuxMsg.MuxMsg(processCmd).parse(buf)
+    return len(results)
+
+def runBatch(apiDef,buf):
+    (results,consumed) = MuxMsg.deserializeMessages(apiDef,buf)
+    return len(results)
+
+def runColumnar(apiDef,buf):
+    (batches,consumed) = MuxMsg.deserializeMessages(apiDef,buf,columnar=True)
+    return sum([len(batch) for batch in batches.values()])
+
+def measure(func,apiDef,buf,numNotifs,numRuns):
+    durations = []
+    for _ in range(numRuns):
+        startTime = time.time()
+        assert func(apiDef,buf)==numNotifs
+        durations.append(time.time()-startTime)
+    # best of numRuns, to filter out scheduling noise
+    return min(durations)
+
+#============================ main ============================================
+
+def main():
+    
+    numNotifs = NUM_NOTIFS
+    numRuns   = NUM_RUNS
+    if len(sys.argv)>1:
+        numNotifs = int(sys.argv[1])
+    if len(sys.argv)>2:
+        numRuns   = int(sys.argv[2])
+    
+    apiDef    = IpMgrDefinition.IpMgrDefinition()
+    buf       = buildBuffer(apiDef,numNotifs)
+    
+    for (name,func) in [
+            ('per message',  runPerMessage),
+            ('batch',        runBatch),
+            ('columnar',     runColumnar),
+        ]:
+        duration = measure(func,apiDef,buf,numNotifs,numRuns)
+        print '{0:<12} {1} notifications in {2:.3f}s ({3:.1f} us/notification, best of {4})'.format(
+            name,
+            numNotifs,
+            duration,
+            1000000*duration/numNotifs,
+            numRuns,
+        )
+
+if __name__=="__main__":
+    main()
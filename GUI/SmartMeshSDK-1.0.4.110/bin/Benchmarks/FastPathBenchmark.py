@@ -0,0 +1,267 @@
+#!/usr/bin/python
+
+'''
+This module was generated automatically by GenApiConnectors. Do not edit directly.
+
+Compares, for each command with a fast path, the cost of serializing a sample
+request and parsing a sample response with the code generated in the
+connector (fast path) and with the API definition (generic path, as send()
+does). Also verifies that both paths give the same results.
+
+Usage: FastPathBenchmark.py [<numRuns>]
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import struct
+import time
+
+from SmartMeshSDK.ApiDefinition import HartMoteDefinition
+from SmartMeshSDK.ApiDefinition import IpMgrDefinition
+from SmartMeshSDK.ApiDefinition import IpMoteDefinition
+from SmartMeshSDK.HartMoteConnector import HartMoteConnector
+from SmartMeshSDK.IpMgrConnectorMux import IpMgrConnectorMux
+from SmartMeshSDK.IpMgrConnectorSerial import IpMgrConnectorSerial
+from SmartMeshSDK.IpMoteConnector import IpMoteConnector
+
+#============================ defines =========================================
+
+NUM_RUNS           = 1000
+
+# (connector, API definition, [(command, names, sample request fields, sample response)])
+CONNECTORS         = [
+    (
+        IpMgrConnectorMux.IpMgrConnectorMux,
+        IpMgrDefinition.IpMgrDefinition,
+        [
+            ('dn_mux_hello', ['mux_hello'], [('version', 90), ('secret', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00Z'),
+            ('dn_hello_response', ['hello_response'], [], '\x00ZZZ\x00'),
+            ('dn_subscribe', ['subscribe'], [('filter', [0, 1, 2, 3]), ('unackFilter', [0, 1, 2, 3])], '\x00'),
+            ('dn_getTime', ['getTime'], [], '\x00\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\x00Z\x00\x00\x00Z\x00\x01\x02\x03\x04\x00Z'),
+            ('dn_setNetworkConfig', ['setNetworkConfig'], [('networkId', 90), ('apTxPower', -5), ('frameProfile', 1), ('maxMotes', 90), ('baseBandwidth', 90), ('downFrameMultVal', 90), ('numParents', 90), ('ccaMode', 0), ('channelList', 90), ('autoStartNetwork', True), ('locMode', 90), ('bbMode', 0), ('bbSize', 90), ('isRadioTest', 90), ('bwMult', 90), ('oneChannel', 90)], '\x00'),
+            ('dn_clearStatistics', ['clearStatistics'], [], '\x00'),
+            ('dn_exchangeMoteJoinKey', ['exchangeMoteJoinKey'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('key', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])], '\x00\x00\x00\x00Z'),
+            ('dn_exchangeNetworkId', ['exchangeNetworkId'], [('id', 90)], '\x00\x00\x00\x00Z'),
+            ('dn_radiotestTx', ['radiotestTx'], [('testType', 90), ('chanMask', 90), ('repeatCnt', 90), ('txPower', -5), ('seqSize', 90), ('pkLen_1', 90), ('delay_1', 90), ('pkLen_2', 90), ('delay_2', 90), ('pkLen_3', 90), ('delay_3', 90), ('pkLen_4', 90), ('delay_4', 90), ('pkLen_5', 90), ('delay_5', 90), ('pkLen_6', 90), ('delay_6', 90), ('pkLen_7', 90), ('delay_7', 90), ('pkLen_8', 90), ('delay_8', 90), ('pkLen_9', 90), ('delay_9', 90), ('pkLen_10', 90), ('delay_10', 90)], '\x00'),
+            ('dn_radiotestRx', ['radiotestRx'], [('mask', 90), ('duration', 90), ('stationId', 90)], '\x00'),
+            ('dn_getRadiotestStatistics', ['getRadiotestStatistics'], [], '\x00\x00Z\x00Z'),
+            ('dn_setACLEntry', ['setACLEntry'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('joinKey', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])], '\x00'),
+            ('dn_getNextACLEntry', ['getNextACLEntry'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'),
+            ('dn_deleteACLEntry', ['deleteACLEntry'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00'),
+            ('dn_pingMote', ['pingMote'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00\x00\x00\x00Z'),
+            ('dn_getLog', ['getLog'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00'),
+            ('dn_sendData', ['sendData'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('priority', 0), ('srcPort', 90), ('dstPort', 90), ('options', 90), ('data', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9])], '\x00\x00\x00\x00Z'),
+            ('dn_startNetwork', ['startNetwork'], [], '\x00'),
+            ('dn_getSystemInfo', ['getSystemInfo'], [], '\x00\x00\x01\x02\x03\x04\x05\x06\x07ZZZZZ\x00Z'),
+            ('dn_getMoteConfig', ['getMoteConfig'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('next', True)], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x00Z\x01\x00Z\x01'),
+            ('dn_getPathInfo', ['getPathInfo'], [('source', [0, 1, 2, 3, 4, 5, 6, 7]), ('dest', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x00\x01\x02\x03\x04\x05\x06\x07\x00ZZZZ'),
+            ('dn_getNextPathInfo', ['getNextPathInfo'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('filter', 0), ('pathId', 90)], '\x00\x00Z\x00\x01\x02\x03\x04\x05\x06\x07\x00\x01\x02\x03\x04\x05\x06\x07\x00ZZZZ'),
+            ('dn_setAdvertising', ['setAdvertising'], [('activate', 0)], '\x00\x00\x00\x00Z'),
+            ('dn_setDownstreamFrameMode', ['setDownstreamFrameMode'], [('frameMode', 0)], '\x00\x00\x00\x00Z'),
+            ('dn_getManagerStatistics', ['getManagerStatistics'], [], '\x00\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z'),
+            ('dn_setTime', ['setTime'], [('trigger', 90), ('utcSecs', 90), ('utcUsecs', 90)], '\x00'),
+            ('dn_getLicense', ['getLicense'], [], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c'),
+            ('dn_setLicense', ['setLicense'], [('license', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12])], '\x00'),
+            ('dn_setCLIUser', ['setCLIUser'], [('role', 0), ('password', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])], '\x00'),
+            ('dn_sendIP', ['sendIP'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('priority', 0), ('options', 90), ('encryptedOffset', 90), ('data', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9])], '\x00\x00\x00\x00Z'),
+            ('dn_restoreFactoryDefaults', ['restoreFactoryDefaults'], [], '\x00'),
+            ('dn_getMoteInfo', ['getMoteInfo'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x00ZZ\x00\x00\x00Z\x00\x00\x00Z\x00\x00\x00Z\x00\x00\x00Z\x00\x00\x00Z\x00\x00\x00Z'),
+            ('dn_getNetworkConfig', ['getNetworkConfig'], [], '\x00\x00ZZ\x01\x00Z\x00ZZZ\x00\x00Z\x01Z\x00ZZ\x00ZZ'),
+            ('dn_getNetworkInfo', ['getNetworkInfo'], [], '\x00\x00Z\x00Z\x00\x00ZZ\x00\x00\x00Z\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\x00ZZ'),
+            ('dn_getMoteConfigById', ['getMoteConfigById'], [('moteId', 90)], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x00Z\x01\x00Z\x01'),
+            ('dn_setCommonJoinKey', ['setCommonJoinKey'], [('key', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])], '\x00'),
+            ('dn_getIPConfig', ['getIPConfig'], [], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'),
+            ('dn_setIPConfig', ['setIPConfig'], [('ipv6Address', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]), ('mask', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])], '\x00'),
+            ('dn_deleteMote', ['deleteMote'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00'),
+            ('dn_getMoteLinks', ['getMoteLinks'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('idx', 90)], '\x00\x00ZZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZ'),
+        ],
+    ),
+    (
+        IpMgrConnectorSerial.IpMgrConnectorSerial,
+        IpMgrDefinition.IpMgrDefinition,
+        [
+            ('dn_mux_hello', ['mux_hello'], [('version', 90), ('secret', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00Z'),
+            ('dn_hello_response', ['hello_response'], [], '\x00ZZZ\x00'),
+            ('dn_subscribe', ['subscribe'], [('filter', [0, 1, 2, 3]), ('unackFilter', [0, 1, 2, 3])], '\x00'),
+            ('dn_getTime', ['getTime'], [], '\x00\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\x00Z\x00\x00\x00Z\x00\x01\x02\x03\x04\x00Z'),
+            ('dn_setNetworkConfig', ['setNetworkConfig'], [('networkId', 90), ('apTxPower', -5), ('frameProfile', 1), ('maxMotes', 90), ('baseBandwidth', 90), ('downFrameMultVal', 90), ('numParents', 90), ('ccaMode', 0), ('channelList', 90), ('autoStartNetwork', True), ('locMode', 90), ('bbMode', 0), ('bbSize', 90), ('isRadioTest', 90), ('bwMult', 90), ('oneChannel', 90)], '\x00'),
+            ('dn_clearStatistics', ['clearStatistics'], [], '\x00'),
+            ('dn_exchangeMoteJoinKey', ['exchangeMoteJoinKey'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('key', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])], '\x00\x00\x00\x00Z'),
+            ('dn_exchangeNetworkId', ['exchangeNetworkId'], [('id', 90)], '\x00\x00\x00\x00Z'),
+            ('dn_radiotestTx', ['radiotestTx'], [('testType', 90), ('chanMask', 90), ('repeatCnt', 90), ('txPower', -5), ('seqSize', 90), ('pkLen_1', 90), ('delay_1', 90), ('pkLen_2', 90), ('delay_2', 90), ('pkLen_3', 90), ('delay_3', 90), ('pkLen_4', 90), ('delay_4', 90), ('pkLen_5', 90), ('delay_5', 90), ('pkLen_6', 90), ('delay_6', 90), ('pkLen_7', 90), ('delay_7', 90), ('pkLen_8', 90), ('delay_8', 90), ('pkLen_9', 90), ('delay_9', 90), ('pkLen_10', 90), ('delay_10', 90)], '\x00'),
+            ('dn_radiotestRx', ['radiotestRx'], [('mask', 90), ('duration', 90), ('stationId', 90)], '\x00'),
+            ('dn_getRadiotestStatistics', ['getRadiotestStatistics'], [], '\x00\x00Z\x00Z'),
+            ('dn_setACLEntry', ['setACLEntry'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('joinKey', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])], '\x00'),
+            ('dn_getNextACLEntry', ['getNextACLEntry'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'),
+            ('dn_deleteACLEntry', ['deleteACLEntry'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00'),
+            ('dn_pingMote', ['pingMote'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00\x00\x00\x00Z'),
+            ('dn_getLog', ['getLog'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00'),
+            ('dn_sendData', ['sendData'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('priority', 0), ('srcPort', 90), ('dstPort', 90), ('options', 90), ('data', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9])], '\x00\x00\x00\x00Z'),
+            ('dn_startNetwork', ['startNetwork'], [], '\x00'),
+            ('dn_getSystemInfo', ['getSystemInfo'], [], '\x00\x00\x01\x02\x03\x04\x05\x06\x07ZZZZZ\x00Z'),
+            ('dn_getMoteConfig', ['getMoteConfig'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('next', True)], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x00Z\x01\x00Z\x01'),
+            ('dn_getPathInfo', ['getPathInfo'], [('source', [0, 1, 2, 3, 4, 5, 6, 7]), ('dest', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x00\x01\x02\x03\x04\x05\x06\x07\x00ZZZZ'),
+            ('dn_getNextPathInfo', ['getNextPathInfo'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('filter', 0), ('pathId', 90)], '\x00\x00Z\x00\x01\x02\x03\x04\x05\x06\x07\x00\x01\x02\x03\x04\x05\x06\x07\x00ZZZZ'),
+            ('dn_setAdvertising', ['setAdvertising'], [('activate', 0)], '\x00\x00\x00\x00Z'),
+            ('dn_setDownstreamFrameMode', ['setDownstreamFrameMode'], [('frameMode', 0)], '\x00\x00\x00\x00Z'),
+            ('dn_getManagerStatistics', ['getManagerStatistics'], [], '\x00\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z'),
+            ('dn_setTime', ['setTime'], [('trigger', 90), ('utcSecs', 90), ('utcUsecs', 90)], '\x00'),
+            ('dn_getLicense', ['getLicense'], [], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c'),
+            ('dn_setLicense', ['setLicense'], [('license', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12])], '\x00'),
+            ('dn_setCLIUser', ['setCLIUser'], [('role', 0), ('password', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])], '\x00'),
+            ('dn_sendIP', ['sendIP'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('priority', 0), ('options', 90), ('encryptedOffset', 90), ('data', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9])], '\x00\x00\x00\x00Z'),
+            ('dn_restoreFactoryDefaults', ['restoreFactoryDefaults'], [], '\x00'),
+            ('dn_getMoteInfo', ['getMoteInfo'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x00ZZ\x00\x00\x00Z\x00\x00\x00Z\x00\x00\x00Z\x00\x00\x00Z\x00\x00\x00Z\x00\x00\x00Z'),
+            ('dn_getNetworkConfig', ['getNetworkConfig'], [], '\x00\x00ZZ\x01\x00Z\x00ZZZ\x00\x00Z\x01Z\x00ZZ\x00ZZ'),
+            ('dn_getNetworkInfo', ['getNetworkInfo'], [], '\x00\x00Z\x00Z\x00\x00ZZ\x00\x00\x00Z\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\x00ZZ'),
+            ('dn_getMoteConfigById', ['getMoteConfigById'], [('moteId', 90)], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x00Z\x01\x00Z\x01'),
+            ('dn_setCommonJoinKey', ['setCommonJoinKey'], [('key', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])], '\x00'),
+            ('dn_getIPConfig', ['getIPConfig'], [], '\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'),
+            ('dn_setIPConfig', ['setIPConfig'], [('ipv6Address', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]), ('mask', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])], '\x00'),
+            ('dn_deleteMote', ['deleteMote'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00'),
+            ('dn_getMoteLinks', ['getMoteLinks'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7]), ('idx', 90)], '\x00\x00ZZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZZ\x00\x00\x00ZZ\x00ZZ'),
+        ],
+    ),
+    (
+        IpMoteConnector.IpMoteConnector,
+        IpMoteDefinition.IpMoteDefinition,
+        [
+            ('dn_setParameter_macAddress', ['setParameter', 'macAddress'], [('macAddress', [0, 1, 2, 3, 4, 5, 6, 7])], '\x00\x01'),
+            ('dn_setParameter_joinKey', ['setParameter', 'joinKey'], [('joinKey', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])], '\x00\x02'),
+            ('dn_setParameter_networkId', ['setParameter', 'networkId'], [('networkId', 90)], '\x00\x03'),
+            ('dn_setParameter_txPower', ['setParameter', 'txPower'], [('txPower', -5)], '\x00\x04'),
+            ('dn_setParameter_joinDutyCycle', ['setParameter', 'joinDutyCycle'], [('dutyCycle', 90)], '\x00\x06'),
+            ('dn_setParameter_eventMask', ['setParameter', 'eventMask'], [('eventMask', [0, 1, 2, 3])], '\x00\x0b'),
+            ('dn_setParameter_OTAPLockout', ['setParameter', 'OTAPLockout'], [('mode', True)], '\x00\x15'),
+            ('dn_setParameter_routingMode', ['setParameter', 'routingMode'], [('mode', True)], '\x00\x1d'),
+            ('dn_setParameter_powerSrcInfo', ['setParameter', 'powerSrcInfo'], [('maxStCurrent', 90), ('minLifetime', 90), ('currentLimit_0', 90), ('dischargePeriod_0', 90), ('rechargePeriod_0', 90), ('currentLimit_1', 90), ('dischargePeriod_1', 90), ('rechargePeriod_1', 90), ('currentLimit_2', 90), ('dischargePeriod_2', 90), ('rechargePeriod_2', 90)], '\x00\x1f'),
+            ('dn_setParameter_autoJoin', ['setParameter', 'autoJoin'], [('mode', True)], '\x00$'),
+            ('dn_getParameter_macAddress', ['getParameter', 'macAddress'], [], '\x00\x01\x00\x01\x02\x03\x04\x05\x06\x07'),
+            ('dn_getParameter_networkId', ['getParameter', 'networkId'], [], '\x00\x03\x00Z'),
+            ('dn_getParameter_txPower', ['getParameter', 'txPower'], [], '\x00\x04Z'),
+            ('dn_getParameter_joinDutyCycle', ['getParameter', 'joinDutyCycle'], [], '\x00\x06Z'),
+            ('dn_getParameter_eventMask', ['getParameter', 'eventMask'], [], '\x00\x0b\x00\x01\x02\x03'),
+            ('dn_getParameter_moteInfo', ['getParameter', 'moteInfo'], [], '\x00\x0cZ\x00\x01\x02\x03\x04\x05\x06\x07ZZZZZ\x00ZZ'),
+            ('dn_getParameter_netInfo', ['getParameter', 'netInfo'], [], '\x00\r\x00\x01\x02\x03\x04\x05\x06\x07\x00Z\x00Z\x00Z'),
+            ('dn_getParameter_moteStatus', ['getParameter', 'moteStatus'], [], '\x00\x0e\x00Z\x00ZZ\x00\x00\x00ZZ'),
+            ('dn_getParameter_time', ['getParameter', 'time'], [], '\x00\x0f\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\x00Z\x00\x00\x00Z\x00\x01\x02\x03\x04\x00Z'),
+            ('dn_getParameter_charge', ['getParameter', 'charge'], [], '\x00\x10\x00\x00\x00Z\x00\x00\x00ZZZ'),
+            ('dn_getParameter_testRadioRxStats', ['getParameter', 'testRadioRxStats'], [], '\x00\x11\x00Z\x00Z'),
+            ('dn_getParameter_OTAPLockout', ['getParameter', 'OTAPLockout'], [], '\x00\x15\x01'),
+            ('dn_getParameter_moteId', ['getParameter', 'moteId'], [], '\x00\x17\x00Z'),
+            ('dn_getParameter_ipv6Address', ['getParameter', 'ipv6Address'], [], '\x00\x18\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'),
+            ('dn_getParameter_routingMode', ['getParameter', 'routingMode'], [], '\x00\x1d\x01'),
+            ('dn_getParameter_powerSrcInfo', ['getParameter', 'powerSrcInfo'], [], '\x00\x1f\x00ZZ\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z\x00Z'),
+            ('dn_getParameter_autoJoin', ['getParameter', 'autoJoin'], [], '\x00$\x01'),
+            ('dn_join', ['join'], [], '\x00'),
+            ('dn_disconnect', ['disconnect'], [], '\x00'),
+            ('dn_reset', ['reset'], [], '\x00'),
+            ('dn_lowPowerSleep', ['lowPowerSleep'], [], '\x00'),
+            ('dn_testRadioRx', ['testRadioRx'], [('channelMask', [0, 1]), ('time', 90), ('stationId', 90)], '\x00'),
+            ('dn_clearNV', ['clearNV'], [], '\x00'),
+            ('dn_requestService', ['requestService'], [('destAddr', 90), ('serviceType', 0), ('value', 90)], '\x00'),
+            ('dn_openSocket', ['openSocket'], [('protocol', 0)], '\x00Z'),
+            ('dn_closeSocket', ['closeSocket'], [('socketId', 90)], '\x00'),
+            ('dn_bindSocket', ['bindSocket'], [('socketId', 90), ('port', 90)], '\x00'),
+            ('dn_search', ['search'], [], '\x00'),
+            ('dn_testRadioTxExt', ['testRadioTxExt'], [('testType', 0), ('chanMask', [0, 1]), ('repeatCnt', 90), ('txPower', -5), ('seqSize', 90), ('pkLen_1', 90), ('delay_1', 90), ('pkLen_2', 90), ('delay_2', 90), ('pkLen_3', 90), ('delay_3', 90), ('pkLen_4', 90), ('delay_4', 90), ('pkLen_5', 90), ('delay_5', 90), ('pkLen_6', 90), ('delay_6', 90), ('pkLen_7', 90), ('delay_7', 90), ('pkLen_8', 90), ('delay_8', 90), ('pkLen_9', 90), ('delay_9', 90), ('pkLen_10', 90), ('delay_10', 90), ('stationId', 90)], '\x00'),
+            ('dn_zeroize', ['zeroize'], [], '\x00'),
+        ],
+    ),
+    (
+        HartMoteConnector.HartMoteConnector,
+        HartMoteDefinition.HartMoteDefinition,
+        [
+            ('dn_setParameter_txPower', ['setParameter', 'txPower'], [('txPower', -5)], '\x00\x04'),
+            ('dn_setParameter_joinDutyCycle', ['setParameter', 'joinDutyCycle'], [('dutyCycle', 90)], '\x00\x06'),
+            ('dn_setParameter_batteryLife', ['setParameter', 'batteryLife'], [('batteryLife', 90), ('powerStatus', 0)], '\x00\x07'),
+            ('dn_setParameter_service', ['setParameter', 'service'], [('serviceId', 90), ('serviceReqFlags', 90), ('appDomain', 0), ('destAddr', [0, 1]), ('time', 90)], '\x00\x08Z'),
+            ('dn_setParameter_hartDeviceStatus', ['setParameter', 'hartDeviceStatus'], [('hartDevStatus', 90)], '\x00\t'),
+            ('dn_setParameter_hartDeviceInfo', ['setParameter', 'hartDeviceInfo'], [('hartCmd0', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21]), ('hartCmd20', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31])], '\x00\n'),
+            ('dn_setParameter_eventMask', ['setParameter', 'eventMask'], [('eventMask', 90)], '\x00\x0b'),
+            ('dn_setParameter_writeProtect', ['setParameter', 'writeProtect'], [('writeProtect', 0)], '\x00\x12'),
+            ('dn_getParameter_joinDutyCycle', ['getParameter', 'joinDutyCycle'], [], '\x00\x06Z'),
+            ('dn_getParameter_service', ['getParameter', 'service'], [('serviceId', 90)], '\x00\x08Z\x00Z\x00\x00\x01\x00\x00\x00Z'),
+            ('dn_getParameter_moteInfo', ['getParameter', 'moteInfo'], [], '\x00\x0cZ\x00\x01\x02\x03\x04\x05\x06\x07ZZZZZ\x00Z'),
+            ('dn_getParameter_networkInfo', ['getParameter', 'networkInfo'], [], '\x00\r\x00\x01\x02\x03\x04\x05\x06\x07\x00Z\x00Z'),
+            ('dn_getParameter_moteStatus', ['getParameter', 'moteStatus'], [], '\x00\x0e\x00Z\x00ZZ\x00\x00\x00ZZ'),
+            ('dn_getParameter_time', ['getParameter', 'time'], [], '\x00\x0f\x00\x01\x02\x03\x04\x05\x06\x07\x00\x01\x02\x03\x04\x00Z'),
+            ('dn_getParameter_charge', ['getParameter', 'charge'], [], '\x00\x10\x00\x00\x00Z\x00\x00\x00ZZZ'),
+            ('dn_getParameter_testRadioRxStats', ['getParameter', 'testRadioRxStats'], [], '\x00\x11\x00Z\x00Z'),
+            ('dn_join', ['join'], [], '\x00'),
+            ('dn_disconnect', ['disconnect'], [], '\x00'),
+            ('dn_reset', ['reset'], [], '\x00'),
+            ('dn_lowPowerSleep', ['lowPowerSleep'], [], '\x00'),
+            ('dn_testRadioTx', ['testRadioTx'], [('channel', 90), ('numPackets', 90)], '\x00'),
+            ('dn_testRadioRx', ['testRadioRx'], [('channel', 90), ('time', 90)], '\x00'),
+            ('dn_clearNV', ['clearNV'], [], '\x00'),
+            ('dn_search', ['search'], [], '\x00'),
+            ('dn_testRadioTxExt', ['testRadioTxExt'], [('testType', 0), ('chanMask', 90), ('repeatCnt', 90), ('txPower', -5), ('seqSize', 90), ('pkLen_1', 90), ('delay_1', 90), ('pkLen_2', 90), ('delay_2', 90), ('pkLen_3', 90), ('delay_3', 90), ('pkLen_4', 90), ('delay_4', 90), ('pkLen_5', 90), ('delay_5', 90), ('pkLen_6', 90), ('delay_6', 90), ('pkLen_7', 90), ('delay_7', 90), ('pkLen_8', 90), ('delay_8', 90), ('pkLen_9', 90), ('delay_9', 90), ('pkLen_10', 90), ('delay_10', 90)], '\x00'),
+            ('dn_testRadioRxExt', ['testRadioRxExt'], [('channelMask', 90), ('time', 90), ('stationId', 90)], '\x00'),
+            ('dn_zeroize', ['zeroize'], [], '\x00'),
+        ],
+    ),
+]
+
+#============================ helpers =========================================
+
+def runGeneric(connector, apiDef, cmdName, names, request, response):
+    (cmdId, serializedFields) = apiDef.serialize(names, dict(request))
+    serializedFields = str(bytearray(serializedFields))
+    if connector.RESPONSE_HEX_TYPE is tuple:
+        payload = struct.unpack('!'+str(len(response))+'B', response)
+    else:
+        payload = memoryview(bytearray(response))
+    (nameArray, res) = apiDef.deserialize(apiDef.COMMAND, cmdId, payload)
+    return (serializedFields, getattr(connector, 'Tuple_'+cmdName)(**res))
+
+def runFastPath(connector, apiDef, cmdName, names, request, response):
+    serializedFields = getattr(connector, '_serialize_'+cmdName)(*[v for (n, v) in request])
+    res = getattr(connector, '_parse_'+cmdName)(memoryview(response), connector.RESPONSE_HEX_TYPE)
+    return (serializedFields, res)
+
+def measure(func, connector, apiDef, commands, numRuns):
+    startTime = time.time()
+    for _ in xrange(numRuns):
+        for (cmdName, names, request, response) in commands:
+            func(connector, apiDef, cmdName, names, request, response)
+    return time.time()-startTime
+
+#============================ main ============================================
+
+def main():
+    
+    numRuns = NUM_RUNS
+    if len(sys.argv)>1:
+        numRuns = int(sys.argv[1])
+    
+    for (connector, apiDefClass, commands) in CONNECTORS:
+        apiDef = apiDefClass()
+        
+        # both paths give the same results
+        for (cmdName, names, request, response) in commands:
+            generic  = runGeneric(connector, apiDef, cmdName, names, request, response)
+            fastPath = runFastPath(connector, apiDef, cmdName, names, request, response)
+            assert generic==fastPath, (cmdName, generic, fastPath)
+        
+        numCalls = numRuns*len(commands)
+        generic  = measure(runGeneric,  connector, apiDef, commands, numRuns)
+        fastPath = measure(runFastPath, connector, apiDef, commands, numRuns)
+        print '{0:<22} {1:>3} commands, generic {2:5.1f} us/call, fast path {3:5.1f} us/call ({4:.1f}x)'.format(
+            connector.__name__,
+            len(commands),
+            1000000*generic/numCalls,
+            1000000*fastPath/numCalls,
+            generic/fastPath,
+        )
+
+if __name__=="__main__":
+    main()
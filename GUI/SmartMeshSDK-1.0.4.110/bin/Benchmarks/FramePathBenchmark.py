@@ -0,0 +1,129 @@
+#!/usr/bin/python
+
+'''
+Measures the per-frame cost of the serial receive path, from the HDLC
+bytes read off the serial port down to the notification queue, including
+the ACK sent back through Hdlc.send().
+
+Usage: FramePathBenchmark.py [<numFrames> [<numRuns>]]
+
+Copies of the frame (or of a part of it) made per received 'receive'
+notification, before/after the frame path was switched to bytearray and
+memoryview:
+
+<table>
+    <tr><th>step                         </th><th>before</th><th>after</th>
+    <tr><td>Hdlc, strip FCS              </td><td>3 lists (payload, fcs, recomputed fcs)</td><td>none (del in place)</td>
+    <tr><td>_parseRxHeader               </td><td>1 list (payload)</td><td>1 memoryview (no copy)</td>
+    <tr><td>deserialize, per field       </td><td>1 list slice + 1 range() list per INT field</td><td>1 memoryview slice (no copy)</td>
+    <tr><td>deserialize, HEXDATA value   </td><td>1 list (the slice)</td><td>1 list (tolist())</td>
+    <tr><td>Hdlc.send (ACK), escaping    </td><td>O(n^2) list.insert(), 1 list + 1 str per byte</td><td>2 bytearray.replace(), 1 str</td>
+</table>
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import random
+import time
+
+from SmartMeshSDK.SerialConnector import Hdlc
+from SmartMeshSDK.IpMoteConnector import IpMoteConnectorInternal
+
+#============================ defines =========================================
+
+NUM_FRAMES         = 20000
+NUM_RUNS           = 5
+CHUNK_SIZE         = 256
+CMDID_RECEIVE      = 0x19
+PAYLOAD_LEN        = 60
+
+#============================ helpers =========================================
+
+class RecordingPort(object):
+    '''
+    \brief Stand-in for a pyserial port, recording what is written.
+    '''
+    
+    def __init__(self):
+        self.written = []
+    
+    def write(self,data):
+        self.written.append(data)
+        return len(data)
+    
+    def close(self):
+        pass
+
+def buildStream(numFrames):
+    '''
+    \brief Build the HDLC byte stream of 'receive' notifications.
+    '''
+    rng          = random.Random(0)
+    frames       = []
+    for i in range(numFrames):
+        payload  = [0x01]                                          # socketId
+        payload += [rng.randint(0x00,0xff) for _ in range(16)]     # srcAddr
+        payload += [0xf0,0xb8]                                     # srcPort
+        payload += [rng.randint(0x00,0xff) for _ in range(PAYLOAD_LEN)]
+        flags    = (i%2)<<1                                        # packetId
+        frames  += [[CMDID_RECEIVE,len(payload),flags]+payload]
+    
+    port                   = RecordingPort()
+    hdlc                   = Hdlc.Hdlc(None,None)
+    hdlc.pyserialHandler   = port
+    hdlc.connected         = True
+    for frame in frames:
+        hdlc.send(frame)
+    stream                 = ''.join(port.written)
+    
+    return [stream[i:i+CHUNK_SIZE] for i in range(0,len(stream),CHUNK_SIZE)]
+
+def runOnce(chunks,numFrames):
+    connector                        = IpMoteConnectorInternal.IpMoteConnectorInternal(maxQSize=numFrames+1)
+    connector.hdlc                   = Hdlc.Hdlc(connector._hdlcRxCb,None,bulkRx=True)
+    connector.hdlc.pyserialHandler   = RecordingPort()
+    connector.hdlc.connected         = True
+    connector.isConnected            = True
+    
+    startTime = time.time()
+    for chunk in chunks:
+        connector.hdlc._rxChunk(chunk)
+    duration  = time.time()-startTime
+    
+    assert connector.queue.qsize()==numFrames
+    
+    return duration
+
+#============================ main ============================================
+
+def main():
+    
+    numFrames = NUM_FRAMES
+    numRuns   = NUM_RUNS
+    if len(sys.argv)>1:
+        numFrames = int(sys.argv[1])
+    if len(sys.argv)>2:
+        numRuns   = int(sys.argv[2])
+    
+    chunks    = buildStream(numFrames)
+    
+    # best of numRuns, to filter out scheduling noise
+    duration  = min([runOnce(chunks,numFrames) for _ in range(numRuns)])
+    
+    print 'serial frame path: {0} frames in {1:.3f}s ({2:.1f} us/frame, best of {3})'.format(
+        numFrames,
+        duration,
+        1000000*duration/numFrames,
+        numRuns,
+    )
+
+if __name__=="__main__":
+    main()
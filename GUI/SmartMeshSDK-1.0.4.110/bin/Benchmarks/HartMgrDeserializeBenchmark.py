@@ -0,0 +1,139 @@
+#!/usr/bin/python
+
+'''
+Compares HartMgrDefinition deserializing the XML-RPC responses of a HART
+manager with cElementTree and cached field converters, to the minidom-based
+deserialization it replaced (reproduced by LegacyHartMgrDefinition).
+
+Usage: HartMgrDeserializeBenchmark.py [<numMotes> [<numRuns>]]
+
+The responses are those of HartMgrStandIn, for a network of numMotes motes:
+getMotes, getPaths, getMoteStatistics and getNetworkStatistics. Both
+deserializations must return the same dictionaries.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import time
+from xml.dom.minidom import parseString
+
+from SmartMeshSDK.ApiDefinition import DefinitionLoader, \
+                                       HartMgrDefinition, \
+                                       xmlutils
+
+import HartMgrStandIn
+
+#============================ defines =========================================
+
+NUM_MOTES          = 250
+NUM_RUNS           = 5
+
+#============================ helpers =========================================
+
+class LegacyHartMgrDefinition(HartMgrDefinition.HartMgrDefinition):
+    '''
+    \brief HartMgrDefinition, deserializing responses with minidom and
+           converting fields one if at a time, as it used to.
+    '''
+
+    def _xml_parse_field(self, str_value, field_metadata):
+        if field_metadata.format in [self.INT, self.INTS]:
+            return int(str_value)
+        elif field_metadata.format == self.FLOAT:
+            return float(str_value)
+        elif field_metadata.format == self.BOOL:
+            if str_value.lower() == 'true':
+                return True
+            else:
+                return False
+        elif field_metadata.format == self.HEXDATA:
+            returnVal = [int(str_value[i:i+2], 16) for i in range(0, len(str_value), 2)]
+            return returnVal
+        else:
+            return str_value
+
+    def _xml_parse_fieldset(self, obj_dict, fields_metadata):
+        filtered_dict = {}
+        for field in fields_metadata:
+            try:
+                field_str = obj_dict[field.name]
+                filtered_dict[field.name] = self._xml_parse_field(field_str, field)
+            except KeyError:
+                filtered_dict[field.name] = ''
+        return filtered_dict
+
+    def _parse_xmlobj(self, xml_doc, base_element, fields_metadata, isArray = False):
+        obj_docs = parseString(xml_doc).getElementsByTagName(base_element)
+        aRes = []
+        for obj_doc in obj_docs:
+            full_resp = xmlutils.xml_obj_to_dict(obj_doc)
+            if fields_metadata:
+                res = self._xml_parse_fieldset(full_resp, fields_metadata)
+            else:
+                res = full_resp
+            if not isArray :
+                return res
+            aRes.append(res)
+        return aRes
+
+def getResponses(numMotes):
+    standIn = HartMgrStandIn.HartMgrStandIn(numMotes=numMotes)
+    apidef  = DefinitionLoader.getDefinition('HartMgrDefinition')
+    mac     = HartMgrStandIn.getMac(2)
+    responses = []
+    for (cmdName, cmdParams) in [
+            (['getMotes'],             {}),
+            (['getPaths'],             {'moteMac': mac}),
+            (['getMoteStatistics'],    {'macAddr': mac, 'period': 'current', 'index': 0}),
+            (['getNetworkStatistics'], {'period': 'lifetime', 'index': 0}),
+        ]:
+        (category, query) = apidef.serialize(cmdName, cmdParams)
+        responses.append((cmdName, standIn.getConfig(HartMgrStandIn.LOGIN_TOKEN, category, query)))
+    standIn.close()
+    return responses
+
+def measure(apidef, cmdName, response, numRuns):
+    durations = []
+    for _ in range(numRuns):
+        startTime = time.time()
+        resp      = apidef.deserialize(cmdName, response)
+        durations.append(time.time()-startTime)
+    # best of numRuns, to filter out scheduling noise
+    return (min(durations), resp)
+
+#============================ main ============================================
+
+def main():
+
+    numMotes = NUM_MOTES
+    numRuns  = NUM_RUNS
+    if len(sys.argv)>1:
+        numMotes = int(sys.argv[1])
+    if len(sys.argv)>2:
+        numRuns  = int(sys.argv[2])
+
+    legacy = LegacyHartMgrDefinition()
+    apidef = HartMgrDefinition.HartMgrDefinition()
+    for (cmdName, response) in getResponses(numMotes):
+        (legacyDuration, legacyResp) = measure(legacy, cmdName, response, numRuns)
+        (duration,       resp)       = measure(apidef, cmdName, response, numRuns)
+        assert resp==legacyResp
+        print '{0:<22} {1:>7} B: minidom {2:8.3f} ms, cElementTree {3:8.3f} ms ({4:.1f}x, best of {5})'.format(
+            cmdName[0],
+            len(response),
+            1000*legacyDuration,
+            1000*duration,
+            legacyDuration/duration,
+            numRuns,
+        )
+
+if __name__=="__main__":
+    main()
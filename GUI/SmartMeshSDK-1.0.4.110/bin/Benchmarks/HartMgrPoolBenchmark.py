@@ -0,0 +1,138 @@
+#!/usr/bin/python
+
+'''
+Measures how fast a HartMgrConnector enumerates a HART network: getMotes,
+then getMoteStatistics and getPaths for each mote, then getPathStatistics for
+each path, against HartMgrStandIn, a local stand-in for the manager's
+XML-RPC API.
+
+Usage: HartMgrPoolBenchmark.py [<numMotes> [<latencyMs>]]
+
+The stand-in takes latencyMs to answer each command. The network is
+enumerated:
+- one command at a time, with a manager closing the connection after each
+  call (HTTP/1.0), then keeping it alive;
+- by 4 threads sharing the 4 connections of the connector;
+- with sendBatch(), i.e. system.multicall requests sent in parallel, then
+  against a manager without system.multicall.
+Everything runs on localhost, without TLS: the cost of a connection is much
+higher on a network, and higher still with TLS.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import threading
+import time
+
+from SmartMeshSDK.HartMgrConnector import HartMgrConnector
+
+import HartMgrStandIn
+
+#============================ defines =========================================
+
+NUM_MOTES          = 250
+LATENCY_MS         = 1.0
+NUM_THREADS        = 4
+
+#============================ helpers =========================================
+
+def enumerateSequential(connector, numThreads):
+    motes     = connector.dn_getMotes()
+    moteStats = {}
+    paths     = {}
+    pathStats = {}
+    def enumerateMotes(motes):
+        for mote in motes:
+            moteStats[mote.macAddr] = connector.dn_getMoteStatistics(mote.macAddr, 'current', 0)
+            paths[mote.macAddr]     = connector.dn_getPaths(mote.macAddr)
+            for path in paths[mote.macAddr]:
+                pathStats[path.pathId] = connector.dn_getPathStatistics(path.pathId, 'current', 0)
+    threads = [threading.Thread(target=enumerateMotes, args=(motes[i::numThreads],)) for i in range(numThreads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return (motes, moteStats, paths, pathStats)
+
+def enumerateBatch(connector, numThreads):
+    motes     = connector.dn_getMotes()
+    responses = connector.sendBatch(
+        [(['getMoteStatistics'], {'macAddr': mote.macAddr, 'period': 'current', 'index': 0}) for mote in motes] +
+        [(['getPaths'],          {'moteMac': mote.macAddr}) for mote in motes]
+    )
+    moteStats = {}
+    paths     = {}
+    for (mote, stats, moteResponses) in zip(motes, responses[:len(motes)], responses[len(motes):]):
+        moteStats[mote.macAddr] = HartMgrConnector.HartMgrConnector.Tuple_dn_getMoteStatistics(**stats)
+        paths[mote.macAddr]     = [HartMgrConnector.HartMgrConnector.Tuple_dn_getPaths(**r) for r in moteResponses]
+    allPaths  = [path for mote in motes for path in paths[mote.macAddr]]
+    responses = connector.sendBatch(
+        [(['getPathStatistics'], {'pathId': path.pathId, 'period': 'current', 'index': 0}) for path in allPaths]
+    )
+    pathStats = {}
+    for (path, stats) in zip(allPaths, responses):
+        pathStats[path.pathId] = HartMgrConnector.HartMgrConnector.Tuple_dn_getPathStatistics(**stats)
+    return (motes, moteStats, paths, pathStats)
+
+def measure(numMotes, latency, keepAlive, multicall, numConnections, enumerate, numThreads):
+    standIn = HartMgrStandIn.HartMgrStandIn(numMotes=numMotes, latency=latency, keepAlive=keepAlive, multicall=multicall)
+    standIn.start()
+    connector = HartMgrConnector.HartMgrConnector()
+    connector.connect({
+        'host':            '127.0.0.1',
+        'port':            standIn.getPort(),
+        'num_connections': numConnections,
+    })
+    try:
+        startTime = time.time()
+        network   = enumerate(connector, numThreads)
+        duration  = time.time()-startTime
+    finally:
+        connector.disconnect()
+        standIn.close()
+    return (duration, standIn.numCalls, standIn.getNumConnections(), network)
+
+#============================ main ============================================
+
+def main():
+
+    numMotes  = NUM_MOTES
+    latencyMs = LATENCY_MS
+    if len(sys.argv)>1:
+        numMotes  = int(sys.argv[1])
+    if len(sys.argv)>2:
+        latencyMs = float(sys.argv[2])
+
+    expected = None
+    for (name, keepAlive, multicall, numConnections, enumerate, numThreads) in [
+            ('sequential, HTTP/1.0',     False, True,  1,           enumerateSequential, 1),
+            ('sequential, keep-alive',   True,  True,  1,           enumerateSequential, 1),
+            ('4 threads, 4 connections', True,  True,  NUM_THREADS, enumerateSequential, NUM_THREADS),
+            ('sendBatch, multicall',     True,  True,  NUM_THREADS, enumerateBatch,      1),
+            ('sendBatch, no multicall',  True,  False, NUM_THREADS, enumerateBatch,      1),
+        ]:
+        (duration, numCalls, numConnections, network) = measure(
+            numMotes, latencyMs/1000.0, keepAlive, multicall, numConnections, enumerate, numThreads,
+        )
+        if expected is None:
+            expected = network
+        assert network==expected
+        print '{0:<26} {1} motes, {2} commands in {3:.3f}s ({4:.2f} ms/command), {5} connections'.format(
+            name,
+            numMotes,
+            numCalls,
+            duration,
+            1000*duration/numCalls,
+            numConnections,
+        )
+
+if __name__=="__main__":
+    main()
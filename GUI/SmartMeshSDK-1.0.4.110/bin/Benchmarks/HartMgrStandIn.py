@@ -0,0 +1,237 @@
+#!/usr/bin/python
+
+'''
+A stand-in for the XML-RPC API of a HART manager, answering the commands an
+application enumerating the network sends: login, logout, and the getConfig
+queries of getMotes, getMote, getMoteStatistics, getPaths,
+getPathStatistics and getNetworkStatistics. Responses are built from the fields of HartMgrDefinition.
+
+Usage: HartMgrStandIn.py [<port> [<numMotes>]]
+
+Imported by HartMgrPoolBenchmark; run on its own, point the HartMgrConnector
+(or the APIExplorer) at it.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import re
+import threading
+import time
+import SocketServer
+import SimpleXMLRPCServer
+
+from SmartMeshSDK.ApiDefinition import DefinitionLoader, \
+                                       ApiDefinition
+
+#============================ defines =========================================
+
+DEFAULT_PORT       = 4445
+NUM_MOTES          = 250
+NUM_PATHS_PER_MOTE = 3
+LOGIN_TOKEN        = 'standInToken'
+
+STAT_PERIODS       = [
+    # query element  response elements
+    ('statCur',      '<statCur>{0}</statCur>'),
+    ('lifetime',     '<lifetime>{0}</lifetime>'),
+    ('stat15Min',    '<stat15MinSet><stat15Min>{0}</stat15Min></stat15MinSet>'),
+    ('stat1Day',     '<stat1DaySet><stat1Day>{0}</stat1Day></stat1DaySet>'),
+]
+
+#============================ helpers =========================================
+
+def getMac(moteId):
+    return '00-17-0D-00-00-38-{0:02X}-{1:02X}'.format(moteId>>8, moteId&0xff)
+
+def getMoteId(mac):
+    return int(mac[-5:].replace('-', ''), 16)
+
+def formatFields(fields, values):
+    '''
+    \brief Returns the XML elements of a response, with the values given or
+           a value of the format of each field.
+    '''
+    elements = []
+    for field in fields:
+        if field.name in values:
+            value = values[field.name]
+        elif field.format==ApiDefinition.FieldFormats.BOOL:
+            value = 'true'
+        elif field.format in [ApiDefinition.FieldFormats.INT, ApiDefinition.FieldFormats.INTS]:
+            value = 7
+        elif field.format==ApiDefinition.FieldFormats.FLOAT:
+            value = 3.6
+        elif field.format==ApiDefinition.FieldFormats.HEXDATA:
+            value = '0A0B'
+        else:
+            value = field.name
+        elements.append('<{0}>{1}</{0}>'.format(field.name, value))
+    return ''.join(elements)
+
+class _RequestHandler(SimpleXMLRPCServer.SimpleXMLRPCRequestHandler):
+    protocol_version        = 'HTTP/1.1'    # keeps connections alive
+    disable_nagle_algorithm = True
+
+class _ClosingRequestHandler(SimpleXMLRPCServer.SimpleXMLRPCRequestHandler):
+    protocol_version        = 'HTTP/1.0'    # one connection per call
+
+class _Server(SocketServer.ThreadingMixIn, SimpleXMLRPCServer.SimpleXMLRPCServer):
+    daemon_threads      = True
+    allow_reuse_address = True
+
+    def __init__(self, addr, requestHandler):
+        SimpleXMLRPCServer.SimpleXMLRPCServer.__init__(self, addr, requestHandler, logRequests=False)
+        self.numConnections = 0
+
+    def process_request(self, request, client_address):
+        self.numConnections += 1
+        SocketServer.ThreadingMixIn.process_request(self, request, client_address)
+
+#============================ classes =========================================
+
+class HartMgrStandIn(threading.Thread):
+    '''
+    \brief Serves the XML-RPC API of a manager of numMotes motes, each with
+           NUM_PATHS_PER_MOTE paths, in a thread.
+    '''
+
+    def __init__(self, port=0, numMotes=NUM_MOTES, latency=0, keepAlive=True, multicall=True):
+        '''
+        \param port      TCP port, 0 for any free port (see getPort()).
+        \param numMotes  Number of motes of the network.
+        \param latency   Time, in seconds, the manager takes to answer a
+                         command.
+        \param keepAlive Keep connections open between calls (HTTP/1.1), or
+                         close them after each call (HTTP/1.0).
+        \param multicall Implement system.multicall.
+        '''
+        self.numMotes  = numMotes
+        self.latency   = latency
+        self.apidef    = DefinitionLoader.getDefinition('HartMgrDefinition')
+        if keepAlive:
+            handler    = _RequestHandler
+        else:
+            handler    = _ClosingRequestHandler
+        self.server    = _Server(('127.0.0.1', port), handler)
+        self.server.register_function(self.login,     'login')
+        self.server.register_function(self.logout,    'logout')
+        self.server.register_function(self.getConfig, 'getConfig')
+        if multicall:
+            self.server.register_multicall_functions()
+        self.numCalls  = 0
+        threading.Thread.__init__(self)
+        self.name      = 'HartMgrStandIn'
+        self.daemon    = True
+
+    def run(self):
+        self.server.serve_forever(poll_interval=0.1)
+
+    def getPort(self):
+        return self.server.server_address[1]
+
+    def getNumConnections(self):
+        return self.server.numConnections
+
+    def close(self):
+        if self.isAlive():
+            self.server.shutdown()
+        self.server.server_close()
+
+    #======================== XML-RPC methods =================================
+
+    def login(self, user, password):
+        return LOGIN_TOKEN
+
+    def logout(self, token):
+        return 'ok'
+
+    def getConfig(self, token, category, query):
+        self.numCalls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        if '<Network><Statistics>' in query:
+            return '<config><Network><Statistics>{0}</Statistics></Network></config>'.format(
+                self._formatStats(['getNetworkStatistics'], query),
+            )
+        m = re.search('<Mote><macAddr>(.+?)</macAddr><Statistics>', query)
+        if m:
+            return '<config><Motes><Mote><macAddr>{0}</macAddr><Statistics>{1}</Statistics></Mote></Motes></config>'.format(
+                m.group(1),
+                self._formatStats(['getMoteStatistics'], query),
+            )
+        m = re.search('<Mote><macAddr>(.+?)</macAddr></Mote>', query)
+        if m:
+            return '<config><Motes>{0}</Motes></config>'.format(self._formatMote(getMoteId(m.group(1))))
+        if '<Motes></Motes>' in query or '<Motes/>' in query:
+            return '<config><Motes>{0}</Motes></config>'.format(
+                ''.join(self._formatMote(moteId) for moteId in range(1, self.numMotes+1)),
+            )
+        m = re.search('<Path><moteMac>(.+?)</moteMac></Path>', query)
+        if m:
+            moteId = getMoteId(m.group(1))
+            return '<config><Paths>{0}</Paths></config>'.format(
+                ''.join(self._formatPath(moteId, i) for i in range(NUM_PATHS_PER_MOTE)),
+            )
+        m = re.search('<Path><pathId>(\d+)</pathId><Statistics>', query)
+        if m:
+            return '<config><Paths><Path><pathId>{0}</pathId><Statistics>{1}</Statistics></Path></Paths></config>'.format(
+                m.group(1),
+                self._formatStats(['getPathStatistics'], query),
+            )
+        raise ValueError('unsupported query {0}'.format(query))
+
+    #======================== private =========================================
+
+    def _formatMote(self, moteId):
+        fields = self.apidef.getResponseFields(self.apidef.COMMAND, ['getMotes'])
+        return '<Mote>{0}</Mote>'.format(formatFields(fields, {
+            'moteId':         moteId,
+            'macAddr':        getMac(moteId),
+            'state':          'Operational',
+            'isAccessPoint':  'true' if moteId==1 else 'false',
+        }))
+
+    def _formatPath(self, moteId, i):
+        fields = self.apidef.getResponseFields(self.apidef.COMMAND, ['getPaths'])
+        return '<Path>{0}</Path>'.format(formatFields(fields, {
+            'pathId':         moteId*NUM_PATHS_PER_MOTE+i,
+            'moteAMac':       getMac(moteId),
+            'moteBMac':       getMac(1+(moteId+i)%self.numMotes),
+            'pathDirection':  'upstream',
+        }))
+
+    def _formatStats(self, cmdName, query):
+        fields = self.apidef.getResponseFields(self.apidef.COMMAND, cmdName)
+        for (element, template) in STAT_PERIODS:
+            if element in query:
+                return template.format(formatFields(fields, {}))
+        return ''
+
+#============================ main ============================================
+
+def main():
+    port     = DEFAULT_PORT
+    numMotes = NUM_MOTES
+    if len(sys.argv)>1:
+        port     = int(sys.argv[1])
+    if len(sys.argv)>2:
+        numMotes = int(sys.argv[2])
+
+    standIn = HartMgrStandIn(port=port, numMotes=numMotes)
+    print 'HART manager stand-in ({0} motes) on 127.0.0.1:{1}. Ctrl-C to exit.'.format(numMotes, standIn.getPort())
+    try:
+        standIn.run()
+    except KeyboardInterrupt:
+        pass
+
+if __name__=="__main__":
+    main()
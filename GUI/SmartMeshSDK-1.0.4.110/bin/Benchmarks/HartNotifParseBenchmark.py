@@ -0,0 +1,137 @@
+#!/usr/bin/python
+
+'''
+Compares the two ways of reading the notification channel of a HART manager:
+- NotifSeparator, which cuts the stream into one string per notification,
+  then HartMgrDefinition.parse_notif, which parses each string again;
+- NotifParser, which parses the stream once with expat, then
+  HartMgrDefinition.parse_notif_obj.
+
+Usage: HartNotifParseBenchmark.py [<captureFile> [<numRuns>]]
+
+captureFile holds the bytes received on a notification channel. Without it,
+the benchmark uses a stream of NUM_NOTIFS notifications of a 100-mote network
+(data, events, standard mote reports and logs), in the manager's format. The
+stream is fed in reads of 1 KB (what NotifReader used to read) and of 64 KB,
+and both ways must parse the same notifications.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import time
+
+from SmartMeshSDK.ApiDefinition    import DefinitionLoader
+from SmartMeshSDK.HartMgrConnector import NotifReader
+
+#============================ defines =========================================
+
+NUM_NOTIFS         = 10000
+NUM_MOTES          = 100
+NUM_RUNS           = 5
+READ_SIZES         = [1024, 65536]
+
+#============================ helpers =========================================
+
+def getMac(moteId):
+    return '00-17-0D-00-00-38-{0:02X}-{1:02X}'.format(moteId>>8, moteId&0xff)
+
+def buildNotif(i):
+    moteId = 2+i%NUM_MOTES
+    kind   = i%20
+    if kind<14:
+        return ('<data><moteId>{0}</moteId><macAddr>{1}</macAddr><time>{2}</time>'
+                '<payload>{3}</payload><payloadType>81</payloadType><isReliable>true</isReliable>'
+                '<isRequest>false</isRequest><isBroadcast>false</isBroadcast>'
+                '<callbackId>0</callbackId><counter>{4}</counter></data>').format(
+                    moteId, getMac(moteId), 1400000000000+i*10, '{0:032X}'.format(i), i&0xffff)
+    elif kind<16:
+        return ('<event><timeStamp>{0}</timeStamp><eventId>{1}</eventId>'
+                '<netMoteLive><moteId>{2}</moteId><macAddr>{3}</macAddr><reason>join</reason>'
+                '</netMoteLive></event>').format(1400000000000+i*10, i, moteId, getMac(moteId))
+    elif kind<18:
+        return ('<event><timeStamp>{0}</timeStamp><eventId>{1}</eventId>'
+                '<netPathCreate><pathId>{2}</pathId><moteAMac>{3}</moteAMac><moteBMac>{4}</moteBMac>'
+                '</netPathCreate></event>').format(1400000000000+i*10, i, i, getMac(moteId), getMac(1))
+    elif kind<19:
+        return ('<stdMoteReport><time>{0}</time><macAddr>{1}</macAddr><payload>{2}</payload>'
+                '</stdMoteReport>').format(1400000000000+i*10, getMac(moteId), '0A0B0C0D'*16)
+    else:
+        return ('<log><time>{0}</time><severity>info</severity>'
+                '<message>Mote #{1} joined</message></log>').format(1400000000000+i*10, moteId)
+
+def buildStream(numNotifs):
+    return '<dustnet><authrs><result>ok</result></authrs></dustnet>' + \
+           '\n'.join(buildNotif(i) for i in range(numNotifs))
+
+def runSeparator(apidef, stream, readSize):
+    notifs = []
+    def handle(notif_name, notif_str):
+        notifs.append(apidef.parse_notif([notif_name], notif_str))
+    separator = NotifReader.NotifSeparator(handle)
+    for i in range(0, len(stream), readSize):
+        separator.parse(stream[i:i+readSize])
+    return notifs
+
+def runParser(apidef, stream, readSize):
+    notifs = []
+    def handle(notif_name, notif_obj):
+        notifs.append(apidef.parse_notif_obj([notif_name], notif_obj))
+    parser = NotifReader.NotifParser(handle)
+    for i in range(0, len(stream), readSize):
+        parser.parse(stream[i:i+readSize])
+    return notifs
+
+def measure(run, apidef, stream, readSize, numRuns):
+    durations = []
+    for _ in range(numRuns):
+        startTime = time.time()
+        notifs    = run(apidef, stream, readSize)
+        durations.append(time.time()-startTime)
+    # best of numRuns, to filter out scheduling noise
+    return (min(durations), notifs)
+
+#============================ main ============================================
+
+def main():
+
+    numRuns = NUM_RUNS
+    if len(sys.argv)>1:
+        with open(sys.argv[1], 'rb') as f:
+            stream = f.read()
+    else:
+        stream  = buildStream(NUM_NOTIFS)
+    if len(sys.argv)>2:
+        numRuns = int(sys.argv[2])
+
+    apidef   = DefinitionLoader.getDefinition('HartMgrDefinition')
+    expected = None
+    for readSize in READ_SIZES:
+        for (name, run) in [
+                ('NotifSeparator',         runSeparator),
+                ('NotifParser (expat)',    runParser),
+            ]:
+            (duration, notifs) = measure(run, apidef, stream, readSize, numRuns)
+            if expected is None:
+                expected = notifs
+            assert notifs==expected
+            print '{0:<24} {1:>5} B reads: {2} notifications ({3} kB) in {4:.3f}s ({5:.1f} us/notification, {6:.1f} MB/s, best of {7})'.format(
+                name,
+                readSize,
+                len(notifs),
+                len(stream)/1000,
+                duration,
+                1000000*duration/len(notifs),
+                len(stream)/duration/1000000,
+                numRuns,
+            )
+
+if __name__=="__main__":
+    main()
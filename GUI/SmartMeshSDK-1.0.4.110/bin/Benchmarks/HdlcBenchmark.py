@@ -0,0 +1,125 @@
+#!/usr/bin/python
+
+'''
+Compares the per-byte and the bulk-read HDLC deframers.
+
+Usage: HdlcBenchmark.py [<recordedStream> [<chunkSize>]]
+
+<recordedStream> is a file containing raw bytes as received on the serial
+port. If not specified, a stream of random frames is generated.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import random
+import time
+
+from SmartMeshSDK.SerialConnector import Hdlc
+
+#============================ defines =========================================
+
+NUM_FRAMES         = 20000
+MIN_FRAME_LEN      = 8
+MAX_FRAME_LEN      = 90
+DEFAULT_CHUNK_SIZE = 256
+
+#============================ helpers =========================================
+
+class ReplayPort(object):
+    '''
+    \brief Stand-in for a pyserial port, replaying a recorded byte stream.
+    
+    At most chunkSize bytes are reported as waiting at any time, like a
+    driver buffer which is drained as data comes in.
+    '''
+    
+    def __init__(self,stream,chunkSize):
+        self.stream     = stream
+        self.chunkSize  = chunkSize
+        self.index      = 0
+        self.written    = []
+    
+    def read(self,size=1):
+        returnVal       = self.stream[self.index:self.index+size]
+        self.index     += len(returnVal)
+        return returnVal
+    
+    def inWaiting(self):
+        return min(len(self.stream)-self.index,self.chunkSize)
+    
+    def write(self,data):
+        self.written   += [data]
+        return len(data)
+    
+    def close(self):
+        pass
+
+def buildStream(numFrames):
+    '''
+    \brief Build a byte stream of random frames, as Hdlc.send() would write them.
+    '''
+    rng                    = random.Random(0)
+    hdlc                   = Hdlc.Hdlc(None,None)
+    hdlc.pyserialHandler   = ReplayPort('',0)
+    hdlc.connected         = True
+    for _ in range(numFrames):
+        hdlc.send([rng.randint(0x00,0xff) for _ in range(rng.randint(MIN_FRAME_LEN,MAX_FRAME_LEN))])
+    return ''.join(hdlc.pyserialHandler.written)
+
+def deframe(stream,bulkRx,chunkSize):
+    '''
+    \brief Run the HDLC receive loop over the stream until it is exhausted.
+    
+    \returns A tuple (duration, frames received).
+    '''
+    frames                 = []
+    hdlc                   = Hdlc.Hdlc(frames.append,lambda state: None,bulkRx=bulkRx)
+    hdlc.pyserialHandler   = ReplayPort(stream,chunkSize)
+    hdlc.connected         = True
+    startTime              = time.time()
+    hdlc.run()
+    return (max(time.time()-startTime,1e-6),frames)
+
+#============================ main ============================================
+
+def main():
+    
+    chunkSize = DEFAULT_CHUNK_SIZE
+    if len(sys.argv)>1:
+        with open(sys.argv[1],'rb') as f:
+            stream = f.read()
+        if len(sys.argv)>2:
+            chunkSize = int(sys.argv[2])
+    else:
+        stream = buildStream(NUM_FRAMES)
+    
+    print 'HDLC deframing benchmark: {0} bytes, chunk size {1}'.format(len(stream),chunkSize)
+    
+    results = {}
+    for (name,bulkRx) in [('per-byte',False),('bulk',True)]:
+        (duration,frames) = deframe(stream,bulkRx,chunkSize)
+        results[name]     = (duration,frames)
+        print '{0:>10}: {1:6} frames in {2:.3f}s ({3:.0f} frames/s, {4:.0f} kB/s)'.format(
+            name,
+            len(frames),
+            duration,
+            len(frames)/duration,
+            len(stream)/duration/1000,
+        )
+    
+    if results['per-byte'][1]!=results['bulk'][1]:
+        print 'ERROR: the two deframers did not produce the same frames'
+        sys.exit(1)
+    
+    print 'speedup: {0:.1f}x'.format(results['per-byte'][0]/results['bulk'][0])
+
+if __name__=="__main__":
+    main()
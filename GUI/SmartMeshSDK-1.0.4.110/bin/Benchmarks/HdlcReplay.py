@@ -0,0 +1,112 @@
+#!/usr/bin/python
+
+'''
+Replays an HDLC capture into a serial connector, and reports throughput
+and latency.
+
+Usage: HdlcReplay.py <IpMote|HartMote|IpMgr> <captureFile> [<speed> [raw]]
+
+<captureFile> is written by a connector connected with the 'captureFile'
+parameter. <speed> is 1 for original speed (default), N for N times faster,
+or 'max' for as fast as possible. With 'raw', the bytes read from the serial
+port are replayed through the deframer, instead of the deframed frames.
+
+The notifications are consumed as they come in, and counted.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import threading
+
+from SmartMeshSDK.SerialConnector                 import HdlcCapture
+from SmartMeshSDK.IpMoteConnector                 import IpMoteConnector
+from SmartMeshSDK.HartMoteConnector               import HartMoteConnector
+from SmartMeshSDK.IpMgrConnectorSerial            import IpMgrConnectorSerial
+
+#============================ defines =========================================
+
+CONNECTORS = {
+    'IpMote':   IpMoteConnector.IpMoteConnector,
+    'HartMote': HartMoteConnector.HartMoteConnector,
+    'IpMgr':    IpMgrConnectorSerial.IpMgrConnectorSerial,
+}
+
+#============================ helpers =========================================
+
+class NotifConsumer(threading.Thread):
+    '''
+    \brief Consumes the notifications of the replayed connector.
+    '''
+
+    def __init__(self,connector):
+        self.connector  = connector
+        self.goOn       = True
+        self.numNotifs  = 0
+        threading.Thread.__init__(self)
+        self.name       = 'NotifConsumer'
+        self.daemon     = True
+
+    def run(self):
+        while self.goOn or not self.connector.queue.empty():
+            if self.connector.getNotificationInternal(0.1):
+                self.numNotifs += 1
+
+def usage():
+    print __doc__
+    sys.exit(1)
+
+#============================ main ============================================
+
+def main():
+
+    if len(sys.argv)<3 or sys.argv[1] not in CONNECTORS:
+        usage()
+
+    connector    = CONNECTORS[sys.argv[1]](maxQSize=100000)
+    fileName     = sys.argv[2]
+    speed        = 1.0
+    if len(sys.argv)>3:
+        if sys.argv[3]=='max':
+            speed = None
+        else:
+            speed = float(sys.argv[3])
+    useRaw       = len(sys.argv)>4 and sys.argv[4]=='raw'
+
+    replay       = HdlcCapture.Replay(connector,fileName,useRaw=useRaw)
+    consumer     = NotifConsumer(connector)
+    consumer.start()
+    stats        = replay.run(speed)
+    consumer.goOn = False
+    consumer.join()
+
+    print 'replayed {0} {1} records ({2} bytes) in {3:.3f}s, speed {4}'.format(
+        stats['numRecords'],
+        'raw' if useRaw else 'frame',
+        stats['numBytes'],
+        stats['duration'],
+        'max' if not speed else '{0}x'.format(speed),
+    )
+    print '  throughput: {0:.0f} records/s, {1:.0f} kB/s'.format(
+        stats['recordsPerSec'],
+        stats['bytesPerSec']/1000,
+    )
+    if stats['numRecords']:
+        print '  latency:    min {0:.1f}us, avg {1:.1f}us, p99 {2:.1f}us, max {3:.1f}us'.format(
+            1000000*stats['minLatency'],
+            1000000*stats['avgLatency'],
+            1000000*stats['p99Latency'],
+            1000000*stats['maxLatency'],
+        )
+    print '  errors:     {0}'.format(stats['numErrors'])
+    print '  notifications consumed: {0}'.format(consumer.numNotifs)
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/python
+
+'''
+Compares the cost of splitting a Serial Mux stream into messages with the
+former string-based parser of MuxMsg, and with the current one, which parses
+in place in a preallocated buffer.
+
+Usage: MuxParserBenchmark.py [<numMsgs> [<numRuns>]]
+
+A stream of 'notifData' notifications, as received from the Serial Mux during
+a burst, is parsed:
+- by the former parser and by MuxMsg.parse(), fed with chunks of 4096 bytes
+  (the size IpMgrConnectorMuxInternal used to read), 65536 bytes, and 1MB
+  (as when the application falls behind a burst);
+- by MuxMsg.recv_from(), reading from a socket-like object.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import struct
+import time
+
+from SmartMeshSDK.IpMgrConnectorMux import MuxMsg
+
+#============================ defines =========================================
+
+NUM_MSGS           = 10000
+NUM_RUNS           = 5
+
+NOTIF_DATA_TYPE    = 6
+PAYLOAD            = struct.pack('!B', 4) + ''.join(chr(i) for i in range(84))
+
+#============================ helpers =========================================
+
+class LegacyMuxMsg(object):
+    '''
+    \brief The parser of MuxMsg before it parsed in place, for comparison.
+    '''
+    def __init__(self, cb, magic=MuxMsg.MAGIC):
+        self.callback = cb
+        self.magic = magic
+        self.input_buffer = ''
+
+    def parse(self, data):
+        if not data:
+            return
+        self.input_buffer += data
+        while self.parse_one():
+            pass
+
+    def parse_one(self):
+        msg_start = self.input_buffer.find(self.magic)
+        if msg_start >= 0:
+            self.input_buffer = self.input_buffer[msg_start:]
+            if len(self.input_buffer) < 6:
+                return False
+            msg_len = struct.unpack('!H', self.input_buffer[4:6])[0]
+            index_end = 6 + msg_len
+            if len(self.input_buffer) < index_end:
+                return False
+            msg = self.input_buffer[6:index_end]
+            (cmd_id, cmd_type) = struct.unpack('!HB', msg[0:3])
+            data = msg[3:]
+            if self.callback:
+                self.callback(cmd_id, cmd_type, data)
+            self.input_buffer = self.input_buffer[index_end:]
+            return True
+        else:
+            self.input_buffer = self.input_buffer[-3:]
+            return False
+
+class StreamSocket(object):
+    '''
+    \brief Socket-like object returning a stream in chunks, as recv_into()
+           would.
+    '''
+    def __init__(self, stream, chunkSize):
+        self.stream    = stream
+        self.chunkSize = chunkSize
+        self.offset    = 0
+
+    def recv_into(self, buf):
+        num_bytes = min(len(buf), self.chunkSize, len(self.stream)-self.offset)
+        buf[:num_bytes] = self.stream[self.offset:self.offset+num_bytes]
+        self.offset += num_bytes
+        return num_bytes
+
+def buildStream(numMsgs):
+    builder = MuxMsg.MuxMsg(None)
+    return ''.join(builder.build_message(NOTIF_DATA_TYPE, PAYLOAD) for _ in range(numMsgs))
+
+def runLegacy(stream, chunkSize, counter):
+    parser = LegacyMuxMsg(counter)
+    for i in range(0, len(stream), chunkSize):
+        parser.parse(stream[i:i+chunkSize])
+
+def runParse(stream, chunkSize, counter):
+    parser = MuxMsg.MuxMsg(counter)
+    for i in range(0, len(stream), chunkSize):
+        parser.parse(stream[i:i+chunkSize])
+
+def runRecvFrom(stream, chunkSize, counter):
+    parser = MuxMsg.MuxMsg(counter)
+    sock   = StreamSocket(stream, chunkSize)
+    while parser.recv_from(sock):
+        pass
+
+def measure(func, stream, chunkSize, numMsgs, numRuns):
+    durations = []
+    for _ in range(numRuns):
+        received = []
+        counter = lambda cmd_id, cmd_type, data: received.append(cmd_type)
+        startTime = time.time()
+        func(stream, chunkSize, counter)
+        durations.append(time.time()-startTime)
+        assert len(received)==numMsgs
+    # best of numRuns, to filter out scheduling noise
+    return min(durations)
+
+#============================ main ============================================
+
+def main():
+
+    numMsgs = NUM_MSGS
+    numRuns = NUM_RUNS
+    if len(sys.argv)>1:
+        numMsgs = int(sys.argv[1])
+    if len(sys.argv)>2:
+        numRuns = int(sys.argv[2])
+
+    stream = buildStream(numMsgs)
+
+    for (name, func, chunkSize) in [
+            ('legacy, 4096B chunks',       runLegacy,      4096),
+            ('legacy, 65536B chunks',      runLegacy,      65536),
+            ('legacy, 1MB chunks',         runLegacy,      1048576),
+            ('parse(), 4096B chunks',      runParse,       4096),
+            ('parse(), 65536B chunks',     runParse,       65536),
+            ('parse(), 1MB chunks',        runParse,       1048576),
+            ('recv_from(), 4096B reads',   runRecvFrom,    4096),
+            ('recv_from(), 65536B reads',  runRecvFrom,    65536),
+        ]:
+        duration = measure(func, stream, chunkSize, numMsgs, numRuns)
+        print '{0:<26} {1} messages ({2} bytes) in {3:.3f}s ({4:.2f} us/message, best of {5})'.format(
+            name,
+            numMsgs,
+            len(stream),
+            duration,
+            1000000*duration/numMsgs,
+            numRuns,
+        )
+
+if __name__=="__main__":
+    main()
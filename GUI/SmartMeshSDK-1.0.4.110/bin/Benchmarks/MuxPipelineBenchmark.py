@@ -0,0 +1,185 @@
+#!/usr/bin/python
+
+'''
+Compares walking the motes of a network with dn_getMoteConfig() one command
+at a time, and with several commands in flight over the Serial Mux.
+
+Usage: MuxPipelineBenchmark.py [<numMotes> [<latencyMs> [<maxInFlight>]]]
+
+A stand-in Serial Mux, listening on the loopback interface, answers each
+command after latencyMs milliseconds, as a manager reached over a network
+would. It knows numMotes motes. The walk is done:
+- synchronously, with dn_getMoteConfig(next=True) from mote to mote;
+- asynchronously, with dn_getMoteConfig_async(next=False) for all the motes
+  at once, up to maxInFlight in flight.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import heapq
+import socket
+import struct
+import threading
+import time
+
+from SmartMeshSDK                   import ApiException
+from SmartMeshSDK.IpMgrConnectorMux import IpMgrConnectorMux, \
+                                           MuxMsg
+
+#============================ defines =========================================
+
+NUM_MOTES          = 500
+LATENCY_MS         = 2
+MAX_IN_FLIGHT      = 16
+
+CMD_HELLO          = 1
+CMD_GETMOTECONFIG  = 47
+RC_OK              = 0
+RC_END_OF_LIST     = 18
+
+#============================ helpers =========================================
+
+def packMac(moteId):
+    return struct.pack('>Q', 0x00170d0000000000+moteId)
+
+def getMac(moteId):
+    return [ord(b) for b in packMac(moteId)]
+
+class StandInMux(threading.Thread):
+    '''
+    \brief Answers the mux_hello and getMoteConfig commands of one client,
+           each after a latency.
+    '''
+    def __init__(self, numMotes, latency):
+        self.numMotes      = numMotes
+        self.latency       = latency
+        self.listener      = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.listen(1)
+        self.port          = self.listener.getsockname()[1]
+        self.sock          = None
+        self.muxMsg        = MuxMsg.MuxMsg(self._handleCmd)
+        self.answers       = []   # heap of (time, sequence number, packet)
+        self.answersCond   = threading.Condition()
+        self.numAnswers    = 0
+        threading.Thread.__init__(self)
+        self.daemon        = True
+
+    def run(self):
+        (self.sock, _) = self.listener.accept()
+        answerThread = threading.Thread(target=self._answer)
+        answerThread.daemon = True
+        answerThread.start()
+        try:
+            while self.muxMsg.recv_from(self.sock):
+                pass
+        except socket.error:
+            pass
+
+    def _handleCmd(self, tag, cmdType, payload):
+        if cmdType==CMD_HELLO:
+            answer = struct.pack('>BB', RC_OK, MuxMsg.VERSION)
+        elif cmdType==CMD_GETMOTECONFIG:
+            moteId = struct.unpack('>Q', payload[:8].tobytes())[0] & 0xffff
+            if ord(payload[8]):
+                moteId += 1
+            if moteId>self.numMotes:
+                answer = struct.pack('>B', RC_END_OF_LIST)
+            else:
+                answer = struct.pack('>B8sHBBBB', RC_OK, packMac(moteId), moteId, moteId==1, 4, 0, True)
+        else:
+            return
+        with self.answersCond:
+            self.numAnswers += 1
+            heapq.heappush(
+                self.answers,
+                (time.time()+self.latency, self.numAnswers, self.muxMsg.build_message(cmdType, answer, tag)),
+            )
+            self.answersCond.notify()
+
+    def _answer(self):
+        while True:
+            with self.answersCond:
+                while not self.answers:
+                    self.answersCond.wait()
+                (answerTime, _, packet) = self.answers[0]
+                delay = answerTime-time.time()
+                if delay<=0:
+                    heapq.heappop(self.answers)
+            if delay>0:
+                time.sleep(delay)
+                continue
+            try:
+                self.sock.sendall(packet)
+            except socket.error:
+                return
+
+def walkSync(connector, numMotes):
+    macAddress = getMac(0)
+    moteIds    = []
+    while True:
+        try:
+            res = connector.dn_getMoteConfig(macAddress, True)
+        except ApiException.APIError:
+            break
+        moteIds.append(res.moteId)
+        macAddress = res.macAddress
+    return moteIds
+
+def walkAsync(connector, numMotes):
+    futures = [connector.dn_getMoteConfig_async(getMac(moteId), False) for moteId in range(1, numMotes+1)]
+    return [future.result().moteId for future in futures]
+
+def measure(func, numMotes, latency, maxInFlight):
+    mux = StandInMux(numMotes, latency)
+    mux.start()
+    connector = IpMgrConnectorMux.IpMgrConnectorMux()
+    connector.connect({'port': mux.port, 'maxInFlight': maxInFlight})
+    try:
+        startTime = time.time()
+        moteIds   = func(connector, numMotes)
+        duration  = time.time()-startTime
+    finally:
+        connector.disconnect()
+    assert moteIds==range(1, numMotes+1)
+    return duration
+
+#============================ main ============================================
+
+def main():
+
+    numMotes    = NUM_MOTES
+    latency     = LATENCY_MS
+    maxInFlight = MAX_IN_FLIGHT
+    if len(sys.argv)>1:
+        numMotes    = int(sys.argv[1])
+    if len(sys.argv)>2:
+        latency     = float(sys.argv[2])
+    if len(sys.argv)>3:
+        maxInFlight = int(sys.argv[3])
+
+    for (name, func, window) in [
+            ('synchronous',                walkSync,       1),
+            ('asynchronous, 1 in flight',  walkAsync,      1),
+            ('asynchronous',               walkAsync,      maxInFlight),
+        ]:
+        duration = measure(func, numMotes, latency/1000.0, window)
+        print '{0:<26} {1} motes in {2:.3f}s ({3:.2f} ms/mote, {4} ms latency, {5} in flight)'.format(
+            name,
+            numMotes,
+            duration,
+            1000*duration/numMotes,
+            latency,
+            window,
+        )
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/python
+
+'''
+Compares IpMgrSubscribe calling its callbacks inline, and dispatching them on
+the thread lanes of a NotifDispatcher.
+
+Usage: NotifDispatchBenchmark.py [<numMotes> [<numNotifsPerMote> [<callbackMs>]]]
+
+numMotes simulated motes each send numNotifsPerMote 'notifData'
+notifications, interleaved, as a manager reports them. The callback takes
+callbackMs milliseconds:
+- waiting, as for an HTTP request ('io');
+- computing ('cpu'), which threads do not run in parallel.
+The time is measured until the subscriber's FINISH, i.e. until all the
+callbacks have returned. The benchmark also checks that the notifications of
+each mote were handled in order.
+
+IpMgrSubscribe does not accept a dispatcher with process lanes, whose
+callbacks must be picklable, so those are not measured.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import struct
+import threading
+import time
+
+from SmartMeshSDK                   import ApiConnector,      \
+                                           NotifDispatcher
+from SmartMeshSDK.IpMgrConnectorMux import IpMgrConnectorMux, \
+                                           IpMgrSubscribe,    \
+                                           MuxMsg
+
+#============================ defines =========================================
+
+NUM_MOTES          = 500
+NUM_NOTIFS_PER_MOTE = 4
+CALLBACK_MS        = 1.0
+
+NOTIF_TYPE         = 20
+SUBID_NOTIFDATA    = 4
+DATA               = ''.join(chr(i) for i in range(60))
+
+#============================ helpers =========================================
+
+class OfflineConnector(IpMgrConnectorMux.IpMgrConnectorMux):
+    '''
+    \brief A connector fed from a buffer, not connected to a Serial Mux.
+    '''
+    def dn_subscribe(self, filter, unackFilter):
+        pass
+
+    def disconnect(self, reason=""):
+        ApiConnector.ApiConnector.disconnect(self, reason)
+
+def buildStream(numMotes, numNotifsPerMote):
+    builder = MuxMsg.MuxMsg(None)
+    stream  = []
+    for seqNum in range(numNotifsPerMote):
+        for moteId in range(1, numMotes+1):
+            payload = struct.pack('>BQIQHH', SUBID_NOTIFDATA, seqNum, 0, 0x00170d0000000000+moteId, 0xf0b8, 0xf0b8) + DATA
+            stream.append(builder.build_message(NOTIF_TYPE, payload))
+    return ''.join(stream)
+
+def spin(duration):
+    endTime = time.time()+duration
+    while time.time()<endTime:
+        pass
+
+def measure(stream, numNotifs, work, duration, numLanes):
+    connector = OfflineConnector(maxQSize=numNotifs)
+    connector.isConnected = True
+    dispatcher = None
+    if numLanes:
+        dispatcher = NotifDispatcher.NotifDispatcher(numLanes=numLanes)
+
+    seqNums  = {}       # {mac: [utcSecs]}, in the order the callbacks were called
+    finished = threading.Event()
+    wait     = {'io': time.sleep, 'cpu': spin}[work]
+    def callback(notifName, notifParams):
+        wait(duration)
+        seqNums.setdefault(tuple(notifParams.macAddress), []).append(notifParams.utcSecs)
+    def finish(notifName, notifParams):
+        if notifName==IpMgrSubscribe.IpMgrSubscribe.FINISH:
+            finished.set()
+
+    subscriber = IpMgrSubscribe.IpMgrSubscribe(connector)
+    subscriber.start(batchSize=100, dispatcher=dispatcher)
+    subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.NOTIFDATA, callback, False)
+    subscriber.subscribe([IpMgrSubscribe.IpMgrSubscribe.ERROR, IpMgrSubscribe.IpMgrSubscribe.FINISH], finish, True)
+
+    startTime = time.time()
+    for i in range(0, len(stream), 65536):
+        connector.muxMsg.parse(stream[i:i+65536])
+    connector.disconnect("done")
+    finished.wait()
+    duration = time.time()-startTime
+
+    maxDepths = []
+    if dispatcher:
+        maxDepths = [lane['maxDepth'] for lane in dispatcher.getStats()]
+        dispatcher.close()
+    for macSeqNums in seqNums.values():
+        assert macSeqNums==sorted(macSeqNums)
+    return (duration, maxDepths)
+
+#============================ main ============================================
+
+def main():
+
+    numMotes         = NUM_MOTES
+    numNotifsPerMote = NUM_NOTIFS_PER_MOTE
+    callbackMs       = CALLBACK_MS
+    if len(sys.argv)>1:
+        numMotes         = int(sys.argv[1])
+    if len(sys.argv)>2:
+        numNotifsPerMote = int(sys.argv[2])
+    if len(sys.argv)>3:
+        callbackMs       = float(sys.argv[3])
+
+    stream    = buildStream(numMotes, numNotifsPerMote)
+    numNotifs = numMotes*numNotifsPerMote
+
+    for (name, work, numLanes) in [
+            ('io, inline',                 'io',   0),
+            ('io, 8 thread lanes',         'io',   8),
+            ('io, 32 thread lanes',        'io',   32),
+            ('cpu, inline',                'cpu',  0),
+            ('cpu, 4 thread lanes',        'cpu',  4),
+        ]:
+        (duration, maxDepths) = measure(stream, numNotifs, work, callbackMs/1000.0, numLanes)
+        depths = ''
+        if maxDepths:
+            depths = ', lane depth up to {0}-{1}'.format(min(maxDepths), max(maxDepths))
+        print '{0:<26} {1} motes, {2} notifications in {3:.3f}s ({4:.3f} ms/notification{5})'.format(
+            name,
+            numMotes,
+            numNotifs,
+            duration,
+            1000*duration/numNotifs,
+            depths,
+        )
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/python
+
+'''
+Compares the cost of draining the notification queue of a connector one
+notification at a time (getNotification()) and in batches
+(getNotifications()).
+
+Usage: NotifDrainBenchmark.py [<numNotifs> [<batchSize> [<numRuns>]]]
+
+The queue of an IpMgrConnectorMux is filled with 'notifData' notifications,
+as received during a burst, then drained, both with the raw notifications
+(getNotificationInternal()/getNotificationsInternal()) and with the
+formatted ones.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import time
+
+from SmartMeshSDK.IpMgrConnectorMux import IpMgrConnectorMux
+
+#============================ defines =========================================
+
+NUM_NOTIFS         = 10000
+BATCH_SIZE         = 100
+NUM_RUNS           = 5
+
+NOTIF              = (
+    ['notifData'],
+    {
+        'utcSecs':       1400000000,
+        'utcUsecs':      0,
+        'macAddress':    (0,0x17,0x0d,0,0,0x38,0x06,0x7a),
+        'srcPort':       0xf0b8,
+        'dstPort':       0xf0b8,
+        'data':          tuple(range(60)),
+    },
+)
+
+#============================ helpers =========================================
+
+def fill(connector,numNotifs):
+    for _ in range(numNotifs):
+        connector.putNotification(NOTIF)
+
+def drainOne(connector,numNotifs,batchSize):
+    for _ in range(numNotifs):
+        connector.getNotificationInternal(0)
+
+def drainBatch(connector,numNotifs,batchSize):
+    numDrained = 0
+    while numDrained<numNotifs:
+        numDrained += len(connector.getNotificationsInternal(batchSize,0))
+
+def drainOneFormatted(connector,numNotifs,batchSize):
+    for _ in range(numNotifs):
+        connector.getNotification(0)
+
+def drainBatchFormatted(connector,numNotifs,batchSize):
+    numDrained = 0
+    while numDrained<numNotifs:
+        numDrained += len(connector.getNotifications(batchSize,0))
+
+def measure(func,numNotifs,batchSize,numRuns):
+    connector = IpMgrConnectorMux.IpMgrConnectorMux(maxQSize=numNotifs)
+    connector.isConnected = True
+    durations = []
+    for _ in range(numRuns):
+        fill(connector,numNotifs)
+        startTime = time.time()
+        func(connector,numNotifs,batchSize)
+        durations.append(time.time()-startTime)
+        assert connector.queue.qsize()==0
+    # best of numRuns, to filter out scheduling noise
+    return min(durations)
+
+#============================ main ============================================
+
+def main():
+
+    numNotifs = NUM_NOTIFS
+    batchSize = BATCH_SIZE
+    numRuns   = NUM_RUNS
+    if len(sys.argv)>1:
+        numNotifs = int(sys.argv[1])
+    if len(sys.argv)>2:
+        batchSize = int(sys.argv[2])
+    if len(sys.argv)>3:
+        numRuns   = int(sys.argv[3])
+
+    for (name,func) in [
+            ('raw, one at a time',         drainOne),
+            ('raw, batches',               drainBatch),
+            ('formatted, one at a time',   drainOneFormatted),
+            ('formatted, batches',         drainBatchFormatted),
+        ]:
+        duration = measure(func,numNotifs,batchSize,numRuns)
+        print '{0:<26} {1} notifications in {2:.3f}s ({3:.2f} us/notification, batches of {4}, best of {5})'.format(
+            name,
+            numNotifs,
+            duration,
+            1000000*duration/numNotifs,
+            batchSize,
+            numRuns,
+        )
+
+if __name__=="__main__":
+    main()
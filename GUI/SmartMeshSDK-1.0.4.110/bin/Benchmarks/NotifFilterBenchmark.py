@@ -0,0 +1,134 @@
+#!/usr/bin/python
+
+'''
+Compares an IpMgrSubscribe callback discarding the data notifications it does
+not want, as DC2369A and OAPDispatcher used to, with the same subscription
+filtering them on their destination port before they are deserialized.
+
+Usage: NotifFilterBenchmark.py [<numNotifs> [<percentWanted> [<numRuns>]]]
+
+A stream of 'notifData' notifications, as received from the Serial Mux, is
+parsed by an IpMgrConnectorMux; percentWanted percent of them are sent to the
+port the subscriber wants. The time is measured until the subscriber has
+handed all of those to its callback.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import struct
+import threading
+import time
+
+from SmartMeshSDK                   import ApiConnector
+from SmartMeshSDK.IpMgrConnectorMux import IpMgrConnectorMux, \
+                                           IpMgrSubscribe,    \
+                                           MuxMsg
+
+#============================ defines =========================================
+
+NUM_NOTIFS         = 20000
+PERCENT_WANTED     = 10
+NUM_RUNS           = 5
+
+NOTIF_TYPE         = 20
+SUBID_NOTIFDATA    = 4
+WANTED_PORT        = 0xf0b8
+OTHER_PORT         = 0xf0b9
+MAC                = struct.pack('>Q', 0x00170d0000380000)
+DATA               = ''.join(chr(i) for i in range(60))
+
+#============================ helpers =========================================
+
+class OfflineConnector(IpMgrConnectorMux.IpMgrConnectorMux):
+    '''
+    \brief A connector fed from a buffer, not connected to a Serial Mux.
+    '''
+    def dn_subscribe(self, filter, unackFilter):
+        pass
+
+    def disconnect(self, reason=""):
+        ApiConnector.ApiConnector.disconnect(self, reason)
+
+def buildStream(numNotifs, percentWanted):
+    builder   = MuxMsg.MuxMsg(None)
+    stream    = []
+    numWanted = 0
+    for i in range(numNotifs):
+        # the last notification is a wanted one
+        isWanted = (numNotifs-1-i)*percentWanted%100 < percentWanted
+        payload  = struct.pack('>BQI', SUBID_NOTIFDATA, 1400000000+i, 0) + MAC + \
+                   struct.pack('>HH', WANTED_PORT, WANTED_PORT if isWanted else OTHER_PORT) + DATA
+        stream.append(builder.build_message(NOTIF_TYPE, payload))
+        numWanted += isWanted
+    return (''.join(stream), numWanted)
+
+def measure(stream, numNotifs, numWanted, isFiltered, numRuns):
+    durations = []
+    for _ in range(numRuns):
+        connector = OfflineConnector(maxQSize=numNotifs)
+        connector.isConnected = True
+        received  = []
+        done      = threading.Event()
+        def notifDataCallback(notifName, notifParams):
+            if notifParams.dstPort != WANTED_PORT:
+                return
+            received.append(notifParams)
+            if len(received)==numWanted:
+                done.set()
+        subscriber = IpMgrSubscribe.IpMgrSubscribe(connector)
+        subscriber.start()
+        if isFiltered:
+            subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.NOTIFDATA, notifDataCallback, False,
+                                 dstPorts=[WANTED_PORT])
+        else:
+            subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.NOTIFDATA, notifDataCallback, False)
+        startTime = time.time()
+        for i in range(0, len(stream), 65536):
+            connector.muxMsg.parse(stream[i:i+65536])
+        done.wait()
+        durations.append(time.time()-startTime)
+        connector.disconnect("done")
+        subscriber._thread.join()
+    # best of numRuns, to filter out scheduling noise
+    return min(durations)
+
+#============================ main ============================================
+
+def main():
+
+    numNotifs     = NUM_NOTIFS
+    percentWanted = PERCENT_WANTED
+    numRuns       = NUM_RUNS
+    if len(sys.argv)>1:
+        numNotifs     = int(sys.argv[1])
+    if len(sys.argv)>2:
+        percentWanted = int(sys.argv[2])
+    if len(sys.argv)>3:
+        numRuns       = int(sys.argv[3])
+
+    (stream, numWanted) = buildStream(numNotifs, percentWanted)
+
+    for (name, isFiltered) in [
+            ('discarded by the callback',  False),
+            ('filtered on dstPort',        True),
+        ]:
+        duration = measure(stream, numNotifs, numWanted, isFiltered, numRuns)
+        print '{0:<26} {1} notifications ({2} wanted) in {3:.3f}s ({4:.2f} us/notification, best of {5})'.format(
+            name,
+            numNotifs,
+            numWanted,
+            duration,
+            1000000*duration/numNotifs,
+            numRuns,
+        )
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/python
+
+'''
+Measures how SerialMuxServer fans the notifications of a manager out to its
+clients, and shares the manager between their commands.
+
+Usage: SerialMuxBenchmark.py [<numNotifs> [<numCmds>]]
+
+A stand-in manager speaks the serial API on one side of a pseudo-terminal;
+SerialMuxServer is connected to the other side, and 1, 4 then 16
+IpMgrConnectorMux clients, subscribed to 'notifData' notifications, to the
+server. For each number of clients:
+- the manager sends numNotifs 'notifData' notifications back to back
+  (unreliably, i.e. without waiting for ACKs), each client receives them all;
+- each client sends numCmds getMoteConfig commands, all at the same time;
+  the server sends them to the manager one at a time.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import select
+import struct
+import threading
+import time
+import tty
+
+from SmartMeshSDK.IpMgrConnectorMux import IpMgrConnectorMux, \
+                                           SerialMuxServer
+from SmartMeshSDK.SerialConnector   import Hdlc
+
+#============================ defines =========================================
+
+NUM_NOTIFS         = 5000
+NUM_CMDS           = 100
+NUM_CLIENTS        = [1, 4, 16]
+
+CMD_HELLO          = 1
+CMD_HELLO_RESPONSE = 2
+CMD_NOTIFICATION   = 20
+CMD_SUBSCRIBE      = 22
+CMD_GETMOTECONFIG  = 47
+SUBID_NOTIFDATA    = 4
+RC_OK              = 0
+MGR_SEQ_NO         = 0
+
+#============================ helpers =========================================
+
+def packMac(moteId):
+    return struct.pack('>Q', 0x00170d0000000000+moteId)
+
+def getMac(moteId):
+    return [ord(b) for b in packMac(moteId)]
+
+class PtyWriter(object):
+    '''
+    \brief Stands for the pyserial handler of Hdlc, on a file descriptor.
+    '''
+    def __init__(self, fd):
+        self.fd = fd
+
+    def write(self, data):
+        data = str(data)
+        numWritten = 0
+        while numWritten<len(data):
+            numWritten += os.write(self.fd, data[numWritten:])
+        return numWritten
+
+class StandInManager(threading.Thread):
+    '''
+    \brief Answers the hello, subscribe and getMoteConfig commands on the
+           master side of a pseudo-terminal, and sends notifications on
+           demand.
+    '''
+    def __init__(self):
+        (self.masterFd, slaveFd) = os.openpty()
+        tty.setraw(slaveFd)
+        self.port          = os.ttyname(slaveFd)
+        self.frames        = []
+        self.hdlc          = Hdlc.Hdlc(self.frames.append, None, bulkRx=True)
+        self.hdlc.pyserialHandler = PtyWriter(self.masterFd)
+        self.hdlc.connected       = True
+        self.sendLock      = threading.Lock()
+        self.isRunning     = True
+        threading.Thread.__init__(self)
+        self.daemon        = True
+
+    def run(self):
+        while self.isRunning:
+            (readable, _, _) = select.select([self.masterFd], [], [], 0.1)
+            if not readable:
+                continue
+            try:
+                data = os.read(self.masterFd, 4096)
+            except OSError:
+                return
+            if not data:
+                return
+            self.hdlc.receive(data)
+            while self.frames:
+                self._handleFrame(self.frames.pop(0))
+
+    def close(self):
+        # hangs up the pseudo-terminal, which ends the read of the serial
+        # port blocked on the other side
+        self.isRunning = False
+        self.join()
+        os.close(self.masterFd)
+
+    def sendNotifs(self, numNotifs):
+        for i in range(numNotifs):
+            payload = struct.pack('>BQI', SUBID_NOTIFDATA, 1400000000+i, 0) + \
+                      packMac(1+i%100) + struct.pack('>HH', 0xf0b8, 0xf0b8) + \
+                      ''.join(chr(j) for j in range(60))
+            self._send(0x00, CMD_NOTIFICATION, 0, payload)
+
+    def _send(self, control, cmdId, packetId, payload):
+        with self.sendLock:
+            self.hdlc.send([control, cmdId, packetId, len(payload)] + [ord(b) for b in payload])
+
+    def _handleFrame(self, frame):
+        (control, cmdId, packetId) = (frame[0], frame[1], frame[2])
+        payload = str(frame[4:])
+        if control & 0x01:
+            return # ACK
+        if cmdId==CMD_HELLO:
+            cliSeqNo = ord(payload[1])
+            self._send(0x00, CMD_HELLO_RESPONSE, 0,
+                       struct.pack('>BBBBB', RC_OK, 4, MGR_SEQ_NO, cliSeqNo, 0))
+        elif cmdId==CMD_SUBSCRIBE:
+            self._send(0x01, cmdId, packetId, struct.pack('>B', RC_OK))
+        elif cmdId==CMD_GETMOTECONFIG:
+            moteId = struct.unpack('>Q', payload[:8])[0] & 0xffff
+            self._send(0x01, cmdId, packetId,
+                       struct.pack('>B8sHBBBB', RC_OK, packMac(moteId), moteId, moteId==1, 4, 0, True))
+
+class Client(threading.Thread):
+    '''
+    \brief An IpMgrConnectorMux, draining its notifications.
+    '''
+    def __init__(self, port, numNotifs):
+        self.connector     = IpMgrConnectorMux.IpMgrConnectorMux(maxQSize=numNotifs)
+        self.connector.connect({'port': port})
+        self.connector.dn_subscribe([0, 0, 0, 1<<SUBID_NOTIFDATA], [0, 0, 0, 1<<SUBID_NOTIFDATA])
+        self.numNotifs     = numNotifs
+        self.doneTime      = None
+        threading.Thread.__init__(self)
+        self.daemon        = True
+
+    def run(self):
+        numReceived = 0
+        while numReceived<self.numNotifs:
+            numReceived += len(self.connector.getNotificationsInternal(100))
+        self.doneTime = time.time()
+
+def sendCmds(connector, numCmds):
+    for moteId in range(1, numCmds+1):
+        assert connector.dn_getMoteConfig(getMac(moteId), False).moteId==moteId
+
+def measure(manager, server, numClients, numNotifs, numCmds):
+    clients = [Client(server.getTcpPort(), numNotifs) for _ in range(numClients)]
+
+    # notifications
+    for client in clients:
+        client.start()
+    startTime = time.time()
+    manager.sendNotifs(numNotifs)
+    for client in clients:
+        client.join()
+    notifDuration = max(client.doneTime for client in clients)-startTime
+
+    # commands
+    threads = [threading.Thread(target=sendCmds, args=(client.connector, numCmds)) for client in clients]
+    startTime = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cmdDuration = time.time()-startTime
+
+    for client in clients:
+        client.connector.disconnect()
+    return (notifDuration, cmdDuration)
+
+#============================ main ============================================
+
+def main():
+
+    numNotifs = NUM_NOTIFS
+    numCmds   = NUM_CMDS
+    if len(sys.argv)>1:
+        numNotifs = int(sys.argv[1])
+    if len(sys.argv)>2:
+        numCmds   = int(sys.argv[2])
+
+    manager = StandInManager()
+    manager.start()
+    server  = SerialMuxServer.SerialMuxServer()
+    server.connect({'port': manager.port, 'bulkRx': True, 'tcpPort': 0})
+    try:
+        for numClients in NUM_CLIENTS:
+            (notifDuration, cmdDuration) = measure(manager, server, numClients, numNotifs, numCmds)
+            print '{0:>2} clients: {1} notifications to each in {2:.3f}s ({3:.0f} notifications/s delivered), {4} commands in {5:.3f}s ({6:.2f} ms/command)'.format(
+                numClients,
+                numNotifs,
+                notifDuration,
+                numClients*numNotifs/notifDuration,
+                numClients*numCmds,
+                cmdDuration,
+                1000*cmdDuration/(numClients*numCmds),
+            )
+        stats = server.getStats()
+        print 'server: {0} notifications received, {1} commands sent, {2} notifications dropped'.format(
+            stats['numNotifs'],
+            stats['numCmds'],
+            stats['numDroppedNotifs'],
+        )
+    finally:
+        manager.close()
+        server.disconnect()
+
+if __name__=="__main__":
+    main()
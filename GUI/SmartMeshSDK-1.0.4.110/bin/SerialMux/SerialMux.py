@@ -0,0 +1,79 @@
+#!/usr/bin/python
+
+'''
+Serial Mux, in Python: shares the API serial port of an IP manager with the
+applications connecting to it over TCP (see SerialMuxServer).
+
+Usage: SerialMux.py -p <serialPort> [-t <tcpPort>] [-H <tcpHost>]
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..'))
+
+#============================ imports =========================================
+
+import time
+from   optparse                        import OptionParser
+
+from   SmartMeshSDK.IpMgrConnectorMux  import SerialMuxServer
+from   SmartMeshSDK.ApiException       import ConnectionError
+
+#============================ defines =========================================
+
+STATS_PERIOD = 10 # in seconds
+
+#============================ main ============================================
+
+def main():
+    parser = OptionParser()
+    parser.add_option("-p", "--port",      dest="port",
+                      help="serial port of the manager's API, e.g. COM7 or /dev/ttyUSB3")
+    parser.add_option("-t", "--tcpPort",   dest="tcpPort",   type="int",
+                      default=SerialMuxServer.DEFAULT_TCP_PORT,
+                      help="TCP port to listen on (default %default)")
+    parser.add_option("-H", "--tcpHost",   dest="tcpHost",
+                      default=SerialMuxServer.DEFAULT_TCP_HOST,
+                      help="interface to listen on (default %default)")
+    (options, args) = parser.parse_args()
+    if not options.port:
+        parser.error("the serial port (-p) is required")
+
+    server = SerialMuxServer.SerialMuxServer()
+    try:
+        server.connect({
+            'port':     options.port,
+            'bulkRx':   True,
+            'tcpHost':  options.tcpHost,
+            'tcpPort':  options.tcpPort,
+        })
+    except ConnectionError as err:
+        print err
+        sys.exit(1)
+    print 'Serial Mux on {0}, listening on {1}:{2}. Ctrl-C to exit.'.format(
+        options.port,
+        options.tcpHost,
+        server.getTcpPort(),
+    )
+
+    try:
+        while server.isRunning:
+            time.sleep(STATS_PERIOD)
+            stats = server.getStats()
+            print '{0} clients, {1} notifications, {2} commands ({3} failed), {4} notifications dropped'.format(
+                stats['numClients'],
+                stats['numNotifs'],
+                stats['numCmds'],
+                stats['numCmdFailures'],
+                stats['numDroppedNotifs'],
+            )
+    except KeyboardInterrupt:
+        pass
+    server.disconnect()
+
+if __name__=="__main__":
+    main()